@@ -6,9 +6,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 import logging
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.websocket import manager
 from app.services.check_runner import check_runner
+from app.services.camera_monitor import camera_monitor_service
+from app.services.raid_monitor import raid_monitor_service
 from app.schemas.check import CheckRunRequest, CheckStatusResponse
 
 router = APIRouter()
@@ -65,6 +68,35 @@ async def get_check_status():
     )
 
 
+@router.get("/monitor")
+async def get_camera_monitor_stats():
+    """
+    카메라 상시 모니터 통계 조회
+    
+    Returns:
+        스트림별 생존 여부, FPS, 마지막 프레임 시각
+    """
+    monitor = camera_monitor_service.monitor
+    if monitor is None:
+        return {"enabled": False, "streams": []}
+    
+    return {"enabled": True, "streams": monitor.get_all_stats()}
+
+
+@router.get("/raid")
+async def get_raid_progress():
+    """
+    RAID 재구축/재동기화 진행률 조회
+    
+    Returns:
+        NAS별 최근 진행률 (실시간 갱신은 WebSocket raid_progress 메시지)
+    """
+    return {
+        "enabled": settings.NAS_RAID_POLL_ENABLED,
+        "hosts": raid_monitor_service.get_progress()
+    }
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
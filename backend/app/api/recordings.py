@@ -0,0 +1,100 @@
+"""
+녹화 타임라인 조회 API 엔드포인트
+"""
+from fastapi import APIRouter, Query
+from typing import Optional
+from datetime import datetime, timedelta
+import asyncio
+import os
+
+from app.core.config import settings
+from app.services.recording_index import recording_index
+from checks.camera_check import find_latest_log_file
+from checks.storage_rate import analyze_write_rates, log_write_rates
+
+router = APIRouter()
+
+
+def _compute_gaps(camera: Optional[int], start: datetime, end: datetime):
+    """녹화 공백 계산 (동기, executor에서 실행)"""
+    # 증분 인덱싱 (최근 갱신 후 1분 이내면 생략)
+    recording_index.update_if_stale()
+    
+    cameras = [camera] if camera else recording_index.cameras()
+    return {
+        cam: recording_index.find_gaps(cam, start, end)
+        for cam in cameras
+    }
+
+
+@router.get("/gaps")
+async def get_recording_gaps(
+    camera: Optional[int] = Query(None, ge=1),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    """
+    녹화 공백 조회
+    
+    Args:
+        camera: 카메라 번호 (None이면 인덱스의 모든 카메라)
+        start: 조회 시작 시각 (기본: 24시간 전)
+        end: 조회 종료 시각 (기본: 현재)
+    
+    Returns:
+        카메라별 녹화 공백 목록 (세그먼트 길이보다 긴 간격)
+    """
+    end = end or datetime.now()
+    start = start or end - timedelta(hours=24)
+    
+    # 인덱스 갱신/공백 계산은 블로킹이므로 executor에서 실행
+    loop = asyncio.get_event_loop()
+    gaps = await loop.run_in_executor(None, _compute_gaps, camera, start, end)
+    
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "segment_seconds": recording_index.segment_seconds,
+        "last_indexed_hour": (
+            recording_index.last_indexed_hour.strftime("%Y/%m/%d/%H")
+            if recording_index.last_indexed_hour else None
+        ),
+        "gaps": gaps
+    }
+
+
+def _compute_write_rates(include_logs: bool):
+    """저장 속도 분석 (동기, executor에서 실행)"""
+    recording_index.update_if_stale()
+    
+    log_rates = {}
+    if include_logs:
+        for camera_num in recording_index.cameras():
+            log_file = find_latest_log_file(camera_num, settings.CAMERA_LOG_BASE_PATH, search_days=0)
+            if log_file:
+                log_rates[camera_num] = log_write_rates(log_file)
+    
+    # 영상 마운트 남은 용량 (가득 찰 때까지 남은 일수 예측)
+    free_bytes = None
+    try:
+        stat = os.statvfs(settings.CAMERA_VIDEO_BASE_PATH)
+        free_bytes = stat.f_bavail * stat.f_frsize
+    except (OSError, AttributeError):
+        pass
+    
+    return analyze_write_rates(recording_index, log_rates=log_rates, free_bytes=free_bytes)
+
+
+@router.get("/rates")
+async def get_write_rates(include_logs: bool = True):
+    """
+    카메라별 저장 속도 조회
+    
+    Args:
+        include_logs: 카메라 로그의 '파일 크기' 기록으로 교차 확인할지 여부
+    
+    Returns:
+        카메라별 MB/min (최근 1시간/1일), 비트레이트 급감/급증 여부, NAS 소비 속도 예측
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, _compute_write_rates, include_logs)
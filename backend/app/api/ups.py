@@ -0,0 +1,87 @@
+"""
+UPS 원격 측정 조회 API 엔드포인트
+"""
+from fastapi import APIRouter, Depends, Query, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import Optional
+from datetime import datetime
+import time
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.ups_telemetry import UpsTelemetry
+from app.services.ups_poller import ups_poller_service
+from checks.ups_check import ups_targets_from_config
+from checks.ups_telemetry import ups_telemetry
+
+router = APIRouter()
+
+# 자동 집계 간격 선택 시 최대 점 개수
+MAX_POINTS = 500
+
+
+@router.get("/series")
+async def get_ups_series(
+    ups: Optional[str] = None,
+    minutes: int = Query(60, ge=1, le=60 * 24 * 30),
+    step: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    UPS 측정값 시계열 조회 (battery.charge, battery.runtime, ups.load, input.voltage, ups.status)
+
+    Args:
+        ups: UPS 이름 (ups@host, 기본: 첫 번째 대상)
+        minutes: 조회 기간 (분, 현재까지)
+        step: 집계 간격 (초, 기본: 점 개수가 500개 이하가 되도록 자동)
+        db: 데이터베이스 세션
+
+    Returns:
+        링 버퍼 구간은 step 간격 집계, 링 버퍼보다 오래된 구간은 DB에 저장된 집계
+        (UPS_AGGREGATE_SECONDS 간격)
+    """
+    names = [target['name'] for target in (ups_poller_service.targets or ups_targets_from_config(
+        settings.NUT_UPS_NAME, ups_poller_service.nut_config())) if not target.get('error')]
+    if not names:
+        raise HTTPException(status_code=404, detail="UPS 대상이 없습니다 (NUT_UPS_TARGETS 확인)")
+    name = ups or names[0]
+    if name not in names:
+        raise HTTPException(status_code=404, detail=f"UPS를 찾을 수 없습니다: {name} (대상: {', '.join(names)})")
+
+    end = time.time()
+    start = end - minutes * 60
+    step = step or max(int(settings.UPS_POLL_INTERVAL), (minutes * 60) // MAX_POINTS)
+
+    series = ups_telemetry.series(name, since=start, until=end, step=step)
+    points = series['points']
+    source = 'memory'
+
+    # 링 버퍼가 조회 기간을 다 담지 못하면 앞부분은 DB 집계로 채움
+    oldest = series['oldest']
+    if oldest is None or oldest > start:
+        boundary = datetime.fromtimestamp(oldest if oldest is not None else end)
+        query = (
+            select(UpsTelemetry)
+            .where(UpsTelemetry.ups == name)
+            .where(UpsTelemetry.bucket_start >= datetime.fromtimestamp(start))
+            .where(UpsTelemetry.bucket_start < boundary)
+            .order_by(UpsTelemetry.bucket_start)
+        )
+        result = await db.execute(query)
+        stored = [row.to_dict() for row in result.scalars().all()]
+        if stored:
+            points = stored + points
+            source = 'db+memory' if series['points'] else 'db'
+
+    return {
+        "ups": name,
+        "enabled": settings.UPS_POLL_ENABLED,
+        "source": source,
+        "step": step,
+        "start": datetime.fromtimestamp(start).isoformat(),
+        "end": datetime.fromtimestamp(end).isoformat(),
+        "latest": ups_telemetry.latest(name, max_age=float('inf')),
+        "error": ups_telemetry.errors.get(name),
+        "points": points
+    }
@@ -34,12 +34,57 @@ class Settings(BaseSettings):
     
     # NUT/UPS 설정
     NUT_UPS_NAME: str = "ups"
+    NUT_HOST: str = "localhost"  # upsd 호스트 (TCP 직접 질의)
+    NUT_PORT: int = 3493
+    NUT_TIMEOUT: float = 5.0  # upsd 연결/응답 대기 시간 (초)
+    NUT_USER: str = ""  # upsd.users 계정 (조회만 하면 불필요)
+    NUT_PASSWORD: str = ""
+    NUT_UPS_TARGETS: str = ""  # 여러 UPS/원격 upsd ("ups@호스트[:포트]" 쉼표 구분, 비우면 NUT_UPS_NAME 1대)
+    UPS_POLL_ENABLED: bool = True  # 웹 백엔드에서 UPS 측정값 상시 수집 (점검은 최근 샘플 사용)
+    UPS_POLL_INTERVAL: float = 5.0  # 수집 간격 (초)
+    UPS_BUFFER_SIZE: int = 17280  # UPS당 메모리 샘플 수 (5초 간격 24시간)
+    UPS_AGGREGATE_SECONDS: int = 60  # DB 저장 집계 구간 (초)
+    UPS_FLUSH_INTERVAL: float = 300.0  # DB 저장 주기 (초)
     
     # NAS 설정
     NAS_IP: str = "192.168.10.30"
     NAS_USER: str = "admin2k"
     NAS_PASSWORD: str = ""
     NAS_PORT: int = 2222
+    NAS_SSH_POOL: bool = True  # 점검 간 SSH 연결 재사용 (프로세스 전역 풀)
+    SSH_POOL_KEEPALIVE: int = 30  # keepalive 간격 (초)
+    SSH_POOL_IDLE_TIMEOUT: float = 300.0  # 미사용 연결 정리 시간 (초)
+    NAS_TARGETS: str = ""  # 다중 NAS 점검 대상 ("이름=[사용자@]호스트[:포트]" 쉼표 구분, 비우면 NAS_IP 1대)
+    NAS_FLEET_CONCURRENCY: int = 8  # 다중 NAS 전체 동시 점검 수
+    NAS_FLEET_PER_HOST: int = 1  # 호스트별 동시 점검 수
+    NAS_FLEET_HOST_TIMEOUT: float = 120.0  # 대상 1개 점검 제한 시간 (초)
+    NAS_SMART_ENABLED: bool = False  # RAID 멤버 디스크 SMART 점검
+    NAS_SMART_HISTORY_PATH: str = "./smart_history.json"  # 디스크별 SMART 이력 (변경값만 저장)
+    NAS_SMART_RATE_WINDOW: float = 7.0  # 오류 카운터 증가 속도 계산 기간 (일)
+    NAS_SMART_RATE_WARN: float = 1.0  # 오류 카운터 일당 증가량 경고 기준
+    NAS_SMART_TEMP_WARN: int = 55  # 디스크 온도 경고 기준 (°C)
+    NAS_IO_SAMPLE_ENABLED: bool = False  # 디스크 I/O/네트워크 부하 샘플링 (/proc/diskstats, /proc/net/dev)
+    NAS_IO_INTERVAL: float = 1.0  # 두 스냅샷 사이 간격 (초)
+    NAS_IO_UTIL_WARN: float = 90.0  # 디스크 사용률 경고 기준 (%)
+    NAS_IO_AWAIT_WARN: float = 100.0  # 디스크 평균 응답 시간 경고 기준 (ms)
+    NAS_IO_NIC_UTIL_WARN: float = 80.0  # NIC 링크 대비 사용률 경고 기준 (%)
+    NAS_IO_NIC_MBPS_WARN: float = 0.0  # 링크 속도를 모를 때 NIC 처리량 경고 기준 (Mbit/s, 0이면 생략)
+    NAS_IO_NIC_DROP_WARN: float = 10.0  # NIC 드롭 경고 기준 (rx+tx 건/초, 0이면 생략, 오류는 1건이라도 경고)
+    NAS_RAID_POLL_ENABLED: bool = True  # RAID 재구축 중 진행률을 WebSocket으로 주기 전송
+    NAS_RAID_POLL_INTERVAL: float = 30.0  # 진행률 조회 간격 (초, mdstat만 조회)
+    
+    # 디스크 사용량 이력 / 가득 참 예측 (NAS 볼륨 + 로컬 디스크 공통)
+    DISK_HISTORY_PATH: str = "./disk_usage_history.json"  # 비우면 예측 없이 80/90% 기준만 적용
+    DISK_FORECAST_WARN_DAYS: float = 30.0  # 이 일수 이내 가득 참 예상 시 WARN
+    DISK_FORECAST_FAIL_DAYS: float = 7.0  # 이 일수 이내 가득 참 예상 시 FAIL
+    
+    # NAS 마운트 성능 벤치마크 (시스템 점검에 포함)
+    MOUNT_BENCH_ENABLED: bool = False
+    MOUNT_BENCH_PATH: str = "/mnt/nas"  # 측정 경로 (마운트 지점이어야 함)
+    MOUNT_BENCH_BUDGET_MB: int = 64  # 순차 쓰기/읽기 용량 (MB)
+    MOUNT_BENCH_META_OPS: int = 50  # stat/listdir/create/unlink 작업별 횟수
+    MOUNT_BENCH_HISTORY_PATH: str = "./mount_bench_history.json"  # 기준값(이전 실행 중앙값) 이력
+    MOUNT_BENCH_REGRESSION: float = 0.5  # 기준값 대비 저하 판정 비율 (처리량 50% 감소/지연 1.5배)
     
     # 카메라 설정
     CAMERA_BASE_IP: str = "192.168.1"
@@ -51,6 +96,48 @@ class Settings(BaseSettings):
     CAMERA_MEDIAMTX_BASE_PORT: int = 1111
     CAMERA_LOG_BASE_PATH: str = "/mnt/nas/logs"
     CAMERA_VIDEO_BASE_PATH: str = "/mnt/nas/cam"
+    CAMERA_LOG_ANALYTICS: bool = False  # 하루치 저장 로그 전체 통계 분석
+    CAMERA_LOG_TRANSPORT: str = "nfs"  # 저장 로그 읽기 경로 (nfs / sftp / auto)
+    CAMERA_LOG_NAS_PATH: str = ""  # NAS 안의 로그 경로 (SFTP용, 예: /volume1/logs)
+    CAMERA_LOG_READ_TIMEOUT: float = 5.0  # 로그 읽기 작업 1회 제한 시간 (초)
+    CAMERA_LOG_SWITCH_MS: float = 500.0  # auto: NFS 평균 지연이 넘으면 SFTP 우선 (ms)
+    CAMERA_LOG_COOLDOWN: float = 300.0  # 실패한 읽기 경로 제외 시간 (초)
+    CAMERA_DEEP_VERIFY: bool = False  # 최신 세그먼트 무결성 샘플링
+    CAMERA_VERIFY_FRAMES: int = 5  # 세그먼트당 샘플 프레임 수
+    CAMERA_VERIFY_WORKERS: int = 2  # 동시 디코딩 워커 수
+    CAMERA_VERIFY_CPU_BUDGET: float = 10.0  # 실행당 CPU 시간 예산 (초)
+    CAMERA_BLUR_VERIFY: bool = False  # 원본/블러 프레임 선명도 비교
+    CAMERA_BLUR_REGIONS: str = ""  # 블러 적용 영역 "x1,y1,x2,y2;..." (0~1, 비우면 화면 전체 기준)
+    CAMERA_BLUR_MAX_RATIO: float = 0.8  # 블러/원본 선명도 비율 기준 (이하이면 블러 적용)
+    CAMERA_FRAME_BACKEND: str = "opencv"  # opencv 또는 ffmpeg (축소 raw 프레임 파이프)
+    CAMERA_FFMPEG_PATH: str = "ffmpeg"
+    CAMERA_RTSP_TRANSPORT: str = "udp"  # ffmpeg 백엔드 기본 RTSP 전송 방식 (tcp/udp)
+    CAMERA_RTSP_TRANSPORT_OVERRIDES: str = ""  # 카메라별 전송 방식 "1:tcp,3:udp"
+    CAMERA_FFMPEG_WIDTH: int = 640  # ffmpeg 출력 프레임 크기
+    CAMERA_FFMPEG_HEIGHT: int = 360
+    CAMERA_FFMPEG_FPS: float = 0  # 출력 프레임레이트 제한 (0이면 제한 없음)
+    CAMERA_MEDIAMTX_API_ENABLED: bool = False  # MediaMTX 제어 API로 블러 스트림 상태 확인
+    CAMERA_MEDIAMTX_API_HOST: str = "127.0.0.1"
+    CAMERA_MEDIAMTX_API_BASE_PORT: int = 9997  # 카메라 1 인스턴스 API 포트 (카메라 N → +N-1)
+    CAMERA_MEDIAMTX_PATH: str = "live"
+    CAMERA_RTP_STATS: bool = False  # 원본 카메라 RTP 손실/지터 측정
+    CAMERA_RTP_WINDOW: float = 3.0  # 수신 구간 (초)
+    CAMERA_RTP_LOSS_WARN: float = 1.0  # 패킷 손실률 경고 기준 (%)
+    CAMERA_RTP_JITTER_WARN: float = 30.0  # 지터 경고 기준 (ms)
+    CAMERA_TCP_SWEEP_ENABLED: bool = True  # RTSP 점검 전 TCP 도달성 스윕
+    CAMERA_TCP_SWEEP_TIMEOUT: float = 0.4  # 대상별 TCP 연결 타임아웃 (초, 시간 초과 대상은 1회 재확인)
+    
+    # 녹화 공백 인덱스 설정
+    RECORDING_INDEX_PATH: str = "./recording_index.json"
+    RECORDING_SEGMENT_SECONDS: int = 300  # 세그먼트 길이 (초)
+    
+    # 카메라 상시 모니터 설정
+    CAMERA_MONITOR_ENABLED: bool = False
+    CAMERA_MONITOR_CAMERA_COUNT: int = 4
+    CAMERA_MONITOR_MODE: str = "grab"  # grab (연결 유지) 또는 reconnect (주기적 재연결)
+    CAMERA_MONITOR_INTERVAL: float = 5.0  # 스트림별 샘플 간격 (초)
+    CAMERA_MONITOR_DECODE_BUDGET: float = 4.0  # 전체 디코딩 예산 (초당 프레임 수)
+    CAMERA_MONITOR_MAX_AGE: float = 30.0  # 통계 유효 시간 (초)
     
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
@@ -64,6 +151,20 @@ class Settings(BaseSettings):
     TIMEOUT_SSH_CONNECTION: int = 15
     TIMEOUT_RTSP_CONNECTION: int = 10
     
+    # RTSP 적응형 타임아웃 (점검 이력의 지연 시간 p99 × 안전 계수)
+    CAMERA_TIMEOUT_ADAPTIVE: bool = True
+    CAMERA_TIMEOUT_FACTOR: float = 3.0
+    CAMERA_TIMEOUT_FLOOR: float = 2.0  # 최소 타임아웃 (초)
+    CAMERA_TIMEOUT_CAP: float = 20.0  # 최대 타임아웃 (초)
+    CAMERA_TIMEOUT_HISTORY_RUNS: int = 20  # 참조할 최근 카메라 점검 횟수
+    
+    # 회로 차단기 (연속 실패 대상은 TCP 연결 확인만 수행, 카메라/NAS 공통)
+    CIRCUIT_BREAKER_ENABLED: bool = False
+    CIRCUIT_BREAKER_PATH: str = "./circuit_breaker.json"
+    CIRCUIT_BREAKER_THRESHOLD: int = 3  # 차단까지 연속 실패 횟수
+    CIRCUIT_BREAKER_BACKOFF: float = 300.0  # 첫 확인까지 대기 (초, 실패할 때마다 2배)
+    CIRCUIT_BREAKER_MAX_BACKOFF: float = 21600.0  # 확인 간격 상한 (초)
+    
     # 스케줄러 설정
     SCHEDULER_ENABLED: bool = False  # 자동 점검 비활성화
     SCHEDULER_CRON_HOUR: int = 1  # 매일 새벽 1시
@@ -10,9 +10,14 @@ import logging
 
 from app.core.config import settings
 from app.core.database import init_db
-from app.api import checks, history, config
+from app.api import checks, history, config, recordings, ups
 from app.core.websocket import manager
 from app.services.scheduler import scheduler_service
+from app.services.camera_monitor import camera_monitor_service
+from app.services.raid_monitor import raid_monitor_service
+from app.services.ups_poller import ups_poller_service
+from utils.ssh_pool import ssh_pool
+from checks.nut_client import close_shared_clients
 
 # 로거 설정
 logging.basicConfig(
@@ -37,6 +42,19 @@ async def lifespan(app: FastAPI):
         scheduler_service.start()
         logger.info("스케줄러 시작됨")
     
+    # SSH 연결 풀 설정 (NAS 점검 간 트랜스포트 재사용)
+    ssh_pool.keepalive = settings.SSH_POOL_KEEPALIVE
+    ssh_pool.idle_timeout = settings.SSH_POOL_IDLE_TIMEOUT
+    
+    # 카메라 상시 모니터 시작
+    if settings.CAMERA_MONITOR_ENABLED:
+        camera_monitor_service.start()
+        logger.info("카메라 모니터 시작됨")
+    
+    # UPS 원격 측정 폴러 시작
+    if settings.UPS_POLL_ENABLED:
+        ups_poller_service.start()
+    
     yield
     
     # 종료 시
@@ -47,6 +65,23 @@ async def lifespan(app: FastAPI):
         scheduler_service.shutdown()
         logger.info("스케줄러 종료됨")
     
+    # 카메라 상시 모니터 종료
+    if settings.CAMERA_MONITOR_ENABLED:
+        camera_monitor_service.shutdown()
+        logger.info("카메라 모니터 종료됨")
+    
+    # RAID 재구축 진행률 모니터 종료 (SSH 연결 풀보다 먼저)
+    await raid_monitor_service.shutdown()
+    
+    # UPS 폴러 종료 (완료된 집계 구간 저장, upsd 연결 종료보다 먼저)
+    await ups_poller_service.shutdown()
+    
+    # SSH 연결 풀 종료
+    ssh_pool.close_all()
+    
+    # upsd 유지 연결 종료
+    close_shared_clients()
+    
     # WebSocket 연결 종료
     for connection in list(manager.active_connections):
         manager.disconnect(connection)
@@ -74,6 +109,8 @@ app.add_middleware(
 app.include_router(checks.router, prefix="/api/checks", tags=["checks"])
 app.include_router(history.router, prefix="/api/history", tags=["history"])
 app.include_router(config.router, prefix="/api/config", tags=["config"])
+app.include_router(recordings.router, prefix="/api/recordings", tags=["recordings"])
+app.include_router(ups.router, prefix="/api/ups", tags=["ups"])
 
 # 정적 파일 제공 (프론트엔드)
 try:
@@ -0,0 +1,30 @@
+"""
+UPS 원격 측정 집계 데이터베이스 모델
+"""
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from app.core.database import Base
+
+
+class UpsTelemetry(Base):
+    """UPS 측정값 구간 집계 테이블 (링 버퍼에서 밀려나기 전 다운샘플링해 저장)"""
+    __tablename__ = "ups_telemetry"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    ups = Column(String(100), nullable=False, index=True)  # UPS 이름 (ups@host)
+    bucket_start = Column(DateTime, nullable=False, index=True)  # 구간 시작 시각
+    bucket_seconds = Column(Integer, nullable=False)  # 구간 길이 (초)
+    samples = Column(Integer, nullable=False)  # 구간 샘플 수
+    status = Column(String(100), nullable=True)  # 구간 중 나타난 상태 플래그 (예: "OL OB DISCHRG")
+    status_flags = Column(Integer, nullable=False, default=0)
+    stats = Column(JSON, nullable=True)  # {필드: {'avg', 'min', 'max'}}
+    
+    def to_dict(self):
+        """딕셔너리로 변환 (시계열 API 점 형식)"""
+        return {
+            "timestamp": self.bucket_start.timestamp(),
+            "time": self.bucket_start.isoformat(),
+            "samples": self.samples,
+            "status": self.status,
+            "status_flags": self.status_flags,
+            **(self.stats or {})
+        }
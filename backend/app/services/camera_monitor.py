@@ -0,0 +1,70 @@
+"""
+카메라 상시 모니터 서비스
+웹 백엔드 생명주기 동안 스트림별 저속 리더를 유지
+"""
+import logging
+from typing import Optional
+
+from app.core.config import settings
+from checks.camera_monitor import CameraMonitor
+
+logger = logging.getLogger(__name__)
+
+
+class CameraMonitorService:
+    """카메라 상시 모니터 서비스 클래스"""
+    
+    def __init__(self):
+        self.monitor: Optional[CameraMonitor] = None
+        self.is_started = False
+    
+    def start(self):
+        """모니터 시작"""
+        if self.is_started:
+            logger.warning("카메라 모니터가 이미 시작되었습니다.")
+            return
+        
+        if not settings.CAMERA_MONITOR_ENABLED:
+            logger.info("카메라 모니터가 비활성화되어 있습니다.")
+            return
+        
+        camera_config = {
+            'base_ip': settings.CAMERA_BASE_IP,
+            'start_ip': settings.CAMERA_START_IP,
+            'username': settings.CAMERA_USER,
+            'password': settings.CAMERA_PASS,
+            'rtsp_path': settings.CAMERA_RTSP_PATH,
+            'rtsp_port': str(settings.CAMERA_RTSP_PORT),
+            'mediamtx_base_port': str(settings.CAMERA_MEDIAMTX_BASE_PORT),
+            'rtsp_transport': settings.CAMERA_RTSP_TRANSPORT,
+            'rtsp_transport_overrides': settings.CAMERA_RTSP_TRANSPORT_OVERRIDES,
+            'ffmpeg_path': settings.CAMERA_FFMPEG_PATH,
+            'ffmpeg_width': str(settings.CAMERA_FFMPEG_WIDTH),
+            'ffmpeg_height': str(settings.CAMERA_FFMPEG_HEIGHT),
+            'ffmpeg_fps': str(settings.CAMERA_FFMPEG_FPS)
+        }
+        
+        self.monitor = CameraMonitor(
+            camera_count=settings.CAMERA_MONITOR_CAMERA_COUNT,
+            camera_config=camera_config,
+            mode=settings.CAMERA_MONITOR_MODE,
+            interval=settings.CAMERA_MONITOR_INTERVAL,
+            decode_budget=settings.CAMERA_MONITOR_DECODE_BUDGET,
+            max_age=settings.CAMERA_MONITOR_MAX_AGE,
+            frame_backend=settings.CAMERA_FRAME_BACKEND
+        )
+        self.monitor.start()
+        self.is_started = True
+    
+    def shutdown(self):
+        """모니터 종료"""
+        if not self.is_started:
+            return
+        
+        self.monitor.stop()
+        self.monitor = None
+        self.is_started = False
+
+
+# 전역 인스턴스
+camera_monitor_service = CameraMonitorService()
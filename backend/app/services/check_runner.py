@@ -13,6 +13,7 @@ from app.core.config import settings
 from app.core.websocket import manager
 from app.models.check_history import CheckHistory
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, desc
 
 # 기존 체크 모듈 import
 import sys
@@ -26,7 +27,10 @@ if checks_dir not in sys.path:
 from checks.ups_check import check_ups_status
 from checks.camera_check import check_cameras
 from checks.nas_check import check_nas_status
+from checks.nas_fleet import check_nas_fleet_async, fleet_options
 from checks.system_check import check_system_status
+from app.services.camera_monitor import camera_monitor_service
+from app.services.raid_monitor import raid_monitor_service
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +94,7 @@ class CheckRunner:
                     if check_type == 'ups':
                         result = await self._run_ups_check()
                     elif check_type == 'camera':
-                        result = await self._run_camera_check(camera_count, auto_mode)
+                        result = await self._run_camera_check(camera_count, auto_mode, db)
                     elif check_type == 'nas':
                         result = await self._run_nas_check()
                     elif check_type == 'system':
@@ -169,16 +173,29 @@ class CheckRunner:
             None,
             check_ups_status,
             settings.NUT_UPS_NAME,
-            settings.NAS_IP
+            settings.NAS_IP,
+            {
+                'host': settings.NUT_HOST,
+                'port': str(settings.NUT_PORT),
+                'timeout': str(settings.NUT_TIMEOUT),
+                'username': settings.NUT_USER,
+                'password': settings.NUT_PASSWORD,
+                'targets': settings.NUT_UPS_TARGETS
+            }
         )
         
         await manager.send_progress("ups", 100, f"UPS 점검 완료: {result.get('status', 'UNKNOWN')}")
         return result
     
-    async def _run_camera_check(self, camera_count: int, auto_mode: bool) -> Dict[str, Any]:
+    async def _run_camera_check(self, camera_count: int, auto_mode: bool, db: AsyncSession) -> Dict[str, Any]:
         """카메라 점검 실행"""
         await manager.send_progress("camera", 0, f"카메라 {camera_count}대 점검 시작...")
         
+        # 과거 RTSP 지연 시간 (적응형 타임아웃용)
+        latency_history = None
+        if settings.CAMERA_TIMEOUT_ADAPTIVE:
+            latency_history = await self._load_camera_latency_history(db)
+        
         camera_config = {
             'base_ip': settings.CAMERA_BASE_IP,
             'start_ip': settings.CAMERA_START_IP,
@@ -188,7 +205,47 @@ class CheckRunner:
             'rtsp_port': str(settings.CAMERA_RTSP_PORT),
             'mediamtx_base_port': str(settings.CAMERA_MEDIAMTX_BASE_PORT),
             'log_base_path': settings.CAMERA_LOG_BASE_PATH,
-            'video_base_path': settings.CAMERA_VIDEO_BASE_PATH
+            'video_base_path': settings.CAMERA_VIDEO_BASE_PATH,
+            'timeout_factor': str(settings.CAMERA_TIMEOUT_FACTOR),
+            'timeout_floor': str(settings.CAMERA_TIMEOUT_FLOOR),
+            'timeout_cap': str(settings.CAMERA_TIMEOUT_CAP),
+            'timeout_default': str(settings.TIMEOUT_RTSP_CONNECTION),
+            'tcp_sweep': str(settings.CAMERA_TCP_SWEEP_ENABLED),
+            'tcp_sweep_timeout': str(settings.CAMERA_TCP_SWEEP_TIMEOUT),
+            'log_analytics': str(settings.CAMERA_LOG_ANALYTICS),
+            'log_transport': settings.CAMERA_LOG_TRANSPORT,
+            'log_nas_path': settings.CAMERA_LOG_NAS_PATH,
+            'log_read_timeout': str(settings.CAMERA_LOG_READ_TIMEOUT),
+            'log_switch_ms': str(settings.CAMERA_LOG_SWITCH_MS),
+            'log_cooldown': str(settings.CAMERA_LOG_COOLDOWN),
+            'nas_ip': settings.NAS_IP,
+            'nas_user': settings.NAS_USER,
+            'nas_password': settings.NAS_PASSWORD,
+            'nas_port': str(settings.NAS_PORT),
+            'ssh_pool': str(settings.NAS_SSH_POOL),
+            'deep_verify': str(settings.CAMERA_DEEP_VERIFY),
+            'verify_frames': str(settings.CAMERA_VERIFY_FRAMES),
+            'verify_workers': str(settings.CAMERA_VERIFY_WORKERS),
+            'verify_cpu_budget': str(settings.CAMERA_VERIFY_CPU_BUDGET),
+            'blur_verify': str(settings.CAMERA_BLUR_VERIFY),
+            'blur_regions': settings.CAMERA_BLUR_REGIONS,
+            'blur_max_ratio': str(settings.CAMERA_BLUR_MAX_RATIO),
+            'frame_backend': settings.CAMERA_FRAME_BACKEND,
+            'ffmpeg_path': settings.CAMERA_FFMPEG_PATH,
+            'rtsp_transport': settings.CAMERA_RTSP_TRANSPORT,
+            'rtsp_transport_overrides': settings.CAMERA_RTSP_TRANSPORT_OVERRIDES,
+            'ffmpeg_width': str(settings.CAMERA_FFMPEG_WIDTH),
+            'ffmpeg_height': str(settings.CAMERA_FFMPEG_HEIGHT),
+            'ffmpeg_fps': str(settings.CAMERA_FFMPEG_FPS),
+            'mediamtx_api': str(settings.CAMERA_MEDIAMTX_API_ENABLED),
+            'mediamtx_api_host': settings.CAMERA_MEDIAMTX_API_HOST,
+            'mediamtx_api_base_port': str(settings.CAMERA_MEDIAMTX_API_BASE_PORT),
+            'mediamtx_path': settings.CAMERA_MEDIAMTX_PATH,
+            'rtp_stats': str(settings.CAMERA_RTP_STATS),
+            'rtp_window': str(settings.CAMERA_RTP_WINDOW),
+            'rtp_loss_warn': str(settings.CAMERA_RTP_LOSS_WARN),
+            'rtp_jitter_warn': str(settings.CAMERA_RTP_JITTER_WARN),
+            **self._breaker_config()
         }
         
         # 동기 함수를 비동기로 실행
@@ -198,12 +255,76 @@ class CheckRunner:
             check_cameras,
             camera_count,
             camera_config,
-            auto_mode
+            auto_mode,
+            camera_monitor_service.monitor,
+            latency_history
         )
         
         await manager.send_progress("camera", 100, f"카메라 점검 완료: {result.get('status', 'UNKNOWN')}")
         return result
     
+    async def _load_recent_results(self, db: AsyncSession, check_type: str, limit: int) -> List[Dict[str, Any]]:
+        """최근 점검 결과 조회 (최신순)"""
+        try:
+            query = (
+                select(CheckHistory.results)
+                .where(CheckHistory.check_type == check_type)
+                .order_by(desc(CheckHistory.timestamp))
+                .limit(limit)
+            )
+            rows = await db.execute(query)
+            return [results for results in rows.scalars().all() if results]
+        except Exception as e:
+            logger.warning(f"{check_type} 점검 이력 조회 실패: {e}")
+            return []
+    
+    async def _load_camera_latency_history(self, db: AsyncSession) -> Dict[str, Dict[str, Any]]:
+        """
+        점검 이력에서 스트림별 RTSP 지연 시간 수집
+        
+        Returns:
+            {키: {'open_ms': [...], 'first_frame_ms': [...], 'failures': n}}
+            키는 원본 카메라 IP 또는 "127.0.0.1:<MediaMTX 포트>"
+        """
+        history: Dict[str, Dict[str, Any]] = {}
+        
+        for results in await self._load_recent_results(db, 'camera', settings.CAMERA_TIMEOUT_HISTORY_RUNS):
+            for detail in results.get('details', []):
+                for stream_type, latency in (detail.get('latency') or {}).items():
+                    if stream_type == 'source':
+                        key = detail.get('ip')
+                    else:
+                        key = f"127.0.0.1:{detail.get('mediamtx_port')}"
+                    
+                    entry = history.setdefault(key, {'open_ms': [], 'first_frame_ms': [], 'failures': 0})
+                    if latency.get('success'):
+                        entry['open_ms'].append(latency.get('open_ms'))
+                        entry['first_frame_ms'].append(latency.get('first_frame_ms'))
+                    else:
+                        entry['failures'] += 1
+        
+        return history
+    
+    @staticmethod
+    def _breaker_config() -> Dict[str, str]:
+        """회로 차단기 설정 (카메라/NAS 점검 설정에 공통으로 추가)"""
+        return {
+            'circuit_breaker': str(settings.CIRCUIT_BREAKER_ENABLED),
+            'breaker_path': settings.CIRCUIT_BREAKER_PATH,
+            'breaker_threshold': str(settings.CIRCUIT_BREAKER_THRESHOLD),
+            'breaker_backoff': str(settings.CIRCUIT_BREAKER_BACKOFF),
+            'breaker_max_backoff': str(settings.CIRCUIT_BREAKER_MAX_BACKOFF)
+        }
+    
+    @staticmethod
+    def _disk_forecast_config() -> Dict[str, str]:
+        """디스크 사용량 이력/가득 참 예측 설정 (NAS/시스템 점검 공통)"""
+        return {
+            'disk_history_path': settings.DISK_HISTORY_PATH,
+            'disk_forecast_warn_days': str(settings.DISK_FORECAST_WARN_DAYS),
+            'disk_forecast_fail_days': str(settings.DISK_FORECAST_FAIL_DAYS)
+        }
+    
     async def _run_nas_check(self) -> Dict[str, Any]:
         """NAS 점검 실행"""
         await manager.send_progress("nas", 0, "NAS 연결 확인 중...")
@@ -212,9 +333,39 @@ class CheckRunner:
             'ip': settings.NAS_IP,
             'user': settings.NAS_USER,
             'password': settings.NAS_PASSWORD,
-            'port': str(settings.NAS_PORT)
+            'port': str(settings.NAS_PORT),
+            'ssh_pool': str(settings.NAS_SSH_POOL),
+            'nas_targets': settings.NAS_TARGETS,
+            'fleet_concurrency': str(settings.NAS_FLEET_CONCURRENCY),
+            'fleet_per_host': str(settings.NAS_FLEET_PER_HOST),
+            'fleet_host_timeout': str(settings.NAS_FLEET_HOST_TIMEOUT),
+            'smart': str(settings.NAS_SMART_ENABLED),
+            'smart_history_path': settings.NAS_SMART_HISTORY_PATH,
+            'smart_rate_window': str(settings.NAS_SMART_RATE_WINDOW),
+            'smart_rate_warn': str(settings.NAS_SMART_RATE_WARN),
+            'smart_temp_warn': str(settings.NAS_SMART_TEMP_WARN),
+            'io_sample': str(settings.NAS_IO_SAMPLE_ENABLED),
+            'io_interval': str(settings.NAS_IO_INTERVAL),
+            'io_util_warn': str(settings.NAS_IO_UTIL_WARN),
+            'io_await_warn': str(settings.NAS_IO_AWAIT_WARN),
+            'io_nic_util_warn': str(settings.NAS_IO_NIC_UTIL_WARN),
+            'io_nic_mbps_warn': str(settings.NAS_IO_NIC_MBPS_WARN),
+            'io_nic_drop_warn': str(settings.NAS_IO_NIC_DROP_WARN),
+            **self._breaker_config(),
+            **self._disk_forecast_config()
         }
         
+        # 다중 NAS: 이벤트 루프에서 바로 동시 점검 (SSH는 전용 스레드 풀에서 실행)
+        if settings.NAS_TARGETS.strip():
+            options = fleet_options(nas_config)
+            await manager.send_progress("nas", 10, f"NAS {len(options['targets'])}대 동시 점검 중...")
+            result = await check_nas_fleet_async(**options)
+            for target in options['targets']:
+                host_result = result['hosts'].get(target['name'], {})
+                self._watch_raid_rebuild(target, host_result)
+            await manager.send_progress("nas", 100, f"NAS 점검 완료: {result.get('status', 'UNKNOWN')}")
+            return result
+        
         # 동기 함수를 비동기로 실행
         loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(
@@ -223,16 +374,39 @@ class CheckRunner:
             nas_config
         )
         
+        self._watch_raid_rebuild({
+            'name': settings.NAS_IP,
+            'host': settings.NAS_IP,
+            'user': settings.NAS_USER,
+            'password': settings.NAS_PASSWORD,
+            'port': result.get('connected_port') or settings.NAS_PORT
+        }, result)
         await manager.send_progress("nas", 100, f"NAS 점검 완료: {result.get('status', 'UNKNOWN')}")
         return result
     
+    @staticmethod
+    def _watch_raid_rebuild(target: Dict[str, Any], result: Dict[str, Any]):
+        """RAID 재구축/재동기화 중이면 진행률 모니터 시작 (이후 진행률은 WebSocket raid_progress로 전송)"""
+        devices = (result.get('storage') or {}).get('raid_sync') or {}
+        if devices:
+            raid_monitor_service.watch(target, devices)
+    
     async def _run_system_check(self) -> Dict[str, Any]:
         """시스템 점검 실행"""
         await manager.send_progress("system", 0, "시스템 점검 시작...")
         
         # 동기 함수를 비동기로 실행
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, check_system_status)
+        system_config = {
+            **self._disk_forecast_config(),
+            'mount_bench': str(settings.MOUNT_BENCH_ENABLED),
+            'mount_bench_path': settings.MOUNT_BENCH_PATH,
+            'mount_bench_budget_mb': str(settings.MOUNT_BENCH_BUDGET_MB),
+            'mount_bench_meta_ops': str(settings.MOUNT_BENCH_META_OPS),
+            'mount_bench_history_path': settings.MOUNT_BENCH_HISTORY_PATH,
+            'mount_bench_regression': str(settings.MOUNT_BENCH_REGRESSION)
+        }
+        result = await loop.run_in_executor(None, check_system_status, system_config)
         
         await manager.send_progress("system", 100, f"시스템 점검 완료: {result.get('status', 'UNKNOWN')}")
         return result
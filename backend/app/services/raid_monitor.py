@@ -0,0 +1,119 @@
+"""
+RAID 재구축 진행률 모니터 서비스
+NAS 점검에서 재구축/재동기화가 감지되면 끝날 때까지 /proc/mdstat만 주기적으로 조회해
+WebSocket으로 진행률(raid_progress)을 전송 (전체 NAS 점검을 다시 실행하지 않음)
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+from app.core.websocket import manager
+from checks.nas_check import poll_raid_progress, REBUILD_ACTIONS
+from utils.ssh_pool import ssh_pool
+
+logger = logging.getLogger(__name__)
+
+# 연속 조회 실패 시 모니터 중단 기준
+MAX_POLL_FAILURES = 5
+
+
+class RaidMonitorService:
+    """RAID 재구축 진행률 모니터 서비스 클래스"""
+
+    def __init__(self):
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.latest: Dict[str, Dict[str, Any]] = {}
+
+    def watch(self, target: Dict[str, Any], devices: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        재구축 중인 NAS 진행률 모니터 시작 (호스트별 1개, 이미 모니터 중이면 무시)
+
+        Args:
+            target: {'name', 'host', 'user', 'password', 'port'}
+            devices: 점검에서 파싱한 동기화 진행 상황 (storage['raid_sync'])
+
+        Returns:
+            새로 시작했으면 True
+        """
+        if not settings.NAS_RAID_POLL_ENABLED:
+            return False
+
+        rebuilding = {device: sync for device, sync in devices.items() if sync['action'] in REBUILD_ACTIONS}
+        if not rebuilding:
+            return False
+
+        name = target['name']
+        self.latest[name] = self._snapshot(target, rebuilding)
+        task = self.tasks.get(name)
+        if task is not None and not task.done():
+            return False
+
+        logger.info(f"RAID 재구축 진행률 모니터 시작: {name} ({', '.join(rebuilding)})")
+        self.tasks[name] = asyncio.create_task(self._poll(target))
+        return True
+
+    @staticmethod
+    def _snapshot(target: Dict[str, Any], devices: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'host': target['name'],
+            'address': target['host'],
+            'devices': devices,
+            'finished': not devices,
+            'timestamp': datetime.now()
+        }
+
+    async def _poll(self, target: Dict[str, Any]):
+        """재구축이 끝날 때까지 진행률 조회 + 브로드캐스트"""
+        name = target['name']
+        pool = ssh_pool if settings.NAS_SSH_POOL else None
+        loop = asyncio.get_event_loop()
+        failures = 0
+
+        try:
+            while True:
+                await asyncio.sleep(settings.NAS_RAID_POLL_INTERVAL)
+
+                progress = await loop.run_in_executor(None, poll_raid_progress, target, pool)
+                if not progress['success']:
+                    failures += 1
+                    logger.warning(f"RAID 진행률 조회 실패 ({name}, {failures}회): {progress['error']}")
+                    if failures >= MAX_POLL_FAILURES:
+                        logger.error(f"RAID 진행률 모니터 중단 ({name}): 연속 {failures}회 조회 실패")
+                        break
+                    continue
+                failures = 0
+
+                rebuilding = {device: sync for device, sync in progress['devices'].items()
+                              if sync['action'] in REBUILD_ACTIONS}
+                snapshot = self._snapshot(target, rebuilding)
+                self.latest[name] = snapshot
+                await manager.broadcast({"type": "raid_progress", **snapshot})
+
+                if not rebuilding:
+                    logger.info(f"RAID 재구축 완료: {name}")
+                    break
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.tasks.pop(name, None)
+
+    def get_progress(self, name: Optional[str] = None) -> Dict[str, Any]:
+        """최근 진행률 (name이 없으면 전체)"""
+        if name is not None:
+            return self.latest.get(name, {})
+        return dict(self.latest)
+
+    async def shutdown(self):
+        """모든 모니터 종료"""
+        tasks = list(self.tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self.tasks.clear()
+
+
+# 전역 인스턴스
+raid_monitor_service = RaidMonitorService()
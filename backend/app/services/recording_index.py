@@ -0,0 +1,13 @@
+"""
+녹화 공백 인덱스 서비스
+NAS 영상 폴더의 카메라별 세그먼트 타임라인을 프로세스 전역으로 유지
+"""
+from app.core.config import settings
+from checks.video_index import RecordingIndex
+
+# 전역 인스턴스 (인덱스 파일에서 이전 상태를 불러와 증분 갱신)
+recording_index = RecordingIndex(
+    video_base_path=settings.CAMERA_VIDEO_BASE_PATH,
+    index_path=settings.RECORDING_INDEX_PATH,
+    segment_seconds=settings.RECORDING_SEGMENT_SECONDS
+)
@@ -0,0 +1,161 @@
+"""
+UPS 원격 측정 폴러 서비스
+웹 백엔드 생명주기 동안 upsd(TCP 3493)를 주기적으로 조회해 링 버퍼(ups_telemetry)에 기록하고,
+완료된 구간을 다운샘플링해 DB(ups_telemetry 테이블)에 저장
+UPS 점검은 최근 샘플을 읽으므로 점검마다 upsd에 다시 질의하지 않음
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Any, List
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.ups_telemetry import UpsTelemetry
+from checks.nut_client import NUTError, shared_client
+from checks.ups_check import ups_targets_from_config
+from checks.ups_telemetry import ups_telemetry, SERIES_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 연속 실패 시 경고 로그 간격 (매 회 기록하지 않음)
+FAILURE_LOG_EVERY = 60
+
+
+class UpsPollerService:
+    """UPS 원격 측정 폴러 서비스 클래스"""
+
+    def __init__(self):
+        self.targets: List[Dict[str, Any]] = []
+        self.tasks: List[asyncio.Task] = []
+        self.flushed_until: Dict[str, float] = {}
+        self.is_started = False
+
+    @staticmethod
+    def nut_config() -> Dict[str, str]:
+        return {
+            'host': settings.NUT_HOST,
+            'port': str(settings.NUT_PORT),
+            'targets': settings.NUT_UPS_TARGETS
+        }
+
+    def start(self):
+        """폴러 시작 (UPS 대상별 조회 작업 + 집계 저장 작업)"""
+        if self.is_started:
+            logger.warning("UPS 폴러가 이미 시작되었습니다.")
+            return
+
+        if not settings.UPS_POLL_ENABLED:
+            logger.info("UPS 폴러가 비활성화되어 있습니다.")
+            return
+
+        ups_telemetry.capacity = settings.UPS_BUFFER_SIZE
+        # 점검은 폴링 3회 이내의 샘플만 사용 (그보다 오래되면 upsd 직접 조회)
+        ups_telemetry.max_age = settings.UPS_POLL_INTERVAL * 3
+
+        self.targets = []
+        for target in ups_targets_from_config(settings.NUT_UPS_NAME, self.nut_config()):
+            if target.get('error'):
+                logger.error(f"UPS 폴러 대상 제외: {target['error']}")
+                continue
+            self.targets.append(target)
+        self.tasks = [asyncio.create_task(self._poll(target)) for target in self.targets]
+        self.tasks.append(asyncio.create_task(self._flush_loop()))
+        self.is_started = True
+        logger.info(f"UPS 폴러 시작: {', '.join(target['name'] for target in self.targets)} "
+                    f"({settings.UPS_POLL_INTERVAL:g}초 간격)")
+
+    async def _poll(self, target: Dict[str, Any]):
+        """UPS 1대 주기 조회 (연결 유지, LIST VAR 1회)"""
+        client = shared_client(
+            target['host'], target['port'],
+            timeout=settings.NUT_TIMEOUT,
+            username=settings.NUT_USER or None,
+            password=settings.NUT_PASSWORD or None
+        )
+        loop = asyncio.get_event_loop()
+        failures = 0
+
+        try:
+            while True:
+                try:
+                    variables = await loop.run_in_executor(None, client.list_vars, target['ups'])
+                    ups_telemetry.record(target['name'], variables)
+                    if failures:
+                        logger.info(f"UPS 조회 복구: {target['name']} ({failures}회 실패 후)")
+                    failures = 0
+                except NUTError as e:
+                    ups_telemetry.record_error(target['name'], str(e))
+                    if failures % FAILURE_LOG_EVERY == 0:
+                        logger.warning(f"UPS 조회 실패 ({target['name']}): {e}")
+                    failures += 1
+                await asyncio.sleep(settings.UPS_POLL_INTERVAL)
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush_loop(self):
+        """완료된 집계 구간을 주기적으로 DB에 저장"""
+        try:
+            while True:
+                await asyncio.sleep(settings.UPS_FLUSH_INTERVAL)
+                try:
+                    await self.flush()
+                except Exception as e:
+                    logger.error(f"UPS 측정값 저장 실패: {e}")
+        except asyncio.CancelledError:
+            pass
+
+    async def flush(self) -> int:
+        """
+        완료된 구간(현재 진행 중인 구간 제외)을 집계해 저장
+
+        Returns:
+            저장한 행 수
+        """
+        step = settings.UPS_AGGREGATE_SECONDS
+        current_bucket = (datetime.now().timestamp() // step) * step
+        rows = []
+        flushed = {}
+        for target in self.targets:
+            name = target['name']
+            since = self.flushed_until.get(name)
+            series = ups_telemetry.series(name, since=since, until=current_bucket, step=step)
+            for point in series['points']:
+                rows.append(UpsTelemetry(
+                    ups=name,
+                    bucket_start=datetime.fromtimestamp(point['timestamp']),
+                    bucket_seconds=step,
+                    samples=point['samples'],
+                    status=point['status'],
+                    status_flags=point['status_flags'],
+                    stats={field: point[field] for field in SERIES_FIELDS}
+                ))
+            if series['points']:
+                flushed[name] = current_bucket
+
+        if rows:
+            async with AsyncSessionLocal() as session:
+                session.add_all(rows)
+                await session.commit()
+        # 저장에 성공한 구간만 완료 처리 (실패하면 다음 주기에 다시 저장)
+        self.flushed_until.update(flushed)
+        return len(rows)
+
+    async def shutdown(self):
+        """폴러 종료 (완료된 구간 저장 후 작업 취소)"""
+        if not self.is_started:
+            return
+
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks.clear()
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"UPS 측정값 저장 실패: {e}")
+        self.is_started = False
+
+
+# 전역 인스턴스
+ups_poller_service = UpsPollerService()
@@ -0,0 +1,131 @@
+"""
+블러 처리 검증 모듈
+원본 스트림(source_url)과 블러 스트림(mediamtx_url) 프레임의 선명도를 비교하여
+블러 엔진이 원본을 그대로 통과시키는 경우를 감지
+- 축소 그레이스케일 이미지의 Laplacian 분산 (전체 + 격자 영역별, NumPy 벡터 연산)
+- 카메라당 CPU 비용 약 50ms 이내
+"""
+import cv2
+import time
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+# 비교용 축소 크기 (16:9 기준, 격자로 나누어 떨어지도록)
+ANALYSIS_SIZE = (320, 176)
+GRID = (4, 4)  # (열, 행)
+
+# 블러 스트림 선명도 / 원본 선명도 비율이 이 값보다 낮아야 블러 처리된 것으로 판단
+DEFAULT_MAX_RATIO = 0.8
+# 원본 선명도가 이 값보다 낮은 영역(단색 벽, 하늘 등)은 판단에서 제외
+MIN_SOURCE_VARIANCE = 5.0
+
+
+def _prepare(frame: np.ndarray) -> np.ndarray:
+    """그레이스케일 + 축소 (INTER_AREA)"""
+    if frame.ndim == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(frame, ANALYSIS_SIZE, interpolation=cv2.INTER_AREA)
+
+
+def sharpness_map(frame: np.ndarray) -> Dict[str, Any]:
+    """
+    선명도 지표 계산
+
+    Returns:
+        {'whole': 전체 Laplacian 분산, 'grid': (행, 열) 영역별 분산 배열}
+    """
+    gray = _prepare(frame)
+    lap = cv2.Laplacian(gray, cv2.CV_32F)
+
+    cols, rows = GRID
+    height, width = lap.shape
+    cell_h, cell_w = height // rows, width // cols
+    # (행, 셀높이, 열, 셀너비) 형태로 재배열 → 영역별 분산을 한 번에 계산
+    cells = lap[:cell_h * rows, :cell_w * cols].reshape(rows, cell_h, cols, cell_w)
+    grid = cells.var(axis=(1, 3))
+
+    return {'whole': float(lap.var()), 'grid': grid}
+
+
+def region_cells(region: List[float]) -> List[tuple]:
+    """정규화 좌표 영역 [x1, y1, x2, y2] (0~1)에 걸치는 격자 셀 (행, 열) 목록"""
+    cols, rows = GRID
+    x1, y1, x2, y2 = region
+    col_range = range(int(x1 * cols), max(int(x1 * cols) + 1, int(np.ceil(x2 * cols))))
+    row_range = range(int(y1 * rows), max(int(y1 * rows) + 1, int(np.ceil(y2 * rows))))
+    return [(r, c) for r in row_range for c in col_range if r < rows and c < cols]
+
+
+def compare_blur(source_frame: np.ndarray, blurred_frame: np.ndarray,
+                 regions: Optional[List[List[float]]] = None,
+                 max_ratio: float = DEFAULT_MAX_RATIO) -> Dict[str, Any]:
+    """
+    원본/블러 프레임 선명도 비교
+
+    Args:
+        source_frame: 원본 스트림 프레임 (BGR)
+        blurred_frame: 블러 스트림 프레임 (BGR)
+        regions: 블러가 적용되어야 하는 영역 목록 (정규화 좌표 [x1, y1, x2, y2])
+                 None이면 화면 어느 곳에서도 선명도가 줄지 않았을 때 FAIL
+        max_ratio: 블러 처리로 인정할 최대 선명도 비율
+
+    Returns:
+        {'status': PASS/FAIL/SKIP, 'whole_ratio', 'min_region_ratio', 'region_ratios', 'cpu_ms', 'reason'}
+    """
+    cpu_start = time.thread_time()
+
+    source = sharpness_map(source_frame)
+    blurred = sharpness_map(blurred_frame)
+
+    # 영역별 선명도 비율 (원본이 평탄한 영역은 NaN 처리)
+    valid = source['grid'] >= MIN_SOURCE_VARIANCE
+    ratios = np.full(source['grid'].shape, np.nan, dtype=np.float64)
+    np.divide(blurred['grid'], source['grid'], out=ratios, where=valid)
+
+    whole_ratio = blurred['whole'] / source['whole'] if source['whole'] >= MIN_SOURCE_VARIANCE else None
+
+    result = {
+        'status': 'UNKNOWN',
+        'whole_ratio': round(whole_ratio, 3) if whole_ratio is not None else None,
+        'min_region_ratio': None,
+        # 평탄한 영역(NaN)은 None (JSON 이력 저장/응답에서 NaN 불가)
+        'region_ratios': [[None if np.isnan(v) else round(float(v), 3) for v in row] for row in ratios],
+        'cpu_ms': None,
+        'reason': None
+    }
+
+    if not valid.any():
+        result['status'] = 'SKIP'
+        result['reason'] = '원본 영상에 비교할 디테일이 없음 (야간/가림 등)'
+    elif regions:
+        # 지정 영역마다 선명도가 충분히 낮아졌는지 확인
+        failed_regions = []
+        region_results = []
+        for region in regions:
+            cell_ratios = [ratios[r, c] for r, c in region_cells(region) if valid[r, c]]
+            region_ratio = float(np.mean(cell_ratios)) if cell_ratios else None
+            region_results.append(round(region_ratio, 3) if region_ratio is not None else None)
+            if region_ratio is not None and region_ratio > max_ratio:
+                failed_regions.append(region)
+        result['expected_region_ratios'] = region_results
+        known = [ratio for ratio in region_results if ratio is not None]
+        result['min_region_ratio'] = min(known) if known else None
+        if not known:
+            result['status'] = 'SKIP'
+            result['reason'] = '지정한 블러 영역에 비교할 디테일이 없음 (평탄한 영역)'
+        elif failed_regions:
+            result['status'] = 'FAIL'
+            result['reason'] = f"블러 영역 {len(failed_regions)}곳의 선명도가 원본과 비슷함 (기준 {max_ratio} 이하)"
+        else:
+            result['status'] = 'PASS'
+    else:
+        min_ratio = float(np.nanmin(ratios))
+        result['min_region_ratio'] = round(min_ratio, 3)
+        if min_ratio > max_ratio:
+            result['status'] = 'FAIL'
+            result['reason'] = f"블러 스트림이 원본보다 덜 선명한 영역이 없음 (최소 비율 {min_ratio:.2f}, 블러 미적용 의심)"
+        else:
+            result['status'] = 'PASS'
+
+    result['cpu_ms'] = round((time.thread_time() - cpu_start) * 1000, 1)
+    return result
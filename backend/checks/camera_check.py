@@ -10,9 +10,20 @@ import gc
 import os
 import re
 import glob
+import math
+from urllib.parse import urlsplit
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
+from .camera_sweep import sweep_camera_ports
+from .camera_log_stats import analyze_save_log
+from .segment_verify import verify_segments
+from .blur_verify import compare_blur
+from .ffmpeg_pipe import ffmpeg_available, parse_transport_overrides, test_ffmpeg_connection
+from .rtp_stats import measure_rtp
+from .mediamtx_api import query_mediamtx_paths
+from .log_transport import log_transport_from_config, TransportError
+
 # OpenCV/FFmpeg 에러 메시지 완전히 숨기기 (H.264, HEVC 등 모든 디코딩 경고 제거)
 os.environ['OPENCV_FFMPEG_CAPTURE_OPTIONS'] = 'rtsp_transport;udp|fflags;nobuffer'
 os.environ['OPENCV_LOG_LEVEL'] = 'SILENT'
@@ -59,29 +70,54 @@ def generate_camera_urls(
     return cameras
 
 
-def test_camera_connection(rtsp_url: str, timeout: int = 10) -> Dict[str, Any]:
-    """카메라 연결 테스트 (OpenCV)"""
+def test_camera_connection(rtsp_url: str, timeout: float = 10,
+                           read_timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    카메라 연결 테스트 (OpenCV)
+    
+    Args:
+        rtsp_url: RTSP URL
+        timeout: 연결(open) 타임아웃 (초)
+        read_timeout: 첫 프레임 읽기 타임아웃 (초, None이면 timeout과 동일)
+    
+    Returns:
+        연결 결과 (open_ms, first_frame_ms 지연 시간 포함)
+    """
+    if read_timeout is None:
+        read_timeout = timeout
+    
     cap = None
+    open_ms = None
+    start = time.monotonic()
     try:
-        cap = cv2.VideoCapture(rtsp_url)
+        cap = cv2.VideoCapture()
         
-        # 연결 타임아웃 설정
-        cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, timeout * 1000)
-        cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, timeout * 1000)
+        # 연결 타임아웃 설정 (open 이전에 지정해야 적용됨)
+        cap.open(rtsp_url, cv2.CAP_ANY, [
+            cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, int(timeout * 1000),
+            cv2.CAP_PROP_READ_TIMEOUT_MSEC, int(read_timeout * 1000)
+        ])
+        open_ms = (time.monotonic() - start) * 1000
         
         if not cap.isOpened():
             return {
                 'success': False,
-                'error': 'Failed to open RTSP stream'
+                'error': 'Failed to open RTSP stream',
+                'open_ms': round(open_ms, 1),
+                'first_frame_ms': None
             }
         
         # 첫 프레임 읽기
+        read_start = time.monotonic()
         ret, frame = cap.read()
+        first_frame_ms = (time.monotonic() - read_start) * 1000
         
         if not ret or frame is None:
             return {
                 'success': False,
-                'error': 'Failed to read frame'
+                'error': 'Failed to read frame',
+                'open_ms': round(open_ms, 1),
+                'first_frame_ms': round(first_frame_ms, 1)
             }
         
         # 프레임 정보
@@ -91,20 +127,96 @@ def test_camera_connection(rtsp_url: str, timeout: int = 10) -> Dict[str, Any]:
             'success': True,
             'width': width,
             'height': height,
-            'frame': frame
+            'frame': frame,
+            'open_ms': round(open_ms, 1),
+            'first_frame_ms': round(first_frame_ms, 1)
         }
     
     except Exception as e:
         return {
             'success': False,
-            'error': str(e)
+            'error': str(e),
+            'open_ms': round(open_ms, 1) if open_ms is not None else None,
+            'first_frame_ms': None
         }
     finally:
         if cap is not None:
             cap.release()
 
 
-def find_latest_log_file(camera_num: int, log_base_path: str, search_days: int = 1) -> Optional[str]:
+def ffmpeg_options_for(camera: Dict[str, Any], camera_config: Dict[str, str]) -> Dict[str, Any]:
+    """
+    카메라별 ffmpeg 파이프 백엔드 옵션 (전송 방식, 출력 해상도, 프레임레이트 제한)
+    
+    camera_config 키: rtsp_transport (기본 전송 방식), rtsp_transport_overrides ("1:tcp,3:udp"),
+    ffmpeg_width, ffmpeg_height, ffmpeg_fps (0이면 제한 없음), ffmpeg_path
+    """
+    overrides = parse_transport_overrides(camera_config.get('rtsp_transport_overrides'))
+    fps = float(camera_config.get('ffmpeg_fps', 0) or 0)
+    return {
+        'transport': overrides.get(camera['camera_num'], str(camera_config.get('rtsp_transport', 'udp')).lower()),
+        'width': int(camera_config.get('ffmpeg_width', 640)),
+        'height': int(camera_config.get('ffmpeg_height', 360)),
+        'fps': fps if fps > 0 else None,
+        'ffmpeg_path': camera_config.get('ffmpeg_path', 'ffmpeg') or 'ffmpeg'
+    }
+
+
+def connect_stream(camera_info: Dict[str, Any], url: str, open_timeout: float,
+                   read_timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    스트림 연결 테스트 (카메라에 ffmpeg 옵션이 있으면 ffmpeg 파이프, 없으면 OpenCV)
+    """
+    if camera_info.get('ffmpeg') is not None:
+        return test_ffmpeg_connection(url, timeout=open_timeout, read_timeout=read_timeout,
+                                      options=camera_info['ffmpeg'])
+    return test_camera_connection(url, timeout=open_timeout, read_timeout=read_timeout)
+
+
+def compute_adaptive_timeout(
+    latencies_ms: List[float],
+    failures: int = 0,
+    factor: float = 3.0,
+    floor: float = 2.0,
+    cap: float = 20.0,
+    default: float = 10.0,
+    min_samples: int = 3
+) -> float:
+    """
+    과거 지연 시간 기반 적응형 타임아웃 계산
+    
+    - 성공 샘플이 충분하면: p99 × factor (floor ~ cap 범위로 제한)
+    - 성공 기록 없이 실패만 있으면: floor (죽은 카메라는 빠르게 실패)
+    - 기록이 부족하면: default
+    
+    Args:
+        latencies_ms: 성공한 시도의 지연 시간 목록 (ms)
+        failures: 최근 실패 횟수
+        factor: 안전 계수
+        floor: 최소 타임아웃 (초)
+        cap: 최대 타임아웃 (초)
+        default: 기록 부족 시 기본 타임아웃 (초)
+        min_samples: 적응형 계산에 필요한 최소 샘플 수
+    
+    Returns:
+        타임아웃 (초)
+    """
+    samples = sorted(v for v in latencies_ms if v is not None)
+    
+    if len(samples) < min_samples:
+        if not samples and failures >= min_samples:
+            return floor
+        return default
+    
+    # p99 (nearest-rank)
+    rank = max(0, math.ceil(0.99 * len(samples)) - 1)
+    p99_seconds = samples[rank] / 1000
+    
+    return round(min(cap, max(floor, p99_seconds * factor)), 1)
+
+
+def find_latest_log_file(camera_num: int, log_base_path: str, search_days: int = 1,
+                         transport=None) -> Optional[str]:
     """
     최근 로그 파일을 자동으로 찾기 (오늘부터 최근 N일간 검색)
     경로 구조: /mnt/nas/logs/년/월/일/rtsp_streamX_YYYYMMDD.log
@@ -113,6 +225,7 @@ def find_latest_log_file(camera_num: int, log_base_path: str, search_days: int =
         camera_num: 카메라 번호
         log_base_path: 로그 베이스 경로 (예: /mnt/nas/logs)
         search_days: 검색할 일수 (기본 1일 - 오늘과 어제)
+        transport: LogTransport (있으면 작업별 타임아웃 + NFS/SFTP 선택, 응답 없으면 TransportError)
     
     Returns:
         로그 파일 경로 또는 None
@@ -127,6 +240,12 @@ def find_latest_log_file(camera_num: int, log_base_path: str, search_days: int =
         day = search_date.strftime("%d")
         log_date = search_date.strftime("%Y%m%d")
         
+        if transport is not None:
+            relative = os.path.join(year, month, day, f"rtsp_stream{camera_num}_{log_date}.log")
+            if transport.exists(relative):
+                return os.path.join(log_base_path, relative)
+            continue
+        
         # 날짜 폴더 경로
         log_dir = os.path.join(log_base_path, year, month, day)
         
@@ -143,7 +262,58 @@ def find_latest_log_file(camera_num: int, log_base_path: str, search_days: int =
     return None
 
 
-def check_camera_log(camera_num: int, log_base_path: str = "/mnt/nas/logs") -> Dict[str, Any]:
+def find_last_save_info(lines: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    로그 줄 목록에서 마지막 "영상 저장 완료" 항목과 다음 3줄의 상세 정보 추출
+    
+    Returns:
+        {'log_time', 'frame_count', 'video_length', 'file_size'} 또는 None
+    """
+    # 역순으로 읽어서 최근 영상 저장 로그 찾기
+    for i in range(len(lines) - 1, -1, -1):
+        line = lines[i]
+        if '영상 저장 완료:' in line:
+            # 타임스탬프 추출
+            timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
+            if timestamp_match:
+                log_time_str = timestamp_match.group(1)
+                log_time = datetime.strptime(log_time_str, "%Y-%m-%d %H:%M:%S")
+                
+                # 다음 3줄에서 프레임 수, 영상 길이, 파일 크기 추출
+                frame_count = None
+                video_length = None
+                file_size = None
+                
+                if i + 1 < len(lines):
+                    frame_line = lines[i + 1]
+                    frame_match = re.search(r'프레임 수:\s*(\d+)', frame_line)
+                    if frame_match:
+                        frame_count = int(frame_match.group(1))
+                
+                if i + 2 < len(lines):
+                    length_line = lines[i + 2]
+                    length_match = re.search(r'영상 길이:\s*([\d.]+)초', length_line)
+                    if length_match:
+                        video_length = float(length_match.group(1))
+                
+                if i + 3 < len(lines):
+                    size_line = lines[i + 3]
+                    size_match = re.search(r'파일 크기:\s*([\d.]+)MB', size_line)
+                    if size_match:
+                        file_size = float(size_match.group(1))
+                
+                return {
+                    'log_time': log_time,
+                    'frame_count': frame_count,
+                    'video_length': video_length,
+                    'file_size': file_size
+                }
+    
+    return None
+
+
+def check_camera_log(camera_num: int, log_base_path: str = "/mnt/nas/logs",
+                     analytics: bool = False, transport=None) -> Dict[str, Any]:
     """
     카메라 영상 저장 로그 확인
     경로 구조: /mnt/nas/logs/년/월/일/시간/
@@ -151,6 +321,8 @@ def check_camera_log(camera_num: int, log_base_path: str = "/mnt/nas/logs") -> D
     Args:
         camera_num: 카메라 번호 (1, 2, 3, ...)
         log_base_path: 로그 베이스 경로 (기본값: /mnt/nas/logs)
+        analytics: True면 하루치 로그 전체 통계 분석 추가 (result['analytics'])
+        transport: LogTransport (있으면 로그 끝부분만 NFS/SFTP 중 응답 빠른 쪽으로 읽음, 작업별 타임아웃)
     
     Returns:
         로그 점검 결과 딕셔너리
@@ -166,7 +338,14 @@ def check_camera_log(camera_num: int, log_base_path: str = "/mnt/nas/logs") -> D
     
     # 로그 파일 자동 검색 (오늘과 어제)
     print_info(f"카메라 {camera_num} 로그 파일 검색 중...")
-    log_file = find_latest_log_file(camera_num, log_base_path, search_days=1)
+    try:
+        log_file = find_latest_log_file(camera_num, log_base_path, search_days=1, transport=transport)
+    except TransportError as e:
+        # 마운트 stale 등으로 모든 읽기 경로가 응답하지 않음
+        print_fail(f"로그 저장소 응답 없음: {str(e)}")
+        result['status'] = 'FAIL'
+        result['details']['error'] = str(e)
+        return result
     
     # 로그 파일 존재 확인
     if not log_file:
@@ -181,55 +360,42 @@ def check_camera_log(camera_num: int, log_base_path: str = "/mnt/nas/logs") -> D
     result['log_found'] = True
     result['checked'] = True
     
+    # 분석 모드: 하루치 전체 저장 이벤트 통계 (판정에는 영향 없음, 파일 전체를 읽으므로 NFS가 응답할 때만)
+    if analytics and transport is not None and transport.last_used != 'nfs':
+        print_warning("로그 분석 생략: NFS 마운트 대신 SFTP로 읽는 중")
+        result['analytics'] = {'error': 'NFS 마운트 사용 불가'}
+    elif analytics:
+        try:
+            if transport is not None:
+                # stale 마운트에서 멈추지 않도록 작업별 타임아웃 적용
+                stats = transport.run_local(analyze_save_log, log_file)
+            else:
+                stats = analyze_save_log(log_file)
+            result['analytics'] = stats
+            cadence = stats['cadence']
+            print_info(f"로그 분석: 저장 {stats['event_count']}건, "
+                       f"평균 간격 {cadence['mean']}초, 긴 공백 {stats['long_gap_count']}건, "
+                       f"기준 이탈 {stats['out_of_range_count']}건")
+        except Exception as e:
+            print_warning(f"로그 분석 실패: {str(e)}")
+            result['analytics'] = {'error': str(e)}
+    
     # 현재 시간 (시간 검증용)
     now = datetime.now()
     
     try:
         # 로그 파일에서 최근 "영상 저장 완료" 항목 찾기
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # 역순으로 읽어서 최근 영상 저장 로그 찾기
-        last_save_info = None
-        for i in range(len(lines) - 1, -1, -1):
-            line = lines[i]
-            if '영상 저장 완료:' in line:
-                # 타임스탬프 추출
-                timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                if timestamp_match:
-                    log_time_str = timestamp_match.group(1)
-                    log_time = datetime.strptime(log_time_str, "%Y-%m-%d %H:%M:%S")
-                    
-                    # 다음 3줄에서 프레임 수, 영상 길이, 파일 크기 추출
-                    frame_count = None
-                    video_length = None
-                    file_size = None
-                    
-                    if i + 1 < len(lines):
-                        frame_line = lines[i + 1]
-                        frame_match = re.search(r'프레임 수:\s*(\d+)', frame_line)
-                        if frame_match:
-                            frame_count = int(frame_match.group(1))
-                    
-                    if i + 2 < len(lines):
-                        length_line = lines[i + 2]
-                        length_match = re.search(r'영상 길이:\s*([\d.]+)초', length_line)
-                        if length_match:
-                            video_length = float(length_match.group(1))
-                    
-                    if i + 3 < len(lines):
-                        size_line = lines[i + 3]
-                        size_match = re.search(r'파일 크기:\s*([\d.]+)MB', size_line)
-                        if size_match:
-                            file_size = float(size_match.group(1))
-                    
-                    last_save_info = {
-                        'log_time': log_time,
-                        'frame_count': frame_count,
-                        'video_length': video_length,
-                        'file_size': file_size
-                    }
-                    break
+        if transport is not None:
+            # 끝부분 블록만 읽기 (저장 완료 항목이 나올 때까지 범위 확장)
+            lines, read_bytes = transport.tail_lines(os.path.relpath(log_file, log_base_path),
+                                                     marker='영상 저장 완료:')
+            result['transport'] = {'used': transport.last_used, 'read_bytes': read_bytes}
+            print_info(f"로그 읽기: {transport.last_used.upper()} (끝부분 {read_bytes // 1024}KB)")
+        else:
+            with open(log_file, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        
+        last_save_info = find_last_save_info(lines)
         
         if not last_save_info:
             print_warning("로그에서 '영상 저장 완료' 기록을 찾을 수 없습니다")
@@ -303,7 +469,8 @@ def check_camera_log(camera_num: int, log_base_path: str = "/mnt/nas/logs") -> D
     return result
 
 
-def show_camera_stream(camera_info: Dict[str, Any], stream_type: str = "source", auto_mode: bool = False) -> str:
+def show_camera_stream(camera_info: Dict[str, Any], stream_type: str = "source", auto_mode: bool = False,
+                       monitor=None) -> str:
     """
     카메라 스트림을 OpenCV 창으로 표시하고 사용자 입력 대기
     또는 자동 모드로 프레임 읽기만 확인
@@ -312,6 +479,7 @@ def show_camera_stream(camera_info: Dict[str, Any], stream_type: str = "source",
         camera_info: 카메라 정보
         stream_type: "source" (원본) 또는 "mediamtx" (블러 처리)
         auto_mode: True면 영상 표시 없이 자동 검증
+        monitor: CameraMonitor 인스턴스 (Auto 모드에서 최신 통계가 있으면 즉시 판정)
     
     Returns: 'pass', 'fail', 'skip', 'quit'
     """
@@ -334,8 +502,33 @@ def show_camera_stream(camera_info: Dict[str, Any], stream_type: str = "source",
     else:
         print_info(f"  URL: 127.0.0.1:{camera_info['mediamtx_port']}")
     
-    # 연결 테스트 (타임아웃: 10초)
-    test_result = test_camera_connection(url, timeout=10)
+    # 상시 모니터 통계가 최신이고 정상이면 재연결 없이 즉시 PASS
+    # (실패 통계는 능동 점검으로 재확인)
+    if auto_mode and monitor is not None:
+        stats = monitor.get_stats(url)
+        if stats and stats['fresh'] and stats['alive']:
+            fps_text = f"{stats['fps']:.1f}fps" if stats['fps'] else "fps 미확인"
+            print_pass(f"{name} {stream_label} 모니터 통계 사용: {fps_text}, "
+                       f"{stats['age_seconds']}초 전 확인 → 자동 PASS")
+            return 'pass'
+        if stats and stats['fresh']:
+            print_info(f"  모니터에서 스트림 이상 감지 ({stats.get('last_error') or '프레임 없음'}), "
+                       f"직접 연결로 재확인합니다.")
+        else:
+            print_info("  모니터 통계가 없거나 오래되어 직접 연결을 시도합니다.")
+    
+    # 연결 테스트 (기본 10초, 과거 지연 시간 기록이 있으면 카메라별 적응형 타임아웃)
+    open_timeout, read_timeout = camera_info.get('timeouts', {}).get(stream_type, (10, 10))
+    test_result = connect_stream(camera_info, url, open_timeout, read_timeout)
+    
+    # 지연 시간 기록 (check_cameras에서 결과에 저장 → 점검 이력에 누적)
+    camera_info.setdefault('latency', {})[stream_type] = {
+        'success': test_result['success'],
+        'open_ms': test_result.get('open_ms'),
+        'first_frame_ms': test_result.get('first_frame_ms'),
+        'open_timeout': open_timeout,
+        'read_timeout': read_timeout
+    }
     
     if not test_result['success']:
         print_fail(f"{name} {stream_label} 연결 실패: {test_result['error']}")
@@ -345,6 +538,10 @@ def show_camera_stream(camera_info: Dict[str, Any], stream_type: str = "source",
     print_pass(f"{name} {stream_label} 연결 성공!")
     print_info(f"  해상도: {test_result['width']}x{test_result['height']}")
     
+    # 블러 검증용 프레임 보관 (check_cameras에서 원본/블러 선명도 비교 후 해제)
+    if camera_info.get('keep_frames'):
+        camera_info.setdefault('frames', {})[stream_type] = test_result['frame']
+    
     # Auto 모드: 프레임 읽기만 확인하고 자동 PASS
     if auto_mode:
         print_pass(f"  프레임 읽기 성공 → 자동 PASS")
@@ -448,7 +645,8 @@ def check_video_files(camera_count: int, video_base_path: str = "/mnt/nas/cam")
         'checked': True,
         'status': 'UNKNOWN',
         'found_videos': [],
-        'missing_videos': []
+        'missing_videos': [],
+        'completed_files': {}
     }
     
     print("")
@@ -486,17 +684,21 @@ def check_video_files(camera_count: int, video_base_path: str = "/mnt/nas/cam")
             
             if files:
                 # 가장 최근 파일 찾기
-                latest_file = max(files, key=os.path.getmtime)
-                mtime = os.path.getmtime(latest_file)
+                mtimes = {path: os.path.getmtime(path) for path in files}
+                latest_file = max(files, key=mtimes.get)
+                mtime = mtimes[latest_file]
                 file_time = datetime.fromtimestamp(mtime)
                 time_diff = (now - file_time).total_seconds() / 60
                 
                 # 10분 이내 파일만 인정
                 if time_diff <= 10:
+                    # 무결성 샘플링 대상: 기록이 끝난(30초 이상 수정 없는) 가장 최근 파일
+                    completed = [path for path in files if now.timestamp() - mtimes[path] >= 30]
                     found_files[cam_num] = {
                         'path': latest_file,
                         'time': file_time,
-                        'minutes_ago': time_diff
+                        'minutes_ago': time_diff,
+                        'completed_path': max(completed, key=mtimes.get) if completed else None
                     }
     
     # 결과 정리
@@ -505,6 +707,8 @@ def check_video_files(camera_count: int, video_base_path: str = "/mnt/nas/cam")
         if cam_num in found_files:
             file_info = found_files[cam_num]
             result['found_videos'].append(cam_num)
+            if file_info['completed_path']:
+                result['completed_files'][cam_num] = file_info['completed_path']
             print_pass(f"카메라 {cam_num} 영상 발견: {os.path.basename(file_info['path'])} ({file_info['minutes_ago']:.1f}분 전)")
         else:
             result['missing_videos'].append(cam_num)
@@ -522,8 +726,290 @@ def check_video_files(camera_count: int, video_base_path: str = "/mnt/nas/cam")
     return result
 
 
-def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: bool = False) -> Dict[str, Any]:
-    """전체 카메라 점검 실행 (원본 + 블러 처리 스트리밍)"""
+def check_video_integrity(video_result: Dict[str, Any], sample_frames: int = 5,
+                          max_workers: int = 2, cpu_budget: float = 10.0) -> Dict[str, Any]:
+    """
+    영상 파일 무결성 샘플링 (check_video_files 이후 선택 단계)
+    카메라별 기록 완료된 최신 세그먼트에서 K개 프레임을 디코딩하여 오류/실제 길이 확인
+    
+    Args:
+        video_result: check_video_files 결과
+        sample_frames: 세그먼트당 샘플 프레임 수
+        max_workers: 동시 디코딩 워커 수
+        cpu_budget: 실행당 CPU 시간 예산 (초)
+    
+    Returns:
+        무결성 점검 결과 딕셔너리 (status: PASS/WARN/FAIL/SKIP)
+    """
+    from utils.ui import print_info, print_pass, print_fail, print_warning
+    
+    targets = video_result.get('completed_files', {})
+    
+    print("")
+    print_info(f"영상 무결성 샘플링 중... (세그먼트 {len(targets)}개, 프레임 {sample_frames}개씩, "
+               f"CPU 예산 {cpu_budget}초)")
+    
+    if not targets:
+        print_warning("샘플링할 기록 완료 세그먼트가 없습니다")
+        return {'status': 'SKIP', 'segments': {}}
+    
+    integrity = verify_segments(targets, sample_frames, max_workers, cpu_budget)
+    
+    statuses = []
+    for cam_num, segment in integrity['segments'].items():
+        status = segment['status']
+        statuses.append(status)
+        name = os.path.basename(segment['path'])
+        if status == 'PASS':
+            print_pass(f"카메라 {cam_num} 세그먼트 정상: {name} ({segment['duration']}초, 샘플 {segment['sampled']}개)")
+        elif status == 'WARN':
+            print_warning(f"카메라 {cam_num} 세그먼트 확인 필요: {name} "
+                          f"(디코딩 오류 {segment['decode_errors']}/{segment['sampled']}, {segment['duration']}초)"
+                          + (f" - {segment['error']}" if segment.get('error') else ""))
+        elif status == 'SKIP':
+            print_warning(f"카메라 {cam_num} 세그먼트 생략: {segment['error']}")
+        else:
+            print_fail(f"카메라 {cam_num} 세그먼트 손상: {name} - {segment['error']}")
+    
+    if 'FAIL' in statuses:
+        integrity['status'] = 'FAIL'
+    elif 'WARN' in statuses or 'SKIP' in statuses:
+        integrity['status'] = 'WARN'
+    else:
+        integrity['status'] = 'PASS'
+    
+    print_info(f"무결성 샘플링 완료: {integrity['status']} "
+               f"(CPU {integrity['cpu_seconds']}초, 소요 {integrity['wall_seconds']}초)")
+    return integrity
+
+
+def latency_history_key(camera: Dict[str, Any], stream_type: str) -> str:
+    """지연 시간 이력 키 (원본: 카메라 IP, 블러: MediaMTX 포트)"""
+    if stream_type == "source":
+        return camera['ip']
+    return f"127.0.0.1:{camera['mediamtx_port']}"
+
+
+def build_camera_timeouts(
+    camera: Dict[str, Any],
+    latency_history: Dict[str, Dict[str, Any]],
+    camera_config: Dict[str, str]
+) -> Dict[str, tuple]:
+    """
+    카메라별 (open, read) 타임아웃 계산
+    
+    Args:
+        camera: generate_camera_urls 결과 항목
+        latency_history: {키: {'open_ms': [...], 'first_frame_ms': [...], 'failures': n}}
+        camera_config: 카메라 설정 (timeout_factor, timeout_floor, timeout_cap, timeout_default)
+    """
+    options = {
+        'factor': float(camera_config.get('timeout_factor', 3.0)),
+        'floor': float(camera_config.get('timeout_floor', 2.0)),
+        'cap': float(camera_config.get('timeout_cap', 20.0)),
+        'default': float(camera_config.get('timeout_default', 10))
+    }
+    
+    timeouts = {}
+    for stream_type in ("source", "mediamtx"):
+        history = latency_history.get(latency_history_key(camera, stream_type), {})
+        failures = history.get('failures', 0)
+        timeouts[stream_type] = (
+            compute_adaptive_timeout(history.get('open_ms', []), failures, **options),
+            compute_adaptive_timeout(history.get('first_frame_ms', []), failures, **options)
+        )
+    return timeouts
+
+
+def _gated_probe_stream(camera: Dict[str, Any], stream_type: str, auto_mode: bool,
+                        monitor=None, sweep: Optional[Dict[str, Any]] = None,
+                        mediamtx_api: Optional[Dict[str, Any]] = None, breaker=None) -> str:
+    """
+    회로 차단기를 거쳐 스트림 1개 점검
+    차단(OPEN) 상태면 RTSP 점검 대신 백오프 간격으로 TCP 연결만 확인하고 FAIL 처리
+    
+    Returns: 'pass', 'fail', 'skip', 'quit'
+    """
+    from utils.ui import print_warning, print_info
+    from utils.circuit_breaker import tcp_probe
+    
+    if breaker is None:
+        return _probe_stream(camera, stream_type, auto_mode, monitor, sweep, mediamtx_api)
+    
+    target = f"camera:{latency_history_key(camera, stream_type)}"
+    url = camera['source_url'] if stream_type == "source" else camera['mediamtx_url']
+    parts = urlsplit(url)
+    
+    def probe() -> bool:
+        # 스윕 결과는 시간 초과 대상을 이미 재확인한 값이므로 그대로 사용
+        if sweep is not None:
+            return sweep['cameras'][camera['camera_num']][stream_type]['reachable']
+        return tcp_probe(parts.hostname, parts.port or 554)
+    
+    gate = breaker.gate(target, probe)
+    if not gate['allowed']:
+        state = gate['breaker']
+        print_warning(f"{camera['name']} {'원본' if stream_type == 'source' else '블러'} 스트림 회로 차단 중 "
+                      f"(연속 실패 {state['failures']}회, 다음 확인까지 {state.get('next_probe_in', 0)}초) "
+                      f"→ RTSP 점검 생략, FAIL 처리")
+        camera.setdefault('breaker', {})[stream_type] = state
+        return 'fail'
+    if gate['probed']:
+        print_info(f"{camera['name']} 응답 확인 → 시험 점검 진행 (실패 시 확인 간격 2배로 다시 차단)")
+    
+    decision = _probe_stream(camera, stream_type, auto_mode, monitor, sweep, mediamtx_api)
+    if decision == 'pass':
+        breaker.record_success(target)
+    elif decision == 'fail':
+        latency = camera.get('latency', {}).get(stream_type, {})
+        breaker.record_failure(target, latency.get('tcp_error') or 'RTSP 점검 실패')
+    camera.setdefault('breaker', {})[stream_type] = breaker.snapshot(target)
+    return decision
+
+
+def _probe_stream(camera: Dict[str, Any], stream_type: str, auto_mode: bool,
+                  monitor=None, sweep: Optional[Dict[str, Any]] = None,
+                  mediamtx_api: Optional[Dict[str, Any]] = None) -> str:
+    """
+    스트림 1개 점검 (TCP 스윕에서 연결 불가로 확인되면 RTSP 디코딩 점검 생략,
+    Auto 모드에서 MediaMTX API가 정상으로 보고한 블러 스트림은 디코딩 점검 생략)
+    
+    Returns: 'pass', 'fail', 'skip', 'quit'
+    """
+    from utils.ui import print_fail, print_warning, print_pass
+    
+    if sweep is not None:
+        probe = sweep['cameras'][camera['camera_num']][stream_type]
+        if not probe['reachable']:
+            label = "원본 카메라" if stream_type == "source" else f"블러 처리 스트리밍 (포트 {camera['mediamtx_port']})"
+            retried = " (재확인 포함)" if probe.get('attempts', 1) > 1 else ""
+            print_fail(f"{camera['name']} {label} TCP 연결 불가: {probe['error']} "
+                       f"({probe['host']}:{probe['port']}, {probe['connect_ms']:.0f}ms{retried})")
+            print_warning("RTSP 점검을 생략하고 자동으로 FAIL 처리됩니다.")
+            camera.setdefault('latency', {})[stream_type] = {
+                'success': False,
+                'open_ms': None,
+                'first_frame_ms': None,
+                'tcp_error': probe['error']
+            }
+            return 'fail'
+    
+    if stream_type == "mediamtx" and auto_mode and mediamtx_api is not None:
+        status = mediamtx_api['cameras'][camera['camera_num']]
+        if status['healthy']:
+            rate_text = f", {status['receive_kbps']}kbps" if status['receive_kbps'] is not None else ""
+            print_pass(f"{camera['name']} 블러 처리 스트리밍 MediaMTX API 정상: "
+                       f"준비됨, 리더 {status['readers']}개{rate_text} → 자동 PASS")
+            return 'pass'
+        print_warning(f"{camera['name']} MediaMTX API 이상: {status.get('reason') or status.get('error')} "
+                      f"→ 디코딩 점검으로 확인합니다.")
+    
+    return show_camera_stream(camera, stream_type=stream_type, auto_mode=auto_mode, monitor=monitor)
+
+
+def parse_blur_regions(value: Optional[str]) -> Optional[List[List[float]]]:
+    """
+    블러 적용 영역 설정 파싱
+    형식: "x1,y1,x2,y2;x1,y1,x2,y2" (0~1 정규화 좌표), 비어 있으면 None
+    형식이 잘못된 영역은 경고 후 제외 (점검 전체를 중단하지 않음)
+    """
+    from utils.ui import print_warning
+    
+    if not value:
+        return None
+    regions = []
+    for part in str(value).split(';'):
+        if not part.strip():
+            continue
+        try:
+            coords = [float(v) for v in part.split(',') if v.strip()]
+        except ValueError:
+            coords = []
+        valid = (len(coords) == 4 and all(0.0 <= v <= 1.0 for v in coords)
+                 and coords[0] < coords[2] and coords[1] < coords[3])
+        if not valid:
+            print_warning(f"블러 영역 설정 무시 (형식: x1,y1,x2,y2, 0~1): '{part.strip()}'")
+            continue
+        regions.append(coords)
+    return regions or None
+
+
+def verify_camera_blur(camera: Dict[str, Any], regions: Optional[List[List[float]]] = None,
+                       max_ratio: float = 0.8) -> Dict[str, Any]:
+    """
+    원본/블러 스트림 프레임 선명도 비교로 블러 적용 여부 확인
+    연결 점검에서 보관한 프레임을 사용하고, 없으면(모니터 통계로 판정된 경우) 1프레임만 새로 읽음
+    
+    Returns:
+        compare_blur 결과 ('status': PASS/FAIL/SKIP)
+    """
+    from utils.ui import print_pass, print_fail, print_warning
+    
+    frames = camera.pop('frames', {})
+    for stream_type, url_key in (('source', 'source_url'), ('mediamtx', 'mediamtx_url')):
+        if frames.get(stream_type) is None:
+            open_timeout, read_timeout = camera.get('timeouts', {}).get(stream_type, (10, 10))
+            grabbed = connect_stream(camera, camera[url_key], open_timeout, read_timeout)
+            frames[stream_type] = grabbed.get('frame') if grabbed['success'] else None
+    
+    if frames.get('source') is None or frames.get('mediamtx') is None:
+        print_warning(f"{camera['name']} 블러 검증 생략: 비교할 프레임을 읽지 못함")
+        return {'status': 'SKIP', 'reason': '프레임 없음'}
+    
+    blur = compare_blur(frames['source'], frames['mediamtx'], regions=regions, max_ratio=max_ratio)
+    ratio_text = f"최소 영역 비율 {blur['min_region_ratio']}, 전체 비율 {blur['whole_ratio']}, {blur['cpu_ms']}ms"
+    if blur['status'] == 'PASS':
+        print_pass(f"{camera['name']} 블러 검증 통과 ({ratio_text})")
+    elif blur['status'] == 'FAIL':
+        print_fail(f"{camera['name']} 블러 검증 실패: {blur['reason']} ({ratio_text})")
+    else:
+        print_warning(f"{camera['name']} 블러 검증 생략: {blur['reason']}")
+    return blur
+
+
+def check_camera_rtp(camera: Dict[str, Any], camera_config: Dict[str, str]) -> Dict[str, Any]:
+    """
+    원본 카메라 RTP 손실/지터 측정 (디코딩 없이 RTP 패킷만 수신)
+    전송 방식은 ffmpeg 백엔드와 같은 설정 사용 (rtsp_transport, rtsp_transport_overrides)
+    """
+    from utils.ui import print_info, print_pass, print_warning, print_fail
+    
+    overrides = parse_transport_overrides(camera_config.get('rtsp_transport_overrides'))
+    transport = overrides.get(camera['camera_num'], str(camera_config.get('rtsp_transport', 'udp')).lower())
+    window = float(camera_config.get('rtp_window', 3))
+    
+    print_info(f"{camera['name']} RTP 손실/지터 측정 중... ({transport.upper()}, {window:.0f}초)")
+    rtp = measure_rtp(
+        camera['source_url'],
+        window=window,
+        transport=transport,
+        loss_warn=float(camera_config.get('rtp_loss_warn', 1.0)),
+        jitter_warn=float(camera_config.get('rtp_jitter_warn', 30.0))
+    )
+    
+    summary = (f"손실 {rtp.get('loss_percent')}% ({rtp.get('lost')}/{rtp.get('expected')}), "
+               f"지터 {rtp.get('jitter_ms')}ms, {rtp.get('bitrate_kbps')}kbps")
+    if rtp['status'] == 'PASS':
+        print_pass(f"  RTP 정상: {summary}")
+    elif rtp['status'] == 'WARN':
+        print_warning(f"  RTP 경고: {rtp['error']} ({summary})")
+    else:
+        print_fail(f"  RTP 측정 실패: {rtp['error']}")
+    return rtp
+
+
+def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: bool = False,
+                  monitor=None, latency_history: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    전체 카메라 점검 실행 (원본 + 블러 처리 스트리밍)
+    
+    Args:
+        camera_count: 카메라 개수
+        camera_config: 카메라 설정
+        auto_mode: True면 영상 표시 없이 자동 검증
+        monitor: 상시 모니터 (CameraMonitor, 선택) - 최신 통계가 있으면 재연결 생략
+        latency_history: 과거 RTSP 지연 시간 기록 (선택) - 카메라별 적응형 타임아웃 계산에 사용
+    """
     from utils.ui import (
         print_section, print_pass, print_fail, print_skip,
         print_info, print_warning
@@ -562,6 +1048,71 @@ def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: b
         'details': []
     }
     
+    # RTSP 점검 전 TCP 도달성 스윕 (연결 불가 장비는 디코딩 점검 생략, 시간 초과는 1회 재확인)
+    sweep = None
+    if str(camera_config.get('tcp_sweep', 'true')).lower() == 'true':
+        print_info("카메라/MediaMTX 포트 TCP 도달성 확인 중...")
+        sweep = sweep_camera_ports(
+            cameras,
+            rtsp_port=int(camera_config.get('rtsp_port', 554)),
+            timeout=float(camera_config.get('tcp_sweep_timeout', 0.4))
+        )
+        results['tcp_sweep'] = sweep
+        
+        if sweep['unreachable']:
+            print_warning(f"TCP 연결 불가 {len(sweep['unreachable'])}건 ({sweep['duration_ms']:.0f}ms) "
+                          f"→ 해당 스트림 RTSP 점검 생략")
+            for probe in sweep['unreachable']:
+                print_warning(f"  {probe['host']}:{probe['port']} - {probe['error']} ({probe['connect_ms']:.0f}ms)")
+        else:
+            print_pass(f"모든 포트 TCP 연결 가능 ({sweep['duration_ms']:.0f}ms)")
+        print("")
+    
+    # 회로 차단기 (장기간 응답 없는 스트림은 TCP 확인만 수행, 상태 파일로 실행 간 유지)
+    from utils.circuit_breaker import breaker_from_config
+    breaker = breaker_from_config(camera_config)
+    
+    # MediaMTX 제어 API 조회 (인스턴스당 요청 1회, 정상 경로는 블러 스트림 디코딩 생략)
+    mediamtx_api = None
+    if str(camera_config.get('mediamtx_api', 'false')).lower() == 'true':
+        print_info("MediaMTX 제어 API로 블러 스트림 경로 상태 확인 중...")
+        mediamtx_api = query_mediamtx_paths(
+            cameras,
+            api_host=camera_config.get('mediamtx_api_host', '127.0.0.1'),
+            api_base_port=int(camera_config.get('mediamtx_api_base_port', 9997)),
+            path_name=camera_config.get('mediamtx_path', 'live'),
+            timeout=float(camera_config.get('mediamtx_api_timeout', 2))
+        )
+        results['mediamtx_api'] = mediamtx_api
+        if mediamtx_api['unhealthy']:
+            print_warning(f"이상 경로 {len(mediamtx_api['unhealthy'])}건 ({mediamtx_api['duration_ms']:.0f}ms): "
+                          f"카메라 {', '.join(str(num) for num in mediamtx_api['unhealthy'])}")
+        else:
+            print_pass(f"모든 블러 스트림 경로 정상 ({mediamtx_api['duration_ms']:.0f}ms)")
+        print("")
+    
+    # 프레임 백엔드 (opencv 기본, ffmpeg: 축소 raw 프레임 파이프)
+    use_ffmpeg = str(camera_config.get('frame_backend', 'opencv')).lower() == 'ffmpeg'
+    if use_ffmpeg and not ffmpeg_available(camera_config.get('ffmpeg_path', 'ffmpeg') or 'ffmpeg'):
+        print_warning("ffmpeg 실행 파일을 찾을 수 없어 OpenCV 백엔드로 점검합니다.")
+        use_ffmpeg = False
+    if use_ffmpeg:
+        for camera in cameras:
+            camera['ffmpeg'] = ffmpeg_options_for(camera, camera_config)
+        print_info("프레임 백엔드: ffmpeg 파이프 "
+                   f"({camera_config.get('ffmpeg_width', 640)}x{camera_config.get('ffmpeg_height', 360)})")
+    
+    # 블러 검증 (원본/블러 프레임 선명도 비교, 선택)
+    blur_verify = str(camera_config.get('blur_verify', 'false')).lower() == 'true'
+    blur_regions = parse_blur_regions(camera_config.get('blur_regions')) if blur_verify else None
+    blur_max_ratio = float(camera_config.get('blur_max_ratio', 0.8))
+    
+    # 저장 로그 읽기 경로 (NFS 마운트 / NAS SFTP, 작업별 타임아웃)
+    log_transport = log_transport_from_config(camera_config)
+    if log_transport.mode != 'nfs':
+        print_info(f"로그 읽기 경로: {log_transport.mode.upper()} "
+                   f"({', '.join(reader.name.upper() for reader in log_transport.readers)})")
+    
     # 각 카메라 순차 점검
     for camera in cameras:
         print("")
@@ -569,6 +1120,12 @@ def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: b
         print(f"   {camera['name']} 점검")
         print("=" * 80)
         
+        # 카메라별 적응형 타임아웃 (이력이 없으면 기본값)
+        if latency_history is not None:
+            camera['timeouts'] = build_camera_timeouts(camera, latency_history, camera_config)
+        
+        camera['keep_frames'] = blur_verify
+        
         camera_result = {
             'name': camera['name'],
             'ip': camera['ip'],
@@ -583,36 +1140,72 @@ def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: b
         print("")
         print(f"[1/2] {camera['name']} - 원본 카메라 영상")
         print("-" * 80)
-        source_decision = show_camera_stream(camera, stream_type="source", auto_mode=auto_mode)
+        source_decision = _gated_probe_stream(camera, "source", auto_mode, monitor, sweep, breaker=breaker)
         camera_result['source_status'] = source_decision.upper()
         
         if source_decision == 'quit':
             print_warning("사용자가 점검을 중단했습니다.")
             results['details'].append(camera_result)
             results['status'] = 'QUIT'
+            log_transport.close()
             return results
         
         # 2) 블러 처리 스트리밍 확인
         print("")
         print(f"[2/2] {camera['name']} - 블러 처리 스트리밍")
         print("-" * 80)
-        mediamtx_decision = show_camera_stream(camera, stream_type="mediamtx", auto_mode=auto_mode)
+        mediamtx_decision = _gated_probe_stream(camera, "mediamtx", auto_mode, monitor, sweep, mediamtx_api, breaker)
         camera_result['mediamtx_status'] = mediamtx_decision.upper()
         
+        # 상시 모니터 통계 기록
+        if monitor is not None:
+            camera_result['monitor'] = {
+                'source': monitor.get_stats(camera['source_url']),
+                'mediamtx': monitor.get_stats(camera['mediamtx_url'])
+            }
+        
         if mediamtx_decision == 'quit':
             print_warning("사용자가 점검을 중단했습니다.")
             results['details'].append(camera_result)
             results['status'] = 'QUIT'
+            log_transport.close()
             return results
         
+        # RTSP 지연 시간 기록 (점검 이력에 저장되어 다음 타임아웃 계산에 사용)
+        camera_result['latency'] = camera.get('latency', {})
+        if sweep is not None:
+            camera_result['tcp'] = sweep['cameras'][camera['camera_num']]
+        if mediamtx_api is not None:
+            camera_result['mediamtx_api'] = mediamtx_api['cameras'][camera['camera_num']]
+        if 'breaker' in camera:
+            camera_result['breaker'] = camera['breaker']
+        
+        # RTP 손실/지터 측정 (선택, TCP 연결 불가 카메라는 생략)
+        if str(camera_config.get('rtp_stats', 'false')).lower() == 'true':
+            if sweep is None or sweep['cameras'][camera['camera_num']]['source']['reachable']:
+                camera_result['rtp'] = check_camera_rtp(camera, camera_config)
+        
+        # 블러 검증 (두 스트림 모두 정상일 때만)
+        blur_status = None
+        if blur_verify and source_decision == 'pass' and mediamtx_decision == 'pass':
+            camera_result['blur_verify'] = verify_camera_blur(camera, blur_regions, blur_max_ratio)
+            blur_status = camera_result['blur_verify']['status']
+        camera.pop('frames', None)
+        
         # 3) 카메라 로그 확인 (자동)
         print("")
         print(f"[3/3] {camera['name']} - 영상 저장 로그 확인")
         print("-" * 80)
         log_base_path = camera_config.get('log_base_path', '/mnt/nas/logs')
-        log_result = check_camera_log(camera['camera_num'], log_base_path)
+        log_analytics = str(camera_config.get('log_analytics', 'false')).lower() == 'true'
+        log_result = check_camera_log(camera['camera_num'], log_base_path, analytics=log_analytics,
+                                      transport=log_transport)
         camera_result['log_status'] = log_result['status']
         camera_result['log_details'] = log_result.get('details', {})
+        if 'analytics' in log_result:
+            camera_result['log_analytics'] = log_result['analytics']
+        if 'transport' in log_result:
+            camera_result['log_transport'] = log_result['transport']
         
         # 결과 기록
         results['details'].append(camera_result)
@@ -620,7 +1213,8 @@ def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: b
         # 전체 상태 판정 (두 스트림 + 로그 모두 고려)
         log_status = camera_result['log_status']
         
-        if source_decision == 'pass' and mediamtx_decision == 'pass' and log_status == 'PASS':
+        if (source_decision == 'pass' and mediamtx_decision == 'pass' and log_status == 'PASS'
+                and blur_status != 'FAIL'):
             results['pass_count'] += 1
             print("")
             print_pass(f"{camera['name']}: PASS (원본 ✓, 블러 처리 ✓, 로그 ✓)")
@@ -638,6 +1232,8 @@ def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: b
                 fail_reasons.append(f"블러: {mediamtx_decision}")
             if log_status != 'PASS':
                 fail_reasons.append(f"로그: {log_status}")
+            if blur_status == 'FAIL':
+                fail_reasons.append("블러 미적용 의심")
             print_fail(f"{camera['name']}: FAIL ({', '.join(fail_reasons)})")
         
         # 메모리 정리 (다음 카메라로 이동 전)
@@ -660,6 +1256,10 @@ def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: b
         results['status'] = 'SKIP'
         print_skip("카메라 점검 결과: SKIP")
     
+    # 로그 읽기 경로 상태 기록 후 SFTP 세션 정리
+    results['log_transport'] = log_transport.snapshot()
+    log_transport.close()
+    
     # 최종 메모리 정리
     cv2.destroyAllWindows()
     gc.collect()
@@ -669,6 +1269,18 @@ def check_cameras(camera_count: int, camera_config: Dict[str, str], auto_mode: b
     video_check_result = check_video_files(camera_count, video_base_path)
     results['video_files'] = video_check_result
     
+    # 영상 무결성 샘플링 (선택)
+    if str(camera_config.get('deep_verify', 'false')).lower() == 'true':
+        integrity = check_video_integrity(
+            video_check_result,
+            sample_frames=int(camera_config.get('verify_frames', 5)),
+            max_workers=int(camera_config.get('verify_workers', 2)),
+            cpu_budget=float(camera_config.get('verify_cpu_budget', 10))
+        )
+        video_check_result['integrity'] = integrity
+        if integrity['status'] == 'FAIL':
+            video_check_result['status'] = 'FAIL'
+    
     # 영상 파일 확인 결과를 전체 상태에 반영
     if video_check_result['status'] == 'FAIL':
         print("")
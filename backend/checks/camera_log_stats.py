@@ -0,0 +1,207 @@
+"""
+카메라 영상 저장 로그 통계 분석 모듈
+하루치 rtsp_streamN_YYYYMMDD.log 전체를 한 번만 스트리밍으로 읽어
+모든 '영상 저장 완료' 이벤트의 통계를 계산 (메모리 사용량 일정)
+"""
+import re
+import bisect
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional
+
+# 정규식 사전 컴파일 (라인마다 재컴파일 방지)
+SAVE_LINE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*영상 저장 완료:')
+FRAME_RE = re.compile(r'프레임 수:\s*(\d+)')
+LENGTH_RE = re.compile(r'영상 길이:\s*([\d.]+)초')
+SIZE_RE = re.compile(r'파일 크기:\s*([\d.]+)MB')
+
+# 검증 기준 (check_camera_log와 동일)
+FRAME_RANGE = (4400, 4600)
+LENGTH_RANGE = (280.0, 310.0)
+
+# 분포 구간 경계 (고정 구간 → 메모리 일정)
+FRAME_BINS = [4000, 4200, 4400, 4500, 4600, 4800, 5000]
+LENGTH_BINS = [240, 270, 280, 290, 300, 310, 330, 360]
+
+# 이벤트 블록에서 상세 정보를 찾는 최대 줄 수 (저장 완료 줄 다음 3줄)
+DETAIL_LINES = 3
+
+# 범위 이탈/긴 간격 샘플 보관 개수 (메모리 상한)
+MAX_SAMPLES = 50
+
+
+class RunningStats:
+    """Welford 방식 누적 통계 + 고정 구간 분포"""
+
+    def __init__(self, bins: Optional[List[float]] = None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.bins = bins
+        self.histogram = [0] * (len(bins) + 1) if bins else None
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if self.bins:
+            self.histogram[bisect.bisect_right(self.bins, value)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'mean': round(self.mean, 2) if self.count else None,
+            'stdev': round((self.m2 / (self.count - 1)) ** 0.5, 2) if self.count > 1 else None
+        }
+        if self.bins:
+            labels = [f"<{self.bins[0]}"]
+            labels += [f"{lo}~{hi}" for lo, hi in zip(self.bins, self.bins[1:])]
+            labels.append(f">={self.bins[-1]}")
+            result['distribution'] = dict(zip(labels, self.histogram))
+        return result
+
+
+def iter_save_events(log_file: str) -> Iterator[Dict[str, Any]]:
+    """
+    로그 파일에서 '영상 저장 완료' 이벤트를 순서대로 추출 (한 줄씩 스트리밍)
+
+    Yields:
+        {'log_time', 'frame_count', 'video_length', 'file_size'}
+    """
+    event = None
+    remaining = 0
+
+    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            if '영상 저장 완료:' in line:
+                match = SAVE_LINE_RE.match(line)
+                if event is not None:
+                    yield event
+                event = None
+                if match:
+                    event = {
+                        'log_time': datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S"),
+                        'frame_count': None,
+                        'video_length': None,
+                        'file_size': None
+                    }
+                    remaining = DETAIL_LINES
+                continue
+
+            if event is None or remaining <= 0:
+                continue
+            remaining -= 1
+
+            if event['frame_count'] is None:
+                frame_match = FRAME_RE.search(line)
+                if frame_match:
+                    event['frame_count'] = int(frame_match.group(1))
+                    continue
+            if event['video_length'] is None:
+                length_match = LENGTH_RE.search(line)
+                if length_match:
+                    event['video_length'] = float(length_match.group(1))
+                    continue
+            if event['file_size'] is None:
+                size_match = SIZE_RE.search(line)
+                if size_match:
+                    event['file_size'] = float(size_match.group(1))
+
+    if event is not None:
+        yield event
+
+
+def analyze_save_log(log_file: str, expected_interval: float = 300.0) -> Dict[str, Any]:
+    """
+    하루치 저장 로그 단일 패스 분석
+
+    Args:
+        log_file: 로그 파일 경로
+        expected_interval: 정상 저장 주기 (초, 기본 5분)
+
+    Returns:
+        이벤트 수, 저장 주기(간격) 통계, 프레임 수/영상 길이/파일 크기 분포,
+        기준 범위(프레임 4400~4600, 길이 280~310초) 이탈 세그먼트
+    """
+    frames = RunningStats(FRAME_BINS)
+    lengths = RunningStats(LENGTH_BINS)
+    sizes = RunningStats()
+    gaps = RunningStats()
+
+    out_of_range_count = 0
+    out_of_range: List[Dict[str, Any]] = []
+    long_gap_count = 0
+    long_gaps: List[Dict[str, Any]] = []
+    missing_fields = 0
+
+    first_time = None
+    prev_time = None
+
+    for event in iter_save_events(log_file):
+        log_time = event['log_time']
+        if first_time is None:
+            first_time = log_time
+
+        # 저장 주기 (이전 세그먼트와의 간격)
+        if prev_time is not None:
+            gap = (log_time - prev_time).total_seconds()
+            gaps.add(gap)
+            if gap > expected_interval * 1.5:
+                long_gap_count += 1
+                if len(long_gaps) < MAX_SAMPLES:
+                    long_gaps.append({
+                        'from': prev_time.strftime("%Y-%m-%d %H:%M:%S"),
+                        'to': log_time.strftime("%Y-%m-%d %H:%M:%S"),
+                        'gap_seconds': gap
+                    })
+        prev_time = log_time
+
+        frame_count = event['frame_count']
+        video_length = event['video_length']
+        if event['file_size'] is not None:
+            sizes.add(event['file_size'])
+
+        if frame_count is None or video_length is None:
+            missing_fields += 1
+            continue
+
+        frames.add(frame_count)
+        lengths.add(video_length)
+
+        reasons = []
+        if not FRAME_RANGE[0] <= frame_count <= FRAME_RANGE[1]:
+            reasons.append('frame_count')
+        if not LENGTH_RANGE[0] <= video_length <= LENGTH_RANGE[1]:
+            reasons.append('video_length')
+        if reasons:
+            out_of_range_count += 1
+            if len(out_of_range) < MAX_SAMPLES:
+                out_of_range.append({
+                    'log_time': log_time.strftime("%Y-%m-%d %H:%M:%S"),
+                    'frame_count': frame_count,
+                    'video_length': video_length,
+                    'file_size': event['file_size'],
+                    'reasons': reasons
+                })
+
+    return {
+        'log_file': log_file,
+        'event_count': frames.count + missing_fields,
+        'first_event': first_time.strftime("%Y-%m-%d %H:%M:%S") if first_time else None,
+        'last_event': prev_time.strftime("%Y-%m-%d %H:%M:%S") if prev_time else None,
+        'missing_fields': missing_fields,
+        'cadence': gaps.to_dict(),
+        'long_gap_count': long_gap_count,
+        'long_gaps': long_gaps,
+        'frame_count': frames.to_dict(),
+        'video_length': lengths.to_dict(),
+        'file_size_mb': sizes.to_dict(),
+        'out_of_range_count': out_of_range_count,
+        'out_of_range': out_of_range
+    }
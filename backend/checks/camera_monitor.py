@@ -0,0 +1,347 @@
+"""
+카메라 스트림 상시 모니터 모듈
+- 스트림별 저속 리더 1개 유지 (주기적 grab 또는 재연결 스케줄)
+- 생존 여부, FPS, 마지막 프레임 시각을 메모리에 롤링 통계로 보관
+  (grab 모드: 스트림 타임스탬프가 멈추거나 grab이 샘플 간격보다 느리면 중단으로 판정)
+- 전체 디코딩 예산(초당 프레임 수)으로 리소스 사용량 제한
+- check_cameras는 통계가 최신이면 즉시 응답, 아니면 능동 점검으로 폴백
+- 프레임 백엔드: OpenCV (기본) 또는 ffmpeg 파이프 (축소 raw 프레임, 샘플마다 프로세스 실행)
+"""
+import cv2
+import time
+import threading
+import logging
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+# camera_check import 시 OpenCV/FFmpeg 환경변수가 함께 설정됨
+from .camera_check import generate_camera_urls, ffmpeg_options_for
+from .ffmpeg_pipe import FFmpegFrameReader, ffmpeg_available
+
+logger = logging.getLogger(__name__)
+
+
+class DecodeBudget:
+    """전체 디코딩 예산 (토큰 버킷, 초당 프레임 수)"""
+
+    def __init__(self, frames_per_second: float):
+        self.rate = max(float(frames_per_second), 0.1)
+        self.capacity = max(self.rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, frames: int, stop_event: threading.Event) -> bool:
+        """
+        프레임 수만큼 예산 확보 (부족하면 대기)
+
+        Returns:
+            확보 성공 여부 (중지 요청 시 False)
+        """
+        frames = min(frames, self.capacity)
+        with self.cond:
+            while not stop_event.is_set():
+                self._refill()
+                if self.tokens >= frames:
+                    self.tokens -= frames
+                    return True
+                wait = (frames - self.tokens) / self.rate
+                self.cond.wait(timeout=min(wait, 1.0))
+        return False
+
+
+class StreamReader:
+    """스트림 1개를 담당하는 저속 리더 (백그라운드 스레드)"""
+
+    def __init__(self, url: str, label: str, budget: DecodeBudget,
+                 mode: str = "grab", interval: float = 5.0,
+                 burst_frames: int = 3, timeout: int = 10, history: int = 20,
+                 ffmpeg_options: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            url: RTSP URL
+            label: 표시용 이름 (예: "카메라 1 원본")
+            budget: 공유 디코딩 예산
+            mode: "grab" (연결 유지 후 주기적 grab) 또는 "reconnect" (매 샘플마다 연결/해제)
+            interval: 샘플 간격 (초)
+            burst_frames: 샘플당 읽을 프레임 수 (FPS 계산용, 최소 2)
+            timeout: 연결/읽기 타임아웃 (초)
+            history: 롤링 통계에 보관할 샘플 수
+            ffmpeg_options: ffmpeg 파이프 백엔드 옵션 (None이면 OpenCV)
+                            파이프가 가득 차면 ffmpeg가 멈춰 오래된 프레임이 쌓이므로
+                            mode와 관계없이 샘플마다 프로세스를 실행/종료
+        """
+        self.url = url
+        self.label = label
+        self.budget = budget
+        self.mode = mode
+        self.interval = interval
+        self.burst_frames = max(2, burst_frames)
+        self.timeout = timeout
+        self.ffmpeg_options = ffmpeg_options
+
+        self.cap: Optional[cv2.VideoCapture] = None
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+        # 롤링 통계
+        self.samples = deque(maxlen=history)  # (샘플 시각, 성공 여부, fps)
+        self.last_frame_time: Optional[float] = None
+        self.last_sample_time: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.width: Optional[int] = None
+        self.height: Optional[int] = None
+        self.reconnects = 0
+        self.consecutive_failures = 0
+        self.last_position: Optional[float] = None  # 직전 샘플의 마지막 스트림 타임스탬프 (ms)
+
+    def start(self):
+        """리더 스레드 시작"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name=f"monitor-{self.label}", daemon=True)
+        self.thread.start()
+
+    def stop(self, join_timeout: Optional[float] = None):
+        """
+        리더 스레드 종료
+        캡처 해제는 리더 스레드만 수행 (grab 중인 VideoCapture를 다른 스레드에서 release하지 않도록)
+        기본 대기 시간은 읽기 타임아웃 + 샘플 간격 (진행 중인 grab이 끝날 때까지)
+        """
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(join_timeout if join_timeout is not None else self.timeout + self.interval + 1)
+            if self.thread.is_alive():
+                logger.warning(f"모니터 리더 종료 대기 시간 초과: {self.label} (리더 스레드가 종료 시 해제)")
+
+    def _open(self) -> bool:
+        self._release()
+        cap = cv2.VideoCapture(self.url)
+        cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, self.timeout * 1000)
+        cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, self.timeout * 1000)
+        if not cap.isOpened():
+            cap.release()
+            return False
+        self.cap = cap
+        self.last_position = None
+        self.reconnects += 1
+        return True
+
+    def _release(self):
+        if self.cap is not None:
+            try:
+                self.cap.release()
+            except Exception:
+                pass
+            self.cap = None
+
+    def _sample_ffmpeg(self) -> Dict[str, Any]:
+        """
+        ffmpeg 파이프로 프레임 burst를 읽어 FPS 계산
+        raw 프레임에는 타임스탬프가 없으므로 첫 프레임 이후 수신 간격(벽시계) 기준 근사치
+        """
+        with FFmpegFrameReader(self.url, timeout=self.timeout, **self.ffmpeg_options) as reader:
+            self.reconnects += 1
+            times = []
+            for _ in range(self.burst_frames):
+                if reader.read() is None:
+                    return {'success': False, 'error': reader.last_error or 'Failed to read frame'}
+                times.append(time.monotonic())
+
+            self.width, self.height = reader.width, reader.height
+
+        fps = None
+        span = times[-1] - times[0]
+        if span > 0:
+            fps = (len(times) - 1) / span
+        return {'success': True, 'fps': fps}
+
+    def _sample(self) -> Dict[str, Any]:
+        """
+        프레임 burst를 읽어 FPS 계산
+        FPS는 스트림 타임스탬프(CAP_PROP_POS_MSEC) 기준이므로 버퍼링 영향을 받지 않음
+        연결을 유지하는 동안 타임스탬프가 앞으로 가지 않거나(같은 프레임 반복, 스트림 정지)
+        grab 1회가 샘플 간격보다 오래 걸리면 실패로 판정
+        """
+        if self.ffmpeg_options is not None:
+            return self._sample_ffmpeg()
+
+        if self.cap is None and not self._open():
+            return {'success': False, 'error': 'Failed to open RTSP stream'}
+
+        positions = []
+        for _ in range(self.burst_frames):
+            started = time.monotonic()
+            if not self.cap.grab():
+                return {'success': False, 'error': 'Failed to read frame'}
+            elapsed = time.monotonic() - started
+            if elapsed > self.interval:
+                return {'success': False,
+                        'error': f'Frame grab slower than sample interval ({elapsed:.1f}s)'}
+            positions.append(self.cap.get(cv2.CAP_PROP_POS_MSEC))
+
+        previous = self.last_position if self.last_position is not None else positions[0]
+        self.last_position = positions[-1]
+        if positions[-1] <= previous:
+            return {'success': False, 'error': 'Stream timestamp not advancing'}
+
+        fps = None
+        span_ms = positions[-1] - positions[0]
+        if span_ms > 0:
+            fps = (len(positions) - 1) * 1000.0 / span_ms
+
+        # 해상도는 최초 1회만 확인 (retrieve 비용 절약)
+        if self.width is None:
+            ret, frame = self.cap.retrieve()
+            if ret and frame is not None:
+                self.height, self.width = frame.shape[:2]
+
+        return {'success': True, 'fps': fps}
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            if not self.budget.acquire(self.burst_frames, self.stop_event):
+                break
+
+            try:
+                sample = self._sample()
+            except Exception as e:
+                sample = {'success': False, 'error': str(e)}
+
+            self._record(sample)
+
+            # 실패 시 또는 재연결 모드에서는 연결 해제
+            if not sample['success'] or self.mode == "reconnect":
+                self._release()
+
+            self.stop_event.wait(self.interval)
+
+        self._release()
+
+    def _record(self, sample: Dict[str, Any]):
+        """샘플 결과를 롤링 통계에 반영"""
+        now = time.time()
+        with self.lock:
+            self.last_sample_time = now
+            self.samples.append((now, sample['success'], sample.get('fps')))
+            if sample['success']:
+                self.last_frame_time = now
+                self.last_error = None
+                self.consecutive_failures = 0
+            else:
+                self.last_error = sample.get('error')
+                self.consecutive_failures += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 롤링 통계 스냅샷"""
+        with self.lock:
+            fps_values = [fps for _, ok, fps in self.samples if ok and fps]
+            success_count = sum(1 for _, ok, _ in self.samples if ok)
+            return {
+                'label': self.label,
+                'alive': self.consecutive_failures == 0 and self.last_frame_time is not None,
+                'fps': round(sum(fps_values) / len(fps_values), 2) if fps_values else None,
+                'last_frame_time': self.last_frame_time,
+                'last_sample_time': self.last_sample_time,
+                'success_rate': round(success_count / len(self.samples), 3) if self.samples else None,
+                'consecutive_failures': self.consecutive_failures,
+                'reconnects': self.reconnects,
+                'width': self.width,
+                'height': self.height,
+                'last_error': self.last_error
+            }
+
+
+class CameraMonitor:
+    """전체 카메라 스트림 상시 모니터 (원본 + 블러 처리 스트림)"""
+
+    def __init__(self, camera_count: int, camera_config: Dict[str, str],
+                 mode: str = "grab", interval: float = 5.0,
+                 decode_budget: float = 4.0, max_age: float = 30.0,
+                 burst_frames: int = 3, frame_backend: str = "opencv"):
+        """
+        Args:
+            camera_count: 카메라 개수
+            camera_config: check_cameras와 동일한 카메라 설정
+            mode: "grab" 또는 "reconnect"
+            interval: 스트림별 샘플 간격 (초)
+            decode_budget: 전체 디코딩 예산 (초당 프레임 수, 모든 스트림 합계)
+            max_age: 통계를 최신으로 인정하는 최대 경과 시간 (초)
+            burst_frames: 샘플당 읽을 프레임 수
+            frame_backend: "opencv" 또는 "ffmpeg" (ffmpeg가 없으면 OpenCV로 폴백)
+        """
+        self.cameras = generate_camera_urls(
+            camera_count=camera_count,
+            base_ip=camera_config.get('base_ip', '192.168.1'),
+            start_ip=int(camera_config.get('start_ip', 101)),
+            username=camera_config.get('username', 'root'),
+            password=camera_config.get('password', 'root'),
+            rtsp_path=camera_config.get('rtsp_path', 'cam0_0'),
+            rtsp_port=int(camera_config.get('rtsp_port', 554)),
+            mediamtx_base_port=int(camera_config.get('mediamtx_base_port', 1111))
+        )
+        self.max_age = max_age
+        self.budget = DecodeBudget(decode_budget)
+        self.readers: Dict[str, StreamReader] = {}
+
+        use_ffmpeg = frame_backend == "ffmpeg"
+        if use_ffmpeg and not ffmpeg_available(camera_config.get('ffmpeg_path', 'ffmpeg') or 'ffmpeg'):
+            logger.warning("ffmpeg 실행 파일을 찾을 수 없어 OpenCV 백엔드로 모니터링합니다.")
+            use_ffmpeg = False
+
+        for camera in self.cameras:
+            ffmpeg_options = ffmpeg_options_for(camera, camera_config) if use_ffmpeg else None
+            for stream_type, url_key, suffix in (("source", 'source_url', "원본"),
+                                                 ("mediamtx", 'mediamtx_url', "블러")):
+                url = camera[url_key]
+                self.readers[url] = StreamReader(
+                    url=url,
+                    label=f"{camera['name']} {suffix}",
+                    budget=self.budget,
+                    mode=mode,
+                    interval=interval,
+                    burst_frames=burst_frames,
+                    ffmpeg_options=ffmpeg_options
+                )
+
+    def start(self):
+        """모든 리더 시작"""
+        for reader in self.readers.values():
+            reader.start()
+        logger.info(f"카메라 모니터 시작: 스트림 {len(self.readers)}개, "
+                    f"디코딩 예산 {self.budget.rate}fps")
+
+    def stop(self):
+        """모든 리더 종료"""
+        for reader in self.readers.values():
+            reader.stop_event.set()
+        for reader in self.readers.values():
+            reader.stop()
+        logger.info("카메라 모니터 종료")
+
+    def get_stats(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        URL에 대한 통계 조회
+
+        Returns:
+            통계 스냅샷 (fresh 키 포함) 또는 None (모니터 대상 아님)
+        """
+        reader = self.readers.get(url)
+        if reader is None:
+            return None
+        stats = reader.snapshot()
+        last_sample = stats['last_sample_time']
+        stats['age_seconds'] = round(time.time() - last_sample, 1) if last_sample else None
+        stats['fresh'] = last_sample is not None and (time.time() - last_sample) <= self.max_age
+        return stats
+
+    def get_all_stats(self) -> List[Dict[str, Any]]:
+        """전체 스트림 통계"""
+        return [self.get_stats(url) for url in self.readers]
@@ -0,0 +1,111 @@
+"""
+카메라 TCP 도달성 스윕 모듈
+asyncio로 모든 카메라 RTSP 포트(554)와 로컬 MediaMTX 포트(1111+N)에 동시 연결 시도
+RTSP 디코딩 점검 전에 실행하여 연결 불가 장비를 빠르게 걸러냄
+(연결 시간 초과 대상은 한 번 더 연결해 확인 - 순간 SYN 손실로 디코딩 점검을 건너뛰지 않도록)
+"""
+import asyncio
+import time
+from typing import List, Dict, Any, Tuple
+
+
+async def probe_tcp(host: str, port: int, timeout: float = 0.4) -> Dict[str, Any]:
+    """
+    TCP 연결 1회 시도
+
+    Returns:
+        {'host', 'port', 'reachable', 'connect_ms', 'error'}
+    """
+    start = time.monotonic()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+        connect_ms = (time.monotonic() - start) * 1000
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+        return {
+            'host': host,
+            'port': port,
+            'reachable': True,
+            'connect_ms': round(connect_ms, 1),
+            'error': None
+        }
+    except asyncio.TimeoutError:
+        error = f'Connect timeout ({timeout}s)'
+    except OSError as e:
+        error = f'{type(e).__name__}: {e.strerror or e}'
+    except Exception as e:
+        error = str(e)
+
+    return {
+        'host': host,
+        'port': port,
+        'reachable': False,
+        'connect_ms': round((time.monotonic() - start) * 1000, 1),
+        'error': error
+    }
+
+
+async def sweep_tcp_async(targets: List[Tuple[str, int]], timeout: float = 0.4) -> List[Dict[str, Any]]:
+    """여러 (host, port) 대상에 동시 연결 시도 (입력 순서대로 결과 반환)"""
+    return await asyncio.gather(*(probe_tcp(host, port, timeout) for host, port in targets))
+
+
+def sweep_tcp(targets: List[Tuple[str, int]], timeout: float = 0.4) -> List[Dict[str, Any]]:
+    """sweep_tcp_async 동기 래퍼 (executor 스레드 등 이벤트 루프 밖에서 호출)"""
+    return asyncio.run(sweep_tcp_async(targets, timeout))
+
+
+def sweep_camera_ports(cameras: List[Dict[str, Any]], rtsp_port: int = 554,
+                       timeout: float = 0.4) -> Dict[str, Any]:
+    """
+    카메라 원본 RTSP 포트 + MediaMTX 포트 도달성 스윕
+    연결 시간 초과로 실패한 대상만 같은 타임아웃으로 1회 재확인 (연결 거부는 즉시 확정)
+    → 필터링된 IP가 있어도 전체 소요 시간은 timeout x 2 이내
+
+    Args:
+        cameras: generate_camera_urls 결과
+        rtsp_port: 카메라 RTSP 포트
+        timeout: 대상별 연결 타임아웃 (초)
+
+    Returns:
+        {
+            'duration_ms': 전체 소요 시간 (재확인 포함),
+            'cameras': {camera_num: {'source': probe, 'mediamtx': probe}},
+            'unreachable': [연결 실패 probe 목록]
+        }
+    """
+    targets = []
+    for camera in cameras:
+        targets.append((camera['ip'], rtsp_port))
+        targets.append(('127.0.0.1', camera['mediamtx_port']))
+
+    start = time.monotonic()
+    probes = sweep_tcp(targets, timeout)
+    for probe in probes:
+        probe['attempts'] = 1
+    retry = [idx for idx, probe in enumerate(probes)
+             if not probe['reachable'] and probe['error'].startswith('Connect timeout')]
+    if retry:
+        rechecks = sweep_tcp([targets[idx] for idx in retry], timeout)
+        for idx, probe in zip(retry, rechecks):
+            # 재확인 결과로 교체 (소요 시간은 두 시도 합계)
+            probe['connect_ms'] = round(probes[idx]['connect_ms'] + probe['connect_ms'], 1)
+            probe['attempts'] = 2
+            probes[idx] = probe
+    duration_ms = (time.monotonic() - start) * 1000
+
+    by_camera = {}
+    for idx, camera in enumerate(cameras):
+        by_camera[camera['camera_num']] = {
+            'source': probes[idx * 2],
+            'mediamtx': probes[idx * 2 + 1]
+        }
+
+    return {
+        'duration_ms': round(duration_ms, 1),
+        'cameras': by_camera,
+        'unreachable': [probe for probe in probes if not probe['reachable']]
+    }
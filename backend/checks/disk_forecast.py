@@ -0,0 +1,242 @@
+"""
+디스크 사용량 정밀 파싱 + 증가 속도/가득 참 예측 모듈
+- df -P -B1 (바이트 단위, POSIX 형식) 출력 파싱 → 반올림된 df -h 대신 정확한 값
+- 마운트별 사용량 이력을 JSON 파일에 보관 (NAS/로컬 공통, 1시간 구간당 1개 - 반복 실행이 오래된 이력을 밀어내지 않음)
+- 최근 실행 기록에 Theil-Sen 회귀(기울기 쌍의 중앙값)를 적용해 일당 증가량 추정
+  → 일시적 삭제/급증 1~2회에 흔들리지 않음, 기록 기간이 며칠 이상일 때만 예측
+- 남은 용량 / 일당 증가량으로 가득 찰 때까지 남은 일수 계산 → 90% 도달 전 몇 주 앞서 경고
+"""
+import os
+import re
+import json
+import shlex
+import time
+import logging
+import statistics
+import threading
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400
+
+# 용량 판정에서 제외할 가상 파일시스템
+PSEUDO_FILESYSTEMS = ('tmpfs', 'devtmpfs', 'none', 'udev', 'overlay', 'shm')
+
+_block_re = re.compile(r'^(\d+)([KMG]?)B?-blocks$', re.I)
+
+
+def df_command(path: Optional[str] = None) -> str:
+    """
+    바이트 단위 df 명령 (POSIX 형식)
+    -B1을 지원하지 않는 df(구버전 BusyBox)는 KB 단위로 대체 (헤더로 단위 판별)
+    """
+    target = f" {shlex.quote(path)}" if path else ""
+    return f"df -P -B1{target} 2>/dev/null || df -P -k{target}"
+
+
+DF_BYTES_COMMAND = df_command()
+
+
+def parse_df_bytes(text: str) -> List[Dict[str, Any]]:
+    """
+    df -P 출력 파싱 (블록 단위는 헤더에서 판별: 1-blocks, 1B-blocks, 1024-blocks 등)
+
+    Returns:
+        [{'filesystem', 'size', 'used', 'avail', 'percent', 'mount'}] (바이트, percent는 df와 같은 방식의 소수)
+    """
+    mounts = []
+    unit = 1
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) < 6:
+            continue
+        block = _block_re.match(parts[1])
+        if block:
+            unit = int(block.group(1)) * {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}[block.group(2).upper()]
+            continue
+        try:
+            size, used, avail = (int(value) * unit for value in parts[1:4])
+        except ValueError:
+            continue
+        # df와 같은 방식: 사용 / (사용 + 여유) → 예약 블록 제외
+        percent = round(used * 100 / (used + avail), 2) if used + avail > 0 else 0.0
+        mounts.append({
+            'filesystem': parts[0],
+            'size': size,
+            'used': used,
+            'avail': avail,
+            'percent': percent,
+            'mount': ' '.join(parts[5:])
+        })
+    return mounts
+
+
+def is_pseudo(mount: Dict[str, Any]) -> bool:
+    """가상/임시 파일시스템 여부 (용량 0 포함)"""
+    return mount['size'] == 0 or mount['filesystem'] in PSEUDO_FILESYSTEMS
+
+
+def format_bytes(value: Optional[float]) -> str:
+    """df -h와 비슷한 사람이 읽는 단위 (예: 5.2T, 826M)"""
+    if value is None:
+        return 'N/A'
+    value = float(value)
+    sign = '-' if value < 0 else ''
+    value = abs(value)
+    for suffix in ('B', 'K', 'M', 'G', 'T'):
+        if value < 1024 or suffix == 'T':
+            return f"{sign}{value:.0f}{suffix}" if suffix == 'B' or value >= 100 else f"{sign}{value:.1f}{suffix}"
+        value /= 1024
+
+
+def format_df_table(mounts: List[Dict[str, Any]]) -> str:
+    """파싱 결과를 df -h 형식 표로 출력 (기존 disk_usage 표시용)"""
+    lines = ["Filesystem      Size  Used Avail Use% Mounted on"]
+    for mount in mounts:
+        lines.append(f"{mount['filesystem']:<15} {format_bytes(mount['size']):>5} {format_bytes(mount['used']):>5} "
+                     f"{format_bytes(mount['avail']):>5} {mount['percent']:>3.0f}% {mount['mount']}")
+    return '\n'.join(lines)
+
+
+def theil_sen(points: List[tuple]) -> Optional[float]:
+    """
+    Theil-Sen 기울기 추정 (모든 점 쌍 기울기의 중앙값)
+
+    Args:
+        points: [(x, y)] (x가 같은 쌍은 제외)
+
+    Returns:
+        기울기 (점 쌍이 없으면 None)
+    """
+    slopes = []
+    for i in range(len(points)):
+        x1, y1 = points[i]
+        for j in range(i + 1, len(points)):
+            x2, y2 = points[j]
+            if x2 != x1:
+                slopes.append((y2 - y1) / (x2 - x1))
+    return statistics.median(slopes) if slopes else None
+
+
+class UsageHistory:
+    """
+    마운트별 사용량 이력 (파일 공유)
+
+    형식: {'mounts': {키: [[시각, 사용 바이트, 사용 가능 용량(사용 + 여유) 바이트], ...]}}
+    키: "nas:192.168.10.30:/volume1", "local:/" 등
+    같은 구간(bucket_seconds) 안의 기록은 최신 값 1개로 교체
+    → 현장 점검/웹 수동 점검을 반복해도 며칠치 이력이 유지됨
+    """
+
+    def __init__(self, path: Optional[str] = None, max_points: int = 24 * 14, max_age_days: float = 90.0,
+                 bucket_seconds: float = 3600):
+        self.path = path
+        self.max_points = max_points
+        self.max_age = max_age_days * DAY
+        self.bucket = bucket_seconds
+        self.lock = threading.Lock()
+        self.mounts: Dict[str, List[list]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.mounts = json.load(f).get('mounts', {})
+        except Exception as e:
+            logger.warning(f"디스크 사용량 이력 로드 실패 (초기화): {e}")
+            self.mounts = {}
+
+    def _save(self):
+        """이력 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'mounts': self.mounts}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"디스크 사용량 이력 저장 실패: {e}")
+
+    def record(self, key: str, used: int, size: int, now: Optional[float] = None) -> List[list]:
+        """
+        이번 사용량 추가 (마지막 기록과 같은 구간이면 교체, 오래된 기록/개수 초과분 정리)
+
+        Args:
+            size: 사용 가능 용량 (사용 + 여유, 예약 블록 제외)
+
+        Returns:
+            이번 기록을 포함한 이력 (오래된 순)
+        """
+        now = now if now is not None else time.time()
+        with self.lock:
+            points = self.mounts.setdefault(key, [])
+            if points and points[-1][0] // self.bucket == now // self.bucket:
+                points[-1] = [now, used, size]
+            else:
+                points.append([now, used, size])
+            points[:] = [point for point in points if now - point[0] <= self.max_age][-self.max_points:]
+            self._save()
+            return [list(point) for point in points]
+
+
+def forecast_usage(points: List[list], min_points: int = 3, min_span_days: float = 3.0) -> Dict[str, Any]:
+    """
+    사용량 이력으로 일당 증가량과 가득 찰 때까지 남은 일수 추정
+    기록 기간이 min_span_days 미만이면 추정하지 않음 (녹화 볼륨의 시간대별 쓰기 급증을 일 단위로 확대하지 않도록)
+
+    Args:
+        points: [[시각, 사용 바이트, 사용 가능 용량 바이트]] (오래된 순, 마지막이 현재)
+        min_points: 추정에 필요한 최소 기록 수
+        min_span_days: 추정에 필요한 최소 기록 기간 (일)
+
+    Returns:
+        {'samples', 'span_days', 'bytes_per_day', 'days_to_full'} (추정 불가 시 bytes_per_day/days_to_full은 None)
+    """
+    result = {'samples': len(points), 'span_days': 0.0, 'bytes_per_day': None, 'days_to_full': None}
+    if not points:
+        return result
+
+    span = points[-1][0] - points[0][0]
+    result['span_days'] = round(span / DAY, 2)
+    if len(points) < min_points or span < min_span_days * DAY:
+        return result
+
+    slope = theil_sen([(ts / DAY, used) for ts, used, _ in points])
+    if slope is None:
+        return result
+    result['bytes_per_day'] = round(slope)
+
+    _, used, size = points[-1]
+    if slope > 0 and size > used:
+        result['days_to_full'] = round((size - used) / slope, 1)
+    return result
+
+
+def evaluate_usage(percent: float, days_to_full: Optional[float],
+                   warn_days: float = 30, fail_days: float = 7) -> str:
+    """
+    사용량 판정 (고정 기준 80/90% + 가득 참 예측)
+
+    - FAIL: 90% 이상 또는 fail_days 이내 가득 참
+    - WARN: 80% 이상 또는 warn_days 이내 가득 참
+    """
+    if percent >= 90 or (days_to_full is not None and days_to_full <= fail_days):
+        return 'FAIL'
+    if percent >= 80 or (days_to_full is not None and days_to_full <= warn_days):
+        return 'WARN'
+    return 'PASS'
+
+
+def history_from_config(config: Optional[Dict[str, str]]) -> Optional[UsageHistory]:
+    """
+    점검 설정에서 사용량 이력 생성 (경로가 비어 있으면 None → 예측 없이 고정 기준만 적용)
+
+    설정 키: disk_history_path
+    """
+    if not config or not config.get('disk_history_path'):
+        return None
+    return UsageHistory(config['disk_history_path'])
@@ -0,0 +1,304 @@
+"""
+FFmpeg 파이프 프레임 백엔드
+ffmpeg 서브프로세스가 축소된 raw 프레임을 stdout 파이프로 출력하고,
+재사용하는 NumPy 버퍼에 readinto로 직접 읽음 (프레임마다 새 배열 할당 없음)
+- 카메라별 RTSP 전송 방식(TCP/UDP), 출력 해상도, 프레임레이트 제한 지정
+- OPENCV_FFMPEG_CAPTURE_OPTIONS 환경변수(프로세스 전역)에 의존하지 않음
+- 샘플링/분석용 경량 점검 (OpenCV 전체 해상도 디코딩 대비 메모리/CPU 절약)
+"""
+import os
+import re
+import time
+import shutil
+import select
+import subprocess
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+# 픽셀 형식별 채널 수
+PIXEL_CHANNELS = {'bgr24': 3, 'gray': 1}
+
+# stderr 보관 최대 크기 (마지막 오류 메시지 확인용)
+STDERR_TAIL_BYTES = 2048
+
+
+def ffmpeg_available(ffmpeg_path: str = "ffmpeg") -> bool:
+    """ffmpeg 실행 파일 존재 여부"""
+    return shutil.which(ffmpeg_path) is not None
+
+
+@lru_cache(maxsize=8)
+def ffmpeg_major_version(ffmpeg_path: str = "ffmpeg") -> Optional[int]:
+    """
+    ffmpeg 주 버전 ("ffmpeg version 4.4.2-0ubuntu0.22.04.1" → 4, 실행 파일별 1회만 확인)
+    git 빌드("N-109421-g...")나 확인 실패는 None
+    """
+    try:
+        output = subprocess.run([ffmpeg_path, '-hide_banner', '-version'], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r'version\s+n?(\d+)\.', output)
+    return int(match.group(1)) if match else None
+
+
+def rtsp_timeout_option(version: Optional[int]) -> str:
+    """
+    RTSP 소켓 타임아웃 옵션 이름 (값은 마이크로초)
+    ffmpeg 4.x의 rtsp -timeout은 수신 대기(listen) 타임아웃이라 연결 대신 대기 모드가 되므로 -stimeout 사용
+    5.0부터 -stimeout이 제거되고 -timeout이 소켓 타임아웃 (버전을 모르면 최신 기준)
+    """
+    return '-stimeout' if version is not None and version < 5 else '-timeout'
+
+
+def parse_transport_overrides(value: Optional[str]) -> Dict[int, str]:
+    """
+    카메라별 RTSP 전송 방식 설정 파싱
+    형식: "1:tcp,3:udp" → {1: 'tcp', 3: 'udp'}
+    """
+    overrides = {}
+    if not value:
+        return overrides
+    for part in str(value).split(','):
+        if ':' not in part:
+            continue
+        camera_num, transport = part.split(':', 1)
+        transport = transport.strip().lower()
+        if camera_num.strip().isdigit() and transport in ('tcp', 'udp'):
+            overrides[int(camera_num)] = transport
+    return overrides
+
+
+class FFmpegFrameReader:
+    """ffmpeg 서브프로세스 기반 프레임 리더 (고정 크기 raw 프레임, 버퍼 재사용)"""
+
+    def __init__(self, url: str, width: int = 640, height: int = 360,
+                 transport: str = "tcp", fps: Optional[float] = None,
+                 pix_fmt: str = "bgr24", timeout: float = 10.0,
+                 ffmpeg_path: str = "ffmpeg"):
+        """
+        Args:
+            url: RTSP URL (rtsp://가 아니면 파일/기타 입력으로 취급)
+            width: 출력 프레임 너비 (ffmpeg에서 축소)
+            height: 출력 프레임 높이
+            transport: RTSP 전송 방식 ("tcp" 또는 "udp")
+            fps: 출력 프레임레이트 제한 (None이면 제한 없음)
+            pix_fmt: 출력 픽셀 형식 ("bgr24" 또는 "gray")
+            timeout: 연결 및 프레임 읽기 타임아웃 (초)
+            ffmpeg_path: ffmpeg 실행 파일 경로
+        """
+        if pix_fmt not in PIXEL_CHANNELS:
+            raise ValueError(f"지원하지 않는 픽셀 형식: {pix_fmt}")
+
+        self.url = url
+        self.width = int(width)
+        self.height = int(height)
+        self.transport = transport
+        self.fps = fps
+        self.pix_fmt = pix_fmt
+        self.timeout = timeout
+        self.ffmpeg_path = ffmpeg_path
+
+        channels = PIXEL_CHANNELS[pix_fmt]
+        shape = (self.height, self.width, channels) if channels > 1 else (self.height, self.width)
+        self.frame_bytes = self.width * self.height * channels
+        # 재사용 버퍼 (read()가 반환하는 배열은 다음 read() 호출 시 덮어씀)
+        self.buffer = np.empty(shape, dtype=np.uint8)
+        self.view = memoryview(self.buffer.reshape(-1))
+
+        self.process: Optional[subprocess.Popen] = None
+        self.stderr_tail = b""
+        self.frames_read = 0
+
+    def build_command(self) -> list:
+        """ffmpeg 명령 구성"""
+        command = [self.ffmpeg_path, '-nostdin', '-hide_banner', '-loglevel', 'error']
+        if self.url.startswith('rtsp://'):
+            command += [
+                '-rtsp_transport', self.transport,
+                rtsp_timeout_option(ffmpeg_major_version(self.ffmpeg_path)),
+                str(int(self.timeout * 1_000_000)),  # 소켓 타임아웃 (마이크로초)
+                '-fflags', 'nobuffer'
+            ]
+        command += ['-i', self.url, '-an', '-sn', '-dn']
+
+        filters = []
+        if self.fps:
+            filters.append(f"fps={self.fps}")
+        filters.append(f"scale={self.width}:{self.height}")
+        command += ['-vf', ','.join(filters)]
+
+        command += ['-f', 'rawvideo', '-pix_fmt', self.pix_fmt, 'pipe:1']
+        return command
+
+    def open(self):
+        """ffmpeg 프로세스 시작"""
+        self.close()
+        self.stderr_tail = b""
+        self.frames_read = 0
+        # bufsize=0 → stdout이 FileIO (readinto가 파이프에 있는 만큼만 즉시 반환)
+        self.process = subprocess.Popen(
+            self.build_command(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        os.set_blocking(self.process.stderr.fileno(), False)
+
+    def _drain_stderr(self):
+        """stderr를 비워 ffmpeg가 블로킹되지 않도록 하고 마지막 부분만 보관"""
+        try:
+            chunk = self.process.stderr.read(65536)
+        except (BlockingIOError, ValueError):
+            return
+        if chunk:
+            self.stderr_tail = (self.stderr_tail + chunk)[-STDERR_TAIL_BYTES:]
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """ffmpeg가 출력한 마지막 오류 메시지"""
+        if not self.stderr_tail:
+            return None
+        lines = self.stderr_tail.decode('utf-8', errors='ignore').strip().splitlines()
+        return lines[-1] if lines else None
+
+    def read(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        다음 프레임 1개 읽기
+
+        Args:
+            timeout: 프레임 읽기 타임아웃 (초, None이면 생성자 값)
+
+        Returns:
+            재사용 버퍼 (다음 read() 전에 보관하려면 copy 필요) 또는 None (타임아웃/스트림 종료)
+        """
+        if self.process is None:
+            self.open()
+
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        stdout = self.process.stdout
+        stderr = self.process.stderr
+        filled = 0
+
+        while filled < self.frame_bytes:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([stdout, stderr], [], [], remaining)
+            if stderr in ready:
+                self._drain_stderr()
+            if stdout not in ready:
+                continue
+            count = stdout.readinto(self.view[filled:])
+            if not count:
+                # 스트림 종료 (ffmpeg 종료)
+                self._drain_stderr()
+                return None
+            filled += count
+
+        self.frames_read += 1
+        return self.buffer
+
+    def close(self):
+        """ffmpeg 프로세스 종료"""
+        if self.process is None:
+            return
+        process = self.process
+        self.process = None
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        for stream in (process.stdout, process.stderr):
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def test_ffmpeg_connection(rtsp_url: str, timeout: float = 10,
+                           read_timeout: Optional[float] = None,
+                           options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    카메라 연결 테스트 (ffmpeg 파이프)
+    test_camera_connection과 같은 형식의 결과 반환
+
+    ffmpeg는 연결과 첫 디코딩이 분리되지 않으므로
+    open_ms = 첫 바이트 수신까지, first_frame_ms = 첫 프레임 완성까지 추가 시간
+
+    Args:
+        rtsp_url: RTSP URL
+        timeout: 연결 타임아웃 (초)
+        read_timeout: 첫 프레임 읽기 타임아웃 (초, None이면 timeout과 동일)
+        options: FFmpegFrameReader 옵션 (width, height, transport, fps, pix_fmt, ffmpeg_path)
+
+    Returns:
+        연결 결과 (frame은 재사용 버퍼의 복사본)
+    """
+    if read_timeout is None:
+        read_timeout = timeout
+    options = dict(options or {})
+
+    reader = None
+    start = time.monotonic()
+    try:
+        reader = FFmpegFrameReader(rtsp_url, timeout=timeout, **options)
+        reader.open()
+
+        # 첫 바이트 대기 (연결 + 첫 디코딩)
+        stdout = reader.process.stdout
+        ready, _, _ = select.select([stdout], [], [], timeout)
+        open_ms = (time.monotonic() - start) * 1000
+        if not ready:
+            reader._drain_stderr()
+            return {
+                'success': False,
+                'error': reader.last_error or 'Failed to open RTSP stream',
+                'open_ms': round(open_ms, 1),
+                'first_frame_ms': None
+            }
+
+        read_start = time.monotonic()
+        frame = reader.read(timeout=read_timeout)
+        first_frame_ms = (time.monotonic() - read_start) * 1000
+
+        if frame is None:
+            return {
+                'success': False,
+                'error': reader.last_error or 'Failed to read frame',
+                'open_ms': round(open_ms, 1),
+                'first_frame_ms': round(first_frame_ms, 1)
+            }
+
+        return {
+            'success': True,
+            'width': reader.width,
+            'height': reader.height,
+            'frame': frame.copy(),
+            'open_ms': round(open_ms, 1),
+            'first_frame_ms': round(first_frame_ms, 1)
+        }
+
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e),
+            'open_ms': None,
+            'first_frame_ms': None
+        }
+    finally:
+        if reader is not None:
+            reader.close()
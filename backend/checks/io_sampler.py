@@ -0,0 +1,209 @@
+"""
+NAS 디스크 I/O / 네트워크 사용률 샘플링 모듈
+mdstat상 정상이어도 디스크나 NIC가 포화 상태일 수 있으므로 카운터 변화량으로 부하를 측정
+- /proc/uptime, /proc/diskstats, /proc/net/dev를 짧은 간격으로 두 번 읽음 (SSH 채널 1개, 명령 1회)
+- 경과 시간은 원격 /proc/uptime 차이로 계산 (SSH 왕복 지연과 무관)
+- 두 스냅샷을 각각 한 번에 파싱해 디스크별 IOPS/처리량/await/사용률, NIC별 처리량 계산
+- 링크 속도(/sys/class/net/*/speed)를 알면 NIC 사용률(%)도 계산
+"""
+import re
+from typing import Dict, Any, List, Optional
+
+SECTOR_BYTES = 512
+SNAPSHOT_MARKER = '__EDGE_IO_SNAPSHOT__'
+
+# 통계 대상 블록 장치 (전체 디스크 + md, 파티션/loop/ram 제외)
+_disk_re = re.compile(r'^(sata\d+|sd[a-z]+|hd[a-z]+|vd[a-z]+|nvme\d+n\d+|md\d+)$')
+# 통계 대상이 아닌 인터페이스
+_skip_nic_re = re.compile(r'^(lo|docker\d*|veth.*|br-.*|ifb\d+|sit\d+|tun\d+|gretap.*|erspan.*)$')
+
+
+def sample_command(interval: float = 1.0) -> str:
+    """카운터 스냅샷 2회 명령 (명령 1회로 실행, 링크 속도는 첫 스냅샷에만 포함)"""
+    snapshot = "cat /proc/uptime /proc/diskstats /proc/net/dev"
+    return (f"{snapshot}; grep -H . /sys/class/net/*/speed 2>/dev/null; "
+            f"echo {SNAPSHOT_MARKER}; sleep {interval:g}; {snapshot}")
+
+
+def parse_snapshot(text: str) -> Dict[str, Any]:
+    """
+    스냅샷 1개 파싱 (줄 형식으로 종류 판별, 한 번 순회)
+
+    Returns:
+        {'uptime': 초, 'disks': {장치: 카운터}, 'nics': {인터페이스: 카운터}, 'speeds': {인터페이스: Mbit/s}}
+    """
+    snapshot: Dict[str, Any] = {'uptime': None, 'disks': {}, 'nics': {}, 'speeds': {}}
+    for line in text.splitlines():
+        if line.startswith('/sys/class/net/'):
+            # /sys/class/net/eth0/speed:1000 (링크 없음은 -1)
+            path, _, value = line.partition(':')
+            try:
+                speed = int(value)
+            except ValueError:
+                continue
+            if speed > 0:
+                snapshot['speeds'][path.split('/')[4]] = speed
+            continue
+
+        if ':' in line:
+            # /proc/net/dev: "  eth0: rx_bytes rx_packets rx_errs rx_drop ... tx_bytes tx_packets tx_errs tx_drop ..."
+            name, _, counters = line.partition(':')
+            fields = counters.split()
+            if len(fields) >= 16 and all(field.isdigit() for field in fields[:16]):
+                snapshot['nics'][name.strip()] = {
+                    'rx_bytes': int(fields[0]),
+                    'rx_errors': int(fields[2]),
+                    'rx_drops': int(fields[3]),
+                    'tx_bytes': int(fields[8]),
+                    'tx_errors': int(fields[10]),
+                    'tx_drops': int(fields[11])
+                }
+            continue
+
+        fields = line.split()
+        if len(fields) == 2 and snapshot['uptime'] is None:
+            try:
+                snapshot['uptime'] = float(fields[0])
+            except ValueError:
+                pass
+        elif len(fields) >= 14 and fields[0].isdigit() and fields[1].isdigit():
+            # /proc/diskstats: major minor name rd_ios rd_merges rd_sectors rd_ticks
+            #                  wr_ios wr_merges wr_sectors wr_ticks in_flight io_ticks time_in_queue ...
+            try:
+                values = [int(field) for field in fields[3:14]]
+            except ValueError:
+                continue
+            snapshot['disks'][fields[2]] = {
+                'reads': values[0],
+                'read_sectors': values[2],
+                'read_ms': values[3],
+                'writes': values[4],
+                'write_sectors': values[6],
+                'write_ms': values[7],
+                'io_ms': values[9]
+            }
+    return snapshot
+
+
+def parse_samples(output: str) -> List[Dict[str, Any]]:
+    """sample_command 출력 → 스냅샷 2개 (구분자가 없으면 빈 목록)"""
+    if SNAPSHOT_MARKER not in output:
+        return []
+    first, second = output.split(SNAPSHOT_MARKER, 1)
+    return [parse_snapshot(first), parse_snapshot(second)]
+
+
+def _delta(after: int, before: int) -> int:
+    """카운터 차이 (32비트 카운터 되돌아감은 0으로 처리)"""
+    return after - before if after >= before else 0
+
+
+def compute_rates(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    두 스냅샷 사이 부하 계산
+
+    Returns:
+        {'elapsed_s', 'disks': {장치: {'read_iops', 'write_iops', 'iops', 'read_mbps', 'write_mbps',
+                                      'await_ms', 'util_pct'}},
+         'nics': {인터페이스: {'rx_mbps', 'tx_mbps', 'speed_mbps', 'util_pct', 'errors', 'drops', 'drops_per_s'}}}
+        (처리량: 디스크 MB/s, NIC Mbit/s, errors/drops: 구간 동안 증가한 rx+tx 건수)
+    """
+    result: Dict[str, Any] = {'elapsed_s': None, 'disks': {}, 'nics': {}}
+    if before['uptime'] is None or after['uptime'] is None:
+        return result
+    elapsed = after['uptime'] - before['uptime']
+    if elapsed <= 0:
+        return result
+    result['elapsed_s'] = round(elapsed, 3)
+
+    for name, end in after['disks'].items():
+        start = before['disks'].get(name)
+        if start is None or not _disk_re.match(name):
+            continue
+        reads = _delta(end['reads'], start['reads'])
+        writes = _delta(end['writes'], start['writes'])
+        ios = reads + writes
+        ticks = _delta(end['read_ms'], start['read_ms']) + _delta(end['write_ms'], start['write_ms'])
+        result['disks'][name] = {
+            'read_iops': round(reads / elapsed, 1),
+            'write_iops': round(writes / elapsed, 1),
+            'iops': round(ios / elapsed, 1),
+            'read_mbps': round(_delta(end['read_sectors'], start['read_sectors']) * SECTOR_BYTES / elapsed / 1e6, 2),
+            'write_mbps': round(_delta(end['write_sectors'], start['write_sectors']) * SECTOR_BYTES / elapsed / 1e6, 2),
+            # md 장치는 지연/사용 시간을 집계하지 않으므로 0 → await는 I/O가 있을 때만
+            'await_ms': round(ticks / ios, 2) if ios and ticks else None,
+            'util_pct': round(min(_delta(end['io_ms'], start['io_ms']) / (elapsed * 1000) * 100, 100.0), 1)
+        }
+
+    speeds = before.get('speeds', {})
+    for name, end in after['nics'].items():
+        start = before['nics'].get(name)
+        if start is None or _skip_nic_re.match(name):
+            continue
+        rx = _delta(end['rx_bytes'], start['rx_bytes']) * 8 / elapsed / 1e6
+        tx = _delta(end['tx_bytes'], start['tx_bytes']) * 8 / elapsed / 1e6
+        speed = speeds.get(name)
+        # 드롭은 버퍼 부족/필터링/모르는 프로토콜 등으로 평상시에도 조금씩 늘어나므로 오류와 따로 집계
+        errors = _delta(end['rx_errors'], start['rx_errors']) + _delta(end['tx_errors'], start['tx_errors'])
+        drops = _delta(end['rx_drops'], start['rx_drops']) + _delta(end['tx_drops'], start['tx_drops'])
+        result['nics'][name] = {
+            'rx_mbps': round(rx, 2),
+            'tx_mbps': round(tx, 2),
+            'speed_mbps': speed,
+            'util_pct': round(max(rx, tx) / speed * 100, 1) if speed else None,
+            'errors': errors,
+            'drops': drops,
+            'drops_per_s': round(drops / elapsed, 2)
+        }
+    return result
+
+
+def evaluate_io(rates: Dict[str, Any], util_warn: float = 90.0, await_warn: float = 100.0,
+                nic_util_warn: float = 80.0, nic_mbps_warn: Optional[float] = None,
+                nic_drop_warn: Optional[float] = 10.0) -> List[str]:
+    """
+    부하 경고 목록
+
+    - 디스크: 사용률 >= util_warn(%), await >= await_warn(ms)
+    - NIC: 링크 대비 사용률 >= nic_util_warn(%) (링크 속도를 모르면 nic_mbps_warn Mbit/s 기준),
+      rx/tx 오류 증가, 드롭 >= nic_drop_warn(건/초, None이면 드롭은 경고하지 않음)
+    """
+    issues = []
+    for name, disk in sorted(rates.get('disks', {}).items()):
+        if disk['util_pct'] >= util_warn:
+            issues.append(f"{name}: 디스크 사용률 {disk['util_pct']:.0f}% (IOPS {disk['iops']:.0f})")
+        if disk['await_ms'] is not None and disk['await_ms'] >= await_warn:
+            issues.append(f"{name}: 디스크 응답 지연 {disk['await_ms']:.0f}ms")
+
+    for name, nic in sorted(rates.get('nics', {}).items()):
+        peak = max(nic['rx_mbps'], nic['tx_mbps'])
+        if nic['util_pct'] is not None and nic['util_pct'] >= nic_util_warn:
+            issues.append(f"{name}: 네트워크 사용률 {nic['util_pct']:.0f}% ({peak:.0f}/{nic['speed_mbps']}Mbps)")
+        elif nic['util_pct'] is None and nic_mbps_warn and peak >= nic_mbps_warn:
+            issues.append(f"{name}: 네트워크 처리량 {peak:.0f}Mbps")
+        if nic['errors']:
+            issues.append(f"{name}: 네트워크 오류 {nic['errors']}건 증가")
+        if nic_drop_warn and nic.get('drops_per_s', 0) >= nic_drop_warn:
+            issues.append(f"{name}: 네트워크 드롭 {nic['drops_per_s']:g}건/초 ({nic['drops']}건 증가)")
+    return issues
+
+
+def io_options_from_config(config: Optional[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+    """
+    점검 설정에서 NASChecker.check_io 인자 구성 (비활성화면 None)
+
+    설정 키: io_sample, io_interval, io_util_warn, io_await_warn, io_nic_util_warn, io_nic_mbps_warn,
+            io_nic_drop_warn
+    """
+    if not config or str(config.get('io_sample', 'false')).lower() != 'true':
+        return None
+    nic_mbps_warn = float(config.get('io_nic_mbps_warn') or 0)
+    nic_drop_warn = float(config.get('io_nic_drop_warn', 10) or 0)
+    return {
+        'interval': float(config.get('io_interval', 1.0)),
+        'util_warn': float(config.get('io_util_warn', 90)),
+        'await_warn': float(config.get('io_await_warn', 100)),
+        'nic_util_warn': float(config.get('io_nic_util_warn', 80)),
+        'nic_mbps_warn': nic_mbps_warn or None,
+        'nic_drop_warn': nic_drop_warn or None
+    }
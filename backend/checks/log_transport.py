@@ -0,0 +1,356 @@
+"""
+카메라 저장 로그 읽기 경로 (NFS 마운트 / NAS SFTP)
+NFS 마운트(/mnt/nas/logs)가 stale 상태면 파일 읽기가 멈춰 카메라 점검 전체가 막히므로
+- 모든 파일 작업을 작업별 타임아웃이 있는 별도 스레드에서 실행 (멈춘 작업은 버리고 진행)
+- SFTP: 풀의 NAS SSH 연결로 로그 끝부분만 범위 읽기 (stat → seek → read)
+- auto 모드: 경로별 지연 시간(EWMA)을 측정해 빠른 쪽을 먼저 사용,
+  시간 초과/오류가 난 경로는 일정 시간 제외 후 다시 시도
+"""
+import os
+import time
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT_MODES = ('nfs', 'sftp', 'auto')
+
+# 경로별 측정 상태 (프로세스 전역: 점검 실행 간 유지)
+# {'nfs': {'ewma_ms': float|None, 'down_until': float, 'last_error': str|None}, 'sftp': {...}}
+_transport_state: Dict[str, Dict[str, Any]] = {}
+_state_lock = threading.Lock()
+
+EWMA_ALPHA = 0.3
+
+
+class TransportError(Exception):
+    """로그 읽기 경로 오류 (시간 초과 포함)"""
+
+
+def call_with_timeout(func, timeout: float, *args):
+    """
+    함수를 데몬 스레드에서 실행하고 timeout 초까지만 대기
+    stale NFS에서 멈춘 시스템 호출은 중단할 수 없으므로 스레드를 버리고 TransportError 발생
+    """
+    outcome: Dict[str, Any] = {}
+
+    def run():
+        try:
+            outcome['value'] = func(*args)
+        except BaseException as e:
+            outcome['error'] = e
+
+    worker = threading.Thread(target=run, daemon=True, name="log-read")
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TransportError(f"응답 없음 ({timeout:g}초 초과)")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome.get('value')
+
+
+def split_lines(data: bytes, partial_head: bool) -> List[str]:
+    """끝부분 바이트 → 줄 목록 (중간에서 시작했으면 잘린 첫 줄 제외)"""
+    lines = data.decode('utf-8', errors='ignore').splitlines(keepends=True)
+    if partial_head and lines:
+        lines = lines[1:]
+    return lines
+
+
+class NFSLogReader:
+    """마운트 경로에서 직접 읽기"""
+
+    name = 'nfs'
+    setup_ms = 0.0
+
+    def __init__(self, base_path: str):
+        self.base_path = base_path
+
+    def exists(self, relative: str) -> bool:
+        return os.path.exists(os.path.join(self.base_path, relative))
+
+    def size(self, relative: str) -> int:
+        return os.stat(os.path.join(self.base_path, relative)).st_size
+
+    def read_range(self, relative: str, offset: int, length: int) -> bytes:
+        with open(os.path.join(self.base_path, relative), 'rb') as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def close(self):
+        pass
+
+
+class SFTPLogReader:
+    """NAS SSH 연결(풀 공유)의 SFTP로 읽기 (연결은 첫 작업 때)"""
+
+    name = 'sftp'
+
+    def __init__(self, target: Dict[str, Any], remote_base: str, pool=None, timeout: float = 5.0):
+        self.target = target
+        self.remote_base = remote_base.rstrip('/')
+        self.pool = pool
+        self.timeout = timeout
+        self.checker = None
+        self.sftp = None
+        self.setup_ms = 0.0  # 이번 작업에 포함된 연결 시간 (지연 측정에서 제외)
+        self.lock = threading.Lock()  # sftp/checker 교체만 보호 (연결/종료 중에는 잡지 않음)
+        self.generation = 0  # close()마다 증가, 그 전에 시작한 연결은 끝난 뒤 버림
+
+    def _client(self):
+        with self.lock:
+            if self.sftp is not None:
+                return self.sftp
+            generation = self.generation
+
+        # SSH 연결/인증은 잠금 밖에서 (시간 초과로 버려진 연결이 close()를 막지 않도록)
+        from .nas_check import NASChecker
+        start = time.perf_counter()
+        checker = NASChecker(
+            host=self.target['host'],
+            username=self.target['user'],
+            password=self.target['password'],
+            port=int(self.target['port']),
+            timeout=int(max(self.timeout, 5)),
+            pool=self.pool
+        )
+        if not checker.connect():
+            raise TransportError(checker.errors[0] if checker.errors else 'SSH 연결 실패')
+        try:
+            sftp = checker.ssh.open_sftp()
+            # 읽기 요청마다 응답 대기 상한
+            sftp.get_channel().settimeout(self.timeout)
+        except Exception:
+            checker.close()
+            raise
+
+        with self.lock:
+            if self.generation == generation and self.sftp is None:
+                self.checker, self.sftp = checker, sftp
+                self.setup_ms = (time.perf_counter() - start) * 1000
+                return sftp
+            current = self.sftp
+        # 연결 중에 close()됐거나 다른 스레드가 먼저 연결함 → 이번 연결은 닫음
+        self._close_client(checker, sftp)
+        if current is None:
+            raise TransportError("연결 중 종료됨")
+        return current
+
+    @staticmethod
+    def _close_client(checker, sftp):
+        if sftp is not None:
+            try:
+                sftp.close()
+            except Exception:
+                pass
+        if checker is not None:
+            checker.close()
+
+    def _path(self, relative: str) -> str:
+        return f"{self.remote_base}/{relative.replace(os.sep, '/')}"
+
+    def exists(self, relative: str) -> bool:
+        try:
+            self._client().stat(self._path(relative))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def size(self, relative: str) -> int:
+        return self._client().stat(self._path(relative)).st_size
+
+    def read_range(self, relative: str, offset: int, length: int) -> bytes:
+        with self._client().open(self._path(relative), 'rb') as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def close(self):
+        """연결 종료 (진행 중인 연결을 기다리지 않음, 그 연결은 끝난 뒤 스스로 닫힘)"""
+        with self.lock:
+            self.generation += 1
+            checker, sftp = self.checker, self.sftp
+            self.checker = self.sftp = None
+        self._close_client(checker, sftp)
+
+
+class LogTransport:
+    """
+    로그 읽기 경로 선택 + 작업별 타임아웃
+
+    Args:
+        readers: 읽기 경로 목록 (우선순위 순, 예: [NFSLogReader, SFTPLogReader])
+        mode: 'nfs' / 'sftp' / 'auto' (auto면 readers 전체 중 선택)
+        read_timeout: 작업 1회 제한 시간 (초)
+        switch_ms: auto 모드에서 NFS 평균 지연이 이 값을 넘으면 더 빠른 경로를 먼저 사용
+        cooldown: 시간 초과/오류 난 경로를 제외하는 시간 (초)
+    """
+
+    def __init__(self, readers: List[Any], mode: str = 'auto', read_timeout: float = 5.0,
+                 switch_ms: float = 500.0, cooldown: float = 300.0):
+        self.mode = mode if mode in TRANSPORT_MODES else 'auto'
+        if self.mode != 'auto':
+            readers = [reader for reader in readers if reader.name == self.mode] or readers[:1]
+        self.readers = readers
+        self.read_timeout = read_timeout
+        self.switch_ms = switch_ms
+        self.cooldown = cooldown
+        self.last_used: Optional[str] = None
+
+    @staticmethod
+    def _state(name: str) -> Dict[str, Any]:
+        return _transport_state.setdefault(name, {'ewma_ms': None, 'down_until': 0.0, 'last_error': None})
+
+    def _order(self) -> List[Any]:
+        """시도 순서 (제외 중인 경로 제외, auto면 첫 경로 지연이 기준을 넘을 때 빠른 경로 우선)"""
+        now = time.time()
+        with _state_lock:
+            states = {reader.name: dict(self._state(reader.name)) for reader in self.readers}
+        available = [reader for reader in self.readers if states[reader.name]['down_until'] <= now]
+
+        if self.mode == 'auto' and len(available) > 1:
+            primary = states[available[0].name]['ewma_ms']
+            if primary is not None and primary > self.switch_ms:
+                # 측정 전인 경로는 0으로 보고 먼저 시도 (측정값 확보)
+                available.sort(key=lambda reader: states[reader.name]['ewma_ms'] or 0.0)
+        return available
+
+    def _record(self, name: str, elapsed_ms: Optional[float], error: Optional[str] = None):
+        with _state_lock:
+            state = self._state(name)
+            if error is not None:
+                state['down_until'] = time.time() + self.cooldown
+                state['last_error'] = error
+                return
+            state['down_until'] = 0.0
+            state['last_error'] = None
+            state['ewma_ms'] = elapsed_ms if state['ewma_ms'] is None else round(
+                EWMA_ALPHA * elapsed_ms + (1 - EWMA_ALPHA) * state['ewma_ms'], 2)
+
+    def call(self, operation: str, *args):
+        """
+        읽기 작업 실행 (경로를 순서대로 시도, 실패/시간 초과 시 다음 경로)
+
+        Returns:
+            작업 결과 (마지막으로 성공한 경로는 self.last_used)
+        """
+        readers = self._order()
+        if not readers:
+            # 모든 경로가 제외 중이면 기다리지 않고 바로 실패 (카메라마다 타임아웃 반복 방지)
+            with _state_lock:
+                reasons = [f"{reader.name}: {self._state(reader.name)['last_error']}" for reader in self.readers]
+            raise TransportError(f"{', '.join(reasons)} (재시도 대기 중)")
+
+        errors = []
+        for reader in readers:
+            start = time.perf_counter()
+            try:
+                value = call_with_timeout(getattr(reader, operation), self.read_timeout, *args)
+            except FileNotFoundError:
+                raise
+            except Exception as e:
+                message = str(e) or type(e).__name__
+                logger.warning(f"로그 읽기 경로 {reader.name} 실패: {message}")
+                self._record(reader.name, None, message)
+                reader.close()  # 다음 시도 때 새로 연결
+                errors.append(f"{reader.name}: {message}")
+                continue
+            # 첫 작업의 SSH/SFTP 연결 시간은 읽기 지연이 아니므로 제외
+            elapsed_ms = (time.perf_counter() - start) * 1000 - reader.setup_ms
+            reader.setup_ms = 0.0
+            self._record(reader.name, max(elapsed_ms, 0.0))
+            self.last_used = reader.name
+            return value
+        raise TransportError(', '.join(errors))
+
+    def exists(self, relative: str) -> bool:
+        return bool(self.call('exists', relative))
+
+    def run_local(self, func, *args):
+        """
+        NFS 마운트 경로에서 함수 실행 (로그 전체 분석 등, 작업별 타임아웃 적용)
+        시간 초과/오류 시 NFS 경로를 제외 목록에 올리고 TransportError 발생
+        """
+        start = time.perf_counter()
+        try:
+            value = call_with_timeout(func, self.read_timeout, *args)
+        except TransportError as e:
+            self._record('nfs', None, str(e))
+            raise
+        except OSError as e:
+            message = str(e) or type(e).__name__
+            self._record('nfs', None, message)
+            raise TransportError(message)
+        self._record('nfs', (time.perf_counter() - start) * 1000)
+        return value
+
+    def tail_lines(self, relative: str, block_size: int = 64 * 1024,
+                   max_bytes: int = 8 * 1024 * 1024, marker: Optional[str] = None) -> Tuple[List[str], int]:
+        """
+        파일 끝부분만 읽어 줄 목록 반환
+        marker가 있으면 끝부분에 marker가 포함될 때까지 읽는 범위를 두 배씩 늘림 (max_bytes까지)
+
+        Returns:
+            (줄 목록, 읽은 바이트 수)
+        """
+        size = self.call('size', relative)
+        length = min(block_size, size)
+        while True:
+            offset = size - length
+            data = self.call('read_range', relative, offset, length)
+            lines = split_lines(data, partial_head=offset > 0)
+            if marker is None or offset == 0 or length >= max_bytes or any(marker in line for line in lines):
+                return lines, len(data)
+            length = min(length * 2, size, max_bytes)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """경로별 측정 상태 (결과 기록용)"""
+        now = time.time()
+        with _state_lock:
+            return {
+                reader.name: {
+                    'ewma_ms': self._state(reader.name)['ewma_ms'],
+                    'excluded_for': max(0, round(self._state(reader.name)['down_until'] - now)),
+                    'last_error': self._state(reader.name)['last_error']
+                } for reader in self.readers
+            }
+
+    def close(self):
+        for reader in self.readers:
+            reader.close()
+
+
+def log_transport_from_config(camera_config: Dict[str, str]) -> LogTransport:
+    """
+    카메라 설정에서 로그 읽기 경로 구성 (기본: NFS만, 작업별 타임아웃 적용)
+
+    설정 키: log_base_path, log_transport(nfs/sftp/auto), log_nas_path, log_read_timeout,
+            log_switch_ms, log_cooldown, nas_ip, nas_user, nas_password, nas_port, ssh_pool
+    """
+    mode = (camera_config.get('log_transport') or 'nfs').lower()
+    read_timeout = float(camera_config.get('log_read_timeout', 5))
+    readers: List[Any] = [NFSLogReader(camera_config.get('log_base_path', '/mnt/nas/logs'))]
+
+    if mode in ('sftp', 'auto') and camera_config.get('nas_ip') and camera_config.get('log_nas_path'):
+        pool = None
+        if str(camera_config.get('ssh_pool', 'false')).lower() == 'true':
+            try:
+                from utils.ssh_pool import ssh_pool as pool
+            except ImportError:
+                pool = None
+        target = {
+            'host': camera_config['nas_ip'],
+            'user': camera_config.get('nas_user', 'admin'),
+            'password': camera_config.get('nas_password', ''),
+            'port': int(camera_config.get('nas_port', 2222))
+        }
+        readers.append(SFTPLogReader(target, camera_config['log_nas_path'], pool, read_timeout))
+
+    return LogTransport(
+        readers,
+        mode=mode,
+        read_timeout=read_timeout,
+        switch_ms=float(camera_config.get('log_switch_ms', 500)),
+        cooldown=float(camera_config.get('log_cooldown', 300))
+    )
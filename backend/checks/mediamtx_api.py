@@ -0,0 +1,185 @@
+"""
+MediaMTX 제어 API 조회 모듈
+블러 처리 스트림을 제공하는 MediaMTX 인스턴스마다 HTTP API(/v3/paths/list)를 한 번 호출하여
+모든 경로의 준비 상태, 리더 수, 수신 바이트를 확인 (RTSP 세션/디코딩 없음)
+- 인스턴스별 HTTP keep-alive 연결을 모듈 전역에 보관 → 점검 주기마다 재사용
+- 이전 조회 대비 수신 바이트 증가 여부로 스트림 정지 감지
+"""
+import json
+import time
+import threading
+import http.client
+from typing import Dict, Any, List, Optional
+
+PATHS_ENDPOINT = "/v3/paths/list"
+
+# 이전 조회 수신 바이트를 비교에 사용하는 최대 경과 시간 (초)
+BYTES_DELTA_MAX_AGE = 600.0
+
+
+class MediaMTXClient:
+    """MediaMTX 인스턴스 1개 API 클라이언트 (연결 재사용)"""
+
+    def __init__(self, host: str, port: int, timeout: float = 2.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.conn: Optional[http.client.HTTPConnection] = None
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connects = 0
+        # 경로별 직전 수신 바이트 (조회 시각, 바이트)
+        self.previous: Dict[str, tuple] = {}
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self.connects += 1
+        return self.conn
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    def list_paths(self) -> List[Dict[str, Any]]:
+        """
+        전체 경로 목록 조회 (연결이 끊겼으면 1회 재연결 후 재시도)
+
+        Raises:
+            OSError, http.client.HTTPException, ValueError: 조회 실패
+        """
+        with self.lock:
+            for attempt in range(2):
+                conn = self._connection()
+                try:
+                    conn.request('GET', PATHS_ENDPOINT, headers={'Accept': 'application/json'})
+                    response = conn.getresponse()
+                    body = response.read()
+                    self.requests += 1
+                    if response.status != 200:
+                        raise http.client.HTTPException(f"HTTP {response.status}")
+                    if response.will_close:
+                        conn.close()
+                        self.conn = None
+                    return json.loads(body).get('items', [])
+                except (ConnectionError, http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                        http.client.BadStatusLine) as e:
+                    # keep-alive 연결이 서버 측에서 닫힌 경우 → 재연결
+                    conn.close()
+                    self.conn = None
+                    if attempt == 1:
+                        raise e
+                except Exception:
+                    conn.close()
+                    self.conn = None
+                    raise
+        return []
+
+    def path_status(self, item: Dict[str, Any], now: float) -> Dict[str, Any]:
+        """
+        경로 1개 상태 판정 (준비 상태 + 수신 바이트 증가)
+
+        Returns:
+            {'healthy', 'ready', 'readers', 'bytes_received', 'bytes_delta', 'receive_kbps', 'reason'}
+        """
+        name = item.get('name')
+        ready = bool(item.get('ready'))
+        bytes_received = int(item.get('bytesReceived') or 0)
+        readers = item.get('readers') or []
+
+        status = {
+            'healthy': False,
+            'ready': ready,
+            'readers': len(readers),
+            'bytes_received': bytes_received,
+            'bytes_delta': None,
+            'receive_kbps': None,
+            'reason': None
+        }
+
+        previous = self.previous.get(name)
+        self.previous[name] = (now, bytes_received)
+
+        if not ready:
+            status['reason'] = '경로 준비되지 않음 (소스 미연결)'
+            return status
+
+        if previous and now - previous[0] <= BYTES_DELTA_MAX_AGE and bytes_received >= previous[1]:
+            delta = bytes_received - previous[1]
+            elapsed = now - previous[0]
+            status['bytes_delta'] = delta
+            if elapsed > 0:
+                status['receive_kbps'] = round(delta * 8 / elapsed / 1000, 1)
+            if delta == 0:
+                status['reason'] = '이전 조회 이후 수신 바이트 증가 없음 (스트림 정지)'
+                return status
+        elif bytes_received == 0:
+            status['reason'] = '수신 바이트 없음'
+            return status
+
+        status['healthy'] = True
+        return status
+
+
+# 인스턴스별 클라이언트 (host, port) → MediaMTXClient
+_clients: Dict[tuple, MediaMTXClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(host: str, port: int, timeout: float = 2.0) -> MediaMTXClient:
+    """인스턴스 클라이언트 조회 (없으면 생성, 이후 조회에서 연결 재사용)"""
+    with _clients_lock:
+        client = _clients.get((host, port))
+        if client is None:
+            client = MediaMTXClient(host, port, timeout)
+            _clients[(host, port)] = client
+        return client
+
+
+def query_mediamtx_paths(cameras: List[Dict[str, Any]], api_host: str = "127.0.0.1",
+                         api_base_port: int = 9997, path_name: str = "live",
+                         timeout: float = 2.0) -> Dict[str, Any]:
+    """
+    카메라별 MediaMTX 인스턴스 API 조회 (인스턴스당 요청 1회)
+
+    Args:
+        cameras: generate_camera_urls 결과
+        api_host: API 호스트
+        api_base_port: 카메라 1의 API 포트 (카메라 N → api_base_port + N - 1)
+        path_name: 블러 스트림 경로 이름
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        {'duration_ms', 'cameras': {번호: 경로 상태 또는 {'healthy': False, 'error'}}, 'unhealthy': [번호]}
+    """
+    start = time.monotonic()
+    results = {}
+
+    for camera in cameras:
+        camera_num = camera['camera_num']
+        port = api_base_port + camera_num - 1
+        client = get_client(api_host, port, timeout)
+        try:
+            items = client.list_paths()
+        except Exception as e:
+            results[camera_num] = {'healthy': False, 'api_port': port,
+                                   'error': f"API 조회 실패: {e}" if str(e) else f"API 조회 실패: {type(e).__name__}"}
+            continue
+
+        item = next((path for path in items if path.get('name') == path_name), None)
+        if item is None:
+            results[camera_num] = {'healthy': False, 'api_port': port,
+                                   'error': f"경로 없음: {path_name}"}
+            continue
+
+        status = client.path_status(item, time.time())
+        status['api_port'] = port
+        results[camera_num] = status
+
+    return {
+        'duration_ms': round((time.monotonic() - start) * 1000, 1),
+        'cameras': results,
+        'unhealthy': sorted(num for num, status in results.items() if not status['healthy'])
+    }
@@ -0,0 +1,317 @@
+"""
+NAS 마운트(/mnt/nas) 성능 벤치마크 모듈
+녹화가 NAS 마운트 성능에 의존하므로 처리량과 메타데이터 지연을 직접 측정
+- 마운트 아래 임시 디렉토리에 정해진 용량(budget)만 순차 쓰기(fsync 포함) → 순차 읽기
+- stat/listdir/create/unlink 지연 시간 백분위(p50/p95/p99)
+- 측정값은 JSON 이력에 보관하고 이전 실행들의 중앙값(기준값)과 비교해 성능 저하 판정
+- 녹화 중에도 안전하게: 여유 공간 확인 후 실행, 용량/시간 상한, 임시 디렉토리만 사용 후 삭제,
+  측정 파일의 페이지 캐시는 즉시 반납(posix_fadvise)해 녹화 쓰기 캐시를 밀어내지 않음
+"""
+import os
+import json
+import math
+import time
+import shutil
+import logging
+import statistics
+import threading
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# 성능 저하 판정 대상 (키, 높을수록 좋은지)
+BENCH_METRICS = (
+    ('write_mbps', True),
+    ('read_mbps', True),
+    ('create_p95_ms', False),
+    ('stat_p95_ms', False),
+    ('listdir_p95_ms', False),
+    ('unlink_p95_ms', False),
+)
+
+
+def percentiles(samples: List[float]) -> Dict[str, Optional[float]]:
+    """지연 시간 백분위 (ms, 최근접 순위 방식)"""
+    if not samples:
+        return {'p50': None, 'p95': None, 'p99': None, 'max': None}
+    ordered = sorted(samples)
+
+    def rank(p: float) -> float:
+        index = max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))
+        return round(ordered[index], 3)
+
+    return {'p50': rank(50), 'p95': rank(95), 'p99': rank(99), 'max': round(ordered[-1], 3)}
+
+
+def _drop_cache(fd: int):
+    """파일 페이지 캐시 반납 (읽기 측정이 캐시가 아닌 NAS에서 읽도록, 지원하지 않으면 무시)"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def sequential_io(directory: str, budget_mb: int = 64, block_kb: int = 1024,
+                  max_seconds: float = 30.0) -> Dict[str, Any]:
+    """
+    순차 쓰기(fsync 포함) + 순차 읽기 처리량 측정
+
+    Args:
+        budget_mb: 쓰기 용량 상한 (MB)
+        block_kb: 쓰기/읽기 단위 (KB)
+        max_seconds: 쓰기 시간 상한 (초과 시 그때까지 쓴 용량으로 계산)
+
+    Returns:
+        {'bytes', 'write_s', 'write_mbps', 'read_s', 'read_mbps', 'truncated'}
+    """
+    path = os.path.join(directory, 'seq.bin')
+    block = os.urandom(block_kb * 1024)
+    budget = budget_mb * MB
+    written = 0
+    truncated = False
+
+    start = time.perf_counter()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while written < budget:
+            written += os.write(fd, block[:min(len(block), budget - written)])
+            if time.perf_counter() - start > max_seconds:
+                truncated = True
+                break
+        os.fsync(fd)
+        write_s = time.perf_counter() - start
+        _drop_cache(fd)
+    finally:
+        os.close(fd)
+
+    read = 0
+    start = time.perf_counter()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        _drop_cache(fd)
+        while True:
+            chunk = os.read(fd, len(block))
+            if not chunk:
+                break
+            read += len(chunk)
+        read_s = time.perf_counter() - start
+        _drop_cache(fd)
+    finally:
+        os.close(fd)
+    os.unlink(path)
+
+    return {
+        'bytes': written,
+        'write_s': round(write_s, 3),
+        'write_mbps': round(written / MB / write_s, 1) if write_s > 0 else None,
+        'read_s': round(read_s, 3),
+        'read_mbps': round(read / MB / read_s, 1) if read_s > 0 else None,
+        'truncated': truncated
+    }
+
+
+def metadata_latency(directory: str, ops: int = 50) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    메타데이터 작업 지연 시간 (create/stat/listdir/unlink 각 ops회, ms 백분위)
+    """
+    timings: Dict[str, List[float]] = {'create': [], 'stat': [], 'listdir': [], 'unlink': []}
+    names = [os.path.join(directory, f"meta_{i:04d}") for i in range(ops)]
+
+    def timed(kind: str, func, *args):
+        start = time.perf_counter()
+        value = func(*args)
+        timings[kind].append((time.perf_counter() - start) * 1000)
+        return value
+
+    for name in names:
+        fd = timed('create', os.open, name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        os.close(fd)
+    for name in names:
+        timed('stat', os.stat, name)
+    for _ in range(ops):
+        timed('listdir', os.listdir, directory)
+    for name in names:
+        timed('unlink', os.unlink, name)
+
+    return {kind: percentiles(samples) for kind, samples in timings.items()}
+
+
+class BenchHistory:
+    """
+    경로별 벤치마크 이력 (파일 공유)
+
+    형식: {'paths': {경로: [{'timestamp', 'write_mbps', 'read_mbps', 'create_p95_ms', ...}, ...]}}
+    """
+
+    def __init__(self, path: Optional[str] = None, max_runs: int = 30):
+        self.path = path
+        self.max_runs = max_runs
+        self.lock = threading.Lock()
+        self.paths: Dict[str, List[Dict[str, Any]]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.paths = json.load(f).get('paths', {})
+        except Exception as e:
+            logger.warning(f"벤치마크 이력 로드 실패 (초기화): {e}")
+            self.paths = {}
+
+    def _save(self):
+        """이력 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'paths': self.paths}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"벤치마크 이력 저장 실패: {e}")
+
+    def baseline(self, key: str, min_runs: int = 3) -> Optional[Dict[str, float]]:
+        """이전 실행들의 지표별 중앙값 (기록이 min_runs 미만이면 None)"""
+        with self.lock:
+            runs = list(self.paths.get(key, []))
+        if len(runs) < min_runs:
+            return None
+        baseline = {}
+        for metric, _ in BENCH_METRICS:
+            values = [run[metric] for run in runs if run.get(metric) is not None]
+            if values:
+                baseline[metric] = statistics.median(values)
+        return baseline
+
+    def record(self, key: str, metrics: Dict[str, Any], now: Optional[float] = None):
+        """이번 측정값 추가 (최근 max_runs개만 보관)"""
+        entry = {'timestamp': now if now is not None else time.time(), **metrics}
+        with self.lock:
+            runs = self.paths.setdefault(key, [])
+            runs.append(entry)
+            del runs[:-self.max_runs]
+            self._save()
+
+
+def compare_baseline(metrics: Dict[str, Any], baseline: Optional[Dict[str, float]],
+                     regression: float = 0.5) -> List[str]:
+    """
+    기준값 대비 성능 저하 항목
+
+    Args:
+        regression: 저하 판정 비율 (0.5 → 처리량 50% 이하로 감소 또는 지연 1.5배 이상 증가)
+
+    Returns:
+        저하 메시지 목록
+    """
+    if not baseline:
+        return []
+    labels = {
+        'write_mbps': '순차 쓰기', 'read_mbps': '순차 읽기', 'create_p95_ms': 'create p95',
+        'stat_p95_ms': 'stat p95', 'listdir_p95_ms': 'listdir p95', 'unlink_p95_ms': 'unlink p95'
+    }
+    issues = []
+    for metric, higher_is_better in BENCH_METRICS:
+        current, reference = metrics.get(metric), baseline.get(metric)
+        if current is None or not reference:
+            continue
+        unit = 'MB/s' if higher_is_better else 'ms'
+        if higher_is_better and current < reference * (1 - regression):
+            issues.append(f"{labels[metric]} {current}{unit} (기준 {reference:.1f}{unit})")
+        elif not higher_is_better and current > reference * (1 + regression) and current - reference >= 1.0:
+            # 1ms 미만 차이는 측정 오차로 보고 무시
+            issues.append(f"{labels[metric]} {current}{unit} (기준 {reference:.1f}{unit})")
+    return issues
+
+
+def run_mount_benchmark(path: str, budget_mb: int = 64, meta_ops: int = 50, history: Optional[BenchHistory] = None,
+                        regression: float = 0.5, require_mount: bool = True, max_seconds: float = 30.0,
+                        min_free_ratio: float = 10.0) -> Dict[str, Any]:
+    """
+    마운트 경로 벤치마크 실행
+
+    Args:
+        path: 측정 경로 (예: /mnt/nas)
+        budget_mb: 순차 쓰기 용량 (MB)
+        meta_ops: 메타데이터 작업 횟수 (작업별)
+        history: BenchHistory (None이면 기준값 비교 없음)
+        regression: 기준값 대비 저하 판정 비율
+        require_mount: 경로가 마운트 지점이 아니면 실패 (NAS 미마운트 시 로컬 디스크 측정 방지)
+        max_seconds: 순차 쓰기 시간 상한
+        min_free_ratio: 여유 공간이 쓰기 용량의 이 배수 미만이면 측정 생략 (녹화 공간 보호)
+
+    Returns:
+        {'status', 'value', 'path', 'sequential', 'metadata', 'metrics', 'baseline', 'regressions', 'duration_ms'}
+    """
+    start = time.monotonic()
+    result: Dict[str, Any] = {'status': 'UNKNOWN', 'value': '', 'path': path}
+
+    if not os.path.isdir(path):
+        result.update(status='FAIL', value=f"{path} 경로 없음")
+        return result
+    if require_mount and not os.path.ismount(path):
+        result.update(status='FAIL', value=f"{path} 마운트되지 않음")
+        return result
+
+    usage = shutil.disk_usage(path)
+    if usage.free < budget_mb * MB * min_free_ratio:
+        result.update(status='SKIP', value=f"여유 공간 부족으로 측정 생략 (여유 {usage.free // MB}MB)")
+        return result
+
+    work_dir = os.path.join(path, f".edge_bench_{os.getpid()}_{int(time.time())}")
+    try:
+        os.mkdir(work_dir)
+        sequential = sequential_io(work_dir, budget_mb, max_seconds=max_seconds)
+        metadata = metadata_latency(work_dir, meta_ops)
+    except OSError as e:
+        result.update(status='FAIL', value=f"측정 실패: {e}")
+        return result
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    metrics = {
+        'write_mbps': sequential['write_mbps'],
+        'read_mbps': sequential['read_mbps'],
+        **{f"{kind}_p95_ms": values['p95'] for kind, values in metadata.items()}
+    }
+    baseline = history.baseline(path) if history is not None else None
+    regressions = compare_baseline(metrics, baseline, regression)
+    if history is not None:
+        history.record(path, metrics)
+
+    result.update(
+        status='WARN' if regressions else 'PASS',
+        value=(f"쓰기 {metrics['write_mbps']}MB/s, 읽기 {metrics['read_mbps']}MB/s, "
+               f"create p95 {metrics['create_p95_ms']}ms, stat p95 {metrics['stat_p95_ms']}ms"),
+        sequential=sequential,
+        metadata=metadata,
+        metrics=metrics,
+        baseline=baseline,
+        regressions=regressions,
+        duration_ms=round((time.monotonic() - start) * 1000, 1)
+    )
+    return result
+
+
+def bench_from_config(config: Optional[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+    """
+    점검 설정에서 벤치마크 인자 구성 (비활성화면 None)
+
+    설정 키: mount_bench, mount_bench_path, mount_bench_budget_mb, mount_bench_meta_ops,
+            mount_bench_history_path, mount_bench_regression
+    """
+    if not config or str(config.get('mount_bench', 'false')).lower() != 'true':
+        return None
+    history_path = config.get('mount_bench_history_path')
+    return {
+        'path': config.get('mount_bench_path') or '/mnt/nas',
+        'budget_mb': int(config.get('mount_bench_budget_mb', 64)),
+        'meta_ops': int(config.get('mount_bench_meta_ops', 50)),
+        'history': BenchHistory(history_path) if history_path else None,
+        'regression': float(config.get('mount_bench_regression', 0.5))
+    }
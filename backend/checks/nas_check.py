@@ -8,20 +8,293 @@ NAS 상태 점검 모듈 (개선 버전 v2)
 - 다국어 지원 (정규식 파싱)
 - RAID 장애 검출 강화
 - utils.ui 폴백 지원
+- 배치 실행: 점검 명령 전체를 스크립트 1개로 묶어 채널 1회 왕복으로 실행
+- SSH 연결 풀(선택): 프로세스 전역 트랜스포트 재사용, 끊긴 연결은 투명하게 재연결
+- 포트 경합 연결: 2222와 22를 동시에 시도하여 먼저 핸드셰이크가 끝난 쪽 사용 (호스트별 캐시)
 """
 import paramiko
 import re
-from typing import Dict, Any, Optional
+import copy
+import time
+import uuid
+import shlex
+import socket
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Optional, Tuple
+
+from .disk_forecast import DF_BYTES_COMMAND
+
+# 호스트별 마지막 연결 성공 포트 (프로세스 전역)
+_port_cache: Dict[str, int] = {}
+_port_cache_lock = threading.Lock()
+CONNECT_STAGGER = 0.3  # 캐시된 포트를 먼저 시도한 뒤 다른 포트를 시작하기까지 대기 (초)
+
+# mdstat 파싱 결과 메모 (내용 해시 → 파싱 결과, 프로세스 전역, 최근 것만 보관)
+MDSTAT_MEMO_SIZE = 32
+_mdstat_memo: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+# 호스트별 마지막 mdstat 해시와 그 내용이 처음 확인된 시각
+_mdstat_seen: Dict[str, Tuple[str, float]] = {}
+_mdstat_lock = threading.Lock()
+
+# 점검 명령 (키: (명령, 타임아웃))
+SYSTEM_COMMANDS = {
+    'hostname': ('hostname', 5),
+    'uptime': ('uptime', 5),
+    'load_average': ('cat /proc/loadavg', 5),
+}
+STORAGE_COMMANDS = {
+    'mdstat': ('cat /proc/mdstat', 30),
+    'df': (DF_BYTES_COMMAND, 30),  # 바이트 단위 (구버전 BusyBox는 KB)
+}
+
+# 배치 스크립트 공통 부분: 명령별 시작/종료 구분자 + 종료 코드 + 시작/종료 시각(ns)
+# 명령 출력 끝에 줄바꿈이 없어도 구분자가 새 줄에서 시작하도록 종료 구분자 앞에 줄바꿈 추가
+BATCH_PRELUDE = '''__m={marker}
+__t() {{ date +%s%N 2>/dev/null; }}
+__run() {{
+  printf '%s:BEGIN:%s\\n' "$__m" "$1"; printf '%s:BEGIN:%s\\n' "$__m" "$1" >&2
+  __s=$(__t); ( eval "$2" ) </dev/null; __rc=$?; __e=$(__t)
+  printf '\\n%s:END:%s:%s:%s:%s\\n' "$__m" "$1" "$__rc" "$__s" "$__e"; printf '\\n%s:END:%s\\n' "$__m" "$1" >&2
+}}
+'''
+
+# mdstat 동기화 진행 줄
+# 예: "[=>....]  recovery =  8.5% (331874816/3902196544) finish=305.3min speed=194848K/sec"
+#     "resync=DELAYED", "resync=PENDING"
+_sync_re = re.compile(
+    r'\b(recovery|resync|reshape|check|repair)\s*=\s*([\d.]+)%\s*\((\d+)/(\d+)\)'
+    r'(?:\s*finish\s*=\s*([\d.]+)min)?(?:\s*speed\s*=\s*(\d+)K/sec)?'
+)
+_sync_waiting_re = re.compile(r'\b(recovery|resync|reshape|check|repair)\s*=\s*(DELAYED|PENDING)')
+
+# 중복성 복구 동작 (check/repair는 정기 검사이므로 경고 대상 아님)
+REBUILD_ACTIONS = ('recovery', 'resync', 'reshape')
+
+
+def parse_raid_progress(mdstat: str) -> Dict[str, Dict[str, Any]]:
+    """
+    mdstat에서 디바이스별 동기화(재구축/재동기화/검사) 진행 상황 파싱
+    
+    Returns:
+        {디바이스: {'action', 'state': 'running'/'delayed'/'pending', 'percent', 'done_blocks',
+                   'total_blocks', 'finish_minutes', 'eta_seconds', 'speed_kbps'}}
+    """
+    progress: Dict[str, Dict[str, Any]] = {}
+    device = None
+    for line in mdstat.splitlines():
+        device_match = re.match(r'(md\d+)\s*:', line)
+        if device_match:
+            device = device_match.group(1)
+            continue
+        if device is None:
+            continue
+        
+        match = _sync_re.search(line)
+        if match:
+            finish = float(match.group(5)) if match.group(5) else None
+            progress[device] = {
+                'action': match.group(1),
+                'state': 'running',
+                'percent': float(match.group(2)),
+                'done_blocks': int(match.group(3)),
+                'total_blocks': int(match.group(4)),
+                'finish_minutes': finish,
+                'eta_seconds': round(finish * 60) if finish is not None else None,
+                'speed_kbps': int(match.group(6)) if match.group(6) else None
+            }
+            continue
+        
+        waiting = _sync_waiting_re.search(line)
+        if waiting:
+            progress[device] = {
+                'action': waiting.group(1),
+                'state': waiting.group(2).lower(),
+                'percent': 0.0,
+                'done_blocks': None,
+                'total_blocks': None,
+                'finish_minutes': None,
+                'eta_seconds': None,
+                'speed_kbps': None
+            }
+    return progress
+
+
+def describe_sync(device: str, sync: Dict[str, Any]) -> str:
+    """동기화 진행 상황 한 줄 요약 (예: "md2: RAID 재구축 중 8.5% (약 5시간 5분 남음, 190.3MB/s)")"""
+    labels = {'recovery': '재구축', 'resync': '재동기화', 'reshape': '재구성', 'check': '검사', 'repair': '복구 검사'}
+    label = labels.get(sync['action'], sync['action'])
+    if sync['state'] != 'running':
+        return f"{device}: RAID {label} 대기 중 ({sync['state'].upper()})"
+    
+    details = []
+    if sync['eta_seconds'] is not None:
+        hours, minutes = divmod(sync['eta_seconds'] // 60, 60)
+        if hours:
+            details.append(f"약 {hours}시간 {minutes}분 남음")
+        else:
+            details.append(f"약 {minutes}분 남음" if minutes else "1분 미만 남음")
+    if sync['speed_kbps'] is not None:
+        details.append(f"{sync['speed_kbps'] / 1024:.1f}MB/s")
+    suffix = f" ({', '.join(details)})" if details else ""
+    return f"{device}: RAID {label} 중 {sync['percent']:.1f}%{suffix}"
+
+
+def parse_mdstat(mdstat: str) -> Dict[str, Any]:
+    """
+    /proc/mdstat 파싱 (출력만으로 결정되는 순수 함수 → 내용 해시로 메모이제이션 가능)
+    
+    Returns:
+        {'raid_info': {디바이스: 정보}, 'raid_sync': parse_raid_progress 결과,
+         'issues': [('error'/'warning', 메시지)]}
+    """
+    raid_info: Dict[str, Dict[str, Any]] = {}
+    issues = []
+    
+    # RAID 장애 검출 개선: [x/y] [UU_U] 패턴 정확히 파싱
+    # 예: "md1 : active raid1 ... 2097088 blocks [4/3] [UUU_]"
+    #     → [4/3]는 "4개 슬롯 중 3개 사용", [UUU_]는 3개 활성 + 1개 빈 슬롯
+    #     → 실제 사용 디스크(3개)와 활성 디스크(U 3개)가 일치하면 정상
+    
+    # 재구축/재동기화 진행 상황 (진행 중인 디바이스는 장애 대신 진행률로 보고)
+    sync_progress = parse_raid_progress(mdstat)
+    
+    # 각 md 디바이스별로 검사 (여러 줄 처리)
+    lines = mdstat.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        
+        # RAID 디바이스 시작 라인: "md0 : active raid1 ..."
+        device_match = re.search(r'(md\d+)\s*:\s*active\s+(raid\d+)', line)
+        if not device_match:
+            i += 1
+            continue
+        
+        device_name = device_match.group(1)
+        raid_level = device_match.group(2)  # raid1, raid5, raid6 등
+        
+        # 디스크 슬롯 번호 추출 (예: sata1p3[0] sata3p3[2] sata2p3[1])
+        disk_slots = re.findall(r'(sata\d+)', line)
+        disk_numbers = sorted(set([d.replace('sata', '') for d in disk_slots]))
+        
+        # 다음 줄에서 blocks, [x/y], [UUU_] 정보 찾기
+        blocks = 0
+        capacity_gb = 0
+        slot_match = None
+        state_match = None
+        
+        # 현재 줄과 다음 2-3줄에서 정보 수집
+        for j in range(i, min(i + 4, len(lines))):
+            check_line = lines[j]
+            
+            # 블록 수 추출
+            if not blocks:
+                blocks_match = re.search(r'(\d+)\s+blocks', check_line)
+                if blocks_match:
+                    blocks = int(blocks_match.group(1))
+                    capacity_gb = blocks / 1024 / 1024
+            
+            # [x/y] 패턴
+            if not slot_match:
+                slot_match = re.search(r'\[(\d+)/(\d+)\]', check_line)
+            
+            # [U_] 패턴
+            if not state_match:
+                state_match = re.search(r'\[([U_]+)\]', check_line)
+        
+        if slot_match and state_match:
+            total_slots = int(slot_match.group(1))
+            active_disks = int(slot_match.group(2))
+            raid_state = state_match.group(1)
+            
+            active_count = raid_state.count('U')
+            failed_count = raid_state.count('_')
+            
+            # RAID 정보 저장
+            raid_info[device_name] = {
+                'level': raid_level,
+                'capacity_gb': capacity_gb,
+                'disk_count': active_disks,
+                'status': raid_state,
+                'active': active_count,
+                'disk_numbers': disk_numbers,
+                'sync': sync_progress.get(device_name)
+            }
+            
+            # 실제 장애 판단
+            sync = sync_progress.get(device_name)
+            if active_count != active_disks and sync and sync['action'] in REBUILD_ACTIONS:
+                # 재구축 진행 중: 중복성은 없지만 복구 중이므로 진행률과 함께 경고
+                issue = f"{describe_sync(device_name, sync)} [{raid_state}]"
+                issues.append(('warning', issue))
+            elif active_count != active_disks:
+                issue = f"{device_name}: RAID 디스크 장애 - {active_disks}개 중 {active_count}개만 활성 [{raid_state}]"
+                issues.append(('error', issue))
+            elif failed_count > 0 and active_count == active_disks:
+                pass  # 정상 (빈 슬롯)
+        elif state_match:
+            # [x/y] 없이 [UU_]만 있는 경우
+            raid_state = state_match.group(1)
+            if '_' in raid_state:
+                failed_count = raid_state.count('_')
+                total_count = len(raid_state)
+                warning = f"{device_name}: RAID 상태 확인 필요 [{raid_state}] (_{failed_count}/{total_count})"
+                issues.append(('warning', warning))
+        
+        i += 1
+    
+    # 장애로 보고되지 않은 재동기화/재구성도 진행률과 함께 경고 (check/repair 정기 검사는 제외)
+    for device_name, sync in sync_progress.items():
+        reported = any(message.startswith(f"{device_name}:") for _, message in issues)
+        if sync['action'] in REBUILD_ACTIONS and not reported:
+            issue = describe_sync(device_name, sync)
+            issues.append(('warning', issue))
+    
+    # 추가: "FAILED" 키워드 명시적 체크
+    if 'FAILED' in mdstat.upper() or '(F)' in mdstat:
+        issue = "RAID 장애 상태 (FAILED)"
+        if issue not in [message for _, message in issues]:
+            issues.append(('error', issue))
+    
+    return {'raid_info': raid_info, 'raid_sync': sync_progress, 'issues': issues}
+
+
+def parse_mdstat_cached(mdstat: str) -> Tuple[str, Dict[str, Any], bool]:
+    """
+    내용 해시로 메모이제이션한 parse_mdstat (대부분의 점검에서 mdstat 원문이 그대로이므로 재파싱 생략)
+    
+    Returns:
+        (해시, 파싱 결과 사본, 메모 적중 여부)
+    """
+    digest = hashlib.sha256(mdstat.encode('utf-8', errors='ignore')).hexdigest()
+    with _mdstat_lock:
+        parsed = _mdstat_memo.get(digest)
+        if parsed is not None:
+            _mdstat_memo.move_to_end(digest)
+    hit = parsed is not None
+    if not hit:
+        parsed = parse_mdstat(mdstat)
+        with _mdstat_lock:
+            _mdstat_memo[digest] = parsed
+            while len(_mdstat_memo) > MDSTAT_MEMO_SIZE:
+                _mdstat_memo.popitem(last=False)
+    # 호출 측에서 결과를 고쳐도 메모가 오염되지 않도록 사본 반환
+    return digest, copy.deepcopy(parsed), hit
 
 
 class NASChecker:
     """NAS 상태 체크 클래스 (세션 재사용)"""
     
     def __init__(self, host: str, username: str, password: str, 
-                 port: int = 2222, timeout: int = 30):
+                 port: int = 2222, timeout: int = 30, pool=None):
         """
         Args:
             port: SSH 포트 (기본값 2222 - Synology 커스텀 SSH 포트)
+            pool: SSHConnectionPool (None이면 점검마다 새로 연결하고 close()에서 종료)
         """
         self.host = host
         self.username = username
@@ -29,64 +302,168 @@ class NASChecker:
         self.port = port
         self.fallback_port = 22  # 2222 실패 시 표준 SSH 포트로 재시도
         self.default_timeout = timeout
+        self.pool = pool
         self.ssh: Optional[paramiko.SSHClient] = None
         self.errors = []
         self.warnings = []
         self.connected_port = None  # 실제 연결된 포트 기록
+        self.prefetched: Dict[str, Dict[str, Any]] = {}  # 배치 실행 결과 (키별)
+        self.deadline: Optional[float] = None  # 점검 전체 마감 시각 (monotonic, 명령 타임아웃을 남은 시간으로 제한)
         
-    def connect(self) -> bool:
-        """SSH 연결 (포트 fallback 지원)"""
-        # 1차 시도: 설정된 포트 (기본 2222)
+    def _open(self, port: int, sockets: Optional[Dict[int, socket.socket]] = None) -> paramiko.SSHClient:
+        """
+        포트 1개로 SSH 연결 (풀이 있으면 풀에서 대여)
+        
+        Args:
+            sockets: 경합 연결 시 소켓 등록용 (다른 포트가 이기면 소켓을 닫아 핸드셰이크 중단)
+        """
+        if self.pool is not None:
+            return self.pool.acquire(self.host, port, self.username, self.password, self.default_timeout)
+        
+        sock = socket.create_connection((self.host, port), timeout=self.default_timeout)
+        if sockets is not None:
+            sockets[port] = sock
+        ssh = paramiko.SSHClient()
+        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         try:
-            self.ssh = paramiko.SSHClient()
-            self.ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            self.ssh.connect(
+            ssh.connect(
                 self.host, 
-                port=self.port, 
+                port=port, 
                 username=self.username, 
                 password=self.password, 
                 timeout=self.default_timeout,
+                banner_timeout=self.default_timeout,
                 look_for_keys=False,
-                allow_agent=False
+                allow_agent=False,
+                sock=sock
             )
-            self.connected_port = self.port
-            return True
-        except Exception as e:
-            first_error = str(e)
-            
-            # 2차 시도: fallback 포트 (22)
-            if self.port != self.fallback_port:
+        except Exception:
+            ssh.close()
+            sock.close()
+            raise
+        return ssh
+    
+    def _discard(self, port: int, client: paramiko.SSHClient):
+        """경합에서 진 연결 정리 (풀이면 반납, 아니면 종료)"""
+        if self.pool is not None:
+            self.pool.release(self.host, port, self.username)
+        else:
+            try:
+                client.close()
+            except Exception:
+                pass
+    
+    def _race(self, ports: list, stagger: float = 0.0) -> Tuple[Optional[int], Optional[paramiko.SSHClient], Dict[int, str]]:
+        """
+        여러 포트에 연결하여 먼저 핸드셰이크가 끝난 연결 사용
+        진 쪽은 소켓을 닫아 중단하고, 이미 연결되었으면 정리
+        
+        Args:
+            ports: 시도할 포트 (앞 순서 우선)
+            stagger: 다음 포트 시작 전 대기 (초, 0이면 동시 시작, 앞 포트가 먼저 실패하면 즉시 시작)
+        
+        Returns:
+            (연결된 포트, 클라이언트, {포트: 오류 메시지})
+        """
+        errors: Dict[int, str] = {}
+        sockets: Dict[int, socket.socket] = {}
+        executor = ThreadPoolExecutor(max_workers=len(ports), thread_name_prefix="nas-connect")
+        futures = {}
+        winner_port, winner = None, None
+        pending = set()
+        
+        def collect(done):
+            nonlocal winner_port, winner
+            for future in done:
+                port = futures[future]
                 try:
-                    self.ssh = paramiko.SSHClient()
-                    self.ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                    
-                    self.ssh.connect(
-                        self.host, 
-                        port=self.fallback_port, 
-                        username=self.username, 
-                        password=self.password, 
-                        timeout=self.default_timeout,
-                        look_for_keys=False,
-                        allow_agent=False
-                    )
-                    self.connected_port = self.fallback_port
-                    self.warnings.append(f"포트 {self.port} 실패, 포트 {self.fallback_port}로 연결 성공")
-                    return True
-                except Exception as e2:
-                    self.errors.append(f"SSH 연결 실패 (포트 {self.port}: {first_error}, 포트 {self.fallback_port}: {str(e2)})")
-                    return False
+                    client = future.result()
+                except Exception as e:
+                    errors[port] = str(e) or type(e).__name__
+                    continue
+                if winner is None:
+                    winner_port, winner = port, client
+                else:
+                    self._discard(port, client)
+        
+        for index, port in enumerate(ports):
+            if index > 0 and pending and stagger > 0:
+                done, pending = wait(pending, timeout=stagger, return_when=FIRST_COMPLETED)
+                collect(done)
+            if winner is not None:
+                break
+            future = executor.submit(self._open, port, sockets)
+            futures[future] = port
+            pending.add(future)
+        
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+        
+        # 남은 시도 중단: 소켓을 shutdown하면 진행 중인 핸드셰이크가 즉시 실패 (소켓 정리는 _open에서)
+        for future in pending:
+            port = futures[future]
+            sock = sockets.get(port)
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            future.add_done_callback(
+                lambda f, port=port: self._discard(port, f.result()) if f.exception() is None else None
+            )
+        executor.shutdown(wait=False)
+        return winner_port, winner, errors
+    
+    def connect(self) -> bool:
+        """
+        SSH 연결 (설정 포트 + fallback 포트 동시 시도)
+        이전에 성공한 포트가 캐시되어 있으면 그 포트를 먼저 시작하고 CONNECT_STAGGER 후 다른 포트도 시작
+        (캐시된 포트가 응답하지 않아도 연결 타임아웃 전체를 기다리지 않음)
+        """
+        ports = [self.port] if self.port == self.fallback_port else [self.port, self.fallback_port]
+        
+        with _port_cache_lock:
+            cached_port = _port_cache.get(self.host)
+        stagger = 0.0
+        if cached_port in ports and len(ports) > 1:
+            ports = [cached_port] + [port for port in ports if port != cached_port]
+            stagger = CONNECT_STAGGER
+        
+        port, client, errors = self._race(ports, stagger)
+        if client is None:
+            if len(ports) > 1:
+                self.errors.append(f"SSH 연결 실패 (포트 {self.port}: {errors.get(self.port)}, "
+                                   f"포트 {self.fallback_port}: {errors.get(self.fallback_port)})")
             else:
-                self.errors.append(f"SSH 연결 실패: {first_error}")
-                return False
+                self.errors.append(f"SSH 연결 실패: {errors.get(self.port)}")
+            return False
+        self.ssh = client
+        self.connected_port = port
+        from_cache = stagger > 0 and port == cached_port
+        
+        with _port_cache_lock:
+            _port_cache[self.host] = self.connected_port
+        
+        if self.connected_port != self.port:
+            if from_cache:
+                self.warnings.append(f"포트 {self.port} 대신 이전 연결 성공 포트 {self.fallback_port}로 연결")
+            elif self.port in errors:
+                self.warnings.append(f"포트 {self.port} 실패, 포트 {self.fallback_port}로 연결 성공")
+            else:
+                self.warnings.append(f"포트 {self.port} 응답 지연, 포트 {self.fallback_port}로 먼저 연결됨")
+        return True
     
     def close(self):
-        """SSH 연결 종료"""
+        """SSH 연결 종료 (풀 사용 시 연결은 유지하고 반납만)"""
         if self.ssh:
-            try:
-                self.ssh.close()
-            except:
-                pass
+            if self.pool is not None:
+                self.pool.release(self.host, self.connected_port, self.username)
+            else:
+                try:
+                    self.ssh.close()
+                except:
+                    pass
             self.ssh = None
     
     def exec_command(self, command: str, timeout: Optional[int] = None) -> Dict[str, Any]:
@@ -108,7 +485,20 @@ class NASChecker:
         
         try:
             cmd_timeout = timeout if timeout is not None else self.default_timeout
-            stdin, stdout, stderr = self.ssh.exec_command(command, timeout=cmd_timeout)
+            if self.deadline is not None:
+                remaining = self.deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("점검 제한 시간 초과")
+                cmd_timeout = min(cmd_timeout, remaining)
+            try:
+                stdin, stdout, stderr = self.ssh.exec_command(command, timeout=cmd_timeout)
+            except (paramiko.SSHException, EOFError, OSError):
+                # 풀 연결이 유휴 중 끊긴 경우 재연결 후 1회 재시도
+                if self.pool is None:
+                    raise
+                self.ssh = self.pool.reconnect(self.host, self.connected_port, self.username,
+                                               self.password, self.default_timeout)
+                stdin, stdout, stderr = self.ssh.exec_command(command, timeout=cmd_timeout)
             
             stdout_text = stdout.read().decode('utf-8', errors='ignore')
             stderr_text = stderr.read().decode('utf-8', errors='ignore')
@@ -129,17 +519,103 @@ class NASChecker:
                 'exit_code': -1
             }
     
+    def exec_batch(self, commands: Dict[str, Tuple[str, int]],
+                   timeout: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 명령을 스크립트 1개로 묶어 채널 1개로 실행 (왕복 1회)
+        각 명령의 출력/종료 코드/소요 시간을 고유 구분자로 감싸 출력한 뒤 키별로 분리
+        
+        Args:
+            commands: {키: (명령, 타임아웃)}
+            timeout: 배치 전체 타임아웃 (None이면 명령별 타임아웃 합계)
+        
+        Returns:
+            {키: exec_command와 같은 형식 + 'duration_ms'}
+            배치 실패 또는 결과가 누락된 명령은 개별 실행으로 폴백
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        if not commands:
+            return results
+        
+        marker = f"__NASCHK_{uuid.uuid4().hex}"
+        script = BATCH_PRELUDE.format(marker=marker)
+        for key, (command, _) in commands.items():
+            script += f"__run {shlex.quote(key)} {shlex.quote(command)}\n"
+        batch_timeout = timeout if timeout is not None else sum(t for _, t in commands.values())
+        
+        batch = self.exec_command(script, timeout=batch_timeout)
+        if 'error' not in batch:
+            results = self._parse_batch(marker, batch['stdout'], batch['stderr'], commands)
+        
+        # 폴백: 배치 실패 또는 누락된 명령만 개별 실행
+        for key, (command, cmd_timeout) in commands.items():
+            if key in results:
+                continue
+            start = time.monotonic()
+            res = self.exec_command(command, cmd_timeout)
+            res['duration_ms'] = round((time.monotonic() - start) * 1000, 1)
+            res['fallback'] = True
+            results[key] = res
+        
+        return results
+    
+    @staticmethod
+    def _parse_batch(marker: str, stdout: str, stderr: str,
+                     commands: Dict[str, Tuple[str, int]]) -> Dict[str, Dict[str, Any]]:
+        """배치 출력을 키별 결과로 분리"""
+        m = re.escape(marker)
+        stdout_re = re.compile(rf'{m}:BEGIN:(\S+)\n(.*?)\n{m}:END:\1:(-?\d+):(\S*):(\S*)\n', re.S)
+        stderr_re = re.compile(rf'{m}:BEGIN:(\S+)\n(.*?)\n{m}:END:\1\n', re.S)
+        
+        errors = {match.group(1): match.group(2) for match in stderr_re.finditer(stderr)}
+        results = {}
+        for match in stdout_re.finditer(stdout):
+            key = match.group(1)
+            if key not in commands:
+                continue
+            exit_code = int(match.group(3))
+            start_ns, end_ns = match.group(4), match.group(5)
+            duration_ms = None
+            if start_ns.isdigit() and end_ns.isdigit():
+                duration_ms = round((int(end_ns) - int(start_ns)) / 1e6, 1)
+            results[key] = {
+                'success': exit_code == 0,
+                'stdout': match.group(2),
+                'stderr': errors.get(key, ''),
+                'exit_code': exit_code,
+                'duration_ms': duration_ms
+            }
+        return results
+    
+    def prefetch(self, commands: Optional[Dict[str, Tuple[str, int]]] = None) -> Dict[str, Any]:
+        """
+        점검 명령 일괄 실행 후 결과 보관 (check_system/check_storage가 재사용)
+        
+        Returns:
+            {'commands': 명령 수, 'duration_ms': 전체 소요 시간, 'fallback': 개별 실행된 키 목록}
+        """
+        if commands is None:
+            commands = {**SYSTEM_COMMANDS, **STORAGE_COMMANDS}
+        start = time.monotonic()
+        self.prefetched.update(self.exec_batch(commands))
+        return {
+            'commands': len(commands),
+            'duration_ms': round((time.monotonic() - start) * 1000, 1),
+            'fallback': [key for key in commands if self.prefetched.get(key, {}).get('fallback')]
+        }
+    
+    def _run(self, key: str, command: str, timeout: Optional[int] = None) -> Dict[str, Any]:
+        """미리 실행된 결과가 있으면 사용, 없으면 개별 실행"""
+        if key in self.prefetched:
+            return self.prefetched.pop(key)
+        return self.exec_command(command, timeout)
+    
     def check_system(self) -> Dict[str, Any]:
         """시스템 정보 체크"""
         result = {}
-        commands = {
-            'hostname': ('hostname', 5),
-            'uptime': ('uptime', 5),
-            'load_average': ('cat /proc/loadavg', 5),
-        }
         
-        for key, (cmd, timeout) in commands.items():
-            res = self.exec_command(cmd, timeout)
+        for key, (cmd, timeout) in SYSTEM_COMMANDS.items():
+            res = self._run(key, cmd, timeout)
             if res['success']:
                 result[key] = res['stdout'].strip()
             else:
@@ -148,159 +624,415 @@ class NASChecker:
         
         return result
     
-    def check_storage(self) -> Dict[str, Any]:
-        """스토리지 정보 체크"""
+    def _parse_mdstat(self, mdstat: str) -> Dict[str, Any]:
+        """
+        mdstat 파싱 (메모 사용) + 호스트별 변경 여부
+        
+        Returns:
+            parse_mdstat 결과 + 'memo': {'raid_digest', 'raid_parse_cached', 'raid_unchanged_since'}
+            (raid_unchanged_since: 이전 점검과 내용이 같으면 그 내용이 처음 확인된 시각, 바뀌었으면 None)
+        """
+        digest, parsed, hit = parse_mdstat_cached(mdstat)
+        now = time.time()
+        with _mdstat_lock:
+            previous = _mdstat_seen.get(self.host)
+            if previous is not None and previous[0] == digest:
+                since = previous[1]
+            else:
+                since = None
+                _mdstat_seen[self.host] = (digest, now)
+        parsed['memo'] = {
+            'raid_digest': digest,
+            'raid_parse_cached': hit,
+            'raid_unchanged_since': datetime.fromtimestamp(since).isoformat(timespec='seconds') if since else None
+        }
+        return parsed
+    
+    def check_storage(self, usage_history=None, warn_days: float = 30,
+                      fail_days: float = 7) -> Dict[str, Any]:
+        """
+        스토리지 정보 체크
+        
+        Args:
+            usage_history: UsageHistory (None이면 가득 참 예측 없이 80/90% 기준만 적용)
+            warn_days: 이 일수 이내 가득 참 예상 시 경고
+            fail_days: 이 일수 이내 가득 참 예상 시 위험
+        """
         result = {
             'raid_status': None,
             'raid_info': {},  # RAID 정보 요약 (디스크 개수, 용량 등)
+            'raid_sync': {},  # 재구축/재동기화 진행 상황
+            'raid_digest': None,  # mdstat 원문 해시 (변경 없으면 raid_status 원문 생략)
+            'raid_parse_cached': False,
+            'raid_unchanged_since': None,
             'disk_usage': None,
             'critical_issues': []
         }
         
         # RAID 상태 (중요 - 긴 타임아웃)
-        raid = self.exec_command('cat /proc/mdstat', timeout=30)
+        raid = self._run('mdstat', *STORAGE_COMMANDS['mdstat'])
         if raid['success']:
-            result['raid_status'] = raid['stdout'].strip()
-            
-            # RAID 장애 검출 개선: [x/y] [UU_U] 패턴 정확히 파싱
-            # 예: "md1 : active raid1 ... 2097088 blocks [4/3] [UUU_]"
-            #     → [4/3]는 "4개 슬롯 중 3개 사용", [UUU_]는 3개 활성 + 1개 빈 슬롯
-            #     → 실제 사용 디스크(3개)와 활성 디스크(U 3개)가 일치하면 정상
-            
-            # 각 md 디바이스별로 검사 (여러 줄 처리)
-            lines = raid['stdout'].splitlines()
-            i = 0
-            while i < len(lines):
-                line = lines[i]
-                
-                # RAID 디바이스 시작 라인: "md0 : active raid1 ..."
-                device_match = re.search(r'(md\d+)\s*:\s*active\s+(raid\d+)', line)
-                if not device_match:
-                    i += 1
-                    continue
-                
-                device_name = device_match.group(1)
-                raid_level = device_match.group(2)  # raid1, raid5, raid6 등
-                
-                # 디스크 슬롯 번호 추출 (예: sata1p3[0] sata3p3[2] sata2p3[1])
-                disk_slots = re.findall(r'(sata\d+)', line)
-                disk_numbers = sorted(set([d.replace('sata', '') for d in disk_slots]))
-                
-                # 다음 줄에서 blocks, [x/y], [UUU_] 정보 찾기
-                blocks = 0
-                capacity_gb = 0
-                slot_match = None
-                state_match = None
-                
-                # 현재 줄과 다음 2-3줄에서 정보 수집
-                for j in range(i, min(i + 4, len(lines))):
-                    check_line = lines[j]
-                    
-                    # 블록 수 추출
-                    if not blocks:
-                        blocks_match = re.search(r'(\d+)\s+blocks', check_line)
-                        if blocks_match:
-                            blocks = int(blocks_match.group(1))
-                            capacity_gb = blocks / 1024 / 1024
-                    
-                    # [x/y] 패턴
-                    if not slot_match:
-                        slot_match = re.search(r'\[(\d+)/(\d+)\]', check_line)
-                    
-                    # [U_] 패턴
-                    if not state_match:
-                        state_match = re.search(r'\[([U_]+)\]', check_line)
-                
-                if slot_match and state_match:
-                    total_slots = int(slot_match.group(1))
-                    active_disks = int(slot_match.group(2))
-                    raid_state = state_match.group(1)
-                    
-                    active_count = raid_state.count('U')
-                    failed_count = raid_state.count('_')
-                    
-                    # RAID 정보 저장
-                    result['raid_info'][device_name] = {
-                        'level': raid_level,
-                        'capacity_gb': capacity_gb,
-                        'disk_count': active_disks,
-                        'status': raid_state,
-                        'active': active_count,
-                        'disk_numbers': disk_numbers
-                    }
-                    
-                    # 실제 장애 판단
-                    if active_count != active_disks:
-                        issue = f"{device_name}: RAID 디스크 장애 - {active_disks}개 중 {active_count}개만 활성 [{raid_state}]"
-                        result['critical_issues'].append(issue)
-                        self.errors.append(issue)
-                    elif failed_count > 0 and active_count == active_disks:
-                        pass  # 정상 (빈 슬롯)
-                elif state_match:
-                    # [x/y] 없이 [UU_]만 있는 경우
-                    raid_state = state_match.group(1)
-                    if '_' in raid_state:
-                        failed_count = raid_state.count('_')
-                        total_count = len(raid_state)
-                        warning = f"{device_name}: RAID 상태 확인 필요 [{raid_state}] (_{failed_count}/{total_count})"
-                        result['critical_issues'].append(warning)
-                        self.warnings.append(warning)
-                
-                i += 1
-            
-            # 추가: "FAILED" 키워드 명시적 체크
-            if 'FAILED' in raid['stdout'].upper() or '(F)' in raid['stdout']:
-                issue = "RAID 장애 상태 (FAILED)"
-                if issue not in result['critical_issues']:
-                    result['critical_issues'].append(issue)
-                    self.errors.append(issue)
+            # 파싱 결과는 원문 해시로 메모 (원문이 같으면 재파싱 생략)
+            parsed = self._parse_mdstat(raid['stdout'])
+            result.update(parsed['memo'])
+            result['raid_info'] = parsed['raid_info']
+            result['raid_sync'] = parsed['raid_sync']
+            # 이전 점검과 내용이 같으면 원문은 싣지 않음 → 점검 이력에는 바뀐 시점에만 원문 저장 (raid_digest로 대조)
+            result['raid_status'] = None if result['raid_unchanged_since'] else raid['stdout'].strip()
+            for level, issue in parsed['issues']:
+                result['critical_issues'].append(issue)
+                (self.errors if level == 'error' else self.warnings).append(issue)
         else:
             result['raid_status'] = 'N/A (SW RAID 없음)'
         
-        # 디스크 사용량 (중요 - 긴 타임아웃) - 견고한 파싱
-        df = self.exec_command('df -h', timeout=30)
+        # 디스크 사용량 (중요 - 긴 타임아웃) - 바이트 단위 정밀 파싱 + 증가 속도 예측
+        df = self._run('df', *STORAGE_COMMANDS['df'])
         if df['success']:
-            result['disk_usage'] = df['stdout']
+            from .disk_forecast import parse_df_bytes, is_pseudo, format_df_table, forecast_usage, \
+                evaluate_usage, format_bytes
             
-            # 정규식으로 % 추출 (로케일/BusyBox 호환)
-            percent_pattern = re.compile(r'(\d{1,3})%')
+            mounts = parse_df_bytes(df['stdout'])
+            result['disk_usage'] = format_df_table(mounts)
+            result['mounts'] = {}
             
-            for line in df['stdout'].splitlines():
-                if not line.strip():
+            for mount in mounts:
+                if is_pseudo(mount):
                     continue
+                mountpoint = mount['mount']
+                forecast = None
+                if usage_history is not None:
+                    points = usage_history.record(f"nas:{self.host}:{mountpoint}", mount['used'],
+                                                  mount['used'] + mount['avail'])
+                    forecast = forecast_usage(points)
+                days_to_full = forecast['days_to_full'] if forecast else None
+                status = evaluate_usage(mount['percent'], days_to_full, warn_days, fail_days)
+                result['mounts'][mountpoint] = {**mount, 'status': status, 'forecast': forecast}
                 
-                # 헤더 스킵 (Filesystem, 파일시스템 등)
-                if 'Filesystem' in line or '파일시스템' in line or line.startswith('Filesystem'):
+                if status == 'PASS':
                     continue
-                
-                # % 패턴 찾기
-                percent_match = percent_pattern.search(line)
-                if percent_match:
-                    try:
-                        use_percent = int(percent_match.group(1))
-                        
-                        # 마운트 포인트 추출 (마지막 공백으로 분리된 부분)
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            # 일반적으로 마지막 필드가 마운트 포인트
-                            mountpoint = parts[-1]
-                            
-                            # 판정
-                            if use_percent >= 90:
-                                issue = f"{mountpoint} 디스크 사용량 {use_percent}% (위험)"
-                                result['critical_issues'].append(issue)
-                                self.errors.append(issue)
-                            elif use_percent >= 80:
-                                warning = f"{mountpoint} 디스크 사용량 {use_percent}% (경고)"
-                                result['critical_issues'].append(warning)
-                                self.warnings.append(warning)
-                    except (ValueError, IndexError):
-                        pass
+                message = f"{mountpoint} 디스크 사용량 {mount['percent']:.1f}%"
+                if days_to_full is not None and days_to_full <= warn_days:
+                    message += f", 약 {days_to_full:.0f}일 후 가득 참 (+{format_bytes(forecast['bytes_per_day'])}/일)"
+                message += " (위험)" if status == 'FAIL' else " (경고)"
+                result['critical_issues'].append(message)
+                if status == 'FAIL':
+                    self.errors.append(message)
+                else:
+                    self.warnings.append(message)
         else:
             self.warnings.append("디스크 사용량 조회 실패")
         
         return result
     
+    def check_smart(self, storage: Dict[str, Any], history=None, window_days: float = 7.0,
+                    rate_warn: float = 1.0, temp_warn: int = 55) -> Dict[str, Any]:
+        """
+        RAID 멤버 디스크(sataN) SMART 점검 (배치 실행으로 왕복 1회)
+        
+        Args:
+            storage: check_storage 결과 (raid_info의 disk_numbers 사용)
+            history: SmartHistory (None이면 증가 속도 판정 없이 이번 값만 판정)
+            window_days: 증가 속도 계산 기간 (일)
+            rate_warn: 오류 카운터 일당 증가량 경고 기준
+            temp_warn: 온도 경고 기준 (°C)
+        
+        Returns:
+            {'disks': {디스크: {'values', 'changed', 'rates', 'status', 'issues'}}, 'unavailable': [디스크]}
+        """
+        from .smart_health import smart_commands, parse_smartctl, evaluate_disk, ERROR_COUNTERS
+        
+        numbers = set()
+        for info in storage.get('raid_info', {}).values():
+            numbers.update(info.get('disk_numbers', []))
+        disks = [f"sata{n}" for n in sorted(numbers, key=int)]
+        result = {'disks': {}, 'unavailable': []}
+        if not disks:
+            return result
+        
+        outputs = self.exec_batch(smart_commands(disks))
+        now = time.time()
+        for disk in disks:
+            values = parse_smartctl(outputs.get(f"smart_{disk}", {}).get('stdout', ''))
+            if len(values) <= 1 and values.get('health') is None:
+                result['unavailable'].append(disk)
+                continue
+            
+            changed, rates = {}, {}
+            if history is not None:
+                # 증가 속도는 이번 값을 기록하기 전 이력과 비교
+                rates = {key: history.growth_rate(self.host, disk, key, values.get(key), now, window_days)
+                         for key in ERROR_COUNTERS}
+                changed = history.record(self.host, disk, values, now)
+            verdict = evaluate_disk(values, rates, rate_warn, temp_warn)
+            result['disks'][disk] = {'values': values, 'changed': changed, 'rates': rates, **verdict}
+            
+            for issue in verdict['issues']:
+                message = f"{disk}: {issue}"
+                if verdict['status'] == 'FAIL':
+                    self.errors.append(message)
+                else:
+                    self.warnings.append(message)
+        
+        if result['unavailable'] and not result['disks']:
+            self.warnings.append("SMART 조회 실패 (smartctl 없음 또는 권한 부족)")
+        return result
+    
+    def check_io(self, interval: float = 1.0, util_warn: float = 90.0, await_warn: float = 100.0,
+                 nic_util_warn: float = 80.0, nic_mbps_warn: Optional[float] = None,
+                 nic_drop_warn: Optional[float] = 10.0) -> Dict[str, Any]:
+        """
+        디스크 I/O / 네트워크 부하 샘플링 (명령 1회 = SSH 채널 1개)
+        
+        Args:
+            interval: 두 스냅샷 사이 간격 (초)
+            util_warn: 디스크 사용률 경고 기준 (%)
+            await_warn: 디스크 평균 응답 시간 경고 기준 (ms)
+            nic_util_warn: NIC 링크 대비 사용률 경고 기준 (%)
+            nic_mbps_warn: 링크 속도를 모를 때 NIC 처리량 경고 기준 (Mbit/s, None이면 생략)
+            nic_drop_warn: NIC 드롭 경고 기준 (rx+tx 건/초, None이면 생략 - 오류는 1건이라도 경고)
+        
+        Returns:
+            {'elapsed_s', 'disks', 'nics', 'issues'} (io_sampler.compute_rates 형식)
+        """
+        from .io_sampler import sample_command, parse_samples, compute_rates, evaluate_io
+        
+        sample = self.exec_command(sample_command(interval), timeout=int(interval) + 15)
+        samples = parse_samples(sample['stdout'])
+        if not sample['success'] or len(samples) != 2:
+            self.warnings.append("디스크/네트워크 부하 조회 실패")
+            return {'elapsed_s': None, 'disks': {}, 'nics': {}, 'issues': []}
+        
+        result = compute_rates(*samples)
+        result['issues'] = evaluate_io(result, util_warn, await_warn, nic_util_warn, nic_mbps_warn, nic_drop_warn)
+        self.warnings.extend(result['issues'])
+        return result
+    
+
+
+def poll_raid_progress(target: Dict[str, Any], pool=None, timeout: int = 15) -> Dict[str, Any]:
+    """
+    RAID 동기화 진행률만 가볍게 조회 (cat /proc/mdstat 1회, 전체 NAS 점검 없이)
+    연결 풀을 넘기면 점검 때 열어 둔 SSH 트랜스포트를 재사용
+    
+    Args:
+        target: {'host', 'user', 'password', 'port'} (nas_fleet 대상 형식)
+    
+    Returns:
+        {'success', 'devices': parse_raid_progress 결과, 'error'}
+    """
+    checker = NASChecker(
+        host=target['host'],
+        username=target['user'],
+        password=target['password'],
+        port=int(target['port']),
+        timeout=timeout,
+        pool=pool
+    )
+    try:
+        if not checker.connect():
+            return {'success': False, 'devices': {}, 'error': checker.errors[0] if checker.errors else 'Unknown error'}
+        mdstat = checker.exec_command(STORAGE_COMMANDS['mdstat'][0], timeout=timeout)
+        if not mdstat['success']:
+            return {'success': False, 'devices': {}, 'error': mdstat.get('error') or mdstat['stderr'].strip()}
+        return {'success': True, 'devices': parse_raid_progress(mdstat['stdout']), 'error': None}
+    finally:
+        checker.close()
+
+
+class NASCheckTimeout(Exception):
+    """점검 제한 시간 초과 (run_nas_check 내부)"""
+
+
+def nas_check_options(nas_config: Dict[str, str]) -> Dict[str, Any]:
+    """
+    점검 설정에서 run_nas_check 부가 인자 구성
+
+    Returns:
+        {'pool', 'breaker', 'smart', 'usage', 'io'} (사용하지 않는 항목은 None)
+    """
+    pool = None
+    if str(nas_config.get('ssh_pool', 'false')).lower() == 'true':
+        try:
+            from utils.ssh_pool import ssh_pool as pool
+        except ImportError:
+            pool = None
+    breaker = None
+    try:
+        from utils.circuit_breaker import breaker_from_config
+        breaker = breaker_from_config(nas_config)
+    except ImportError:
+        pass
+
+    smart = None
+    try:
+        from .smart_health import history_from_config
+        history = history_from_config(nas_config)
+        if history is not None:
+            smart = {
+                'history': history,
+                'window_days': float(nas_config.get('smart_rate_window', 7)),
+                'rate_warn': float(nas_config.get('smart_rate_warn', 1.0)),
+                'temp_warn': int(nas_config.get('smart_temp_warn', 55))
+            }
+    except ImportError:
+        pass
+
+    usage_history = None
+    try:
+        from .disk_forecast import history_from_config as usage_history_from_config
+        usage_history = usage_history_from_config(nas_config)
+    except ImportError:
+        pass
+    usage = {
+        'usage_history': usage_history,
+        'warn_days': float(nas_config.get('disk_forecast_warn_days', 30)),
+        'fail_days': float(nas_config.get('disk_forecast_fail_days', 7))
+    }
+
+    io = None
+    try:
+        from .io_sampler import io_options_from_config
+        io = io_options_from_config(nas_config)
+    except ImportError:
+        pass
+
+    return {'pool': pool, 'breaker': breaker, 'smart': smart, 'usage': usage, 'io': io}
+
+
+def run_nas_check(target: Dict[str, Any], pool=None, breaker=None, timeout: int = 30,
+                  smart: Optional[Dict[str, Any]] = None,
+                  usage: Optional[Dict[str, Any]] = None,
+                  io: Optional[Dict[str, Any]] = None,
+                  host_timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    NAS 1대 점검 (출력 없음, check_nas_status와 다중 NAS 점검이 공유)
+    회로 차단기 확인 → SSH 연결 → 배치 실행 → 시스템 → 스토리지 → SMART → 부하
+
+    Args:
+        target: {'name', 'host', 'user', 'password', 'port'} (nas_fleet.parse_nas_targets 형식, 'error'가 있으면 바로 FAIL)
+        timeout: SSH 연결/명령 기본 타임아웃 (초)
+        smart: SMART 점검 인자 {'history', 'window_days', 'rate_warn', 'temp_warn'} (None이면 생략)
+        usage: 사용량 예측 인자 {'usage_history', 'warn_days', 'fail_days'} (None이면 80/90% 기준만)
+        io: 부하 샘플링 인자 (io_sampler.io_options_from_config 형식, None이면 생략)
+        host_timeout: 점검 전체 제한 시간 (초, 이 스레드 안에서 적용 - 연결/명령 타임아웃을 남은 시간으로 제한,
+                      초과 시 FAIL + 회로 차단기 실패 기록)
+
+    Returns:
+        {'name', 'host', 'status', 'connection', 'system', 'storage', 'errors', 'warnings',
+         'batch', 'smart', 'io', 'breaker', 'breaker_probed', 'connected_port', 'duration_ms'}
+    """
+    host = target['host']
+    start = time.monotonic()
+    result = {
+        'name': target.get('name', host),
+        'host': host,
+        'status': 'UNKNOWN',
+        'connection': 'Not tested',
+        'system': {},
+        'storage': {},
+        'errors': [],
+        'warnings': []
+    }
+
+    if target.get('error'):
+        # 대상 설정 형식 오류는 해당 대상만 실패
+        result['status'] = 'FAIL'
+        result['connection'] = 'Invalid target'
+        result['errors'] = [target['error']]
+        result['duration_ms'] = 0.0
+        return result
+
+    port = int(target['port'])
+    breaker_target = f"nas:{host}"
+    if breaker is not None:
+        from utils.circuit_breaker import tcp_probe
+        gate = breaker.gate(
+            breaker_target,
+            lambda: tcp_probe(host, port, timeout=3) or (port != 22 and tcp_probe(host, 22, timeout=3))
+        )
+        result['breaker'] = gate['breaker']
+        result['breaker_probed'] = gate['probed']
+        if not gate['allowed']:
+            state = gate['breaker']
+            result['status'] = 'FAIL'
+            result['connection'] = 'Circuit open'
+            result['errors'] = [f"회로 차단 중 (연속 실패 {state['failures']}회, "
+                                f"다음 확인까지 {state.get('next_probe_in', 0)}초) - 마지막 오류: {state['last_error']}"]
+            result['duration_ms'] = round((time.monotonic() - start) * 1000, 1)
+            return result
+
+    deadline = start + host_timeout if host_timeout else None
+    if deadline is not None:
+        timeout = max(1, int(min(timeout, host_timeout)))
+
+    def check_deadline():
+        if deadline is not None and time.monotonic() >= deadline:
+            raise NASCheckTimeout()
+
+    checker = NASChecker(
+        host=host,
+        username=target['user'],
+        password=target['password'],
+        port=port,
+        timeout=timeout,
+        pool=pool
+    )
+    checker.deadline = deadline
+    try:
+        if not checker.connect():
+            check_deadline()
+            result['status'] = 'FAIL'
+            result['connection'] = 'Failed'
+            result['errors'] = checker.errors
+            if breaker is not None:
+                breaker.record_failure(breaker_target, checker.errors[0] if checker.errors else None)
+                result['breaker'] = breaker.snapshot(breaker_target)
+            return result
+
+        if breaker is not None:
+            breaker.record_success(breaker_target)
+            result['breaker'] = breaker.snapshot(breaker_target)
+
+        result['connection'] = 'Success'
+        result['connected_port'] = checker.connected_port
+        # 점검 명령 일괄 실행 (채널 1회 왕복, 실패 시 명령별 개별 실행)
+        result['batch'] = checker.prefetch()
+        check_deadline()
+        result['system'] = checker.check_system()
+        result['storage'] = checker.check_storage(**(usage or {}))
+        check_deadline()
+        if smart is not None:
+            result['smart'] = checker.check_smart(result['storage'], **smart)
+            check_deadline()
+        if io is not None:
+            result['io'] = checker.check_io(**io)
+            check_deadline()
+        result['errors'] = checker.errors
+        result['warnings'] = checker.warnings
+
+        if checker.errors:
+            result['status'] = 'FAIL'
+        elif checker.warnings:
+            result['status'] = 'WARN'
+        else:
+            result['status'] = 'PASS'
+    except NASCheckTimeout:
+        message = f"점검 시간 초과 ({host_timeout:g}초)"
+        result['status'] = 'FAIL'
+        result['connection'] = 'Timeout'
+        result['errors'] = checker.errors + [message]
+        result['warnings'] = checker.warnings
+        if breaker is not None:
+            breaker.record_failure(breaker_target, message)
+            result['breaker'] = breaker.snapshot(breaker_target)
+    except Exception as e:
+        result['status'] = 'FAIL'
+        result['errors'] = checker.errors + [f"점검 중 오류: {e}"]
+    finally:
+        checker.close()
+        result['duration_ms'] = round((time.monotonic() - start) * 1000, 1)
+
+    return result
 
 
 def check_nas_status(nas_config: Dict[str, str]) -> Dict[str, Any]:
@@ -349,173 +1081,209 @@ def check_nas_status(nas_config: Dict[str, str]) -> Dict[str, Any]:
     
     print_info(f"연결 정보: {username}@{host}:{port} (실패 시 포트 22로 재시도)")
     
-    result = {
-        'status': 'UNKNOWN',
-        'connection': 'Not tested',
-        'system': {},
-        'storage': {},
-        'errors': [],
-        'warnings': []
-    }
+    # 점검 자체는 출력 없는 공용 루틴 (회로 차단기, SSH 연결 풀, SMART/사용량 예측/부하 설정 포함)
+    target = {'name': host, 'host': host, 'user': username, 'password': password, 'port': port}
+    print_info("SSH 연결 테스트 중...")
+    result = run_nas_check(target, timeout=30, **nas_check_options(nas_config))
     
-    # NASChecker 인스턴스 생성
-    checker = NASChecker(
-        host=host,
-        username=username,
-        password=password,
-        port=port,
-        timeout=30
-    )
+    # 1. SSH 연결 결과
+    if result['connection'] == 'Circuit open':
+        print_fail(f"연결 생략: {result['errors'][0]}")
+        return result
+    if result.get('breaker_probed'):
+        print_info("NAS 응답 확인 → 시험 점검으로 SSH 연결을 시도합니다 (실패 시 확인 간격 2배로 다시 차단).")
+    if result['connection'] != 'Success' and not result.get('connected_port'):
+        print_fail(f"연결 실패: {result['errors'][0] if result['errors'] else 'Unknown error'}")
+        return result
     
-    try:
-        # 1. SSH 연결 테스트
-        print_info("SSH 연결 테스트 중...")
-        
-        if not checker.connect():
-            print_fail(f"연결 실패: {checker.errors[0] if checker.errors else 'Unknown error'}")
-            result['status'] = 'FAIL'
-            result['connection'] = 'Failed'
-            result['errors'] = checker.errors
-            return result
-        
-        # 연결된 포트 정보 출력
-        if checker.connected_port:
-            print_pass(f"SSH 연결 성공 (포트 {checker.connected_port})")
+    # 연결된 포트 정보 출력
+    if result.get('connected_port'):
+        print_pass(f"SSH 연결 성공 (포트 {result['connected_port']})")
+    else:
+        print_pass("SSH 연결 성공")
+    
+    # 2. 시스템 정보
+    print("")
+    print_info("시스템 정보 수집 중...")
+    system_info = result['system']
+    
+    for key, value in system_info.items():
+        if value and not value.startswith("Error"):
+            print_key_value(key, value[:60], 'PASS')
         else:
-            print_pass("SSH 연결 성공")
-        result['connection'] = 'Success'
-        result['connected_port'] = checker.connected_port
-        
-        # 2. 시스템 정보 수집
+            print_key_value(key, value, 'FAIL')
+    
+    # 3. 스토리지 정보
+    print("")
+    print_info("스토리지 정보 확인 중...")
+    storage_info = result['storage']
+    
+    # 디스크 사용량 출력
+    if storage_info.get('disk_usage'):
+        print_pass("디스크 사용량 조회 성공")
         print("")
-        print_info("시스템 정보 수집 중...")
-        system_info = checker.check_system()
-        result['system'] = system_info
+        print("  주요 볼륨:")
+        lines = storage_info['disk_usage'].split('\n')
+        for line in lines[:10]:
+            if line.strip():
+                print(f"    {line}")
         
-        for key, value in system_info.items():
-            if value and not value.startswith("Error"):
-                print_key_value(key, value[:60], 'PASS')
-            else:
-                print_key_value(key, value, 'FAIL')
+        # 사용량 증가 속도 / 가득 참 예측 (이력이 충분한 볼륨만)
+        from .disk_forecast import format_bytes
+        for mountpoint, mount in storage_info.get('mounts', {}).items():
+            forecast = mount.get('forecast') or {}
+            if forecast.get('bytes_per_day') is None:
+                continue
+            text = f"{mountpoint}: {format_bytes(forecast['bytes_per_day'])}/일 증가"
+            if forecast.get('days_to_full') is not None:
+                text += f", 약 {forecast['days_to_full']:.0f}일 후 가득 참"
+            text += f" (최근 {forecast['samples']}회, {forecast['span_days']}일)"
+            print_info(text)
+    else:
+        print_warning("디스크 사용량 조회 실패")
+    
+    # RAID 상태 출력
+    print("")
+    print_info("RAID 상태 확인 중...")
+    if storage_info.get('raid_unchanged_since'):
+        print_info(f"mdstat 변경 없음 ({storage_info['raid_unchanged_since']} 이후 동일)")
+    if storage_info.get('raid_info'):
+        # 주 데이터 볼륨(md2) 찾기
+        data_volumes = [k for k in storage_info['raid_info'].keys() if k == 'md2']
+        system_volumes = [k for k in storage_info['raid_info'].keys() if k in ['md0', 'md1']]
         
-        # 3. 스토리지 정보 확인
-        print("")
-        print_info("스토리지 정보 확인 중...")
-        storage_info = checker.check_storage()
-        result['storage'] = storage_info
+        # 데이터 볼륨의 RAID 레벨 추출
+        raid_level_display = None
+        if data_volumes:
+            raid_level = storage_info['raid_info'][data_volumes[0]]['level']
+            level_map = {
+                'raid0': 'RAID 0',
+                'raid1': 'RAID 1',
+                'raid5': 'RAID 5',
+                'raid6': 'RAID 6',
+                'raid10': 'RAID 10'
+            }
+            raid_level_display = level_map.get(raid_level, raid_level.upper())
         
-        # 디스크 사용량 출력
-        if storage_info.get('disk_usage'):
-            print_pass("디스크 사용량 조회 성공")
-            print("")
-            print("  주요 볼륨:")
-            lines = storage_info['disk_usage'].split('\n')
-            for line in lines[:10]:
-                if line.strip():
-                    print(f"    {line}")
+        # RAID 디스크 실패 확인
+        if any('RAID 디스크 실패' in issue for issue in storage_info.get('critical_issues', [])):
+            if raid_level_display:
+                print_fail(f"⚠️  {raid_level_display} 디스크 실패 감지!")
+            else:
+                print_fail("⚠️  RAID 디스크 실패 감지!")
+        elif any(sync['action'] in REBUILD_ACTIONS for sync in storage_info.get('raid_sync', {}).values()):
+            print_warning(f"{raid_level_display or 'RAID'} 재구축/재동기화 진행 중")
         else:
-            print_warning("디스크 사용량 조회 실패")
-        
-        # RAID 상태 출력
+            if raid_level_display:
+                print_pass(f"{raid_level_display} 구성으로 정상")
+            else:
+                print_pass("RAID 상태 정상")
         print("")
-        print_info("RAID 상태 확인 중...")
-        if storage_info.get('raid_info'):
-            # 주 데이터 볼륨(md2) 찾기
-            data_volumes = [k for k in storage_info['raid_info'].keys() if k == 'md2']
-            system_volumes = [k for k in storage_info['raid_info'].keys() if k in ['md0', 'md1']]
+        
+        # 데이터 볼륨 먼저 표시
+        for device in sorted(data_volumes + system_volumes):
+            info = storage_info['raid_info'][device]
+            raid_level = info['level']
+            disk_count = info['disk_count']
+            capacity = info['capacity_gb']
+            disk_numbers = info.get('disk_numbers', [])
             
-            # 데이터 볼륨의 RAID 레벨 추출
-            raid_level_display = None
-            if data_volumes:
-                raid_level = storage_info['raid_info'][data_volumes[0]]['level']
-                level_map = {
-                    'raid0': 'RAID 0',
-                    'raid1': 'RAID 1',
-                    'raid5': 'RAID 5',
-                    'raid6': 'RAID 6',
-                    'raid10': 'RAID 10'
-                }
-                raid_level_display = level_map.get(raid_level, raid_level.upper())
+            # RAID 레벨 한글 표시
+            level_map = {
+                'raid0': 'RAID 0',
+                'raid1': 'RAID 1',
+                'raid5': 'RAID 5',
+                'raid6': 'RAID 6',
+                'raid10': 'RAID 10'
+            }
+            level_name = level_map.get(raid_level, raid_level.upper())
             
-            # RAID 디스크 실패 확인
-            if any('RAID 디스크 실패' in issue for issue in storage_info.get('critical_issues', [])):
-                if raid_level_display:
-                    print_fail(f"⚠️  {raid_level_display} 디스크 실패 감지!")
-                else:
-                    print_fail("⚠️  RAID 디스크 실패 감지!")
+            if capacity >= 1000:
+                capacity_str = f"{capacity/1000:.1f}TB"
             else:
-                if raid_level_display:
-                    print_pass(f"{raid_level_display} 구성으로 정상")
-                else:
-                    print_pass("RAID 상태 정상")
-            print("")
+                capacity_str = f"{capacity:.1f}GB"
             
-            # 데이터 볼륨 먼저 표시
-            for device in sorted(data_volumes + system_volumes):
-                info = storage_info['raid_info'][device]
-                raid_level = info['level']
-                disk_count = info['disk_count']
-                capacity = info['capacity_gb']
-                disk_numbers = info.get('disk_numbers', [])
-                
-                # RAID 레벨 한글 표시
-                level_map = {
-                    'raid0': 'RAID 0',
-                    'raid1': 'RAID 1',
-                    'raid5': 'RAID 5',
-                    'raid6': 'RAID 6',
-                    'raid10': 'RAID 10'
-                }
-                level_name = level_map.get(raid_level, raid_level.upper())
-                
-                if capacity >= 1000:
-                    capacity_str = f"{capacity/1000:.1f}TB"
-                else:
-                    capacity_str = f"{capacity:.1f}GB"
-                
-                # 디스크 슬롯 번호 표시
-                if disk_numbers:
-                    disk_info = f"슬롯 {', '.join(disk_numbers)}번에 {disk_count}개 디스크 연결됨"
-                else:
-                    disk_info = f"{disk_count}개 디스크 사용 중"
-                
-                # 볼륨 타입 판단
-                if device == 'md2':
-                    vol_type = "데이터 볼륨"
-                    print(f"  📀 {vol_type}: {level_name}로 구성됨")
-                else:
-                    vol_type = "시스템 볼륨" if device == 'md0' else "SWAP 볼륨"
-                    print(f"  💾 {vol_type}: {level_name}로 구성됨")
-                
-                print(f"     - {disk_info}")
-                print(f"     - 총 용량: {capacity_str}")
+            # 디스크 슬롯 번호 표시
+            if disk_numbers:
+                disk_info = f"슬롯 {', '.join(disk_numbers)}번에 {disk_count}개 디스크 연결됨"
+            else:
+                disk_info = f"{disk_count}개 디스크 사용 중"
+            
+            # 볼륨 타입 판단
+            if device == 'md2':
+                vol_type = "데이터 볼륨"
+                print(f"  📀 {vol_type}: {level_name}로 구성됨")
+            else:
+                vol_type = "시스템 볼륨" if device == 'md0' else "SWAP 볼륨"
+                print(f"  💾 {vol_type}: {level_name}로 구성됨")
+            
+            print(f"     - {disk_info}")
+            print(f"     - 총 용량: {capacity_str}")
+            sync = info.get('sync')
+            if sync:
+                print(f"     - 상태: {info['status']}")
+                print(f"     - 진행: {describe_sync(device, sync)}")
+            else:
                 print(f"     - 상태: {info['status']} (정상)")
-                print("")
-        else:
-            print_warning("RAID 정보 없음 (SW RAID 미사용 또는 정보를 가져올 수 없음)")
-        
-        # 4. 오류/경고 집계
-        result['errors'] = checker.errors
-        result['warnings'] = checker.warnings
-        
-        # 5. 최종 판정
+            print("")
+    else:
+        print_warning("RAID 정보 없음 (SW RAID 미사용 또는 정보를 가져올 수 없음)")
+    
+    # SMART 디스크 상태 (선택)
+    smart = result.get('smart')
+    if smart is not None:
         print("")
-        if checker.errors:
-            result['status'] = 'FAIL'
-            print_fail(f"NAS 점검 결과: FAIL (오류 {len(checker.errors)}개)")
-            for error in checker.errors:
-                print_fail(f"  - {error}")
-        elif checker.warnings:
-            result['status'] = 'WARN'
-            print_warning(f"NAS 점검 결과: WARN (경고 {len(checker.warnings)}개)")
-            for warning in checker.warnings:
-                print_warning(f"  - {warning}")
-        else:
-            result['status'] = 'PASS'
-            print_pass("NAS 점검 결과: PASS")
+        print_info("디스크 SMART 상태 확인 중...")
+        for disk, info in smart['disks'].items():
+            values = info['values']
+            summary = (f"재할당 {values.get('reallocated_sectors', '-')}, 보류 {values.get('pending_sectors', '-')}, "
+                       f"CRC {values.get('crc_errors', '-')}, {values.get('temperature', '-')}°C, "
+                       f"{values.get('power_on_hours', '-')}시간")
+            if info['status'] == 'PASS':
+                print_pass(f"{disk}: {summary}")
+            elif info['status'] == 'FAIL':
+                print_fail(f"{disk}: {summary} - {', '.join(info['issues'])}")
+            else:
+                print_warning(f"{disk}: {summary} - {', '.join(info['issues'])}")
+        if smart['unavailable']:
+            print_warning(f"SMART 조회 불가: {', '.join(smart['unavailable'])}")
     
-    finally:
-        # 연결 종료
-        checker.close()
+    # 디스크 I/O / 네트워크 부하 (선택)
+    io = result.get('io')
+    if io is not None:
+        print("")
+        print_info(f"디스크/네트워크 부하 ({io['elapsed_s'] or 0:g}초 측정)")
+        issues = io['issues']
+        for disk, stats in sorted(io['disks'].items()):
+            await_text = '-' if stats['await_ms'] is None else f"{stats['await_ms']:.1f}ms"
+            summary = (f"{disk}: IOPS {stats['iops']:.0f} (읽기 {stats['read_mbps']:.1f}MB/s, "
+                       f"쓰기 {stats['write_mbps']:.1f}MB/s), await {await_text}, 사용률 {stats['util_pct']:.0f}%")
+            if any(issue.startswith(f"{disk}:") for issue in issues):
+                print_warning(summary)
+            else:
+                print_pass(summary)
+        for nic, stats in sorted(io['nics'].items()):
+            summary = f"{nic}: 수신 {stats['rx_mbps']:.1f}Mbps, 송신 {stats['tx_mbps']:.1f}Mbps"
+            if stats['util_pct'] is not None:
+                summary += f" (링크 {stats['speed_mbps']}Mbps 대비 {stats['util_pct']:.0f}%)"
+            if stats['errors'] or stats['drops']:
+                summary += f", 오류 {stats['errors']}건, 드롭 {stats['drops']}건"
+            if any(issue.startswith(f"{nic}:") for issue in issues):
+                print_warning(summary)
+            else:
+                print_pass(summary)
+    
+    # 4. 최종 판정
+    print("")
+    if result['status'] == 'FAIL':
+        print_fail(f"NAS 점검 결과: FAIL (오류 {len(result['errors'])}개)")
+        for error in result['errors']:
+            print_fail(f"  - {error}")
+    elif result['status'] == 'WARN':
+        print_warning(f"NAS 점검 결과: WARN (경고 {len(result['warnings'])}개)")
+        for warning in result['warnings']:
+            print_warning(f"  - {warning}")
+    else:
+        print_pass("NAS 점검 결과: PASS")
     
     return result
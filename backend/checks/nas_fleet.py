@@ -0,0 +1,217 @@
+"""
+다중 NAS 동시 점검 모듈 (asyncio)
+사이트별 주/백업 NAS 또는 본사에서 여러 NAS를 한 번에 점검
+- 대상 목록을 동시에 점검하되 전체 동시 실행 수와 호스트별 동시 실행 수를 각각 제한
+- SSH(paramiko)는 블로킹이므로 점검 자체는 전용 스레드 풀에서 실행하고, 스케줄링만 이벤트 루프에서 처리
+- 호스트 1대 점검은 단일 NAS 점검과 같은 루틴(run_nas_check) 사용
+- 호스트별 결과 + 전체 요약(roll-up) 반환
+"""
+import time
+import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from .nas_check import run_nas_check, nas_check_options
+
+STATUS_ORDER = {'PASS': 0, 'WARN': 1, 'FAIL': 2}
+
+
+def parse_nas_targets(value: str, default_user: str = 'admin', default_password: str = '',
+                      default_port: int = 2222) -> List[Dict[str, Any]]:
+    """
+    NAS 대상 목록 파싱
+
+    형식: 쉼표로 구분된 "[이름=][사용자@]호스트[:포트]"
+    예: "main=192.168.10.30,backup=admin2k@192.168.10.31:22"
+
+    Returns:
+        [{'name', 'host', 'user', 'password', 'port'}]
+        (포트가 잘못된 항목은 'port': None, 'error': 메시지 → 해당 대상만 FAIL)
+    """
+    targets = []
+    for item in (value or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        name = None
+        if '=' in item:
+            name, item = (part.strip() for part in item.split('=', 1))
+        user = default_user
+        if '@' in item:
+            user, item = item.rsplit('@', 1)
+        host, port = item, default_port
+        error = None
+        if ':' in item:
+            host, port_text = item.rsplit(':', 1)
+            try:
+                port = int(port_text)
+            except ValueError:
+                port = None
+            if port is None or not 0 < port < 65536:
+                error = f"NAS 대상 '{item}' 잘못된 포트: '{port_text}'"
+                port = None
+        target = {
+            'name': name or host,
+            'host': host,
+            'user': user,
+            'password': default_password,
+            'port': port
+        }
+        if error:
+            target['error'] = error
+        targets.append(target)
+    return targets
+
+
+def summarize_fleet(hosts: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    호스트별 결과 요약 (전체 상태 = 가장 나쁜 호스트 상태)
+
+    오류/경고는 "[이름] 메시지" 형식으로 합쳐 단일 NAS 결과와 같은 키로 제공
+    """
+    counts = {'PASS': 0, 'WARN': 0, 'FAIL': 0}
+    errors, warnings = [], []
+    worst = 'PASS'
+    for name, host_result in hosts.items():
+        status = host_result.get('status', 'FAIL')
+        if status not in STATUS_ORDER:
+            status = 'FAIL'
+        counts[status] += 1
+        if STATUS_ORDER[status] > STATUS_ORDER[worst]:
+            worst = status
+        errors.extend(f"[{name}] {message}" for message in host_result.get('errors', []))
+        warnings.extend(f"[{name}] {message}" for message in host_result.get('warnings', []))
+
+    return {
+        'status': worst if hosts else 'SKIP',
+        'total': len(hosts),
+        'counts': counts,
+        'failed_hosts': [name for name, r in hosts.items() if r.get('status') == 'FAIL'],
+        'degraded_raid': [name for name, r in hosts.items()
+                          if any('RAID' in issue for issue in r.get('storage', {}).get('critical_issues', []))],
+        'errors': errors,
+        'warnings': warnings
+    }
+
+
+async def check_nas_fleet_async(targets: List[Dict[str, Any]], max_concurrency: int = 8,
+                                per_host_limit: int = 1, host_timeout: float = 120.0,
+                                pool=None, breaker=None, ssh_timeout: int = 30,
+                                smart: Optional[Dict[str, Any]] = None,
+                                usage: Optional[Dict[str, Any]] = None,
+                                io: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    NAS 목록 동시 점검
+
+    Args:
+        targets: parse_nas_targets 결과
+        max_concurrency: 전체 동시 점검 수
+        per_host_limit: 같은 호스트에 대한 동시 점검 수 (같은 NAS를 여러 계정/포트로 등록한 경우)
+        host_timeout: 대상 1개 점검 제한 시간 (초, 점검 스레드 안에서 적용 - 대기 시간은 포함하지 않음,
+                      초과 시 FAIL + 회로 차단기 실패 기록)
+        pool: SSHConnectionPool (None이면 대상마다 새로 연결)
+        breaker: CircuitBreaker (None이면 사용 안 함)
+        smart: SMART 점검 인자 (run_nas_check 참고, None이면 생략)
+        usage: 사용량 예측 인자 (run_nas_check 참고, None이면 80/90% 기준만)
+        io: 부하 샘플링 인자 (run_nas_check 참고, None이면 생략)
+
+    Returns:
+        {'status', 'hosts': {이름: 호스트 결과}, 'summary', 'errors', 'warnings', 'duration_ms', 'concurrency'}
+    """
+    start = time.monotonic()
+    max_concurrency = max(1, int(max_concurrency))
+    per_host_limit = max(1, int(per_host_limit))
+
+    global_limit = asyncio.Semaphore(max_concurrency)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="nas-fleet")
+
+    async def run(target: Dict[str, Any]) -> Dict[str, Any]:
+        host_limit = host_limits.setdefault(target['host'], asyncio.Semaphore(per_host_limit))
+        # 호스트 제한을 먼저 획득 → 같은 호스트 대기 중에 전체 슬롯을 점유하지 않음
+        async with host_limit:
+            async with global_limit:
+                # 제한 시간은 스레드 안에서 적용 (연결/명령 타임아웃을 남은 시간으로 제한)
+                # → 스레드가 실제로 끝날 때까지 슬롯을 유지해 같은 호스트에 점검이 겹치지 않음
+                return await loop.run_in_executor(executor, partial(
+                    run_nas_check, target, pool, breaker, ssh_timeout, smart, usage, io,
+                    host_timeout=host_timeout
+                ))
+
+    try:
+        results = await asyncio.gather(*(run(target) for target in targets))
+    finally:
+        executor.shutdown(wait=False)
+
+    hosts = {}
+    for target, host_result in zip(targets, results):
+        name = target.get('name', target['host'])
+        if name in hosts:
+            name = f"{name}:{target['port']}"
+        hosts[name] = host_result
+
+    summary = summarize_fleet(hosts)
+    return {
+        'status': summary['status'],
+        'connection': 'Fleet',
+        'hosts': hosts,
+        'summary': {key: summary[key] for key in ('total', 'counts', 'failed_hosts', 'degraded_raid')},
+        'errors': summary['errors'],
+        'warnings': summary['warnings'],
+        'duration_ms': round((time.monotonic() - start) * 1000, 1),
+        'concurrency': {'global': max_concurrency, 'per_host': per_host_limit}
+    }
+
+
+def fleet_options(nas_config: Dict[str, str]) -> Dict[str, Any]:
+    """점검 설정에서 다중 NAS 점검 인자 구성 (nas_targets가 비어 있으면 대상 없음)"""
+    try:
+        default_port = int(nas_config.get('port', 2222))
+    except ValueError:
+        default_port = 2222
+    return {
+        'targets': parse_nas_targets(
+            nas_config.get('nas_targets', ''),
+            default_user=nas_config.get('user', 'admin'),
+            default_password=nas_config.get('password', ''),
+            default_port=default_port
+        ),
+        'max_concurrency': int(nas_config.get('fleet_concurrency', 8)),
+        'per_host_limit': int(nas_config.get('fleet_per_host', 1)),
+        'host_timeout': float(nas_config.get('fleet_host_timeout', 120)),
+        **nas_check_options(nas_config)
+    }
+
+
+def check_nas_fleet(nas_config: Dict[str, str]) -> Dict[str, Any]:
+    """다중 NAS 점검 실행 (CLI용, 동기 호출 + 결과 출력)"""
+    from utils.ui import print_section, print_info, print_pass, print_fail, print_warning
+
+    print_section(4, 4, "NAS 상태 점검 (다중 대상)")
+    options = fleet_options(nas_config)
+    print_info(f"대상 {len(options['targets'])}대, 동시 점검 {options['max_concurrency']}개 "
+               f"(호스트당 {options['per_host_limit']}개)")
+
+    result = asyncio.run(check_nas_fleet_async(**options))
+
+    print("")
+    for name, host_result in result['hosts'].items():
+        line = f"{name} ({host_result['host']}): {host_result['status']} - {host_result.get('duration_ms')}ms"
+        if host_result['status'] == 'PASS':
+            print_pass(line)
+        elif host_result['status'] == 'WARN':
+            print_warning(line)
+        else:
+            print_fail(line)
+        for message in host_result.get('errors', []):
+            print_fail(f"  - {message}")
+        for message in host_result.get('warnings', []):
+            print_warning(f"  - {message}")
+
+    counts = result['summary']['counts']
+    print("")
+    print_info(f"전체 {result['summary']['total']}대: PASS {counts['PASS']}, WARN {counts['WARN']}, "
+               f"FAIL {counts['FAIL']} ({result['duration_ms']}ms)")
+    return result
@@ -0,0 +1,256 @@
+"""
+NUT(upsd) 네트워크 프로토콜 클라이언트
+upsc 프로세스를 실행하지 않고 TCP 3493으로 upsd에 직접 질의
+- LIST UPS / LIST VAR / GET VAR (응답의 따옴표/이스케이프 처리)
+- 한 세션에서 전체 변수 조회, 연결을 유지해 반복 조회에 재사용 (끊기면 1회 재연결)
+- 원격 upsd, 여러 UPS 지원 ("ups@host[:port]" 형식, upsc와 동일)
+"""
+import socket
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 3493
+
+
+class NUTError(Exception):
+    """upsd 오류 응답 (ERR UNKNOWN-UPS 등) 또는 통신 오류"""
+
+    def __init__(self, message: str, code: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
+
+
+def split_line(line: str) -> List[str]:
+    """
+    응답 한 줄을 토큰으로 분리 (따옴표 안 공백 유지, \\" \\\\ 이스케이프 해제)
+    예: 'VAR ups ups.model "Back-UPS \\"XS\\""' → ['VAR', 'ups', 'ups.model', 'Back-UPS "XS"']
+    """
+    tokens = []
+    current = []
+    quoted = False
+    escaped = False
+    has_token = False
+    for char in line:
+        if escaped:
+            current.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+            has_token = True
+        elif char == ' ' and not quoted:
+            if current or has_token:
+                tokens.append(''.join(current))
+                current = []
+                has_token = False
+        else:
+            current.append(char)
+    if current or has_token:
+        tokens.append(''.join(current))
+    return tokens
+
+
+def target_name(ups: str, host: str, port: int = DEFAULT_PORT) -> str:
+    """UPS 대상 표시 이름 (upsc 형식, 기본 포트는 생략)"""
+    return f"{ups}@{host}" + (f":{port}" if int(port) != DEFAULT_PORT else '')
+
+
+def parse_ups_targets(spec: str, default_host: str = 'localhost',
+                      default_port: int = DEFAULT_PORT) -> List[Dict[str, Any]]:
+    """
+    UPS 대상 목록 파싱 ("ups@host[:port]" 쉼표 구분, 호스트 생략 시 default_host)
+    형식이 잘못된 항목은 예외 대신 'error'를 담아 반환 (해당 대상만 실패 처리)
+
+    Returns:
+        [{'name': 'ups@host', 'ups': 'ups', 'host': 'host', 'port': 3493}, ...]
+        (잘못된 항목: {'name': 원문, ..., 'port': None, 'error': 메시지})
+    """
+    targets = []
+    for item in (spec or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        ups, _, address = item.partition('@')
+        host, port = address or default_host, default_port
+        error = None
+        if ':' in host:
+            host, port_text = host.rsplit(':', 1)
+            try:
+                port = int(port_text)
+            except ValueError:
+                port = None
+            if port is None or not 0 < port < 65536:
+                error = f"잘못된 포트: '{port_text}'"
+                port = None
+        if not ups or ' ' in ups or not host:
+            error = error or "형식 오류 (ups@호스트[:포트])"
+        if error:
+            targets.append({'name': item, 'ups': ups, 'host': host, 'port': None,
+                            'error': f"UPS 대상 '{item}' {error}"})
+            continue
+        targets.append({'name': target_name(ups, host, port), 'ups': ups, 'host': host, 'port': port})
+    return targets
+
+
+class NUTClient:
+    """
+    upsd 연결 1개 (스레드 안전, 요청은 직렬화)
+
+    Args:
+        host: upsd 호스트
+        port: upsd 포트 (기본 3493)
+        timeout: 연결/응답 대기 시간 (초)
+        username/password: upsd.users 계정 (조회만 하면 불필요)
+    """
+
+    def __init__(self, host: str = 'localhost', port: int = DEFAULT_PORT, timeout: float = 5.0,
+                 username: Optional[str] = None, password: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.username = username
+        self.password = password
+        self.sock: Optional[socket.socket] = None
+        self.reader = None
+        self.lock = threading.Lock()
+        self.connects = 0
+
+    def _connect(self):
+        self.sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self.reader = self.sock.makefile('r', encoding='utf-8', errors='replace', newline='\n')
+        self.connects += 1
+        if self.username:
+            try:
+                self._request(f"USERNAME {self.username}")
+                self._request(f"PASSWORD {self.password or ''}")
+            except Exception:
+                self._disconnect()
+                raise
+
+    def _disconnect(self):
+        if self.reader is not None:
+            try:
+                self.reader.close()
+            except Exception:
+                pass
+            self.reader = None
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except Exception:
+                pass
+            self.sock = None
+
+    def _readline(self) -> str:
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("upsd 연결 끊김")
+        line = line.rstrip('\r\n')
+        if line.startswith('ERR '):
+            code = line.split()[1]
+            raise NUTError(f"upsd 오류: {code}", code)
+        return line
+
+    def _request(self, command: str, list_query: Optional[str] = None) -> List[str]:
+        """
+        명령 1개 전송 후 응답 수신
+        list_query가 있으면 'BEGIN LIST ...' ~ 'END LIST ...' 사이 줄 목록, 없으면 응답 1줄
+        """
+        self.sock.sendall(f"{command}\n".encode('utf-8'))
+        first = self._readline()
+        if list_query is None:
+            return [first]
+        if first != f"BEGIN LIST {list_query}":
+            raise NUTError(f"예상하지 못한 응답: {first}")
+        lines = []
+        while True:
+            line = self._readline()
+            if line == f"END LIST {list_query}":
+                return lines
+            lines.append(line)
+
+    def request(self, command: str, list_query: Optional[str] = None) -> List[str]:
+        """연결을 재사용해 명령 실행 (유지 중인 연결이 끊겼으면 1회 재연결 후 재시도)"""
+        with self.lock:
+            for attempt in (1, 2):
+                reused = self.sock is not None
+                try:
+                    if self.sock is None:
+                        self._connect()
+                    return self._request(command, list_query)
+                except NUTError as e:
+                    if e.code is None:
+                        self._disconnect()  # 응답 순서가 어긋났으면 새 연결로
+                    raise
+                except OSError as e:
+                    self._disconnect()
+                    # 응답 시간 초과는 재시도하지 않음 (대기 시간이 두 배가 되므로)
+                    if attempt == 2 or not reused or isinstance(e, socket.timeout):
+                        raise NUTError(f"upsd {self.host}:{self.port} 통신 실패: {str(e) or type(e).__name__}")
+                    logger.debug(f"upsd 유지 연결 끊김, 재연결: {self.host}:{self.port}")
+
+    def list_ups(self) -> Dict[str, str]:
+        """upsd에 등록된 UPS 목록 {이름: 설명}"""
+        upses = {}
+        for line in self.request("LIST UPS", "UPS"):
+            tokens = split_line(line)
+            if len(tokens) >= 2 and tokens[0] == 'UPS':
+                upses[tokens[1]] = tokens[2] if len(tokens) > 2 else ''
+        return upses
+
+    def list_vars(self, ups: str) -> Dict[str, str]:
+        """UPS 전체 변수 (한 번의 요청으로 조회)"""
+        data = {}
+        for line in self.request(f"LIST VAR {ups}", f"VAR {ups}"):
+            tokens = split_line(line)
+            if len(tokens) >= 4 and tokens[0] == 'VAR':
+                data[tokens[2]] = tokens[3]
+        return data
+
+    def get_var(self, ups: str, name: str) -> str:
+        """변수 1개 조회"""
+        tokens = split_line(self.request(f"GET VAR {ups} {name}")[0])
+        if len(tokens) < 4 or tokens[0] != 'VAR':
+            raise NUTError(f"예상하지 못한 응답: {' '.join(tokens)}")
+        return tokens[3]
+
+    def close(self):
+        """세션 종료 (LOGOUT 후 소켓 닫기)"""
+        with self.lock:
+            if self.sock is not None:
+                try:
+                    self.sock.sendall(b"LOGOUT\n")
+                except OSError:
+                    pass
+            self._disconnect()
+
+
+# 프로세스 전역 연결 (host, port, username) 별 1개 - 반복 조회 시 재사용
+_clients: Dict[Tuple[str, int, str], NUTClient] = {}
+_clients_lock = threading.Lock()
+
+
+def shared_client(host: str = 'localhost', port: int = DEFAULT_PORT, timeout: float = 5.0,
+                  username: Optional[str] = None, password: Optional[str] = None) -> NUTClient:
+    """공유 클라이언트 (없으면 생성, 연결은 첫 요청 때)"""
+    key = (host, int(port), username or '')
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = NUTClient(host, int(port), timeout, username, password)
+            _clients[key] = client
+        client.timeout = timeout
+        return client
+
+
+def close_shared_clients():
+    """공유 클라이언트 전체 종료 (애플리케이션 종료 시)"""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
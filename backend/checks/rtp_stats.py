@@ -0,0 +1,481 @@
+"""
+RTP 패킷 손실/지터 측정 모듈
+RTSP DESCRIBE/SETUP/PLAY 후 짧은 구간 동안 RTP 패킷만 수신하여 (영상 디코딩 없음)
+- 시퀀스 번호 기반 패킷 손실 (RFC 3550 A.1)
+- 도착 간격 지터 (RFC 3550 A.8)
+- 수신 비트레이트
+를 계산 → 카메라 VLAN 네트워크 문제와 카메라 자체 문제를 구분
+"""
+import os
+import re
+import time
+import socket
+import base64
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+from typing import Dict, Any, Optional, Tuple
+
+USER_AGENT = "edge-system-checker"
+
+# RFC 3550 A.1 시퀀스 처리 상수
+MAX_DROPOUT = 3000
+MAX_MISORDER = 100
+RTP_SEQ_MOD = 1 << 16
+
+# 판정 기준 기본값
+DEFAULT_LOSS_WARN = 1.0  # 손실률 (%)
+DEFAULT_JITTER_WARN = 30.0  # 지터 (ms)
+
+
+class RTSPError(Exception):
+    """RTSP 요청 실패"""
+    pass
+
+
+class RTPStats:
+    """RTP 수신 통계 (시퀀스 번호 손실 + 도착 간격 지터 + 수신량)"""
+
+    def __init__(self, clock_rate: int = 90000):
+        self.clock_rate = clock_rate
+        self.ssrc: Optional[int] = None
+        self.base_seq: Optional[int] = None
+        self.max_seq = 0
+        self.cycles = 0
+        self.received = 0
+        self.reordered = 0
+        self.restarts = 0
+        self.discarded = 0  # 큰 점프 후 연속되지 않은 패킷 (떠돌이 패킷, 집계 제외)
+        self.bad_seq = RTP_SEQ_MOD + 1  # 큰 점프 다음에 기대하는 시퀀스 (연속 2개면 재시작으로 판단)
+        self.expected_prior = 0  # 시퀀스 재시작 전까지의 예상 패킷 수
+        self.received_prior = 0
+
+        self.jitter = 0.0  # RTP 타임스탬프 단위
+        self.last_transit: Optional[int] = None
+
+        self.bytes = 0
+        self.first_arrival: Optional[float] = None
+        self.last_arrival: Optional[float] = None
+
+    def _init_seq(self, seq: int):
+        self.base_seq = seq
+        self.max_seq = seq
+        self.cycles = 0
+        self.received = 0
+
+    def update(self, seq: int, timestamp: int, ssrc: int, size: int, arrival: float):
+        """
+        RTP 패킷 1개 반영
+
+        Args:
+            seq: 시퀀스 번호 (16bit)
+            timestamp: RTP 타임스탬프 (32bit)
+            ssrc: 송신자 식별자 (첫 SSRC만 집계)
+            size: 패킷 크기 (bytes, RTP 헤더 포함)
+            arrival: 수신 시각 (time.monotonic)
+        """
+        if self.ssrc is None:
+            self.ssrc = ssrc
+        elif ssrc != self.ssrc:
+            return
+
+        if self.first_arrival is None:
+            self.first_arrival = arrival
+        self.last_arrival = arrival
+        self.bytes += size
+
+        # 시퀀스 번호 (RFC 3550 A.1 간소화)
+        if self.base_seq is None:
+            self._init_seq(seq)
+        else:
+            udelta = (seq - self.max_seq) % RTP_SEQ_MOD
+            if udelta < MAX_DROPOUT:
+                if seq < self.max_seq:
+                    self.cycles += RTP_SEQ_MOD
+                self.max_seq = seq
+            elif udelta <= RTP_SEQ_MOD - MAX_MISORDER:
+                if seq != self.bad_seq:
+                    # 큰 점프 1개는 떠돌이 패킷일 수 있으므로 집계하지 않고 다음 패킷으로 확인
+                    self.bad_seq = (seq + 1) % RTP_SEQ_MOD
+                    self.discarded += 1
+                    return
+                # 점프한 번호에서 연속 2개 → 송신측 재시작으로 보고 새로 집계
+                # (확인용으로 버린 첫 패킷은 재시작 집계에 포함)
+                self.discarded -= 1
+                self.expected_prior += self._expected_current()
+                self.received_prior += self.received
+                self.restarts += 1
+                self._init_seq((seq - 1) % RTP_SEQ_MOD)
+                self.received = 1
+            else:
+                # 중복 또는 순서 뒤바뀜
+                self.reordered += 1
+        self.received += 1
+
+        # 도착 간격 지터 (RFC 3550 A.8)
+        arrival_units = int(arrival * self.clock_rate)
+        transit = (arrival_units - timestamp) & 0xFFFFFFFF
+        if self.last_transit is not None:
+            d = (transit - self.last_transit) & 0xFFFFFFFF
+            if d >= 1 << 31:
+                d -= 1 << 32
+            self.jitter += (abs(d) - self.jitter) / 16.0
+        self.last_transit = transit
+
+    def _expected_current(self) -> int:
+        if self.base_seq is None:
+            return 0
+        return self.cycles + self.max_seq - self.base_seq + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        expected = self.expected_prior + self._expected_current()
+        received = self.received_prior + self.received
+        lost = max(0, expected - received)
+        duration = (self.last_arrival - self.first_arrival) if self.first_arrival is not None else 0.0
+        return {
+            'packets': received,
+            'expected': expected,
+            'lost': lost,
+            'loss_percent': round(lost * 100.0 / expected, 2) if expected else None,
+            'reordered': self.reordered,
+            'restarts': self.restarts,
+            'discarded': self.discarded,
+            'jitter_ms': round(self.jitter * 1000.0 / self.clock_rate, 2) if received > 1 else None,
+            'bytes': self.bytes,
+            'duration': round(duration, 2),
+            'bitrate_kbps': round(self.bytes * 8 / duration / 1000, 1) if duration > 0 else None
+        }
+
+
+def parse_rtp_header(packet: bytes) -> Optional[Tuple[int, int, int]]:
+    """RTP 헤더에서 (시퀀스 번호, 타임스탬프, SSRC) 추출 (RTP v2가 아니면 None)"""
+    if len(packet) < 12 or packet[0] >> 6 != 2:
+        return None
+    seq = int.from_bytes(packet[2:4], 'big')
+    timestamp = int.from_bytes(packet[4:8], 'big')
+    ssrc = int.from_bytes(packet[8:12], 'big')
+    return seq, timestamp, ssrc
+
+
+def parse_sdp_video(sdp: str) -> Dict[str, Any]:
+    """
+    SDP에서 첫 번째 video 미디어의 control 속성과 클럭 레이트 추출
+
+    Returns:
+        {'control': str 또는 None, 'clock_rate': int, 'encoding': str 또는 None}
+    """
+    result = {'control': None, 'clock_rate': 90000, 'encoding': None}
+    in_video = False
+    for line in sdp.splitlines():
+        line = line.strip()
+        if line.startswith('m='):
+            if in_video:
+                break
+            in_video = line.startswith('m=video')
+            continue
+        if not in_video:
+            continue
+        if line.startswith('a=control:'):
+            result['control'] = line[len('a=control:'):]
+        elif line.startswith('a=rtpmap:'):
+            match = re.match(r'a=rtpmap:\d+\s+([\w\-]+)/(\d+)', line)
+            if match:
+                result['encoding'] = match.group(1)
+                result['clock_rate'] = int(match.group(2))
+    return result
+
+
+class RTSPSession:
+    """RTP 수신만을 위한 최소 RTSP 클라이언트 (Basic/Digest 인증 지원)"""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 554
+        self.username = parts.username
+        self.password = parts.password
+        # 요청 URL에는 인증 정보 제외
+        netloc = self.host if parts.port is None else f"{self.host}:{parts.port}"
+        self.url = urlunsplit((parts.scheme, netloc, parts.path, parts.query, ''))
+        self.timeout = timeout
+
+        self.sock: Optional[socket.socket] = None
+        self.buffer = bytearray()
+        self.cseq = 0
+        self.session_id: Optional[str] = None
+        self.auth_header_factory = None
+
+    def connect(self):
+        self.sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+
+    def close(self):
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+    def _recv_more(self):
+        chunk = self.sock.recv(65536)
+        if not chunk:
+            raise RTSPError("RTSP 연결 종료")
+        self.buffer += chunk
+
+    def _read_response(self) -> Tuple[int, Dict[str, str], str]:
+        """RTSP 응답 1개 읽기 (앞에 섞인 interleaved RTP 프레임은 건너뜀)"""
+        while True:
+            # interleaved 데이터 ($ + 채널 + 길이 2바이트)
+            if self.buffer[:1] == b'$':
+                while len(self.buffer) < 4:
+                    self._recv_more()
+                length = int.from_bytes(self.buffer[2:4], 'big')
+                while len(self.buffer) < 4 + length:
+                    self._recv_more()
+                del self.buffer[:4 + length]
+                continue
+
+            header_end = self.buffer.find(b'\r\n\r\n')
+            if header_end < 0:
+                self._recv_more()
+                continue
+
+            header_text = self.buffer[:header_end].decode('utf-8', errors='ignore')
+            lines = header_text.split('\r\n')
+            status_match = re.match(r'RTSP/\d\.\d\s+(\d{3})', lines[0])
+            if not status_match:
+                raise RTSPError(f"잘못된 RTSP 응답: {lines[0][:80]}")
+            headers = {}
+            for line in lines[1:]:
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    headers[key.strip().lower()] = value.strip()
+
+            length = int(headers.get('content-length', 0))
+            body_start = header_end + 4
+            while len(self.buffer) < body_start + length:
+                self._recv_more()
+            body = self.buffer[body_start:body_start + length].decode('utf-8', errors='ignore')
+            del self.buffer[:body_start + length]
+            return int(status_match.group(1)), headers, body
+
+    def _authorization(self, challenge: str):
+        """
+        WWW-Authenticate 헤더로 Authorization 헤더 생성 함수 구성
+        Digest는 qop=auth를 제시하면 nc/cnonce 포함 (RFC 2617), 없으면 RFC 2069 방식
+        """
+        username = self.username or ''
+        password = self.password or ''
+        if challenge.lower().startswith('digest'):
+            # 따옴표 값 안의 쉼표 유지 (예: qop="auth,auth-int")
+            params = {key.lower(): quoted or bare for key, quoted, bare in re.findall(r'(\w+)=(?:"([^"]*)"|([^,\s]*))', challenge)}
+            realm = params.get('realm', '')
+            nonce = params.get('nonce', '')
+            opaque = params.get('opaque')
+            qop = 'auth' if 'auth' in [value.strip() for value in params.get('qop', '').split(',')] else None
+            ha1 = hashlib.md5(f"{username}:{realm}:{password}".encode()).hexdigest()
+            counter = {'nc': 0}
+
+            def digest(method: str, uri: str) -> str:
+                ha2 = hashlib.md5(f"{method}:{uri}".encode()).hexdigest()
+                header = f'Digest username="{username}", realm="{realm}", nonce="{nonce}", uri="{uri}"'
+                if qop:
+                    # 같은 nonce로 보내는 요청마다 nc 증가, cnonce는 요청마다 새로
+                    counter['nc'] += 1
+                    nc = f"{counter['nc']:08x}"
+                    cnonce = os.urandom(8).hex()
+                    response = hashlib.md5(f"{ha1}:{nonce}:{nc}:{cnonce}:{qop}:{ha2}".encode()).hexdigest()
+                    header += f', qop={qop}, nc={nc}, cnonce="{cnonce}"'
+                else:
+                    response = hashlib.md5(f"{ha1}:{nonce}:{ha2}".encode()).hexdigest()
+                header += f', response="{response}"'
+                if opaque is not None:
+                    header += f', opaque="{opaque}"'
+                if 'algorithm' in params:
+                    header += f", algorithm={params['algorithm']}"
+                return header
+            return digest
+
+        token = base64.b64encode(f"{username}:{password}".encode()).decode()
+        return lambda method, uri: f"Basic {token}"
+
+    def request(self, method: str, uri: str,
+                headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], str]:
+        """RTSP 요청 (401이면 인증 정보로 1회 재시도)"""
+        for attempt in range(2):
+            self.cseq += 1
+            lines = [f"{method} {uri} RTSP/1.0", f"CSeq: {self.cseq}", f"User-Agent: {USER_AGENT}"]
+            if self.session_id:
+                lines.append(f"Session: {self.session_id}")
+            if self.auth_header_factory:
+                lines.append(f"Authorization: {self.auth_header_factory(method, uri)}")
+            for key, value in (headers or {}).items():
+                lines.append(f"{key}: {value}")
+            self.sock.sendall(('\r\n'.join(lines) + '\r\n\r\n').encode())
+
+            status, response_headers, body = self._read_response()
+            if status == 401 and attempt == 0 and self.username is not None:
+                challenge = response_headers.get('www-authenticate', '')
+                self.auth_header_factory = self._authorization(challenge)
+                continue
+            if status != 200:
+                raise RTSPError(f"{method} 실패 (RTSP {status})")
+            return status, response_headers, body
+        raise RTSPError(f"{method} 인증 실패")
+
+
+def _bind_udp_pair(host: str = '0.0.0.0') -> Tuple[socket.socket, socket.socket]:
+    """RTP/RTCP용 연속 UDP 포트 쌍 (RTP 짝수 포트)"""
+    for _ in range(20):
+        rtp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        rtp.bind((host, 0))
+        port = rtp.getsockname()[1]
+        if port % 2 == 0:
+            rtcp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                rtcp.bind((host, port + 1))
+                return rtp, rtcp
+            except OSError:
+                rtcp.close()
+        rtp.close()
+    raise OSError("RTP/RTCP UDP 포트 쌍 확보 실패")
+
+
+def measure_rtp(rtsp_url: str, window: float = 3.0, transport: str = "udp",
+                timeout: float = 5.0,
+                loss_warn: float = DEFAULT_LOSS_WARN,
+                jitter_warn: float = DEFAULT_JITTER_WARN) -> Dict[str, Any]:
+    """
+    RTSP 스트림의 RTP 손실/지터/비트레이트 측정 (디코딩 없음)
+
+    Args:
+        rtsp_url: RTSP URL (인증 정보 포함 가능)
+        window: 수신 구간 (초)
+        transport: "udp" (네트워크 손실 측정에 적합) 또는 "tcp" (interleaved)
+        timeout: RTSP 요청/패킷 대기 타임아웃 (초)
+        loss_warn: 손실률 경고 기준 (%)
+        jitter_warn: 지터 경고 기준 (ms)
+
+    Returns:
+        {'status': PASS/WARN/FAIL, 'transport', 'encoding', 'clock_rate',
+         'packets', 'expected', 'lost', 'loss_percent', 'jitter_ms', 'bitrate_kbps', ..., 'error'}
+    """
+    result = {'status': 'UNKNOWN', 'transport': transport, 'encoding': None,
+              'clock_rate': None, 'error': None}
+    session = RTSPSession(rtsp_url, timeout=timeout)
+    rtp_sock = rtcp_sock = None
+
+    try:
+        session.connect()
+        _, headers, body = session.request('DESCRIBE', session.url, {'Accept': 'application/sdp'})
+        video = parse_sdp_video(body)
+        result['encoding'] = video['encoding']
+        result['clock_rate'] = video['clock_rate']
+
+        base = headers.get('content-base') or headers.get('content-location') or session.url
+        control = video['control']
+        if not control or control == '*':
+            track_url = base
+        elif control.startswith('rtsp://'):
+            track_url = control
+        else:
+            track_url = base.rstrip('/') + '/' + control
+
+        if transport == "tcp":
+            transport_header = "RTP/AVP/TCP;unicast;interleaved=0-1"
+        else:
+            rtp_sock, rtcp_sock = _bind_udp_pair()
+            rtp_port = rtp_sock.getsockname()[1]
+            transport_header = f"RTP/AVP;unicast;client_port={rtp_port}-{rtp_port + 1}"
+
+        _, headers, _ = session.request('SETUP', track_url, {'Transport': transport_header})
+        session.session_id = headers.get('session', '').split(';')[0] or None
+        session.request('PLAY', base, {'Range': 'npt=0.000-'})
+
+        stats = RTPStats(video['clock_rate'])
+        deadline = time.monotonic() + window
+
+        if transport == "tcp":
+            _receive_interleaved(session, stats, deadline)
+        else:
+            _receive_udp(rtp_sock, stats, deadline)
+
+        try:
+            session.request('TEARDOWN', base)
+        except (RTSPError, OSError):
+            pass
+
+        result.update(stats.to_dict())
+
+        if result['packets'] == 0:
+            result['status'] = 'FAIL'
+            result['error'] = 'RTSP 응답은 정상이나 RTP 패킷 수신 없음 (UDP 차단/방화벽 의심)'
+        elif (result['loss_percent'] or 0) > loss_warn:
+            result['status'] = 'WARN'
+            result['error'] = f"패킷 손실 {result['loss_percent']}% (기준 {loss_warn}%)"
+        elif (result['jitter_ms'] or 0) > jitter_warn:
+            result['status'] = 'WARN'
+            result['error'] = f"지터 {result['jitter_ms']}ms (기준 {jitter_warn}ms)"
+        else:
+            result['status'] = 'PASS'
+
+    except (RTSPError, OSError) as e:
+        result['status'] = 'FAIL'
+        result['error'] = str(e) or type(e).__name__
+    finally:
+        session.close()
+        for sock in (rtp_sock, rtcp_sock):
+            if sock is not None:
+                sock.close()
+
+    return result
+
+
+def _receive_udp(rtp_sock: socket.socket, stats: RTPStats, deadline: float):
+    """UDP RTP 수신 (구간 종료까지)"""
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        rtp_sock.settimeout(remaining)
+        try:
+            packet = rtp_sock.recv(65536)
+        except socket.timeout:
+            return
+        arrival = time.monotonic()
+        header = parse_rtp_header(packet)
+        if header:
+            stats.update(header[0], header[1], header[2], len(packet), arrival)
+
+
+def _receive_interleaved(session: RTSPSession, stats: RTPStats, deadline: float):
+    """TCP interleaved RTP 수신 (채널 0만 집계)"""
+    buffer = session.buffer
+    while True:
+        # 버퍼에 완성된 프레임 처리
+        while len(buffer) >= 4 and buffer[:1] == b'$':
+            length = int.from_bytes(buffer[2:4], 'big')
+            if len(buffer) < 4 + length:
+                break
+            channel = buffer[1]
+            packet = bytes(buffer[4:4 + length])
+            del buffer[:4 + length]
+            if channel == 0:
+                header = parse_rtp_header(packet)
+                if header:
+                    stats.update(header[0], header[1], header[2], len(packet), time.monotonic())
+        # 중간에 섞인 RTSP 메시지(서버 keepalive 응답 등)는 버림
+        if buffer and buffer[:1] != b'$':
+            next_frame = buffer.find(b'$')
+            del buffer[:next_frame if next_frame >= 0 else len(buffer)]
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        session.sock.settimeout(remaining)
+        try:
+            chunk = session.sock.recv(65536)
+        except socket.timeout:
+            return
+        if not chunk:
+            return
+        buffer += chunk
@@ -0,0 +1,197 @@
+"""
+녹화 세그먼트 무결성 샘플링 모듈
+카메라별 최신 세그먼트에서 파일 전체에 고르게 분포한 K개 프레임을 디코딩하여
+디코딩 오류와 실제 영상 길이를 확인
+- 워커 수 제한 스레드 풀 (OpenCV 디코딩은 GIL을 해제하므로 스레드로 충분)
+- 실행당 전체 CPU 시간 예산 (워커 스레드 CPU 시간 합계) → 영상 파이프라인 동작 중에도 안전하게 스케줄 가능
+"""
+import cv2
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+
+# 영상 길이 기준 (check_camera_log와 동일)
+LENGTH_RANGE = (280.0, 310.0)
+
+
+class CpuBudget:
+    """
+    실행 단위 CPU 시간 예산 (이번 실행 워커 스레드의 CPU 시간 합계 기준)
+    프로세스 CPU 시간(process_time)은 웹 백엔드의 카메라 모니터/UPS 폴러/다른 점검까지 포함하므로 사용하지 않음
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.spent = 0.0
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    @contextmanager
+    def track(self):
+        """현재 스레드에서 실행하는 작업의 CPU 시간(thread_time)을 예산에 합산"""
+        self.local.mark = time.thread_time()
+        try:
+            yield
+        finally:
+            self._charge()
+            self.local.mark = None
+
+    def _charge(self):
+        """직전 합산 이후 현재 스레드가 사용한 CPU 시간 반영 (track 밖이면 무시)"""
+        mark = getattr(self.local, 'mark', None)
+        if mark is None:
+            return
+        now = time.thread_time()
+        self.local.mark = now
+        with self.lock:
+            self.spent += now - mark
+
+    def used(self) -> float:
+        self._charge()
+        with self.lock:
+            return self.spent
+
+    def exhausted(self) -> bool:
+        return self.used() >= self.seconds
+
+
+def verify_segment(path: str, sample_frames: int = 5,
+                   budget: Optional[CpuBudget] = None) -> Dict[str, Any]:
+    """
+    세그먼트 1개 무결성 샘플링
+
+    OpenCV(FFmpeg)는 위치 이동 시 직전 키프레임으로 seek 후 목표 프레임까지 디코딩하므로
+    파일 전체를 디코딩하지 않고 K개 지점만 확인
+
+    Args:
+        path: 영상 파일 경로
+        sample_frames: 샘플링할 프레임 수 (K)
+        budget: 공유 CPU 예산 (초과 시 남은 샘플 생략, 호출 스레드의 CPU 시간을 합산)
+
+    Returns:
+        {'path', 'status', 'duration', 'fps', 'frame_count', 'sampled', 'decode_errors', 'error'}
+    """
+    result = {
+        'path': path,
+        'status': 'UNKNOWN',
+        'duration': None,
+        'fps': None,
+        'frame_count': None,
+        'sampled': 0,
+        'decode_errors': 0,
+        'error': None
+    }
+
+    if budget is not None:
+        with budget.track():
+            return _sample_segment(path, sample_frames, budget, result)
+    return _sample_segment(path, sample_frames, None, result)
+
+
+def _sample_segment(path: str, sample_frames: int, budget: Optional[CpuBudget],
+                    result: Dict[str, Any]) -> Dict[str, Any]:
+    """verify_segment 본문 (result를 채워 반환)"""
+    cap = None
+    try:
+        cap = cv2.VideoCapture(path)
+        if not cap.isOpened():
+            result['status'] = 'FAIL'
+            result['error'] = '영상 파일 열기 실패'
+            return result
+
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        result['frame_count'] = frame_count
+        result['fps'] = round(fps, 2) if fps else None
+        if frame_count > 0 and fps > 0:
+            result['duration'] = round(frame_count / fps, 1)
+
+        if frame_count <= 0:
+            result['status'] = 'FAIL'
+            result['error'] = '프레임 정보 없음 (헤더 손상 또는 기록 중)'
+            return result
+
+        # 파일 전체에 고르게 분포한 위치 (처음/끝 포함)
+        count = max(1, min(sample_frames, frame_count))
+        if count == 1:
+            positions = [0]
+        else:
+            positions = [round(i * (frame_count - 1) / (count - 1)) for i in range(count)]
+
+        last_ok_msec = None
+        for pos in positions:
+            if budget is not None and budget.exhausted():
+                result['error'] = 'CPU 예산 초과로 샘플링 중단'
+                break
+            cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
+            ret, frame = cap.read()
+            result['sampled'] += 1
+            if not ret or frame is None:
+                result['decode_errors'] += 1
+            else:
+                last_ok_msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+
+        # 마지막 프레임까지 디코딩되면 타임스탬프 기준 실제 길이로 보정
+        if last_ok_msec and positions[-1] == frame_count - 1 and result['decode_errors'] == 0:
+            result['duration'] = round(last_ok_msec / 1000, 1)
+
+        if result['sampled'] and result['decode_errors'] == result['sampled']:
+            result['status'] = 'FAIL'
+            result['error'] = result['error'] or '샘플 프레임 디코딩 전부 실패'
+        elif result['decode_errors'] > 0:
+            result['status'] = 'WARN'
+        elif result['duration'] is not None and not LENGTH_RANGE[0] <= result['duration'] <= LENGTH_RANGE[1]:
+            result['status'] = 'WARN'
+            result['error'] = f"영상 길이 범위 벗어남 ({result['duration']}초)"
+        else:
+            result['status'] = 'PASS'
+
+    except Exception as e:
+        result['status'] = 'FAIL'
+        result['error'] = str(e)
+    finally:
+        if cap is not None:
+            cap.release()
+
+    return result
+
+
+def verify_segments(paths: Dict[int, str], sample_frames: int = 5,
+                    max_workers: int = 2, cpu_budget: float = 10.0) -> Dict[str, Any]:
+    """
+    카메라별 최신 세그먼트 무결성 샘플링 (워커 풀 + CPU 예산)
+
+    Args:
+        paths: {카메라 번호: 세그먼트 경로}
+        sample_frames: 세그먼트당 샘플 프레임 수
+        max_workers: 동시 디코딩 워커 수
+        cpu_budget: 실행당 전체 CPU 시간 예산 (초, 워커 스레드 CPU 시간 합계)
+
+    Returns:
+        {'segments': {카메라: 결과}, 'cpu_seconds', 'wall_seconds', 'skipped': [카메라]}
+    """
+    budget = CpuBudget(cpu_budget)
+    wall_start = time.monotonic()
+    lock = threading.Lock()
+    skipped = []
+
+    def task(camera_num: int, path: str) -> Dict[str, Any]:
+        if budget.exhausted():
+            with lock:
+                skipped.append(camera_num)
+            return {'path': path, 'status': 'SKIP', 'error': 'CPU 예산 초과로 생략'}
+        return verify_segment(path, sample_frames, budget)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="segment-verify") as pool:
+        futures = {camera_num: pool.submit(task, camera_num, path)
+                   for camera_num, path in sorted(paths.items())}
+        segments = {camera_num: future.result() for camera_num, future in futures.items()}
+
+    return {
+        'segments': segments,
+        'cpu_seconds': round(budget.used(), 2),
+        'wall_seconds': round(time.monotonic() - wall_start, 2),
+        'skipped': sorted(skipped)
+    }
@@ -0,0 +1,243 @@
+"""
+NAS 디스크 SMART 상태 수집 모듈
+RAID 멤버가 빠지기 전에 디스크 열화를 감지
+- mdstat 파싱에서 찾은 sataN 디스크마다 smartctl -H -A 실행 (기존 SSH 세션의 배치 실행으로 왕복 1회)
+- 재할당/보류 섹터, CRC 오류, 온도, 사용 시간 수집
+- 이력은 JSON 파일에 변경된 값만 저장 (디스크별 마지막 값 + 변경 기록)
+- 오류 카운터는 절대값뿐 아니라 증가 속도(일당 증가량)로 판정
+"""
+import os
+import re
+import json
+import time
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SMART 속성 ID → 키 (온도는 194 우선, 없으면 190)
+SMART_ATTRIBUTES = {
+    5: 'reallocated_sectors',
+    197: 'pending_sectors',
+    199: 'crc_errors',
+    9: 'power_on_hours',
+    194: 'temperature',
+    190: 'temperature',
+}
+
+# 증가 속도로 판정하는 오류 카운터
+ERROR_COUNTERS = ('reallocated_sectors', 'pending_sectors', 'crc_errors')
+
+DAY = 86400
+
+_attribute_re = re.compile(
+    r'^\s*(\d+)\s+(\S+)\s+0x[0-9a-fA-F]+\s+\d+\s+\d+\s+\S+\s+\S+\s+\S+\s+\S+\s+(.+?)\s*$'
+)
+_health_re = re.compile(r'self-assessment test result:\s*(\S+)')
+
+
+def smart_commands(disks: List[str]) -> Dict[str, Tuple[str, int]]:
+    """
+    디스크별 smartctl 명령 (exec_batch 형식)
+    관리자 계정에서 직접 실행이 안 되면 sudo -n(비밀번호 없이)으로 재시도
+    """
+    commands = {}
+    for disk in disks:
+        command = f"smartctl -H -A -d sat /dev/{disk}"
+        commands[f"smart_{disk}"] = (f"{command} 2>/dev/null || sudo -n {command}", 20)
+    return commands
+
+
+def parse_smartctl(text: str) -> Dict[str, Any]:
+    """
+    smartctl -H -A 출력 파싱
+
+    Returns:
+        {'health': 'PASSED'/'FAILED'/None, 'reallocated_sectors', 'pending_sectors', 'crc_errors',
+         'temperature', 'power_on_hours'} (없는 속성은 제외)
+    """
+    values: Dict[str, Any] = {}
+    temperatures = {}
+
+    health = _health_re.search(text)
+    values['health'] = health.group(1).rstrip('!') if health else None
+
+    for line in text.splitlines():
+        match = _attribute_re.match(line)
+        if not match:
+            continue
+        attr_id = int(match.group(1))
+        key = SMART_ATTRIBUTES.get(attr_id)
+        if key is None:
+            continue
+        # RAW_VALUE 첫 정수 (예: "36 (Min/Max 20/45)", "12345h+23m+10.123s")
+        raw = re.match(r'(\d+)', match.group(3))
+        if raw is None:
+            continue
+        if key == 'temperature':
+            temperatures[attr_id] = int(raw.group(1))
+        else:
+            values[key] = int(raw.group(1))
+
+    if temperatures:
+        values['temperature'] = temperatures.get(194, temperatures.get(190))
+    return values
+
+
+class SmartHistory:
+    """
+    디스크별 SMART 이력 (변경된 값만 저장, 파일 공유)
+
+    형식: {'hosts': {호스트: {디스크: {'values': 마지막 값, 'updated': 시각,
+                                      'changes': [[시각, {변경된 키: 값}], ...]}}}}
+    """
+
+    def __init__(self, path: Optional[str] = None, retention_days: float = 90.0):
+        self.path = path
+        self.retention = retention_days * DAY
+        self.lock = threading.Lock()
+        self.hosts: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.hosts = json.load(f).get('hosts', {})
+        except Exception as e:
+            logger.warning(f"SMART 이력 로드 실패 (초기화): {e}")
+            self.hosts = {}
+
+    def _save(self):
+        """이력 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'hosts': self.hosts}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"SMART 이력 저장 실패: {e}")
+
+    def _prune(self, entry: Dict[str, Any], now: float):
+        """보관 기간이 지난 변경 기록은 경계 시점의 기준값 1개로 합침"""
+        cutoff = now - self.retention
+        changes = entry['changes']
+        old = [change for change in changes if change[0] < cutoff]
+        if len(old) < 2:
+            return
+        baseline: Dict[str, Any] = {}
+        for _, values in old:
+            baseline.update(values)
+        entry['changes'] = [[old[-1][0], baseline]] + changes[len(old):]
+
+    def record(self, host: str, disk: str, values: Dict[str, Any],
+               now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        이번 수집값 기록 (마지막 값과 다른 키만 저장)
+
+        Returns:
+            변경된 값 {키: 값} (첫 수집이면 전체)
+        """
+        now = now if now is not None else time.time()
+        values = {key: value for key, value in values.items() if value is not None}
+        with self.lock:
+            entry = self.hosts.setdefault(host, {}).setdefault(
+                disk, {'values': {}, 'updated': None, 'changes': []}
+            )
+            changed = {key: value for key, value in values.items() if entry['values'].get(key) != value}
+            if changed:
+                entry['changes'].append([now, changed])
+                entry['values'].update(changed)
+                self._prune(entry, now)
+            entry['updated'] = now
+            self._save()
+        return changed
+
+    def value_at(self, host: str, disk: str, key: str, at: float) -> Optional[Tuple[float, Any]]:
+        """
+        특정 시각 기준 값 (그 시각 이전 마지막 변경값, 없으면 가장 오래된 기록)
+
+        Returns:
+            (기록 시각, 값) 또는 None
+        """
+        with self.lock:
+            changes = self.hosts.get(host, {}).get(disk, {}).get('changes', [])
+            found = None
+            for ts, values in changes:
+                if key not in values:
+                    continue
+                if ts <= at or found is None:
+                    found = (ts, values[key])
+                if ts > at:
+                    break
+            return found
+
+    def growth_rate(self, host: str, disk: str, key: str, current: Any, now: float,
+                    window_days: float) -> Optional[Dict[str, Any]]:
+        """
+        카운터 증가 속도 (window_days 동안의 일당 증가량)
+        기록 기간이 1일 미만이면 1일로 보고 계산 (짧은 간격 과대 추정 방지)
+
+        Returns:
+            {'delta', 'days', 'per_day'} 또는 None (비교 기록 없음)
+        """
+        window_start = now - window_days * DAY
+        reference = self.value_at(host, disk, key, window_start)
+        if reference is None or current is None:
+            return None
+        ref_ts, ref_value = reference
+        delta = current - ref_value
+        # 기간 시작 전에 기록된 값은 기간 시작 시점까지 그대로였으므로 기간 시작부터 계산
+        days = max((now - max(ref_ts, window_start)) / DAY, 1.0)
+        return {'delta': delta, 'days': round(days, 2), 'per_day': round(delta / days, 2)}
+
+
+def evaluate_disk(values: Dict[str, Any], rates: Dict[str, Optional[Dict[str, Any]]],
+                  rate_warn: float = 1.0, temp_warn: int = 55) -> Dict[str, Any]:
+    """
+    디스크 1개 판정
+
+    - FAIL: SMART 자가 진단 FAILED
+    - WARN: 오류 카운터 일당 증가량 >= rate_warn, 보류 섹터 > 0, 온도 >= temp_warn
+
+    Returns:
+        {'status', 'issues': [메시지]}
+    """
+    issues = []
+    status = 'PASS'
+
+    if values.get('health') == 'FAILED':
+        status = 'FAIL'
+        issues.append("SMART 자가 진단 실패 (FAILED)")
+
+    labels = {'reallocated_sectors': '재할당 섹터', 'pending_sectors': '보류 섹터', 'crc_errors': 'CRC 오류'}
+    for key in ERROR_COUNTERS:
+        rate = rates.get(key)
+        if rate and rate['delta'] > 0 and rate['per_day'] >= rate_warn:
+            issues.append(f"{labels[key]} 증가 중 (+{rate['delta']}, {rate['per_day']}/일, 현재 {values.get(key)})")
+
+    if values.get('pending_sectors') and not any(issue.startswith('보류 섹터') for issue in issues):
+        issues.append(f"보류 섹터 {values['pending_sectors']}개")
+
+    temperature = values.get('temperature')
+    if temperature is not None and temperature >= temp_warn:
+        issues.append(f"온도 {temperature}°C (기준 {temp_warn}°C)")
+
+    if issues and status == 'PASS':
+        status = 'WARN'
+    return {'status': status, 'issues': issues}
+
+
+def history_from_config(config: Dict[str, str]) -> Optional[SmartHistory]:
+    """
+    점검 설정에서 SMART 이력 생성 (비활성화면 None)
+
+    설정 키: smart, smart_history_path
+    """
+    if str(config.get('smart', 'false')).lower() != 'true':
+        return None
+    return SmartHistory(config.get('smart_history_path') or None)
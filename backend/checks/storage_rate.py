@@ -0,0 +1,144 @@
+"""
+카메라별 저장 속도(write-rate) 분석 모듈
+- 녹화 인덱스(RecordingIndex)에 기록된 세그먼트 크기(st_size) 재사용 → 영상 폴더 재스캔 없음
+- 카메라 로그의 '파일 크기' 값과 교차 확인
+- 최근 1시간/1일 MB/min, 비트레이트 급감(검은 화면 등)/급증 감지, NAS 소비 속도 예측
+"""
+import statistics
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+from .camera_log_stats import iter_save_events
+
+MB = 1024 * 1024
+
+# 판정 기준 (최근 1시간 세그먼트 중앙값 / 1일 중앙값)
+COLLAPSE_RATIO = 0.3
+SPIKE_RATIO = 3.0
+MIN_SEGMENTS = 3
+
+
+def log_write_rates(log_file: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    카메라 로그의 '파일 크기' 기록으로 최근 1시간/1일 저장량 계산 (한 번만 스트리밍)
+
+    Returns:
+        {'hour_mb', 'day_mb', 'hour_mb_per_min', 'day_mb_per_min', 'events'}
+    """
+    now = now or datetime.now()
+    hour_ago = now - timedelta(hours=1)
+    day_ago = now - timedelta(days=1)
+
+    hour_mb = 0.0
+    day_mb = 0.0
+    events = 0
+    for event in iter_save_events(log_file):
+        if event['file_size'] is None or event['log_time'] < day_ago:
+            continue
+        events += 1
+        day_mb += event['file_size']
+        if event['log_time'] >= hour_ago:
+            hour_mb += event['file_size']
+
+    return {
+        'hour_mb': round(hour_mb, 1),
+        'day_mb': round(day_mb, 1),
+        'hour_mb_per_min': round(hour_mb / 60, 2),
+        'day_mb_per_min': round(day_mb / 1440, 2),
+        'events': events
+    }
+
+
+def camera_write_rate(segments: List[tuple], now: datetime,
+                      segment_seconds: int = 300) -> Dict[str, Any]:
+    """
+    카메라 1대 저장 속도 계산
+
+    Args:
+        segments: 최근 1일 세그먼트 [(시작 시각 epoch, 파일 크기 bytes)] (시간순)
+        now: 기준 시각
+        segment_seconds: 세그먼트 길이 (초)
+
+    Returns:
+        MB/min (1시간/1일), 세그먼트 크기 중앙값, 비트레이트 상태 (NORMAL/COLLAPSED/SPIKE/UNKNOWN)
+    """
+    now_ts = now.timestamp()
+    hour_ago = now_ts - 3600
+
+    # 기록 중인 세그먼트는 크기가 확정되지 않았으므로 제외
+    completed = [(start, size) for start, size in segments if start + segment_seconds <= now_ts]
+    hour_sizes = [size for start, size in completed if start >= hour_ago]
+    day_sizes = [size for _, size in completed]
+
+    result = {
+        'hour_segments': len(hour_sizes),
+        'day_segments': len(day_sizes),
+        'hour_mb_per_min': round(sum(hour_sizes) / MB / 60, 2),
+        'day_mb_per_min': round(sum(day_sizes) / MB / 1440, 2),
+        'hour_median_mb': round(statistics.median(hour_sizes) / MB, 1) if hour_sizes else None,
+        'day_median_mb': round(statistics.median(day_sizes) / MB, 1) if day_sizes else None,
+        'bitrate_ratio': None,
+        'status': 'UNKNOWN'
+    }
+
+    if len(hour_sizes) < MIN_SEGMENTS or len(day_sizes) < MIN_SEGMENTS or not result['day_median_mb']:
+        return result
+
+    ratio = statistics.median(hour_sizes) / statistics.median(day_sizes)
+    result['bitrate_ratio'] = round(ratio, 2)
+    if ratio < COLLAPSE_RATIO:
+        result['status'] = 'COLLAPSED'
+    elif ratio > SPIKE_RATIO:
+        result['status'] = 'SPIKE'
+    else:
+        result['status'] = 'NORMAL'
+    return result
+
+
+def analyze_write_rates(index, now: Optional[datetime] = None,
+                        log_rates: Optional[Dict[int, Dict[str, Any]]] = None,
+                        free_bytes: Optional[int] = None) -> Dict[str, Any]:
+    """
+    전체 카메라 저장 속도 분석
+
+    Args:
+        index: RecordingIndex (update() 완료 상태)
+        now: 기준 시각
+        log_rates: {카메라 번호: log_write_rates 결과} (선택, 교차 확인용)
+        free_bytes: NAS 남은 용량 (선택, 가득 찰 때까지 남은 일수 예측)
+
+    Returns:
+        {'cameras': {번호: 속도 정보}, 'total_mb_per_min', 'projected_gb_per_day',
+         'days_to_full', 'warnings'}
+    """
+    now = now or datetime.now()
+    day_ago = now - timedelta(days=1)
+
+    cameras = {}
+    warnings = []
+    total_mb_per_min = 0.0
+
+    for camera_num in index.cameras():
+        rate = camera_write_rate(index.segments(camera_num, day_ago, now), now, index.segment_seconds)
+        if log_rates and camera_num in log_rates:
+            rate['log'] = log_rates[camera_num]
+        cameras[camera_num] = rate
+        total_mb_per_min += rate['day_mb_per_min']
+
+        if rate['status'] == 'COLLAPSED':
+            warnings.append(f"카메라 {camera_num}: 비트레이트 급감 (1일 대비 {rate['bitrate_ratio']}배, 화면 가림/검은 화면 의심)")
+        elif rate['status'] == 'SPIKE':
+            warnings.append(f"카메라 {camera_num}: 비트레이트 급증 (1일 대비 {rate['bitrate_ratio']}배)")
+
+    projected_gb_per_day = total_mb_per_min * 1440 / 1024
+    days_to_full = None
+    if free_bytes is not None and projected_gb_per_day > 0:
+        days_to_full = round(free_bytes / (1024 ** 3) / projected_gb_per_day, 1)
+
+    return {
+        'cameras': cameras,
+        'total_mb_per_min': round(total_mb_per_min, 2),
+        'projected_gb_per_day': round(projected_gb_per_day, 1),
+        'days_to_full': days_to_full,
+        'warnings': warnings
+    }
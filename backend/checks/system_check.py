@@ -6,7 +6,7 @@ OS, 서비스, Java, Network 등 종합적인 시스템 상태 확인
 import os
 import subprocess
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 def run_command(cmd: str) -> Dict[str, Any]:
@@ -248,35 +248,58 @@ def check_network() -> Dict[str, Any]:
     return results
 
 
-def check_disk_space() -> Dict[str, Any]:
-    """디스크 공간 확인"""
+def check_disk_space(usage_history=None, warn_days: float = 30, fail_days: float = 7) -> Dict[str, Any]:
+    """
+    디스크 공간 확인 (df -P -B1 바이트 단위, 이력이 있으면 가득 참 예측 포함)
+    
+    Args:
+        usage_history: UsageHistory (None이면 80/90% 기준만 적용)
+        warn_days: 이 일수 이내 가득 참 예상 시 WARN
+        fail_days: 이 일수 이내 가득 참 예상 시 FAIL
+    """
+    from .disk_forecast import df_command, parse_df_bytes, format_bytes, forecast_usage, evaluate_usage
+    
+    entries: Dict[str, Dict[str, Any]] = {}  # 마운트 지점 → 항목 (같은 파일시스템은 이력에 1번만 기록)
+    
+    def usage_entry(path: str) -> Optional[Dict[str, Any]]:
+        df_result = run_command(df_command(path))
+        mounts = parse_df_bytes(df_result['stdout']) if df_result['success'] else []
+        if not mounts:
+            return None
+        mount = mounts[-1]
+        if mount['mount'] in entries:
+            return dict(entries[mount['mount']])
+        forecast = None
+        if usage_history is not None:
+            points = usage_history.record(f"local:{mount['mount']}", mount['used'], mount['used'] + mount['avail'])
+            forecast = forecast_usage(points)
+        days_to_full = forecast['days_to_full'] if forecast else None
+        entries[mount['mount']] = {
+            'status': evaluate_usage(mount['percent'], days_to_full, warn_days, fail_days),
+            'size': format_bytes(mount['size']),
+            'used': format_bytes(mount['used']),
+            'avail': format_bytes(mount['avail']),
+            'usage': f"{mount['percent']:.0f}%",
+            'mount': mount['mount'],
+            'bytes': {key: mount[key] for key in ('size', 'used', 'avail')},
+            'percent': mount['percent'],
+            'forecast': forecast
+        }
+        return dict(entries[mount['mount']])
+    
     results = {}
     
     # 루트 파티션
-    df_result = run_command("df -h / | tail -1")
-    if df_result['success']:
-        parts = df_result['stdout'].split()
-        if len(parts) >= 5:
-            usage_pct = int(parts[4].replace('%', ''))
-            results['root'] = {
-                'status': 'PASS' if usage_pct < 80 else 'WARN' if usage_pct < 90 else 'FAIL',
-                'size': parts[1],
-                'used': parts[2],
-                'avail': parts[3],
-                'usage': parts[4]
-            }
-    
-    # PostgreSQL 데이터 디렉토리
-    pg_result = run_command("df -h /var/lib/postgresql 2>/dev/null | tail -1")
-    if pg_result['success']:
-        parts = pg_result['stdout'].split()
-        if len(parts) >= 5:
-            usage_pct = int(parts[4].replace('%', ''))
-            results['postgresql'] = {
-                'status': 'PASS' if usage_pct < 80 else 'WARN',
-                'usage': parts[4],
-                'avail': parts[3]
-            }
+    root = usage_entry('/')
+    if root:
+        results['root'] = root
+    
+    # PostgreSQL 데이터 디렉토리 (루트와 같은 파일시스템이면 루트 항목 재사용, 이력 중복 기록 없음)
+    if os.path.isdir('/var/lib/postgresql'):
+        pg = usage_entry('/var/lib/postgresql')
+        if pg and pg['status'] == 'FAIL':
+            pg['status'] = 'WARN'  # 기존과 같이 데이터 디렉토리는 경고까지만
+        results['postgresql'] = pg if pg else {'status': 'SKIP', 'value': 'Not accessible'}
     else:
         results['postgresql'] = {'status': 'SKIP', 'value': 'Not mounted separately'}
     
@@ -393,21 +416,19 @@ def check_postgresql_details() -> Dict[str, Any]:
         results['postgis'] = {'status': 'SKIP', 'value': 'Not found'}
     
     # 3. 데이터 디렉토리 용량 확인
-    df_result = run_command("df -h /var/lib/postgresql 2>/dev/null | tail -1")
+    from .disk_forecast import df_command, parse_df_bytes, format_bytes
+    df_result = run_command(df_command('/var/lib/postgresql'))
     if df_result['success']:
-        parts = df_result['stdout'].split()
-        if len(parts) >= 5:
-            try:
-                usage_pct = int(parts[4].replace('%', ''))
-                results['disk_usage'] = {
-                    'status': 'PASS' if usage_pct < 80 else 'WARN',
-                    'usage': parts[4],
-                    'avail': parts[3]
-                }
-            except (ValueError, IndexError):
-                results['disk_usage'] = {'status': 'SKIP', 'value': 'Parse error'}
+        mounts = parse_df_bytes(df_result['stdout'])
+        if mounts:
+            mount = mounts[-1]
+            results['disk_usage'] = {
+                'status': 'PASS' if mount['percent'] < 80 else 'WARN',
+                'usage': f"{mount['percent']:.0f}%",
+                'avail': format_bytes(mount['avail'])
+            }
         else:
-            results['disk_usage'] = {'status': 'SKIP', 'value': 'Not mounted'}
+            results['disk_usage'] = {'status': 'SKIP', 'value': 'Parse error'}
     else:
         results['disk_usage'] = {'status': 'SKIP', 'value': 'Not accessible'}
     
@@ -623,8 +644,14 @@ def check_setup_scripts() -> Dict[str, Any]:
     return results
 
 
-def check_system_status() -> Dict[str, Any]:
-    """전체 시스템 종합 점검"""
+def check_system_status(system_config: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    전체 시스템 종합 점검
+    
+    Args:
+        system_config: 디스크 사용량 예측 설정 (disk_history_path, disk_forecast_warn_days, disk_forecast_fail_days)
+                       + NAS 마운트 벤치마크 설정 (mount_bench.bench_from_config 참고)
+    """
     from utils.ui import (
         print_section, print_pass, print_fail, print_warning,
         print_info, print_key_value, print_table
@@ -736,7 +763,13 @@ def check_system_status() -> Dict[str, Any]:
     # 6. 디스크 공간
     print("")
     print_info("디스크 공간 확인 중...")
-    disk = check_disk_space()
+    from .disk_forecast import history_from_config, format_bytes
+    system_config = system_config or {}
+    disk = check_disk_space(
+        history_from_config(system_config),
+        warn_days=float(system_config.get('disk_forecast_warn_days', 30)),
+        fail_days=float(system_config.get('disk_forecast_fail_days', 7))
+    )
     result['disk'] = disk
     
     if 'root' in disk:
@@ -744,13 +777,19 @@ def check_system_status() -> Dict[str, Any]:
         status = root_info.get('status', 'UNKNOWN')
         usage = root_info.get('usage', 'N/A')
         avail = root_info.get('avail', 'N/A')
+        message = f"루트 파티션: {usage} 사용 (여유: {avail})"
+        forecast = root_info.get('forecast') or {}
+        if forecast.get('bytes_per_day') is not None:
+            message += f", {format_bytes(forecast['bytes_per_day'])}/일 증가"
+            if forecast.get('days_to_full') is not None:
+                message += f", 약 {forecast['days_to_full']:.0f}일 후 가득 참"
         
         if status == 'PASS':
-            print_pass(f"루트 파티션: {usage} 사용 (여유: {avail})")
+            print_pass(message)
         elif status == 'WARN':
-            print_warning(f"루트 파티션: {usage} 사용 (여유: {avail})")
+            print_warning(message)
         else:
-            print_fail(f"루트 파티션: {usage} 사용 (여유: {avail})")
+            print_fail(message)
     
     # 7. Cron 작업
     print("")
@@ -842,6 +881,29 @@ def check_system_status() -> Dict[str, Any]:
         else:
             print_info(f"{display_key}: {value}")
     
+    # 11. NAS 마운트 성능 (선택)
+    mount_bench = {}
+    from .mount_bench import bench_from_config, run_mount_benchmark
+    bench_options = bench_from_config(system_config)
+    if bench_options is not None:
+        print("")
+        print_info(f"NAS 마운트 성능 측정 중 ({bench_options['path']}, {bench_options['budget_mb']}MB)...")
+        bench = run_mount_benchmark(**bench_options)
+        mount_bench['nas_mount'] = bench
+        
+        message = f"NAS 마운트 {bench['path']}: {bench['value']}"
+        if bench['status'] == 'PASS':
+            print_pass(message)
+        elif bench['status'] == 'WARN':
+            print_warning(message)
+            for regression in bench.get('regressions', []):
+                print_warning(f"  - 성능 저하: {regression}")
+        elif bench['status'] == 'SKIP':
+            print_info(message)
+        else:
+            print_fail(message)
+    result['mount_bench'] = mount_bench
+    
     # 전체 판정 및 통계
     print("")
     
@@ -859,6 +921,7 @@ def check_system_status() -> Dict[str, Any]:
         ('Tomcat', tomcat_details),
         ('PostgreSQL', pg_details),
         ('설정 스크립트', setup_scripts), # 추가된 카테고리
+        ('NAS 마운트', mount_bench),
     ]
     for category_name, category in named_categories:
         for key, item in category.items():
@@ -1,10 +1,14 @@
 """
 UPS/NUT 점검 모듈
 NUT 서비스 상태, 포트 리스닝, UPS 데이터, 설정 파일, NAS 연결 확인
+UPS 데이터는 upsc 대신 upsd(TCP 3493)에 직접 질의 (연결 재사용, 여러 UPS/원격 upsd 지원)
 """
 import os
 import subprocess
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+from .nut_client import NUTError, shared_client, parse_ups_targets, target_name, DEFAULT_PORT
+from .ups_telemetry import ups_telemetry
 
 
 def run_command(cmd: list) -> Dict[str, Any]:
@@ -100,23 +104,38 @@ def check_port_listening() -> Dict[str, Any]:
         }
 
 
-def check_ups_data(ups_name: str = 'ups') -> Dict[str, Any]:
-    """upsc로 UPS 데이터 확인"""
-    result = run_command(['upsc', f'{ups_name}@localhost'])
-    
-    if not result['success']:
-        return {
-            'success': False,
-            'error': result['stderr'] or result['stdout'] or 'Failed to get UPS data',
-            'data': {}
-        }
-    
-    # upsc 출력 파싱
-    data = {}
-    for line in result['stdout'].split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            data[key.strip()] = value.strip()
+def check_ups_data(ups_name: str = 'ups', host: str = 'localhost', port: int = DEFAULT_PORT,
+                   timeout: float = 5.0, username: Optional[str] = None,
+                   password: Optional[str] = None) -> Dict[str, Any]:
+    """
+    UPS 데이터 확인
+    웹 백엔드 UPS 폴러의 최근 샘플이 있으면 그 값을 사용하고,
+    없으면 upsd에 직접 질의 (LIST VAR 1회로 전체 변수 조회, 연결 재사용)
+    """
+    name = target_name(ups_name, host, port)
+    sample = ups_telemetry.latest(name)
+    if sample is not None:
+        data = sample['vars']
+        source = {'source': name, 'sampled': 'poller', 'sample_age': sample['age']}
+    else:
+        source = {'source': name, 'sampled': 'upsd'}
+        client = shared_client(host, port, timeout, username, password)
+        try:
+            data = client.list_vars(ups_name)
+        except NUTError as e:
+            error = str(e)
+            if e.code == 'UNKNOWN-UPS':
+                # 이름이 틀린 경우 등록된 UPS 목록 안내
+                try:
+                    error += f" (등록된 UPS: {', '.join(client.list_ups()) or '없음'})"
+                except NUTError:
+                    pass
+            return {
+                'success': False,
+                'error': error,
+                **source,
+                'data': {}
+            }
     
     # 주요 필드 추출
     important_fields = {
@@ -130,11 +149,27 @@ def check_ups_data(ups_name: str = 'ups') -> Dict[str, Any]:
     
     return {
         'success': True,
+        **source,
         'data': important_fields,
         'raw_count': len(data)
     }
 
 
+def ups_targets_from_config(ups_name: str, nut_config: Optional[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    점검할 UPS 목록 (nut_config['targets']가 비어 있으면 ups_name 1대)
+    
+    설정 키: host, port, targets ("ups@host[:port]" 쉼표 구분)
+    """
+    nut_config = nut_config or {}
+    host = nut_config.get('host') or 'localhost'
+    try:
+        port = int(nut_config.get('port') or DEFAULT_PORT)
+    except ValueError:
+        port = DEFAULT_PORT
+    return parse_ups_targets(nut_config.get('targets') or ups_name, host, port)
+
+
 def check_config_files() -> Dict[str, bool]:
     """NUT 설정 파일 존재 여부 확인"""
     config_files = [
@@ -152,8 +187,16 @@ def check_config_files() -> Dict[str, bool]:
     return results
 
 
-def check_ups_status(ups_name: str = 'ups', nas_ip: str = None) -> Dict[str, Any]:
-    """전체 UPS 점검 실행"""
+def check_ups_status(ups_name: str = 'ups', nas_ip: str = None,
+                     nut_config: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    전체 UPS 점검 실행
+    
+    Args:
+        ups_name: UPS 이름 ("ups" 또는 upsc 형식 "ups@host[:port]")
+        nas_ip: NAS IP (NAS 점검 항목에서 확인하므로 미사용)
+        nut_config: upsd 접속 설정 (host, port, timeout, username, password, targets)
+    """
     from utils.ui import (
         print_section, print_pass, print_fail, print_info,
         print_warning, print_key_value, print_table
@@ -194,37 +237,58 @@ def check_ups_status(ups_name: str = 'ups', nas_ip: str = None) -> Dict[str, Any
         print_fail("NUT 서버가 3493 포트에서 리스닝하지 않음")
         print(f"  {port['details']}")
     
-    # 3. UPS 데이터 확인
-    print("")
-    print_info("UPS 데이터 조회 중...")
-    ups_data = check_ups_data(ups_name)
-    result['ups_data'] = ups_data
-    
-    if ups_data['success']:
-        print_pass(f"UPS 데이터 조회 성공 (총 {ups_data['raw_count']}개 필드)")
+    # 3. UPS 데이터 확인 (upsd 직접 질의)
+    nut_config = nut_config or {}
+    targets = ups_targets_from_config(ups_name, nut_config)
+    units = []
+    for target in targets:
         print("")
-        print("  주요 UPS 정보:")
-        
-        # 테이블 형식으로 출력
-        headers = ["항목", "값"]
-        rows = [[k, v] for k, v in ups_data['data'].items()]
-        print_table(headers, rows)
+        print_info(f"UPS 데이터 조회 중... ({target['name']})")
+        if target.get('error'):
+            # 설정 형식 오류는 해당 대상만 실패
+            ups_data = {'success': False, 'error': target['error'], 'source': target['name'], 'data': {}}
+        else:
+            ups_data = check_ups_data(
+                target['ups'], target['host'], target['port'],
+                timeout=float(nut_config.get('timeout') or 5),
+                username=nut_config.get('username') or None,
+                password=nut_config.get('password') or None
+            )
+        units.append(ups_data)
         
-        # ups.status 기반 판정
-        ups_status = ups_data['data'].get('ups.status', 'N/A')
-        if 'OL' in ups_status:
-            print("")
-            print_pass(f"UPS 상태: {ups_status} (정상)")
-        elif 'OB' in ups_status:
+        if ups_data['success']:
+            print_pass(f"UPS 데이터 조회 성공 (총 {ups_data['raw_count']}개 필드)")
+            if ups_data['sampled'] == 'poller':
+                print_info(f"UPS 폴러 최근 샘플 사용 ({ups_data['sample_age']}초 전 수집)")
             print("")
-            print_warning(f"UPS 상태: {ups_status} (배터리 모드)")
+            print("  주요 UPS 정보:")
+            
+            # 테이블 형식으로 출력
+            headers = ["항목", "값"]
+            rows = [[k, v] for k, v in ups_data['data'].items()]
+            print_table(headers, rows)
+            
+            # ups.status 기반 판정
+            ups_status = ups_data['data'].get('ups.status', 'N/A')
+            if 'OL' in ups_status:
+                print("")
+                print_pass(f"UPS 상태: {ups_status} (정상)")
+            elif 'OB' in ups_status:
+                print("")
+                print_warning(f"UPS 상태: {ups_status} (배터리 모드)")
+            else:
+                print("")
+                print_warning(f"UPS 상태: {ups_status}")
         else:
-            print("")
-            print_warning(f"UPS 상태: {ups_status}")
-    else:
-        print_fail("UPS 데이터 조회 실패")
-        print(f"  오류: {ups_data.get('error', 'Unknown error')}")
-        result['error'] = ups_data.get('error', 'Unknown error')
+            print_fail("UPS 데이터 조회 실패")
+            print(f"  오류: {ups_data.get('error', 'Unknown error')}")
+            error = ups_data.get('error', 'Unknown error')
+            result['error'] = f"{target['name']}: {error}" if len(targets) > 1 else error
+    
+    # 첫 UPS는 기존 필드로 (대시보드/리포트 호환), 여러 대면 전체 목록 추가
+    result['ups_data'] = units[0] if units else {'success': False, 'error': 'UPS 대상 없음', 'data': {}}
+    if len(units) > 1:
+        result['ups_units'] = units
     
     # 4. 설정 파일 확인
     print("")
@@ -247,7 +311,7 @@ def check_ups_status(ups_name: str = 'ups', nas_ip: str = None) -> Dict[str, Any
     # 각 항목별 상태 확인
     services_ok = services['all_active']
     port_ok = port['listening']
-    ups_ok = ups_data['success']
+    ups_ok = bool(units) and all(unit['success'] for unit in units)
     
     # NAS 연결 확인은 선택적 체크 (FAIL 판정에서 제외)
     # NAS가 원격 NUT 클라이언트로 연결된 경우 로그에 항상 기록되는 것은 아님
@@ -0,0 +1,215 @@
+"""
+UPS 원격 측정 시계열 (고정 크기 링 버퍼)
+웹 백엔드의 UPS 폴러가 주기적으로 upsd 값을 기록하고, UPS 점검/시계열 API가 읽음
+- 배터리 충전량/잔여 시간/부하/입력 전압은 NumPy 배열(float64, 값 없으면 NaN), 상태는 플래그 비트로 저장
+- 용량이 차면 가장 오래된 샘플부터 덮어씀 (메모리 고정)
+- 구간 집계(평균/최소/최대, 상태 플래그 OR)는 reduceat으로 한 번에 계산
+"""
+import math
+import time
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+SERIES_FIELDS = ('battery.charge', 'battery.runtime', 'ups.load', 'input.voltage')
+
+# ups.status 토큰 → 플래그 비트
+STATUS_FLAGS = {
+    'OL': 1, 'OB': 2, 'LB': 4, 'HB': 8, 'RB': 16, 'CHRG': 32, 'DISCHRG': 64, 'BYPASS': 128,
+    'CAL': 256, 'OFF': 512, 'OVER': 1024, 'TRIM': 2048, 'BOOST': 4096, 'FSD': 8192
+}
+
+
+def encode_status(status: Optional[str]) -> int:
+    """ups.status 문자열 → 플래그 (알 수 없는 토큰은 무시)"""
+    flags = 0
+    for token in (status or '').split():
+        flags |= STATUS_FLAGS.get(token, 0)
+    return flags
+
+
+def decode_status(flags: int) -> str:
+    """플래그 → ups.status 형식 문자열"""
+    return ' '.join(name for name, bit in STATUS_FLAGS.items() if flags & bit)
+
+
+def _number(value: Optional[str]) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _clean(value: float) -> Optional[float]:
+    """NaN → None (JSON 응답용)"""
+    return None if math.isnan(value) else round(float(value), 2)
+
+
+class UPSRingBuffer:
+    """UPS 1대의 샘플 링 버퍼 (스레드 안전)"""
+
+    def __init__(self, capacity: int = 17280):
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.values = np.full((capacity, len(SERIES_FIELDS)), np.nan, dtype=np.float64)
+        self.flags = np.zeros(capacity, dtype=np.uint16)
+        self.next = 0
+        self.count = 0
+        self.latest_vars: Dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    def append(self, timestamp: float, variables: Dict[str, str]):
+        """샘플 1개 기록 (variables: LIST VAR 결과 전체, 시계열 필드만 배열에 저장)"""
+        with self.lock:
+            slot = self.next
+            self.times[slot] = timestamp
+            self.values[slot] = [_number(variables.get(field)) for field in SERIES_FIELDS]
+            self.flags[slot] = encode_status(variables.get('ups.status'))
+            self.next = (slot + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+            self.latest_vars = dict(variables)
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """최근 샘플 {'timestamp', 'vars'} (없으면 None)"""
+        with self.lock:
+            if not self.count:
+                return None
+            return {'timestamp': float(self.times[(self.next - 1) % self.capacity]),
+                    'vars': dict(self.latest_vars)}
+
+    def oldest(self) -> Optional[float]:
+        """가장 오래된 샘플 시각"""
+        with self.lock:
+            if not self.count:
+                return None
+            return float(self.times[(self.next - self.count) % self.capacity])
+
+    def window(self, since: Optional[float] = None,
+               until: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """구간 샘플 (시간순 복사본: times, values, flags)"""
+        with self.lock:
+            order = (np.arange(self.count) + self.next - self.count) % self.capacity
+            times = self.times[order]
+            values = self.values[order]
+            flags = self.flags[order]
+        mask = np.ones(len(times), dtype=bool)
+        if since is not None:
+            mask &= times >= since
+        if until is not None:
+            mask &= times < until
+        return times[mask], values[mask], flags[mask]
+
+
+def aggregate(times: np.ndarray, values: np.ndarray, flags: np.ndarray, step: float) -> List[Dict[str, Any]]:
+    """
+    step초 구간별 집계 (구간 시작은 step 배수로 정렬)
+
+    Returns:
+        [{'timestamp': 구간 시작(epoch), 'samples', 'status', 'status_flags',
+          '<필드>': {'avg', 'min', 'max'}}, ...]
+    """
+    if not len(times):
+        return []
+    buckets = np.floor(times / step).astype(np.int64)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+
+    present = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(present, values, 0.0), starts)
+    counts = np.add.reduceat(present.astype(np.int64), starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    minimums = np.fmin.reduceat(values, starts)
+    maximums = np.fmax.reduceat(values, starts)
+    merged_flags = np.bitwise_or.reduceat(flags, starts)
+    samples = np.diff(np.concatenate((starts, [len(times)])))
+
+    points = []
+    for i, start in enumerate(starts):
+        point = {
+            'timestamp': float(buckets[start] * step),
+            'samples': int(samples[i]),
+            'status_flags': int(merged_flags[i]),
+            'status': decode_status(int(merged_flags[i]))
+        }
+        for j, field in enumerate(SERIES_FIELDS):
+            point[field] = {'avg': _clean(means[i, j]), 'min': _clean(minimums[i, j]), 'max': _clean(maximums[i, j])}
+        points.append(point)
+    return points
+
+
+class UPSTelemetryStore:
+    """UPS별 링 버퍼 모음 (프로세스 전역, 폴러가 기록하고 점검/API가 읽음)"""
+
+    def __init__(self, capacity: int = 17280, max_age: float = 15.0):
+        """
+        Args:
+            capacity: UPS당 샘플 수
+            max_age: 점검에서 최근 샘플을 사용할 최대 경과 시간 (초, 폴러가 간격에 맞춰 설정)
+        """
+        self.capacity = capacity
+        self.max_age = max_age
+        self.buffers: Dict[str, UPSRingBuffer] = {}
+        self.errors: Dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    def buffer(self, name: str) -> UPSRingBuffer:
+        with self.lock:
+            if name not in self.buffers:
+                self.buffers[name] = UPSRingBuffer(self.capacity)
+            return self.buffers[name]
+
+    def record(self, name: str, variables: Dict[str, str], timestamp: Optional[float] = None):
+        self.buffer(name).append(timestamp if timestamp is not None else time.time(), variables)
+        self.errors.pop(name, None)
+
+    def record_error(self, name: str, error: str):
+        self.errors[name] = error
+
+    def latest(self, name: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        최근 샘플 (max_age초보다 오래됐거나 폴러가 없으면 None)
+
+        Returns:
+            {'timestamp', 'vars', 'age'}
+        """
+        with self.lock:
+            ring = self.buffers.get(name)
+        sample = ring.latest() if ring is not None else None
+        if sample is None:
+            return None
+        age = time.time() - sample['timestamp']
+        if age > (self.max_age if max_age is None else max_age):
+            return None
+        sample['age'] = round(age, 1)
+        return sample
+
+    def series(self, name: str, since: Optional[float] = None, until: Optional[float] = None,
+               step: Optional[float] = None) -> Dict[str, Any]:
+        """
+        시계열 조회 (step이 있으면 구간 집계, 없으면 원본 샘플)
+
+        Returns:
+            {'ups', 'oldest', 'step', 'points': [...]}
+        """
+        with self.lock:
+            ring = self.buffers.get(name)
+        if ring is None:
+            return {'ups': name, 'oldest': None, 'step': step, 'points': []}
+        times, values, flags = ring.window(since, until)
+        if step:
+            points = aggregate(times, values, flags, step)
+        else:
+            points = [
+                {'timestamp': float(times[i]), 'status': decode_status(int(flags[i])),
+                 **{field: _clean(values[i, j]) for j, field in enumerate(SERIES_FIELDS)}}
+                for i in range(len(times))
+            ]
+        for point in points:
+            point['time'] = datetime.fromtimestamp(point['timestamp']).isoformat()
+        return {'ups': name, 'oldest': ring.oldest(), 'step': step, 'points': points}
+
+
+# 전역 인스턴스
+ups_telemetry = UPSTelemetryStore()
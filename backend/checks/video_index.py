@@ -0,0 +1,288 @@
+"""
+녹화 공백 타임라인 인덱스 모듈
+CAMERA_VIDEO_BASE_PATH/YYYY/MM/DD/HH 폴더를 순회하여 카메라별 세그먼트 시작 시각 타임라인 구성
+- 증분 갱신: 마지막으로 인덱싱한 시간 폴더부터 재개 (오래 멈춰 있었으면 lookback_hours까지만 따라잡음)
+- 폴더 스캔은 잠금 밖에서 하고 결과 병합만 잠금 안에서 (스캔 중에도 조회 가능)
+- 조회: 임의 구간에서 세그먼트 길이보다 긴 녹화 공백 반환 (bisect 기반)
+- 세그먼트 파일 크기(st_size)도 함께 기록하여 저장 속도 분석에 재사용
+"""
+import os
+import re
+import json
+import time
+import bisect
+import threading
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 파일명 패턴: *_stream0{cam_num}_*.mp4
+STREAM_RE = re.compile(r'_stream0?(\d+)_')
+# 파일명 내 시작 시각 (예: 20241027_153000, 20241027153000)
+FILENAME_TIME_RE = re.compile(r'(\d{8})[_-]?(\d{6})')
+
+INDEX_VERSION = 2
+
+
+def parse_segment_start(filename: str, mtime: float, segment_seconds: int) -> int:
+    """
+    세그먼트 시작 시각 (epoch 초)
+    파일명에 시각이 있으면 사용, 없으면 수정 시각(저장 완료 시점) - 세그먼트 길이
+    """
+    match = FILENAME_TIME_RE.search(filename)
+    if match:
+        try:
+            dt = datetime.strptime(match.group(1) + match.group(2), "%Y%m%d%H%M%S")
+            return int(dt.timestamp())
+        except ValueError:
+            pass
+    return int(mtime) - segment_seconds
+
+
+class RecordingIndex:
+    """카메라별 녹화 세그먼트 타임라인 인덱스"""
+
+    def __init__(self, video_base_path: str = "/mnt/nas/cam",
+                 index_path: Optional[str] = None,
+                 segment_seconds: int = 300,
+                 lookback_hours: int = 24,
+                 retention_days: int = 7):
+        """
+        Args:
+            video_base_path: 영상 파일 베이스 경로
+            index_path: 인덱스 저장 파일 (JSON, None이면 메모리에만 유지)
+            segment_seconds: 세그먼트 길이 (초, 기본 5분)
+            lookback_hours: 최초 인덱싱 시 거슬러 올라갈 시간 (증분 갱신 시 따라잡는 최대 시간)
+            retention_days: 인덱스 보관 기간 (일)
+        """
+        self.video_base_path = video_base_path
+        self.index_path = index_path
+        self.segment_seconds = segment_seconds
+        self.lookback_hours = lookback_hours
+        self.retention_days = retention_days
+
+        self.lock = threading.Lock()  # timeline/sizes 조회·병합
+        self.update_lock = threading.Lock()  # 갱신 직렬화 (동시에 한 번만 스캔)
+        self.timeline: Dict[int, List[int]] = {}  # 카메라 번호 -> 정렬된 세그먼트 시작 시각
+        self.sizes: Dict[int, List[int]] = {}  # 카메라 번호 -> 세그먼트 파일 크기 (timeline과 같은 순서)
+        self.last_indexed_hour: Optional[datetime] = None
+        self.updated_at: Optional[float] = None
+
+        self._load()
+
+    def _load(self):
+        """저장된 인덱스 로드"""
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_VERSION or data.get('base_path') != self.video_base_path:
+                return
+            self.timeline = {int(cam): starts for cam, starts in data.get('timeline', {}).items()}
+            self.sizes = {int(cam): sizes for cam, sizes in data.get('sizes', {}).items()}
+            if any(len(self.sizes.get(cam, [])) != len(starts) for cam, starts in self.timeline.items()):
+                raise ValueError("timeline/sizes 길이 불일치")
+            if data.get('last_indexed_hour'):
+                self.last_indexed_hour = datetime.strptime(data['last_indexed_hour'], "%Y/%m/%d/%H")
+            self.updated_at = data.get('updated_at')
+        except Exception as e:
+            logger.warning(f"녹화 인덱스 로드 실패 (새로 생성): {e}")
+            self.timeline = {}
+            self.sizes = {}
+            self.last_indexed_hour = None
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """저장할 내용 복사 (self.lock 안에서 호출)"""
+        return {
+            'version': INDEX_VERSION,
+            'base_path': self.video_base_path,
+            'last_indexed_hour': self.last_indexed_hour.strftime("%Y/%m/%d/%H") if self.last_indexed_hour else None,
+            'updated_at': self.updated_at,
+            'timeline': {str(cam): list(starts) for cam, starts in self.timeline.items()},
+            'sizes': {str(cam): list(sizes) for cam, sizes in self.sizes.items()}
+        }
+
+    def _save(self, data: Dict[str, Any]):
+        """인덱스 저장 (임시 파일에 쓴 뒤 교체, 잠금 밖에서 호출)"""
+        if not self.index_path:
+            return
+        tmp_path = f"{self.index_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            logger.warning(f"녹화 인덱스 저장 실패: {e}")
+
+    def _scan_hour(self, hour: datetime) -> Dict[int, List[tuple]]:
+        """시간 폴더 1개 스캔 -> {카메라: [(시작 시각, 파일 크기)]}"""
+        hour_dir = os.path.join(self.video_base_path, hour.strftime("%Y/%m/%d/%H"))
+        found: Dict[int, List[tuple]] = {}
+        try:
+            entries = os.scandir(hour_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            return found
+
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith('.mp4'):
+                    continue
+                match = STREAM_RE.search(entry.name)
+                if not match:
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                start = parse_segment_start(entry.name, stat.st_mtime, self.segment_seconds)
+                found.setdefault(int(match.group(1)), []).append((start, stat.st_size))
+        return found
+
+    def update(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        증분 인덱싱 (마지막 인덱싱 시간 폴더부터 현재 시간 폴더까지)
+        마지막 시간 폴더는 기록 중일 수 있으므로 다시 스캔
+        오래 갱신되지 않았으면 최근 lookback_hours 시간만 스캔 (그 이전은 건너뜀)
+
+        Returns:
+            {'scanned_hours', 'skipped_hours', 'added', 'duration_ms'}
+        """
+        with self.update_lock:
+            return self._update(now)
+
+    def _update(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """update() 본체 (update_lock 안에서 호출)"""
+        start_time = time.monotonic()
+        now = now or datetime.now()
+        current_hour = now.replace(minute=0, second=0, microsecond=0)
+        earliest = current_hour - timedelta(hours=self.lookback_hours)
+
+        with self.lock:
+            last_indexed_hour = self.last_indexed_hour
+        hour = earliest if last_indexed_hour is None else max(last_indexed_hour, earliest)
+        skipped = 0
+        if last_indexed_hour is not None and last_indexed_hour < earliest:
+            skipped = int((earliest - last_indexed_hour).total_seconds() // 3600)
+            logger.warning(f"녹화 인덱스 갱신이 {skipped}시간 밀려 최근 {self.lookback_hours}시간만 스캔")
+
+        # 폴더 스캔은 잠금 밖에서 (NAS 응답이 느려도 조회가 막히지 않음)
+        scanned_hours = []
+        while hour <= current_hour:
+            scanned_hours.append(self._scan_hour(hour))
+            hour += timedelta(hours=1)
+
+        cutoff = int((now - timedelta(days=self.retention_days)).timestamp())
+        added = 0
+        with self.lock:
+            for found in scanned_hours:
+                for cam, segments in found.items():
+                    timeline = self.timeline.setdefault(cam, [])
+                    sizes = self.sizes.setdefault(cam, [])
+                    for start, size in segments:
+                        # 재스캔한 시간 폴더의 기존 항목은 크기만 갱신 (기록 중이던 파일)
+                        pos = bisect.bisect_left(timeline, start)
+                        if pos < len(timeline) and timeline[pos] == start:
+                            sizes[pos] = size
+                            continue
+                        timeline.insert(pos, start)
+                        sizes.insert(pos, size)
+                        added += 1
+
+            # 보관 기간 경과 항목 정리
+            for cam, starts in self.timeline.items():
+                expired = bisect.bisect_left(starts, cutoff)
+                del starts[:expired]
+                del self.sizes[cam][:expired]
+
+            self.last_indexed_hour = current_hour
+            self.updated_at = time.time()
+            data = self._snapshot() if self.index_path else None
+
+        if data is not None:
+            self._save(data)
+
+        return {
+            'scanned_hours': len(scanned_hours),
+            'skipped_hours': skipped,
+            'added': added,
+            'duration_ms': round((time.monotonic() - start_time) * 1000, 1)
+        }
+
+    def update_if_stale(self, max_age: float = 60.0) -> Optional[Dict[str, Any]]:
+        """
+        마지막 갱신 후 max_age초가 지났을 때만 증분 인덱싱 (API 조회용)
+        동시에 호출되면 한 곳만 갱신하고 나머지는 갱신이 끝난 뒤 최신 상태로 판단
+        """
+        with self.update_lock:
+            if self.updated_at is not None and time.time() - self.updated_at < max_age:
+                return None
+            return self._update()
+
+    def find_gaps(self, camera_num: int, start: datetime, end: datetime,
+                  tolerance: float = 1.2) -> List[Dict[str, Any]]:
+        """
+        구간 내 녹화 공백 조회
+
+        Args:
+            camera_num: 카메라 번호
+            start: 조회 시작 시각
+            end: 조회 종료 시각
+            tolerance: 세그먼트 길이 대비 허용 배수 (기본 1.2 → 6분 초과 간격이 공백)
+
+        Returns:
+            [{'start', 'end', 'seconds'}] - start는 녹화가 멈춘 시각, end는 재개된 시각
+        """
+        window_start = int(start.timestamp())
+        window_end = int(end.timestamp())
+        max_gap = self.segment_seconds * tolerance
+
+        with self.lock:
+            starts = self.timeline.get(camera_num, [])
+            lo = bisect.bisect_left(starts, window_start)
+            hi = bisect.bisect_right(starts, window_end)
+            # 구간 직전 세그먼트까지 포함 (구간 시작 시점 녹화 여부 판단)
+            points = starts[max(0, lo - 1):hi]
+
+        gaps = []
+        prev_end = window_start
+        if points and points[0] < window_start:
+            prev_end = points[0] + self.segment_seconds
+            points = points[1:]
+
+        for seg_start in points:
+            if seg_start - prev_end > max_gap - self.segment_seconds:
+                gaps.append(self._gap(prev_end, seg_start))
+            prev_end = max(prev_end, seg_start + self.segment_seconds)
+
+        # 구간 끝: 기록 중인 세그먼트 1개는 아직 저장되지 않았을 수 있으므로 허용
+        if window_end - prev_end > max_gap:
+            gaps.append(self._gap(prev_end, window_end))
+
+        return gaps
+
+    @staticmethod
+    def _gap(gap_start: int, gap_end: int) -> Dict[str, Any]:
+        return {
+            'start': datetime.fromtimestamp(gap_start).strftime("%Y-%m-%d %H:%M:%S"),
+            'end': datetime.fromtimestamp(gap_end).strftime("%Y-%m-%d %H:%M:%S"),
+            'seconds': gap_end - gap_start
+        }
+
+    def segments(self, camera_num: int, start: datetime, end: datetime) -> List[tuple]:
+        """구간 내 세그먼트 [(시작 시각 epoch, 파일 크기 bytes)]"""
+        window_start = int(start.timestamp())
+        window_end = int(end.timestamp())
+        with self.lock:
+            starts = self.timeline.get(camera_num, [])
+            sizes = self.sizes.get(camera_num, [])
+            lo = bisect.bisect_left(starts, window_start)
+            hi = bisect.bisect_right(starts, window_end)
+            return list(zip(starts[lo:hi], sizes[lo:hi]))
+
+    def cameras(self) -> List[int]:
+        """인덱스에 있는 카메라 번호 목록"""
+        with self.lock:
+            return sorted(self.timeline.keys())
@@ -0,0 +1,211 @@
+"""
+회로 차단기(Circuit Breaker) 모듈
+장시간 응답 없는 대상(카메라, NAS 등)에 매 점검마다 전체 타임아웃을 소모하지 않도록
+- 연속 N회 실패 시 차단(OPEN): 전체 점검 대신 저비용 TCP 연결 확인만 수행
+- 확인 간격은 지수 백오프로 증가
+- TCP 응답이 오면 시험 점검(HALF_OPEN) 1회: 성공하면 복구(CLOSED), 실패하면 백오프를 2배로 늘려 다시 차단
+- 상태는 JSON 파일에 저장되어 실행 간 유지 (여러 프로세스가 공유: 파일 잠금 후 다시 읽어 대상별로 갱신)
+"""
+import os
+import json
+import time
+import socket
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 없이 동작
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'CLOSED'
+OPEN = 'OPEN'
+HALF_OPEN = 'HALF_OPEN'
+
+
+def tcp_probe(host: str, port: int, timeout: float = 1.0) -> bool:
+    """저비용 확인: TCP 연결 1회"""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+class CircuitBreaker:
+    """대상별 회로 차단기 (상태 파일 공유)"""
+
+    def __init__(self, state_path: Optional[str] = None, failure_threshold: int = 3,
+                 base_backoff: float = 300.0, max_backoff: float = 21600.0):
+        """
+        Args:
+            state_path: 상태 저장 파일 (JSON, None이면 메모리에만 유지)
+            failure_threshold: 차단까지의 연속 실패 횟수 (N)
+            base_backoff: 차단 후 첫 확인까지 대기 시간 (초)
+            max_backoff: 확인 간격 상한 (초)
+        """
+        self.state_path = state_path
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.lock = threading.Lock()
+        self.targets: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        """상태 파일 다시 읽기 (파일에 있는 대상은 파일 값으로 교체)"""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.targets.update(json.load(f).get('targets', {}))
+        except Exception as e:
+            logger.warning(f"회로 차단기 상태 로드 실패 (메모리 상태 사용): {e}")
+
+    def _save(self):
+        """상태 저장 (임시 파일에 쓴 뒤 교체, _transaction 안에서 호출)"""
+        if not self.state_path:
+            return
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'targets': self.targets}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            logger.warning(f"회로 차단기 상태 저장 실패: {e}")
+
+    @contextmanager
+    def _transaction(self, save: bool = True):
+        """
+        상태 파일 잠금 → 다시 읽기 → (변경) → 저장
+        다른 프로세스(CLI 점검, 웹 백엔드)가 그사이 기록한 다른 대상 상태를 덮어쓰지 않음
+        """
+        with self.lock:
+            lock_file = None
+            if self.state_path and fcntl is not None:
+                try:
+                    lock_file = open(f"{self.state_path}.lock", 'a')
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                except OSError as e:
+                    logger.warning(f"회로 차단기 상태 파일 잠금 실패: {e}")
+            try:
+                self._load()
+                yield
+                if save:
+                    self._save()
+            finally:
+                if lock_file is not None:
+                    lock_file.close()  # 잠금도 함께 해제
+
+    def _entry(self, target: str) -> Dict[str, Any]:
+        return self.targets.setdefault(target, {
+            'state': CLOSED,
+            'failures': 0,
+            'opened_at': None,
+            'backoff': None,
+            'next_probe_at': None,
+            'last_error': None,
+            'last_success': None
+        })
+
+    def snapshot(self, target: str) -> Dict[str, Any]:
+        """결과 기록용 상태 (표시용 시각 포함)"""
+        with self.lock:
+            entry = dict(self._entry(target))
+        entry['target'] = target
+        if entry['next_probe_at']:
+            entry['next_probe_in'] = max(0, round(entry['next_probe_at'] - time.time()))
+        return entry
+
+    def gate(self, target: str, probe: Callable[[], bool]) -> Dict[str, Any]:
+        """
+        점검 전 차단 여부 판단
+
+        - CLOSED / HALF_OPEN(시험 점검 중): 전체 점검 진행
+        - OPEN + 확인 시각 전: 네트워크 접근 없이 생략
+        - OPEN + 확인 시각 도달: probe() 실행 → 성공 시 HALF_OPEN으로 시험 점검 (백오프 유지),
+          실패 시 백오프 2배
+
+        Args:
+            target: 대상 키 (예: "camera:192.168.1.101", "nas:192.168.10.30")
+            probe: 저비용 확인 함수 (응답 여부 반환)
+
+        Returns:
+            {'allowed': 전체 점검 진행 여부, 'probed': 확인 실행 여부, 'breaker': 상태 스냅샷}
+        """
+        now = time.time()
+        with self._transaction(save=False):
+            entry = self._entry(target)
+            state = entry['state']
+            due = state == OPEN and now >= (entry['next_probe_at'] or 0)
+
+        if state != OPEN:
+            return {'allowed': True, 'probed': False, 'breaker': self.snapshot(target)}
+        if not due:
+            return {'allowed': False, 'probed': False, 'breaker': self.snapshot(target)}
+
+        answered = False
+        try:
+            answered = probe()
+        except Exception as e:
+            logger.debug(f"{target} 확인 실패: {e}")
+
+        with self._transaction():
+            entry = self._entry(target)
+            # 그사이 다른 프로세스가 복구/시험 점검을 시작했으면 상태는 그대로 두고 전체 점검 진행
+            if entry['state'] != OPEN:
+                answered = True
+            elif answered:
+                # 응답 → 시험 점검 (성공하면 복구, 실패하면 유지한 백오프의 2배로 다시 차단)
+                entry.update({'state': HALF_OPEN, 'next_probe_at': None})
+                logger.info(f"회로 시험 점검: {target} (응답 확인)")
+            else:
+                entry['backoff'] = min(self.max_backoff, (entry['backoff'] or self.base_backoff) * 2)
+                entry['next_probe_at'] = now + entry['backoff']
+
+        return {'allowed': answered, 'probed': True, 'breaker': self.snapshot(target)}
+
+    def record_success(self, target: str):
+        """전체 점검 성공 기록 (차단 해제)"""
+        with self._transaction():
+            entry = self._entry(target)
+            if entry['state'] != CLOSED:
+                logger.info(f"회로 차단 해제: {target}")
+            entry.update({'state': CLOSED, 'failures': 0, 'opened_at': None,
+                          'backoff': None, 'next_probe_at': None, 'last_success': time.time()})
+
+    def record_failure(self, target: str, error: Optional[str] = None):
+        """전체 점검 실패 기록 (연속 N회 실패 시 차단, 시험 점검 실패 시 백오프 2배로 다시 차단)"""
+        now = time.time()
+        with self._transaction():
+            entry = self._entry(target)
+            entry['failures'] += 1
+            entry['last_error'] = error
+            if entry['state'] == HALF_OPEN:
+                backoff = min(self.max_backoff, (entry['backoff'] or self.base_backoff) * 2)
+                entry.update({'state': OPEN, 'backoff': backoff, 'next_probe_at': now + backoff})
+                logger.warning(f"회로 다시 차단: {target} (시험 점검 실패, 다음 확인 {backoff:.0f}초 후)")
+            elif entry['state'] == CLOSED and entry['failures'] >= self.failure_threshold:
+                entry.update({'state': OPEN, 'opened_at': now, 'backoff': self.base_backoff,
+                              'next_probe_at': now + self.base_backoff})
+                logger.warning(f"회로 차단: {target} (연속 실패 {entry['failures']}회)")
+
+
+def breaker_from_config(config: Dict[str, str]) -> Optional[CircuitBreaker]:
+    """
+    점검 설정에서 회로 차단기 생성 (비활성화면 None)
+
+    설정 키: circuit_breaker, breaker_path, breaker_threshold, breaker_backoff, breaker_max_backoff
+    """
+    if str(config.get('circuit_breaker', 'false')).lower() != 'true':
+        return None
+    return CircuitBreaker(
+        state_path=config.get('breaker_path') or None,
+        failure_threshold=int(config.get('breaker_threshold', 3)),
+        base_backoff=float(config.get('breaker_backoff', 300)),
+        max_backoff=float(config.get('breaker_max_backoff', 21600))
+    )
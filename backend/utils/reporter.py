@@ -174,6 +174,17 @@ def generate_report(results: Dict[str, Any]) -> str:
                     else:
                         lines.append(f"    - {key}: {value}")
         
+        # 다중 NAS 점검 결과 (호스트별)
+        if 'hosts' in nas:
+            lines.append("")
+            lines.append("  호스트별 결과:")
+            for name, host_result in nas['hosts'].items():
+                lines.append(f"    - {name} ({host_result.get('host')}): {host_result.get('status', 'UNKNOWN')}")
+                for message in host_result.get('errors', []):
+                    lines.append(f"      오류: {message}")
+                for message in host_result.get('warnings', []):
+                    lines.append(f"      경고: {message}")
+        
         if 'error' in nas:
             lines.append("")
             lines.append(f"  오류: {nas['error']}")
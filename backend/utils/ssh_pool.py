@@ -0,0 +1,197 @@
+"""
+SSH 연결 풀 모듈
+프로세스 전역에서 (host, port, username) 별로 SSH 트랜스포트 1개를 공유
+- paramiko 트랜스포트는 채널 다중화를 지원하므로 여러 executor 스레드가 동시에 사용 가능
+- keepalive 전송으로 NAT/방화벽 유휴 연결 끊김 방지
+- 대여 전 상태 확인, 끊긴 연결은 투명하게 재연결
+- 일정 시간 사용하지 않은 연결은 자동 정리
+"""
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple
+
+import paramiko
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, int, str]
+
+
+class _PoolEntry:
+    """풀 항목 (연결 1개 + 사용 정보)"""
+
+    def __init__(self):
+        self.client: Optional[paramiko.SSHClient] = None
+        self.password: Optional[str] = None
+        self.lock = threading.Lock()  # 연결/재연결 직렬화
+        self.borrowers = 0
+        self.last_used = time.monotonic()
+        self.connects = 0
+
+
+class SSHConnectionPool:
+    """프로세스 전역 SSH 연결 풀 (스레드 안전)"""
+
+    def __init__(self, keepalive: int = 30, idle_timeout: float = 300.0):
+        """
+        Args:
+            keepalive: keepalive 전송 간격 (초, 0이면 사용 안 함)
+            idle_timeout: 대여 중이 아닌 연결을 정리하기까지의 유휴 시간 (초)
+        """
+        self.keepalive = keepalive
+        self.idle_timeout = idle_timeout
+        self.entries: Dict[PoolKey, _PoolEntry] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _healthy(client: Optional[paramiko.SSHClient]) -> bool:
+        """연결 상태 확인 (트랜스포트 활성 + ignore 메시지 전송 가능)"""
+        if client is None:
+            return False
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            transport.send_ignore()
+            return True
+        except Exception:
+            return False
+
+    def _connect(self, entry: _PoolEntry, host: str, port: int, username: str,
+                 password: Optional[str], timeout: float):
+        if entry.client is not None:
+            try:
+                entry.client.close()
+            except Exception:
+                pass
+            entry.client = None
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            host,
+            port=port,
+            username=username,
+            password=password,
+            timeout=timeout,
+            banner_timeout=timeout,
+            auth_timeout=timeout,
+            look_for_keys=False,
+            allow_agent=False
+        )
+        if self.keepalive:
+            client.get_transport().set_keepalive(self.keepalive)
+        entry.client = client
+        entry.password = password
+        entry.connects += 1
+        logger.debug(f"SSH 풀 연결: {username}@{host}:{port} (누적 {entry.connects}회)")
+
+    def acquire(self, host: str, port: int, username: str, password: Optional[str] = None,
+                timeout: float = 15.0) -> paramiko.SSHClient:
+        """
+        연결 대여 (없거나 끊겼으면 연결/재연결)
+        사용 후 반드시 release() 호출 (또는 borrow() 컨텍스트 매니저 사용)
+
+        Raises:
+            paramiko/소켓 예외: 연결 실패
+        """
+        self.evict_idle()
+        key = (host, int(port), username)
+        with self.lock:
+            entry = self.entries.setdefault(key, _PoolEntry())
+            entry.borrowers += 1
+
+        try:
+            with entry.lock:
+                if entry.password != password or not self._healthy(entry.client):
+                    self._connect(entry, host, int(port), username, password, timeout)
+                entry.last_used = time.monotonic()
+                return entry.client
+        except Exception:
+            with self.lock:
+                entry.borrowers -= 1
+            raise
+
+    def release(self, host: str, port: int, username: str):
+        """연결 반납 (연결은 유지)"""
+        key = (host, int(port), username)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry.borrowers = max(0, entry.borrowers - 1)
+                entry.last_used = time.monotonic()
+
+    def reconnect(self, host: str, port: int, username: str, password: Optional[str] = None,
+                  timeout: float = 15.0) -> paramiko.SSHClient:
+        """대여 중인 연결이 끊겼을 때 강제 재연결 (이미 다른 스레드가 재연결했으면 그 연결 사용)"""
+        key = (host, int(port), username)
+        with self.lock:
+            entry = self.entries.setdefault(key, _PoolEntry())
+        with entry.lock:
+            if not self._healthy(entry.client):
+                self._connect(entry, host, int(port), username, password, timeout)
+            entry.last_used = time.monotonic()
+            return entry.client
+
+    @contextmanager
+    def borrow(self, host: str, port: int, username: str, password: Optional[str] = None,
+               timeout: float = 15.0):
+        """with 문용 대여"""
+        client = self.acquire(host, port, username, password, timeout)
+        try:
+            yield client
+        finally:
+            self.release(host, port, username)
+
+    def evict_idle(self):
+        """유휴 시간이 지난 미대여 연결 정리"""
+        now = time.monotonic()
+        expired = []
+        with self.lock:
+            for key, entry in list(self.entries.items()):
+                if entry.borrowers == 0 and now - entry.last_used > self.idle_timeout:
+                    expired.append((key, self.entries.pop(key)))
+        for key, entry in expired:
+            with entry.lock:
+                if entry.client is not None:
+                    try:
+                        entry.client.close()
+                    except Exception:
+                        pass
+                    entry.client = None
+            logger.debug(f"SSH 풀 유휴 연결 정리: {key[2]}@{key[0]}:{key[1]}")
+
+    def close_all(self):
+        """모든 연결 종료 (애플리케이션 종료 시)"""
+        with self.lock:
+            entries = list(self.entries.values())
+            self.entries.clear()
+        for entry in entries:
+            with entry.lock:
+                if entry.client is not None:
+                    try:
+                        entry.client.close()
+                    except Exception:
+                        pass
+                    entry.client = None
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 (API/로그용)"""
+        now = time.monotonic()
+        with self.lock:
+            return {
+                f"{key[2]}@{key[0]}:{key[1]}": {
+                    'borrowers': entry.borrowers,
+                    'connects': entry.connects,
+                    'idle_seconds': round(now - entry.last_used, 1),
+                    'active': entry.client is not None and entry.client.get_transport() is not None
+                              and entry.client.get_transport().is_active()
+                }
+                for key, entry in self.entries.items()
+            }
+
+
+# 전역 인스턴스
+ssh_pool = SSHConnectionPool()
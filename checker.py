@@ -29,6 +29,7 @@ from checks.ups_check import check_ups_status
 from checks.camera_check import check_cameras
 from checks.pg_check import check_postgresql
 from checks.nas_check import check_nas_status
+from checks.nas_fleet import check_nas_fleet
 from checks.system_check import check_system_status
 from checks.registry import registry
 
@@ -65,6 +66,26 @@ def pad_string(text, target_width):
     return text
 
 
+def get_breaker_config():
+    """회로 차단기 설정 (카메라/NAS 공통)"""
+    return {
+        'circuit_breaker': os.getenv('CIRCUIT_BREAKER_ENABLED', 'False'),
+        'breaker_path': os.getenv('CIRCUIT_BREAKER_PATH', './circuit_breaker.json'),
+        'breaker_threshold': os.getenv('CIRCUIT_BREAKER_THRESHOLD', '3'),
+        'breaker_backoff': os.getenv('CIRCUIT_BREAKER_BACKOFF', '300'),
+        'breaker_max_backoff': os.getenv('CIRCUIT_BREAKER_MAX_BACKOFF', '21600')
+    }
+
+
+def get_disk_forecast_config():
+    """디스크 사용량 이력/가득 참 예측 설정 (NAS/로컬 공통)"""
+    return {
+        'disk_history_path': os.getenv('DISK_HISTORY_PATH', './disk_usage_history.json'),
+        'disk_forecast_warn_days': os.getenv('DISK_FORECAST_WARN_DAYS', '30'),
+        'disk_forecast_fail_days': os.getenv('DISK_FORECAST_FAIL_DAYS', '7')
+    }
+
+
 def get_env_config():
     """환경변수에서 설정 읽기"""
     return {
@@ -76,13 +97,46 @@ def get_env_config():
             'password': os.getenv('PG_PASS', '')
         },
         'nut': {
-            'ups_name': os.getenv('NUT_UPS_NAME', 'ups')
+            'ups_name': os.getenv('NUT_UPS_NAME', 'ups'),
+            'host': os.getenv('NUT_HOST', 'localhost'),
+            'port': os.getenv('NUT_PORT', '3493'),
+            'timeout': os.getenv('NUT_TIMEOUT', '5'),
+            'username': os.getenv('NUT_USER', ''),
+            'password': os.getenv('NUT_PASSWORD', ''),
+            'targets': os.getenv('NUT_UPS_TARGETS', '')
         },
         'nas': {
             'ip': os.getenv('NAS_IP', '192.168.10.30'),
             'user': os.getenv('NAS_USER', 'admin'),
             'password': os.getenv('NAS_PASSWORD', ''),
-            'port': os.getenv('NAS_PORT', '2222')  # 시놀로지 커스텀 SSH 포트 (실패 시 22로 재시도)
+            'port': os.getenv('NAS_PORT', '2222'),  # 시놀로지 커스텀 SSH 포트 (실패 시 22로 재시도)
+            'nas_targets': os.getenv('NAS_TARGETS', ''),  # 다중 NAS (비우면 NAS_IP 1대)
+            'fleet_concurrency': os.getenv('NAS_FLEET_CONCURRENCY', '8'),
+            'fleet_per_host': os.getenv('NAS_FLEET_PER_HOST', '1'),
+            'fleet_host_timeout': os.getenv('NAS_FLEET_HOST_TIMEOUT', '120'),
+            'smart': os.getenv('NAS_SMART_ENABLED', 'False'),
+            'smart_history_path': os.getenv('NAS_SMART_HISTORY_PATH', './smart_history.json'),
+            'smart_rate_window': os.getenv('NAS_SMART_RATE_WINDOW', '7'),
+            'smart_rate_warn': os.getenv('NAS_SMART_RATE_WARN', '1'),
+            'smart_temp_warn': os.getenv('NAS_SMART_TEMP_WARN', '55'),
+            'io_sample': os.getenv('NAS_IO_SAMPLE_ENABLED', 'False'),
+            'io_interval': os.getenv('NAS_IO_INTERVAL', '1'),
+            'io_util_warn': os.getenv('NAS_IO_UTIL_WARN', '90'),
+            'io_await_warn': os.getenv('NAS_IO_AWAIT_WARN', '100'),
+            'io_nic_util_warn': os.getenv('NAS_IO_NIC_UTIL_WARN', '80'),
+            'io_nic_mbps_warn': os.getenv('NAS_IO_NIC_MBPS_WARN', '0'),
+            'io_nic_drop_warn': os.getenv('NAS_IO_NIC_DROP_WARN', '10'),
+            **get_breaker_config(),
+            **get_disk_forecast_config()
+        },
+        'system': {
+            **get_disk_forecast_config(),
+            'mount_bench': os.getenv('MOUNT_BENCH_ENABLED', 'False'),
+            'mount_bench_path': os.getenv('MOUNT_BENCH_PATH', '/mnt/nas'),
+            'mount_bench_budget_mb': os.getenv('MOUNT_BENCH_BUDGET_MB', '64'),
+            'mount_bench_meta_ops': os.getenv('MOUNT_BENCH_META_OPS', '50'),
+            'mount_bench_history_path': os.getenv('MOUNT_BENCH_HISTORY_PATH', './mount_bench_history.json'),
+            'mount_bench_regression': os.getenv('MOUNT_BENCH_REGRESSION', '0.5')
         },
         'camera': {
             'base_ip': os.getenv('CAMERA_BASE_IP', '192.168.1'),
@@ -93,7 +147,42 @@ def get_env_config():
             'rtsp_port': os.getenv('CAMERA_RTSP_PORT', '554'),
             'mediamtx_base_port': os.getenv('CAMERA_MEDIAMTX_BASE_PORT', '1111'),
             'log_base_path': os.getenv('CAMERA_LOG_BASE_PATH', '/mnt/nas/logs'),
-            'video_base_path': os.getenv('CAMERA_VIDEO_BASE_PATH', '/mnt/nas/cam')
+            'video_base_path': os.getenv('CAMERA_VIDEO_BASE_PATH', '/mnt/nas/cam'),
+            'tcp_sweep': os.getenv('CAMERA_TCP_SWEEP_ENABLED', 'True'),
+            'tcp_sweep_timeout': os.getenv('CAMERA_TCP_SWEEP_TIMEOUT', '0.4'),
+            'log_analytics': os.getenv('CAMERA_LOG_ANALYTICS', 'False'),
+            'log_transport': os.getenv('CAMERA_LOG_TRANSPORT', 'nfs'),
+            'log_nas_path': os.getenv('CAMERA_LOG_NAS_PATH', ''),
+            'log_read_timeout': os.getenv('CAMERA_LOG_READ_TIMEOUT', '5'),
+            'log_switch_ms': os.getenv('CAMERA_LOG_SWITCH_MS', '500'),
+            'log_cooldown': os.getenv('CAMERA_LOG_COOLDOWN', '300'),
+            'nas_ip': os.getenv('NAS_IP', '192.168.10.30'),
+            'nas_user': os.getenv('NAS_USER', 'admin'),
+            'nas_password': os.getenv('NAS_PASSWORD', ''),
+            'nas_port': os.getenv('NAS_PORT', '2222'),
+            'deep_verify': os.getenv('CAMERA_DEEP_VERIFY', 'False'),
+            'verify_frames': os.getenv('CAMERA_VERIFY_FRAMES', '5'),
+            'verify_workers': os.getenv('CAMERA_VERIFY_WORKERS', '2'),
+            'verify_cpu_budget': os.getenv('CAMERA_VERIFY_CPU_BUDGET', '10'),
+            'blur_verify': os.getenv('CAMERA_BLUR_VERIFY', 'False'),
+            'blur_regions': os.getenv('CAMERA_BLUR_REGIONS', ''),
+            'blur_max_ratio': os.getenv('CAMERA_BLUR_MAX_RATIO', '0.8'),
+            'frame_backend': os.getenv('CAMERA_FRAME_BACKEND', 'opencv'),
+            'ffmpeg_path': os.getenv('CAMERA_FFMPEG_PATH', 'ffmpeg'),
+            'rtsp_transport': os.getenv('CAMERA_RTSP_TRANSPORT', 'udp'),
+            'rtsp_transport_overrides': os.getenv('CAMERA_RTSP_TRANSPORT_OVERRIDES', ''),
+            'ffmpeg_width': os.getenv('CAMERA_FFMPEG_WIDTH', '640'),
+            'ffmpeg_height': os.getenv('CAMERA_FFMPEG_HEIGHT', '360'),
+            'ffmpeg_fps': os.getenv('CAMERA_FFMPEG_FPS', '0'),
+            'mediamtx_api': os.getenv('CAMERA_MEDIAMTX_API_ENABLED', 'False'),
+            'mediamtx_api_host': os.getenv('CAMERA_MEDIAMTX_API_HOST', '127.0.0.1'),
+            'mediamtx_api_base_port': os.getenv('CAMERA_MEDIAMTX_API_BASE_PORT', '9997'),
+            'mediamtx_path': os.getenv('CAMERA_MEDIAMTX_PATH', 'live'),
+            'rtp_stats': os.getenv('CAMERA_RTP_STATS', 'False'),
+            'rtp_window': os.getenv('CAMERA_RTP_WINDOW', '3'),
+            'rtp_loss_warn': os.getenv('CAMERA_RTP_LOSS_WARN', '1.0'),
+            'rtp_jitter_warn': os.getenv('CAMERA_RTP_JITTER_WARN', '30'),
+            **get_breaker_config()
         }
     }
 
@@ -244,7 +333,8 @@ def main(args=None):
             try:
                 ups_result = check_ups_status(
                     ups_name=config['nut']['ups_name'],
-                    nas_ip=config['nas']['ip']
+                    nas_ip=config['nas']['ip'],
+                    nut_config=config['nut']
                 )
                 results['ups'] = ups_result
                 progress.update(1, "UPS 점검 완료")
@@ -395,7 +485,10 @@ def main(args=None):
     if 'nas' in selected_checks:
         while True:
             try:
-                nas_result = check_nas_status(config['nas'])
+                if config['nas'].get('nas_targets', '').strip():
+                    nas_result = check_nas_fleet(config['nas'])
+                else:
+                    nas_result = check_nas_status(config['nas'])
                 results['nas'] = nas_result
                 progress.update(1, "NAS 점검 완료")
                 
@@ -448,7 +541,7 @@ def main(args=None):
     # ========== 4. 시스템 종합 점검 ==========
     if 'system' in selected_checks:
         try:
-            system_result = check_system_status()
+            system_result = check_system_status(config.get('system'))
             results['system'] = system_result
             progress.finish("모든 점검 완료")
             
@@ -114,6 +114,15 @@ class WebSocketClient {
                     error: error
                 });
                 break;
+
+            case 'raid_progress':
+                this.emit('raidProgress', {
+                    host: data.host,
+                    devices: data.devices,
+                    finished: data.finished,
+                    timestamp: data.timestamp
+                });
+                break;
         }
     }
     
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+카메라 상시 모니터 grab 모드 중단 감지 테스트
+실제 카메라 없이 VideoCapture 대역으로 확인
+- 타임스탬프가 정상 증가하면 생존, FPS 계산
+- grab은 성공하지만 타임스탬프가 멈추면(같은 프레임 반복) 중단으로 판정
+- grab 1회가 샘플 간격보다 느리면 중단으로 판정
+- stop()은 진행 중인 grab이 끝날 때까지 기다리고, 캡처 해제는 리더 스레드에서만 수행
+"""
+import os
+import sys
+import time
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+import cv2
+from checks.camera_monitor import StreamReader, DecodeBudget
+
+
+class FakeCapture:
+    """VideoCapture 대역 (grab마다 타임스탬프 step ms 증가, delay초 지연)"""
+
+    def __init__(self, step: float = 40.0, delay: float = 0.0):
+        self.position = 0.0
+        self.step = step
+        self.delay = delay
+        self.grabbing = False
+        self.released = False
+        self.released_during_grab = False
+
+    def grab(self):
+        self.grabbing = True
+        time.sleep(self.delay)
+        self.position += self.step
+        self.grabbing = False
+        return True
+
+    def get(self, prop):
+        return self.position if prop == cv2.CAP_PROP_POS_MSEC else 0
+
+    def retrieve(self):
+        return False, None
+
+    def release(self):
+        self.released = True
+        self.released_during_grab = self.grabbing
+
+
+def sample_with(reader: StreamReader, capture: FakeCapture, rounds: int = 2):
+    """샘플을 rounds회 수행 후 스냅샷 반환 (실패 시 모니터처럼 연결 해제)"""
+    reader.cap = capture
+    for _ in range(rounds):
+        sample = reader._sample()
+        reader._record(sample)
+        if not sample['success']:
+            reader._release()
+            break
+    return reader.snapshot()
+
+
+def main():
+    print("=" * 60)
+    print("카메라 모니터 grab 모드 중단 감지 테스트")
+    print("=" * 60)
+    print()
+
+    budget = DecodeBudget(100)
+    checks = []
+
+    reader = StreamReader("rtsp://test/live", "정상", budget, interval=0.5)
+    live = sample_with(reader, FakeCapture(step=40.0))
+    print(f"정상: alive={live['alive']}, fps={live['fps']}, 오류={live['last_error']}")
+    checks.append(('타임스탬프 증가 → 생존', live['alive'] and live['fps'] == 25.0))
+
+    reader = StreamReader("rtsp://test/live", "정지", budget, interval=0.5)
+    reader.cap = FakeCapture(step=40.0)
+    reader._record(reader._sample())
+    reader.cap.step = 0.0  # 이후 같은 프레임 반복
+    frozen = sample_with(reader, reader.cap, rounds=1)
+    print(f"정지: alive={frozen['alive']}, 오류={frozen['last_error']}")
+    checks.append(('타임스탬프 정지 → 중단', not frozen['alive']
+                   and 'not advancing' in (frozen['last_error'] or '')
+                   and reader.cap is None))
+
+    reader = StreamReader("rtsp://test/live", "지연", budget, interval=0.1)
+    slow = sample_with(reader, FakeCapture(step=40.0, delay=0.2), rounds=1)
+    print(f"지연: alive={slow['alive']}, 오류={slow['last_error']}")
+    checks.append(('grab이 샘플 간격보다 느림 → 중단', not slow['alive']
+                   and 'slower than sample interval' in (slow['last_error'] or '')))
+
+    # 종료: grab 도중 stop() 호출 → grab이 끝난 뒤 리더 스레드가 해제
+    reader = StreamReader("rtsp://test/live", "종료", budget, interval=1.0, timeout=2)
+    capture = FakeCapture(step=40.0, delay=0.3)
+    reader.cap = capture
+    reader.start()
+    time.sleep(0.1)
+    started = time.monotonic()
+    reader.stop()
+    waited = time.monotonic() - started
+    print(f"종료: 대기 {waited:.2f}초, 해제={capture.released}, grab 중 해제={capture.released_during_grab}")
+    checks.append(('grab 종료 후 리더 스레드에서 해제', not reader.thread.is_alive() and capture.released
+                   and not capture.released_during_grab and reader.cap is None))
+
+    print()
+    for name, ok in checks:
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+카메라 TCP 도달성 스윕 테스트
+로컬 리스닝 소켓으로 카메라/MediaMTX 포트를 흉내내어 스윕 동작 확인
+- 동시 연결로 1초 이내 완료, 닫힌 포트는 연결 불가
+- 시간 초과 대상만 1회 재확인 (두 번째 연결이 되면 연결 가능)
+- 연결 불가로 확인된 스트림은 디코딩 점검(show_camera_stream)에 가지 않고 FAIL
+"""
+import os
+import sys
+import socket
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from checks import camera_sweep, camera_check
+from checks.camera_sweep import sweep_tcp, sweep_camera_ports
+from checks.camera_check import generate_camera_urls
+
+
+def open_listener() -> socket.socket:
+    """임의 포트에 리스닝 소켓 생성"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(64)
+    return sock
+
+
+def main():
+    print("=" * 60)
+    print("카메라 TCP 도달성 스윕 테스트")
+    print("=" * 60)
+    print()
+
+    # 리스닝 포트 16개 + 닫힌 포트 4개
+    listeners = [open_listener() for _ in range(16)]
+    closed = [open_listener() for _ in range(4)]
+    closed_ports = [sock.getsockname()[1] for sock in closed]
+    for sock in closed:
+        sock.close()
+
+    targets = [('127.0.0.1', sock.getsockname()[1]) for sock in listeners]
+    targets += [('127.0.0.1', port) for port in closed_ports]
+
+    import time
+    start = time.monotonic()
+    probes = sweep_tcp(targets, timeout=0.5)
+    elapsed_ms = (time.monotonic() - start) * 1000
+
+    reachable = [p for p in probes if p['reachable']]
+    unreachable = [p for p in probes if not p['reachable']]
+
+    print(f"대상: {len(targets)}개, 소요 시간: {elapsed_ms:.1f}ms")
+    print(f"연결 가능: {len(reachable)}개, 연결 불가: {len(unreachable)}개")
+    for probe in unreachable:
+        print(f"  - {probe['host']}:{probe['port']} {probe['error']} ({probe['connect_ms']}ms)")
+
+    checks = [('동시 스윕 1초 이내', len(reachable) == 16 and len(unreachable) == 4 and elapsed_ms < 1000)]
+
+    # 카메라 2대: 1번은 원본/MediaMTX 모두 리스닝, 2번은 닫힌 포트
+    cameras = generate_camera_urls(2, base_ip='127.0.0', start_ip=1,
+                                   mediamtx_base_port=listeners[0].getsockname()[1])
+    cameras[1]['ip'] = '127.0.0.2'
+    cameras[1]['mediamtx_port'] = closed_ports[0]
+    sweep = sweep_camera_ports(cameras, rtsp_port=listeners[1].getsockname()[1], timeout=0.4)
+    camera_sweep_ok = (sweep['cameras'][1]['mediamtx']['reachable']
+                       and not sweep['cameras'][2]['mediamtx']['reachable']
+                       and sweep['cameras'][2]['mediamtx']['attempts'] == 1)
+    checks.append(('연결 거부는 재확인 없이 확정', camera_sweep_ok))
+
+    # 시간 초과 대상 재확인: 첫 시도는 시간 초과, 두 번째 시도는 연결
+    original_sweep = camera_sweep.sweep_tcp
+    calls = []
+
+    def flaky_sweep(targets, timeout=0.4):
+        calls.append(list(targets))
+        if len(calls) == 1:
+            return [{'host': h, 'port': p, 'reachable': False, 'connect_ms': 400.0,
+                     'error': f'Connect timeout ({timeout}s)'} for h, p in targets]
+        return original_sweep(targets, timeout)
+
+    camera_sweep.sweep_tcp = flaky_sweep
+    try:
+        rechecked = sweep_camera_ports(cameras[:1], rtsp_port=listeners[1].getsockname()[1], timeout=0.4)
+    finally:
+        camera_sweep.sweep_tcp = original_sweep
+    source = rechecked['cameras'][1]['source']
+    print(f"재확인: 시도 {source['attempts']}회, 연결 {'가능' if source['reachable'] else '불가'}, "
+          f"{source['connect_ms']}ms")
+    checks.append(('시간 초과 대상 1회 재확인', len(calls) == 2 and source['reachable']
+                   and source['attempts'] == 2 and source['connect_ms'] >= 400))
+
+    # 연결 불가로 확인된 스트림은 디코딩 점검을 거치지 않음
+    decoded = []
+    original_show = camera_check.show_camera_stream
+    camera_check.show_camera_stream = lambda camera, stream_type, **kwargs: decoded.append(stream_type) or 'pass'
+    try:
+        gated = camera_check._probe_stream(cameras[1], "mediamtx", True, sweep=sweep)
+        passed = camera_check._probe_stream(cameras[0], "mediamtx", True, sweep=sweep)
+    finally:
+        camera_check.show_camera_stream = original_show
+    print(f"게이트: 연결 불가 → {gated}, 연결 가능 → {passed}, 디코딩 점검 {decoded}")
+    checks.append(('연결 불가 스트림은 디코딩 점검 생략', gated == 'fail' and passed == 'pass'
+                   and decoded == ['mediamtx']
+                   and cameras[1]['latency']['mediamtx']['tcp_error'] is not None))
+
+    for sock in listeners:
+        sock.close()
+
+    print()
+    for name, passed in checks:
+        print(f"  {'✓' if passed else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+회로 차단기 상태 전이 테스트
+- 연속 N회 실패 → OPEN, 확인 시각 전에는 네트워크 접근 없이 생략
+- 확인 실패 → 백오프 2배, 확인 성공 → HALF_OPEN (백오프 유지) 시험 점검
+- 시험 점검 실패 → 백오프 2배로 다시 OPEN (무한 반복 시 상한까지 증가), 성공 → CLOSED
+- 같은 상태 파일을 쓰는 두 인스턴스(CLI/웹 백엔드 흉내)가 서로의 대상 상태를 덮어쓰지 않음
+"""
+import os
+import sys
+import tempfile
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from utils.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+
+
+def expire(breaker: CircuitBreaker, target: str):
+    """다음 확인 시각 도달 흉내"""
+    breaker.targets[target]['next_probe_at'] = 0
+    breaker._save()
+
+
+def main():
+    print("=" * 60)
+    print("회로 차단기 상태 전이 테스트")
+    print("=" * 60)
+    print()
+
+    checks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'breaker.json')
+        breaker = CircuitBreaker(path, failure_threshold=3, base_backoff=100, max_backoff=1000)
+        target = 'nas:10.0.0.1'
+        probes = []
+
+        def probe_with(answer):
+            def probe():
+                probes.append(answer)
+                return answer
+            return probe
+
+        for _ in range(3):
+            checks.append(('CLOSED는 전체 점검', breaker.gate(target, probe_with(True))['allowed']))
+            breaker.record_failure(target, 'timeout')
+        state = breaker.snapshot(target)
+        checks.append(('3회 실패 → OPEN', state['state'] == OPEN and state['backoff'] == 100))
+
+        gate = breaker.gate(target, probe_with(True))
+        checks.append(('확인 시각 전 생략', not gate['allowed'] and not gate['probed'] and not probes))
+
+        expire(breaker, target)
+        gate = breaker.gate(target, probe_with(False))
+        checks.append(('확인 실패 → 백오프 2배', not gate['allowed'] and gate['breaker']['backoff'] == 200))
+
+        backoffs = []
+        for _ in range(4):
+            expire(breaker, target)
+            gate = breaker.gate(target, probe_with(True))
+            half_open = gate['allowed'] and gate['breaker']['state'] == HALF_OPEN
+            breaker.record_failure(target, 'ssh auth timeout')
+            backoffs.append((half_open, breaker.snapshot(target)['backoff']))
+        print(f"TCP 응답 + 시험 점검 실패 반복 시 백오프: {[b for _, b in backoffs]}")
+        checks.append(('확인 성공 → HALF_OPEN', all(h for h, _ in backoffs)))
+        checks.append(('시험 점검 실패 → 백오프 증가 (상한)', [b for _, b in backoffs] == [400, 800, 1000, 1000]))
+        checks.append(('시험 점검 실패 → OPEN', breaker.snapshot(target)['state'] == OPEN))
+
+        expire(breaker, target)
+        breaker.gate(target, probe_with(True))
+        breaker.record_success(target)
+        state = breaker.snapshot(target)
+        checks.append(('시험 점검 성공 → CLOSED', state['state'] == CLOSED and state['failures'] == 0
+                       and state['backoff'] is None))
+
+        # 두 인스턴스가 같은 파일 공유
+        cli = CircuitBreaker(path, failure_threshold=1)
+        web = CircuitBreaker(path, failure_threshold=1)
+        cli.record_failure('camera:10.0.0.5', 'cli')
+        web.record_failure('camera:10.0.0.6', 'web')
+        reloaded = CircuitBreaker(path)
+        names = sorted(reloaded.targets)
+        print(f"공유 상태 파일 대상: {names}")
+        checks.append(('다른 인스턴스 상태 보존', names == ['camera:10.0.0.5', 'camera:10.0.0.6', target]))
+        web.record_success('camera:10.0.0.5')
+        checks.append(('다른 인스턴스 변경 반영', cli.gate('camera:10.0.0.5', probe_with(False))['allowed']))
+
+    print()
+    for name, ok in checks:
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
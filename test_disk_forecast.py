@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+디스크 사용량 이력/가득 참 예측 테스트
+- 같은 1시간 구간의 반복 실행은 기록 1개로 교체 → 며칠치 이력이 밀려나지 않음
+- 기록 기간이 3일 미만이면 일시적 쓰기 급증으로 가득 참을 예측하지 않음
+- 며칠간 꾸준히 증가하면 남은 일수 추정 → 경고
+"""
+import os
+import sys
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from checks.disk_forecast import UsageHistory, forecast_usage, evaluate_usage, DAY
+
+GB = 1024 ** 3
+SIZE = 1000 * GB
+
+
+def main():
+    print("=" * 60)
+    print("디스크 사용량 이력/가득 참 예측 테스트")
+    print("=" * 60)
+    print()
+
+    checks = []
+    start = 1_700_000_000 // 3600 * 3600
+
+    # 1) 하루 1회씩 5일 기록 후, 현장 점검으로 같은 시간대에 100회 반복 실행
+    history = UsageHistory()
+    for day in range(5):
+        history.record('local:/', 500 * GB + day * 5 * GB, SIZE, now=start + day * DAY)
+    for i in range(100):
+        points = history.record('local:/', 520 * GB + i * GB, SIZE, now=start + 4 * DAY + 60 + i * 30)
+    print(f"반복 실행 후 기록: {len(points)}개, 기간 {(points[-1][0] - points[0][0]) / DAY:.1f}일")
+    checks.append(('같은 구간은 1개로 교체', len(points) == 5 and points[-1][1] == 619 * GB))
+
+    # 2) 1시간 안의 쓰기 급증만 있는 이력 → 예측 안 함
+    burst = [[start + i * 600, 500 * GB + i * 20 * GB, SIZE] for i in range(6)]
+    forecast = forecast_usage(burst)
+    print(f"1시간 급증: 증가량 {forecast['bytes_per_day']}, 남은 일수 {forecast['days_to_full']}")
+    checks.append(('3일 미만은 예측 안 함', forecast['days_to_full'] is None
+                   and evaluate_usage(60.0, forecast['days_to_full']) == 'PASS'))
+
+    # 3) 6일간 하루 20GB씩 증가 → 약 20일 후 가득 참 (WARN)
+    steady = [[start + day * DAY, 500 * GB + day * 20 * GB, SIZE] for day in range(7)]
+    forecast = forecast_usage(steady)
+    print(f"꾸준한 증가: {forecast['bytes_per_day'] / GB:.0f}GB/일, 약 {forecast['days_to_full']}일 후 가득 참")
+    checks.append(('며칠간 증가는 예측', forecast['days_to_full'] == 19.0
+                   and evaluate_usage(62.0, forecast['days_to_full']) == 'WARN'))
+
+    print()
+    for name, ok in checks:
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+카메라 저장 로그 읽기 경로(NFS / SFTP) 테스트
+로컬 SSH 대역 서버(paramiko, SFTP 서브시스템)를 띄워 NAS 로그 폴더를 흉내내어 확인
+- SFTP로 로그 끝부분만 읽어 카메라 로그 점검 PASS (전송량이 파일 크기보다 훨씬 작은지)
+- 멈춘 NFS 읽기(stale 마운트 흉내) → 작업 타임아웃 후 SFTP로 전환, NFS는 일정 시간 제외
+- auto 모드에서 NFS 지연이 기준을 넘으면 SFTP를 먼저 사용
+- 모든 경로 제외 중이면 기다리지 않고 즉시 실패
+- 연결 중인 SFTP를 close()해도 기다리지 않음, 전체 로그 분석도 작업 타임아웃 적용
+"""
+import os
+import sys
+import time
+import socket
+import logging
+import tempfile
+import threading
+import warnings
+from datetime import datetime
+
+warnings.filterwarnings('ignore')
+logging.getLogger('paramiko').setLevel(logging.CRITICAL)
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+import paramiko
+from checks import log_transport
+from checks.log_transport import LogTransport, NFSLogReader, SFTPLogReader, TransportError
+from checks.camera_check import check_camera_log
+
+HOST_KEY = paramiko.RSAKey.generate(2048)
+FILLER_LINES = 20000
+sftp_bytes = {'read': 0}
+
+
+class LocalSFTPHandle(paramiko.SFTPHandle):
+    def read(self, offset, length):
+        data = super().read(offset, length)
+        if isinstance(data, bytes):
+            sftp_bytes['read'] += len(data)
+        return data
+
+
+class LocalSFTPServer(paramiko.SFTPServerInterface):
+    """읽기 전용 로컬 SFTP (NAS 경로 그대로 로컬 파일 사용)"""
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(path))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    lstat = stat
+
+    def open(self, path, flags, attr):
+        try:
+            f = open(path, 'rb')
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        handle = LocalSFTPHandle(flags)
+        handle.filename = path
+        handle.readfile = f
+        return handle
+
+
+class FakeNAS(paramiko.ServerInterface):
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+
+def start_server() -> int:
+    sock = socket.socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(5)
+
+    def serve():
+        while True:
+            conn, _ = sock.accept()
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(HOST_KEY)
+            transport.set_subsystem_handler('sftp', paramiko.SFTPServer, LocalSFTPServer)
+            transport.start_server(server=FakeNAS())
+
+    threading.Thread(target=serve, daemon=True).start()
+    return sock.getsockname()[1]
+
+
+class HangingNFSReader(NFSLogReader):
+    """stale NFS 흉내: 읽기 작업이 돌아오지 않음"""
+
+    def __init__(self, base_path: str):
+        super().__init__(base_path)
+        self.release = threading.Event()
+
+    def exists(self, relative):
+        self.release.wait()
+        return super().exists(relative)
+
+    size = exists
+
+
+class SlowNFSReader(NFSLogReader):
+    """응답은 하지만 느린 NFS"""
+
+    def exists(self, relative):
+        time.sleep(0.05)
+        return super().exists(relative)
+
+
+def write_log(base: str, camera_num: int) -> str:
+    now = datetime.now()
+    log_dir = os.path.join(base, now.strftime('%Y'), now.strftime('%m'), now.strftime('%d'))
+    os.makedirs(log_dir, exist_ok=True)
+    path = os.path.join(log_dir, f"rtsp_stream{camera_num}_{now.strftime('%Y%m%d')}.log")
+    stamp = now.strftime('%Y-%m-%d %H:%M:%S')
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(FILLER_LINES):
+            f.write(f"{stamp} - INFO - 프레임 수신 중 ({i})\n")
+        f.write(f"{stamp} - INFO - 영상 저장 완료: /volume1/cam/cam{camera_num}.mp4\n")
+        f.write(f"{stamp} - INFO -   프레임 수: 4500\n")
+        f.write(f"{stamp} - INFO -   영상 길이: 300.0초\n")
+        f.write(f"{stamp} - INFO -   파일 크기: 120.5MB\n")
+    return path
+
+
+def sftp_reader(base: str, port: int, timeout: float = 2.0) -> SFTPLogReader:
+    target = {'host': '127.0.0.1', 'user': 'admin', 'password': 'x', 'port': port}
+    return SFTPLogReader(target, base, timeout=timeout)
+
+
+def main():
+    print("=" * 60)
+    print("카메라 저장 로그 읽기 경로 테스트")
+    print("=" * 60)
+    print()
+
+    port = start_server()
+    checks = []
+    with tempfile.TemporaryDirectory() as base:
+        log_path = write_log(base, 1)
+        log_size = os.path.getsize(log_path)
+
+        # 1) SFTP 끝부분 범위 읽기
+        log_transport._transport_state.clear()
+        transport = LogTransport([sftp_reader(base, port)], mode='sftp')
+        result = check_camera_log(1, '/mnt/nas/logs', transport=transport)
+        transport.close()
+        print(f"SFTP: {result['status']} - 전송 {sftp_bytes['read']} / 파일 {log_size} bytes")
+        checks.append(('SFTP 로그 점검 PASS', result['status'] == 'PASS'))
+        checks.append(('끝부분만 전송', 0 < sftp_bytes['read'] < log_size / 10))
+        checks.append(('사용 경로 기록', result.get('transport', {}).get('used') == 'sftp'))
+
+        # 2) 멈춘 NFS → 타임아웃 후 SFTP 전환, NFS 제외
+        log_transport._transport_state.clear()
+        hanging = HangingNFSReader(base)
+        transport = LogTransport([hanging, sftp_reader(base, port)], mode='auto', read_timeout=0.5)
+        start = time.perf_counter()
+        result = check_camera_log(1, base, transport=transport)
+        elapsed = time.perf_counter() - start
+        snapshot = transport.snapshot()
+        print(f"멈춘 NFS: {result['status']} ({elapsed:.2f}초) - {snapshot['nfs']['last_error']}")
+        checks.append(('NFS 멈춤 시 SFTP로 PASS', result['status'] == 'PASS'
+                       and result['transport']['used'] == 'sftp'))
+        checks.append(('타임아웃 1회만 대기', elapsed < 2.0))
+        checks.append(('NFS 제외 기록', snapshot['nfs']['excluded_for'] > 0))
+
+        # 3) 모든 경로 제외 중이면 즉시 실패
+        transport.close()
+        nfs_only = LogTransport([hanging], mode='nfs', read_timeout=0.5)
+        start = time.perf_counter()
+        try:
+            nfs_only.exists('x.log')
+            immediate = False
+        except TransportError as e:
+            immediate = '재시도 대기' in str(e) and time.perf_counter() - start < 0.1
+        checks.append(('제외 중 즉시 실패', immediate))
+        failed = check_camera_log(1, base, transport=nfs_only)
+        checks.append(('저장소 응답 없음 FAIL', failed['status'] == 'FAIL'))
+        hanging.release.set()
+
+        # 4) auto: NFS 평균 지연이 기준 초과 → SFTP 우선
+        log_transport._transport_state.clear()
+        transport = LogTransport([SlowNFSReader(base), sftp_reader(base, port)], mode='auto', switch_ms=20)
+        relative = os.path.relpath(log_path, base)
+        order = []
+        for _ in range(3):
+            transport.exists(relative)
+            order.append(transport.last_used)
+        transport.close()
+        print(f"느린 NFS 사용 순서: {order}")
+        checks.append(('느린 NFS → SFTP 우선', order[0] == 'nfs' and order[-1] == 'sftp'))
+
+        # 5) 배너를 보내지 않는 SSH 서버: 연결 중 close()가 바로 반환되는지
+        silent = socket.socket()
+        silent.bind(('127.0.0.1', 0))
+        silent.listen(5)
+        stuck = sftp_reader(base, silent.getsockname()[1], timeout=0.5)
+        transport = LogTransport([stuck], mode='sftp', read_timeout=0.5)
+        try:
+            transport.exists(relative)
+        except TransportError:
+            pass
+        start = time.perf_counter()
+        transport.close()
+        close_elapsed = time.perf_counter() - start
+        print(f"연결 중 close(): {close_elapsed:.3f}초")
+        checks.append(('연결 중 close() 대기 없음', close_elapsed < 0.1))
+        silent.close()
+
+        # 6) 분석 모드 전체 읽기도 작업 타임아웃 (멈추면 NFS 제외)
+        log_transport._transport_state.clear()
+        transport = LogTransport([NFSLogReader(base)], mode='nfs', read_timeout=0.3)
+        release = threading.Event()
+        start = time.perf_counter()
+        try:
+            transport.run_local(release.wait)
+            bounded = False
+        except TransportError:
+            bounded = time.perf_counter() - start < 1.0
+        release.set()
+        checks.append(('전체 분석 읽기 타임아웃', bounded and transport.snapshot()['nfs']['excluded_for'] > 0))
+
+    print()
+    for name, ok in checks:
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
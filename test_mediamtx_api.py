@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+MediaMTX 제어 API 조회 테스트
+로컬 HTTP 대역 서버 3개(/v3/paths/list)로 인스턴스를 흉내내어 확인
+- 카메라 1: 정상 (수신 바이트 증가)
+- 카메라 2: 경로 준비되지 않음
+- 카메라 3: 두 번째 조회에서 수신 바이트 정지
+- 조회 2회 동안 인스턴스당 TCP 연결 1개만 사용 (keep-alive 재사용)
+"""
+import os
+import sys
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from checks.mediamtx_api import query_mediamtx_paths
+
+
+def make_handler(state: dict):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def setup(self):
+            super().setup()
+            state['connections'] += 1
+
+        def do_GET(self):
+            state['requests'] += 1
+            state['bytes'] += state['growth']
+            item = {
+                'name': 'live',
+                'ready': state['ready'],
+                'bytesReceived': state['bytes'],
+                'readers': [{'type': 'rtspSession'}]
+            }
+            body = json.dumps({'itemCount': 1, 'pageCount': 1, 'items': [item]}).encode()
+            self.send_response(200 if self.path == '/v3/paths/list' else 404)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    print("=" * 60)
+    print("MediaMTX 제어 API 조회 테스트")
+    print("=" * 60)
+    print()
+
+    states = [
+        {'ready': True, 'growth': 500000},
+        {'ready': False, 'growth': 0},
+        {'ready': True, 'growth': 500000},
+    ]
+    servers = []
+    for state in states:
+        state.update({'connections': 0, 'requests': 0, 'bytes': 0})
+        server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(state))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+
+    ports = [server.server_address[1] for server in servers]
+    cameras = [{'camera_num': i + 1} for i in range(3)]
+
+    # 대역 서버 포트는 연속이 아니므로 카메라별로 api_base_port를 맞춰 조회
+    first = {}
+    for camera, port in zip(cameras, ports):
+        first.update(query_mediamtx_paths([camera], api_base_port=port - camera['camera_num'] + 1)['cameras'])
+    states[2]['growth'] = 0
+    second = {}
+    for camera, port in zip(cameras, ports):
+        second.update(query_mediamtx_paths([camera], api_base_port=port - camera['camera_num'] + 1)['cameras'])
+
+    for num in (1, 2, 3):
+        print(f"카메라 {num}: 1차 healthy={first[num]['healthy']}, "
+              f"2차 healthy={second[num]['healthy']} ({second[num].get('reason')}, {second[num].get('receive_kbps')}kbps)")
+    print(f"인스턴스별 연결 수: {[s['connections'] for s in states]}, 요청 수: {[s['requests'] for s in states]}")
+
+    for server in servers:
+        server.shutdown()
+
+    ok = (first[1]['healthy'] and second[1]['healthy']
+          and not first[2]['healthy'] and not second[2]['healthy']
+          and first[3]['healthy'] and not second[3]['healthy']
+          and all(s['connections'] == 1 and s['requests'] == 2 for s in states))
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
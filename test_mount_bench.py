@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+NAS 마운트 벤치마크 테스트
+/mnt/nas 대신 로컬 임시 디렉토리로 확인 (마운트 지점 확인은 끔)
+- 측정값(처리량/지연 백분위) 구조, 임시 파일 정리 확인
+- 실행 3회로 기준값을 쌓은 뒤, 기준값을 크게 부풀린 이력으로 성능 저하(WARN) 판정 확인
+- 여유 공간 배수를 크게 주어 측정 생략(SKIP), 없는 경로는 FAIL 확인
+"""
+import os
+import sys
+import tempfile
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from checks.mount_bench import BenchHistory, run_mount_benchmark, percentiles
+
+
+def main():
+    print("=" * 60)
+    print("NAS 마운트 벤치마크 테스트")
+    print("=" * 60)
+    print()
+
+    checks = []
+    with tempfile.TemporaryDirectory() as mount:
+        history = BenchHistory(os.path.join(mount, 'history.json'))
+        runs = []
+        for i in range(3):
+            result = run_mount_benchmark(mount, budget_mb=8, meta_ops=20, history=history,
+                                         require_mount=False, min_free_ratio=1)
+            runs.append(result)
+            print(f"실행 {i + 1}: {result['status']} - {result['value']} ({result.get('duration_ms')}ms)")
+
+        first = runs[0]
+        checks.append(('측정 성공', all(run['status'] == 'PASS' for run in runs)))
+        checks.append(('쓰기 용량', first['sequential']['bytes'] == 8 * 1024 * 1024))
+        checks.append(('처리량 측정', first['metrics']['write_mbps'] > 0 and first['metrics']['read_mbps'] > 0))
+        checks.append(('지연 백분위', all(values['p50'] <= values['p95'] <= values['p99'] <= values['max']
+                                       for values in first['metadata'].values())))
+        checks.append(('임시 파일 정리', sorted(os.listdir(mount)) == ['history.json']))
+        checks.append(('기준값 없음(첫 3회)', runs[2]['baseline'] is None))
+        checks.append(('기준값 생성', history.baseline(mount) is not None))
+
+        # 기준값을 현재보다 훨씬 빠르게 부풀려 성능 저하 판정 확인
+        inflated = BenchHistory()
+        for _ in range(3):
+            metrics = dict(first['metrics'])
+            metrics['write_mbps'] = first['metrics']['write_mbps'] * 100
+            metrics['read_mbps'] = first['metrics']['read_mbps'] * 100
+            inflated.record(mount, metrics)
+        slow = run_mount_benchmark(mount, budget_mb=8, meta_ops=20, history=inflated,
+                                   require_mount=False, min_free_ratio=1)
+        print(f"부풀린 기준값: {slow['status']} - {slow['regressions']}")
+        checks.append(('성능 저하 WARN', slow['status'] == 'WARN' and len(slow['regressions']) >= 2))
+
+        skipped = run_mount_benchmark(mount, budget_mb=8, require_mount=False, min_free_ratio=10 ** 9)
+        print(f"여유 공간 부족: {skipped['status']} - {skipped['value']}")
+        checks.append(('여유 공간 부족 SKIP', skipped['status'] == 'SKIP'))
+
+        unmounted = run_mount_benchmark(mount, budget_mb=8)
+        print(f"마운트 아님: {unmounted['status']} - {unmounted['value']}")
+        checks.append(('마운트 아님 FAIL', unmounted['status'] == 'FAIL'))
+
+    missing = run_mount_benchmark(os.path.join(mount, 'missing'), require_mount=False)
+    checks.append(('경로 없음 FAIL', missing['status'] == 'FAIL'))
+    checks.append(('백분위 계산', percentiles([float(i) for i in range(1, 101)])['p95'] == 95.0))
+
+    print()
+    for name, ok in checks:
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
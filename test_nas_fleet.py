@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+다중 NAS 동시 점검 테스트 + 벤치마크
+로컬 SSH 대역 서버(paramiko)를 127.0.0.x 주소마다 띄워 NAS 여러 대를 흉내내어 확인
+- 명령마다 지연(WAN 왕복 흉내)을 주고 순차(동시 1개)와 동시 점검 소요 시간 비교
+- 같은 호스트를 두 번 등록하여 호스트별 동시 실행 제한 확인
+- 1대는 RAID 디스크 장애(mdstat (F) [4/3] [UU_U]) → 전체 요약 FAIL 기대
+- 응답이 느린 NAS: 제한 시간 안에 점검 스레드가 끝나고 회로 차단기에 실패 기록,
+  포트가 잘못된 대상은 전체 점검을 멈추지 않고 해당 대상만 FAIL
+"""
+import os
+import sys
+import time
+import socket
+import asyncio
+import logging
+import subprocess
+import threading
+import warnings
+
+warnings.filterwarnings('ignore')
+logging.getLogger('paramiko').setLevel(logging.CRITICAL)  # 점검 종료 시 연결 끊김 로그 숨김
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+import paramiko
+from checks.nas_fleet import check_nas_fleet_async, parse_nas_targets
+from utils.circuit_breaker import CircuitBreaker
+
+HOSTS = 6
+CHANNEL_DELAY = 0.3  # 명령 채널당 지연 (초)
+HOST_KEY = paramiko.RSAKey.generate(2048)
+
+MDSTAT_OK = """Personalities : [raid1] [raid6] [raid5] [raid4]
+md2 : active raid5 sata1p3[0] sata4p3[3] sata3p3[2] sata2p3[1]
+      11706589632 blocks super 1.2 level 5, 64k chunk, algorithm 2 [4/4] [UUUU]
+md1 : active raid1 sata1p2[0] sata4p2[3] sata3p2[2] sata2p2[1]
+      2097088 blocks [4/4] [UUUU]
+md0 : active raid1 sata1p1[0] sata4p1[3] sata3p1[2] sata2p1[1]
+      2490176 blocks [4/4] [UUUU]
+unused devices: <none>
+"""
+MDSTAT_DEGRADED = (MDSTAT_OK.replace("sata3p3[2]", "sata3p3[2](F)", 1)
+                   .replace("[4/4] [UUUU]", "[4/3] [UU_U]", 1))
+DF = """Filesystem          1B-blocks          Used     Available Capacity Mounted on
+/dev/md0           2442780672    1503238144     866123776      64% /
+/dev/vg1000/lv  11987541422080 5717499609088 6270041812992      48% /volume1
+"""
+
+# /proc/mdstat, df만 대역 데이터로 바꾸고 나머지 명령은 그대로 실행
+SHELL_PRELUDE = ('cat() { if [ "$1" = /proc/mdstat ]; then printf "%s" "$FAKE_MDSTAT"; else command cat "$@"; fi; }\n'
+                 'df() { printf "%s" "$FAKE_DF"; }\n')
+
+
+class StandInServer(paramiko.ServerInterface):
+    def __init__(self, host_state: dict):
+        self.state = host_state
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+    def check_channel_exec_request(self, channel, command):
+        def run():
+            with self.state['lock']:
+                self.state['active'] += 1
+                self.state['max_active'] = max(self.state['max_active'], self.state['active'])
+            time.sleep(self.state.get('delay', CHANNEL_DELAY))
+            env = dict(os.environ, FAKE_MDSTAT=self.state['mdstat'], FAKE_DF=DF)
+            proc = subprocess.run(['sh', '-c', SHELL_PRELUDE + command.decode()], capture_output=True, env=env)
+            channel.sendall(proc.stdout)
+            channel.sendall_stderr(proc.stderr)
+            channel.send_exit_status(proc.returncode)
+            channel.close()
+            with self.state['lock']:
+                self.state['active'] -= 1
+        threading.Thread(target=run, daemon=True).start()
+        return True
+
+
+def serve(address: str, host_state: dict) -> int:
+    """대역 SSH 서버 시작 (호스트별 동시 실행 명령 수 기록)"""
+    listener = socket.socket()
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((address, 0))
+    listener.listen(50)
+
+    def handle(conn):
+        transport = paramiko.Transport(conn)
+        transport.add_server_key(HOST_KEY)
+        transport.start_server(server=StandInServer(host_state))
+        channels = []  # 채널 객체가 GC되면 닫히므로 연결이 끝날 때까지 보관
+        while transport.is_active():
+            channel = transport.accept(0.2)
+            if channel is not None:
+                channels.append(channel)
+
+    def loop():
+        while True:
+            conn, _ = listener.accept()
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=loop, daemon=True).start()
+    return listener.getsockname()[1]
+
+
+def main():
+    print("=" * 60)
+    print("다중 NAS 동시 점검 테스트")
+    print("=" * 60)
+    print()
+
+    states = {}
+    specs = []
+    for i in range(1, HOSTS + 1):
+        address = f"127.0.0.{i + 1}"
+        state = {'mdstat': MDSTAT_DEGRADED if i == 3 else MDSTAT_OK,
+                 'lock': threading.Lock(), 'active': 0, 'max_active': 0}
+        port = serve(address, state)
+        states[address] = state
+        specs.append(f"nas{i}={address}:{port}")
+    # 같은 호스트 중복 등록 (호스트별 제한 확인용)
+    specs.append(f"nas1-dup={specs[0].split('=', 1)[1]}")
+    targets = parse_nas_targets(','.join(specs), default_user='admin', default_password='pw')
+
+    start = time.monotonic()
+    sequential = asyncio.run(check_nas_fleet_async(targets, max_concurrency=1))
+    sequential_s = time.monotonic() - start
+
+    for state in states.values():
+        state['max_active'] = 0
+    start = time.monotonic()
+    concurrent = asyncio.run(check_nas_fleet_async(targets, max_concurrency=8, per_host_limit=1))
+    concurrent_s = time.monotonic() - start
+
+    for name, host_result in concurrent['hosts'].items():
+        print(f"{name:10} {host_result['host']:12} {host_result['status']:5} "
+              f"{host_result.get('duration_ms')}ms  {host_result.get('errors')} {host_result.get('warnings')}")
+    print()
+    print(f"요약: {concurrent['status']} {concurrent['summary']}")
+    print(f"순차(동시 1개): {sequential_s:.2f}초, 동시(8개): {concurrent_s:.2f}초 "
+          f"→ {sequential_s / concurrent_s:.1f}배")
+    print(f"호스트별 최대 동시 명령: {[s['max_active'] for s in states.values()]}")
+
+    # 느린 NAS(명령마다 5초) + 잘못된 포트: 제한 시간 1.5초
+    slow_state = {'mdstat': MDSTAT_OK, 'lock': threading.Lock(), 'active': 0, 'max_active': 0, 'delay': 5.0}
+    slow_port = serve('127.0.0.20', slow_state)
+    breaker = CircuitBreaker(failure_threshold=3)
+    slow_targets = parse_nas_targets(f"slow=127.0.0.20:{slow_port},bad=127.0.0.21:22x,range=127.0.0.22:70000",
+                                     default_user='admin', default_password='pw')
+    start = time.monotonic()
+    slow = asyncio.run(check_nas_fleet_async(slow_targets, host_timeout=1.5, breaker=breaker))
+    slow_s = time.monotonic() - start
+    slow_host = slow['hosts']['slow']
+    print(f"느린 NAS: {slow_host['status']} {slow_host['connection']} {slow_host['duration_ms']}ms "
+          f"- {slow_host['errors']} (차단기 실패 {breaker.snapshot('nas:127.0.0.20')['failures']}회)")
+    print(f"잘못된 포트: {[slow['hosts'][name]['errors'] for name in ('bad', 'range')]}")
+
+    ok = (concurrent['status'] == 'FAIL'
+          and concurrent['summary']['failed_hosts'] == ['nas3']
+          and concurrent['summary']['degraded_raid'] == ['nas3']
+          and concurrent['summary']['counts']['PASS'] == len(targets) - 1
+          and sequential['summary'] == concurrent['summary']
+          and all(s['max_active'] <= 1 for s in states.values())
+          and concurrent_s * 2 < sequential_s
+          and slow_host['connection'] == 'Timeout' and slow_s < 3.5
+          and breaker.snapshot('nas:127.0.0.20')['failures'] == 1
+          and all(slow['hosts'][name]['connection'] == 'Invalid target' for name in ('bad', 'range')))
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+NAS SSH 포트 경합 연결 테스트
+포트별 연결 지연/실패를 흉내내는 NASChecker 대역으로 확인 (실제 SSH 서버 없음)
+- 캐시 없음: 2222/22 동시 시작, 먼저 연결된 포트 사용 후 캐시
+- 캐시된 포트가 응답하지 않음: 짧은 간격 뒤 다른 포트 시작 → 연결 타임아웃 전체를 기다리지 않고 캐시 갱신
+- 캐시된 포트가 정상: 다른 포트는 시작하지 않음
+"""
+import os
+import sys
+import time
+import warnings
+
+warnings.filterwarnings('ignore')
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from checks import nas_check
+from checks.nas_check import NASChecker
+
+
+class FakeClient:
+    def close(self):
+        pass
+
+
+class FakeChecker(NASChecker):
+    """포트별 동작: 'ok' (지연 delay초 후 연결), 'dark' (timeout까지 응답 없음)"""
+
+    behavior = {}
+
+    def __init__(self, host: str):
+        super().__init__(host, 'admin', 'pw', port=2222, timeout=5)
+        self.attempts = []
+
+    def _open(self, port, sockets=None):
+        self.attempts.append(port)
+        mode, delay = self.behavior[port]
+        if mode == 'dark':
+            time.sleep(self.default_timeout)
+            raise TimeoutError('timed out')
+        time.sleep(delay)
+        return FakeClient()
+
+
+def connect(host: str, behavior: dict):
+    FakeChecker.behavior = behavior
+    checker = FakeChecker(host)
+    start = time.monotonic()
+    ok = checker.connect()
+    return checker, ok, time.monotonic() - start
+
+
+def main():
+    print("=" * 60)
+    print("NAS SSH 포트 경합 연결 테스트")
+    print("=" * 60)
+    print()
+
+    checks = []
+    host = '10.0.0.30'
+
+    # 1) 캐시 없음, 2222는 응답 없음 → 22로 바로 연결
+    checker, ok, elapsed = connect(host, {2222: ('dark', 0), 22: ('ok', 0.05)})
+    print(f"캐시 없음: 포트 {checker.connected_port}, {elapsed:.2f}초, 경고 {checker.warnings}")
+    checks.append(('동시 시작 후 22 연결', ok and checker.connected_port == 22 and elapsed < 1.0
+                   and nas_check._port_cache[host] == 22))
+
+    # 2) 캐시된 22가 정상 → 22만 시도
+    checker, ok, elapsed = connect(host, {2222: ('ok', 0.05), 22: ('ok', 0.05)})
+    print(f"캐시 정상: 포트 {checker.connected_port}, 시도 {checker.attempts}, 경고 {checker.warnings}")
+    checks.append(('캐시 포트만 시도', ok and checker.attempts == [22]
+                   and any('이전 연결 성공 포트' in w for w in checker.warnings)))
+
+    # 3) NAS가 2222로 복귀 (22 응답 없음) → 간격 뒤 2222 시작, 타임아웃(5초) 전에 연결
+    checker, ok, elapsed = connect(host, {2222: ('ok', 0.05), 22: ('dark', 0)})
+    print(f"캐시 포트 응답 없음: 포트 {checker.connected_port}, 시도 {checker.attempts}, {elapsed:.2f}초")
+    checks.append(('캐시 포트 지연 시 다른 포트로 전환', ok and checker.connected_port == 2222
+                   and checker.attempts == [22, 2222]
+                   and nas_check.CONNECT_STAGGER <= elapsed < 1.0
+                   and nas_check._port_cache[host] == 2222 and not checker.warnings))
+
+    # 4) 캐시된 포트가 즉시 실패하면 간격을 기다리지 않고 다른 포트 시작
+    nas_check._port_cache[host] = 22
+    FakeChecker.behavior = {2222: ('ok', 0.0), 22: ('dark', 0)}
+    checker = FakeChecker(host)
+    checker.default_timeout = 0
+    start = time.monotonic()
+    ok = checker.connect()
+    elapsed = time.monotonic() - start
+    print(f"캐시 포트 즉시 실패: 포트 {checker.connected_port}, {elapsed:.2f}초")
+    checks.append(('즉시 실패 시 바로 전환', ok and checker.connected_port == 2222
+                   and elapsed < nas_check.CONNECT_STAGGER))
+
+    print()
+    for name, passed in checks:
+        print(f"  {'✓' if passed else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    # 응답 없는 포트 시도 스레드는 기다리지 않고 종료
+    os._exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
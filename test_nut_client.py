@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+NUT(upsd) 프로토콜 클라이언트 테스트
+로컬에 가짜 upsd(TCP)를 띄워 upsc 없이 조회되는지 확인
+- LIST UPS / LIST VAR / GET VAR, 따옴표/이스케이프 값 파싱
+- 반복 조회 시 연결 1개 재사용, 서버가 연결을 끊으면 1회 재연결
+- 여러 UPS / 다른 포트의 upsd 동시 점검, 없는 UPS는 ERR UNKNOWN-UPS → 실패
+"""
+import os
+import sys
+import socket
+import threading
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from checks.nut_client import NUTClient, NUTError, split_line, parse_ups_targets, close_shared_clients
+from checks.ups_check import check_ups_data, ups_targets_from_config
+
+UPS_VARS = {
+    'ups': {
+        'battery.charge': '100',
+        'battery.runtime': '1830',
+        'input.voltage': '221.0',
+        'ups.load': '23',
+        'ups.model': 'Back-UPS "XS" 1400U',
+        'ups.status': 'OL',
+        'ups.delay.shutdown': '20'
+    },
+    'rack': {
+        'battery.charge': '64',
+        'ups.load': '71',
+        'ups.status': 'OB DISCHRG'
+    }
+}
+
+
+def quote(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+class FakeUpsd:
+    """upsd 흉내 (명령별 응답, 연결 수 기록)"""
+
+    def __init__(self, upses):
+        self.upses = upses
+        self.connections = 0
+        self.drop_next = False  # 다음 명령 수신 시 연결 끊기 (유지 연결 끊김 흉내)
+        self.sock = socket.socket()
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(5)
+        self.port = self.sock.getsockname()[1]
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        while True:
+            conn, _ = self.sock.accept()
+            self.connections += 1
+            threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+
+    def respond(self, line: str) -> str:
+        words = line.split()
+        if words[:2] == ['LIST', 'UPS']:
+            body = ''.join(f'UPS {name} {quote("fake " + name)}\n' for name in self.upses)
+            return f"BEGIN LIST UPS\n{body}END LIST UPS\n"
+        if words[:2] == ['LIST', 'VAR'] and len(words) == 3:
+            ups = words[2]
+            if ups not in self.upses:
+                return "ERR UNKNOWN-UPS\n"
+            body = ''.join(f"VAR {ups} {key} {quote(value)}\n" for key, value in self.upses[ups].items())
+            return f"BEGIN LIST VAR {ups}\n{body}END LIST VAR {ups}\n"
+        if words[:2] == ['GET', 'VAR'] and len(words) == 4:
+            ups, name = words[2], words[3]
+            if ups not in self.upses:
+                return "ERR UNKNOWN-UPS\n"
+            if name not in self.upses[ups]:
+                return "ERR VAR-NOT-SUPPORTED\n"
+            return f"VAR {ups} {name} {quote(self.upses[ups][name])}\n"
+        return "ERR UNKNOWN-COMMAND\n"
+
+    def handle(self, conn):
+        reader = conn.makefile('r', encoding='utf-8')
+        with conn:
+            for line in reader:
+                line = line.strip()
+                if line == 'LOGOUT':
+                    conn.sendall(b"OK Goodbye\n")
+                    return
+                if self.drop_next:
+                    self.drop_next = False
+                    return
+                conn.sendall(self.respond(line).encode('utf-8'))
+
+
+def main():
+    print("=" * 60)
+    print("NUT(upsd) 프로토콜 클라이언트 테스트")
+    print("=" * 60)
+    print()
+
+    checks = []
+    checks.append(('따옴표/이스케이프 파싱',
+                   split_line('VAR ups ups.model "Back-UPS \\"XS\\" 1400U"') ==
+                   ['VAR', 'ups', 'ups.model', 'Back-UPS "XS" 1400U']))
+    checks.append(('빈 값 파싱', split_line('VAR ups ups.id ""') == ['VAR', 'ups', 'ups.id', '']))
+
+    upsd = FakeUpsd(UPS_VARS)
+    client = NUTClient('127.0.0.1', upsd.port, timeout=2)
+
+    upses = client.list_ups()
+    values = client.list_vars('ups')
+    print(f"LIST UPS: {upses}")
+    print(f"LIST VAR ups: {len(values)}개")
+    checks.append(('LIST UPS', set(upses) == {'ups', 'rack'}))
+    checks.append(('LIST VAR 전체 조회', values == UPS_VARS['ups']))
+    checks.append(('GET VAR', client.get_var('rack', 'ups.status') == 'OB DISCHRG'))
+
+    for _ in range(20):
+        client.get_var('ups', 'battery.charge')
+    checks.append(('연결 1개 재사용', upsd.connections == 1 and client.connects == 1))
+
+    upsd.drop_next = True
+    recovered = client.get_var('ups', 'ups.load') == '23'
+    print(f"유지 연결 끊김 후 재연결: 연결 {upsd.connections}회")
+    checks.append(('끊김 후 1회 재연결', recovered and client.connects == 2))
+
+    try:
+        client.get_var('ups', 'ups.beeper.status')
+        unsupported = False
+    except NUTError as e:
+        unsupported = e.code == 'VAR-NOT-SUPPORTED'
+    checks.append(('ERR 응답 코드', unsupported))
+    client.close()
+
+    # 여러 UPS + 다른 포트의 upsd (원격 upsd 흉내)
+    remote = FakeUpsd({'edge': {'ups.status': 'OL CHRG', 'battery.charge': '88'}})
+    targets = ups_targets_from_config('ups', {
+        'host': '127.0.0.1',
+        'port': str(upsd.port),
+        'targets': f"ups,rack@127.0.0.1:{upsd.port},edge@127.0.0.1:{remote.port}"
+    })
+    results = [check_ups_data(t['ups'], t['host'], t['port'], timeout=2) for t in targets]
+    for target, result in zip(targets, results):
+        print(f"  {target['name']}: {result['data'].get('ups.status')} ({result.get('raw_count')}개 필드)")
+    checks.append(('여러 UPS 조회', [r['data']['ups.status'] for r in results] == ['OL', 'OB DISCHRG', 'OL CHRG']))
+    checks.append(('upsd별 연결 공유', upsd.connections == 3 and remote.connections == 1))
+
+    missing = check_ups_data('nope', '127.0.0.1', upsd.port, timeout=2)
+    print(f"없는 UPS: {missing['error']}")
+    checks.append(('없는 UPS 실패', not missing['success'] and 'UNKNOWN-UPS' in missing['error']
+                   and 'rack' in missing['error']))
+
+    closed = socket.socket()
+    closed.bind(('127.0.0.1', 0))
+    unreachable = check_ups_data('ups', '127.0.0.1', closed.getsockname()[1], timeout=1)
+    closed.close()
+    checks.append(('upsd 없음 실패', not unreachable['success'] and '통신 실패' in unreachable['error']))
+    checks.append(('대상 파싱', parse_ups_targets('ups, rack@nas:3500', 'edge')[1] ==
+                   {'name': 'rack@nas:3500', 'ups': 'rack', 'host': 'nas', 'port': 3500}))
+    bad = parse_ups_targets('ups, rack@nas:3493), edge@nas:99999')
+    print(f"잘못된 대상: {[t.get('error') for t in bad]}")
+    checks.append(('잘못된 포트는 대상별 오류', bad[0].get('error') is None
+                   and all(t.get('error') for t in bad[1:])))
+    close_shared_clients()
+
+    print()
+    for name, ok in checks:
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+녹화 세그먼트 무결성 샘플링 CPU 예산 테스트
+- 예산은 워커 스레드의 CPU 시간만 합산 (같은 프로세스의 다른 스레드 작업은 제외)
+- 여러 워커가 같은 예산을 나눠 쓰고, 소진되면 남은 세그먼트는 SKIP
+"""
+import os
+import sys
+import time
+import tempfile
+import threading
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+import cv2
+import numpy as np
+from checks.segment_verify import CpuBudget, verify_segments
+
+
+def write_segment(path: str, frames: int = 50):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (320, 240))
+    for _ in range(frames):
+        writer.write(np.random.randint(0, 255, (240, 320, 3), np.uint8))
+    writer.release()
+
+
+def main():
+    print("=" * 60)
+    print("녹화 세그먼트 CPU 예산 테스트")
+    print("=" * 60)
+    print()
+
+    checks = []
+
+    # 무관한 CPU 작업 스레드 (웹 백엔드의 모니터/폴러 흉내)
+    stop = threading.Event()
+
+    def burn():
+        while not stop.is_set():
+            sum(range(10000))
+
+    burner = threading.Thread(target=burn, daemon=True)
+    burner.start()
+
+    # 1) 예산 측정 중 다른 스레드가 CPU를 써도 합산되지 않음
+    budget = CpuBudget(10.0)
+    with budget.track():
+        time.sleep(0.5)
+    print(f"대기만 한 워커: {budget.used():.3f}초")
+    checks.append(('다른 스레드 CPU 제외', budget.used() < 0.05))
+
+    # 2) 워커 2개가 예산을 함께 소진
+    shared = CpuBudget(0.1)
+
+    def spin():
+        with shared.track():
+            while not shared.exhausted():
+                pass
+
+    workers = [threading.Thread(target=spin) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    print(f"워커 2개 합계: {shared.used():.3f}초 (예산 0.1초)")
+    checks.append(('워커 합계로 예산 소진', 0.1 <= shared.used() < 0.2))
+
+    # 3) 실제 세그먼트 샘플링: 다른 스레드가 바빠도 예산 안에서 전부 점검
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {}
+        for camera_num in range(1, 4):
+            paths[camera_num] = os.path.join(directory, f"{camera_num}.avi")
+            write_segment(paths[camera_num])
+        result = verify_segments(paths, sample_frames=5, max_workers=2, cpu_budget=5.0)
+    stop.set()
+    burner.join()
+    print(f"세그먼트 3개: CPU {result['cpu_seconds']}초, 경과 {result['wall_seconds']}초, 생략 {result['skipped']}")
+    checks.append(('다른 작업 때문에 생략되지 않음', not result['skipped']
+                   and all(s['sampled'] == 5 for s in result['segments'].values())))
+
+    print()
+    for name, ok in checks:
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+UPS 원격 측정 링 버퍼 테스트
+- 용량 초과 시 오래된 샘플부터 덮어쓰기, 시간순 조회
+- 구간 집계(평균/최소/최대, 값 없는 샘플 제외, 상태 플래그 OR)를 단순 계산과 비교
+- 점검(check_ups_data)이 최근 샘플을 사용해 upsd에 접속하지 않는지, 오래된 샘플은 무시하는지
+"""
+import os
+import sys
+import time
+import math
+import random
+
+# backend 경로를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from checks.ups_telemetry import (
+    UPSRingBuffer, UPSTelemetryStore, ups_telemetry, aggregate, encode_status, decode_status
+)
+from checks.ups_check import check_ups_data
+
+
+def sample(charge, load, status='OL', voltage='220.5'):
+    variables = {'battery.charge': str(charge), 'ups.load': str(load), 'ups.status': status,
+                 'battery.runtime': '1800'}
+    if voltage is not None:
+        variables['input.voltage'] = voltage
+    return variables
+
+
+def main():
+    print("=" * 60)
+    print("UPS 원격 측정 링 버퍼 테스트")
+    print("=" * 60)
+    print()
+
+    checks = []
+
+    # 1) 덮어쓰기 + 시간순
+    ring = UPSRingBuffer(capacity=10)
+    for i in range(25):
+        ring.append(1000.0 + i, sample(100 - i, i))
+    times, values, _ = ring.window()
+    print(f"용량 10, 25개 기록 → {len(times)}개 ({times[0]:.0f}~{times[-1]:.0f})")
+    checks.append(('덮어쓰기 후 최근 10개', list(times) == [1015.0 + i for i in range(10)]))
+    checks.append(('가장 오래된 샘플', ring.oldest() == 1015.0))
+    checks.append(('최근 샘플', ring.latest()['vars']['ups.load'] == '24'))
+    checks.append(('구간 조회', len(ring.window(since=1020.0, until=1023.0)[0]) == 3))
+
+    # 2) 구간 집계를 단순 계산과 비교
+    random.seed(7)
+    ring = UPSRingBuffer(capacity=1000)
+    raw = []
+    for i in range(600):
+        timestamp = 5000.0 + i * 0.7
+        status = random.choice(['OL', 'OL CHRG', 'OB DISCHRG'])
+        voltage = None if i % 13 == 0 else f"{random.uniform(200, 240):.1f}"
+        values = sample(random.randint(40, 100), random.randint(0, 90), status, voltage)
+        ring.append(timestamp, values)
+        raw.append((timestamp, values))
+    points = aggregate(*ring.window(), step=30)
+
+    expected = {}
+    for timestamp, values in raw:
+        bucket = expected.setdefault(math.floor(timestamp / 30) * 30, {'loads': [], 'volts': [], 'flags': 0})
+        bucket['loads'].append(float(values['ups.load']))
+        if 'input.voltage' in values:
+            bucket['volts'].append(float(values['input.voltage']))
+        bucket['flags'] |= encode_status(values['ups.status'])
+
+    matches = len(points) == len(expected)
+    for point in points:
+        bucket = expected[point['timestamp']]
+        matches &= point['samples'] == len(bucket['loads'])
+        matches &= point['ups.load']['avg'] == round(sum(bucket['loads']) / len(bucket['loads']), 2)
+        matches &= point['ups.load']['max'] == max(bucket['loads'])
+        matches &= point['input.voltage']['min'] == min(bucket['volts'])
+        matches &= point['status_flags'] == bucket['flags']
+    print(f"30초 집계: 샘플 {len(raw)}개 → 구간 {len(points)}개")
+    checks.append(('집계 = 단순 계산', bool(matches)))
+
+    empty = UPSRingBuffer(capacity=4)
+    empty.append(0.0, {'ups.status': 'OL'})
+    checks.append(('값 없는 구간은 None', aggregate(*empty.window(), step=10)[0]['ups.load']['avg'] is None))
+    checks.append(('상태 플래그 변환', decode_status(encode_status('OB LB DISCHRG')) == 'OB LB DISCHRG'))
+
+    # 3) 점검이 최근 샘플 사용 (닫힌 포트여도 upsd 접속 없이 성공)
+    store = UPSTelemetryStore(capacity=10, max_age=15)
+    store.record('x@host', sample(90, 10))
+    checks.append(('최근 샘플 조회', store.latest('x@host')['vars']['battery.charge'] == '90'))
+    store.record('x@host', sample(80, 10), timestamp=time.time() - 60)
+    checks.append(('오래된 샘플 무시', store.latest('x@host') is None))
+
+    ups_telemetry.record('ups@127.0.0.1:1', sample(77, 33, 'OB DISCHRG'))
+    polled = check_ups_data('ups', '127.0.0.1', 1, timeout=1)
+    print(f"폴러 샘플 사용: {polled['sampled']} - {polled['data']['ups.status']} ({polled['sample_age']}초 전)")
+    checks.append(('점검이 폴러 샘플 사용', polled['success'] and polled['sampled'] == 'poller'
+                   and polled['data']['battery.charge'] == '77'))
+    direct = check_ups_data('ups', '127.0.0.1', 2, timeout=1)
+    checks.append(('샘플 없으면 upsd 직접 조회', direct['sampled'] == 'upsd' and not direct['success']))
+
+    print()
+    for name, ok in checks:
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    ok = all(passed for _, passed in checks)
+    print()
+    print("결과:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()